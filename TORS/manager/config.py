@@ -36,6 +36,8 @@ class ScenarioGeneratorConfig:
     n_workers: int = 0
     n_disturbances: int = 0
     match_outgoing_trains: bool = False
+    cache_size: int = 16
+    screen_scenarios: bool = False
 
 
 @deserialize(type_check=Strict)
@@ -48,6 +50,8 @@ class EpisodeConfig:
     n_runs: int = 1
     max_trains: int = 1
     time_limit: int = -1
+    feasibility_monitor: bool = False
+    symmetry_reduction: bool = False
 
 
 @deserialize(type_check=Strict)
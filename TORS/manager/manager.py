@@ -115,7 +115,7 @@ class Manager:
 
         planning_time_left = self.get_remaining_planning_time()
         if planning_time_left < 0 and planning_time_left != -1:
-            return self.simulator.get_result(), True
+            return self.simulator.get_result().snapshot(), True
 
         # Close running engine, generate new scenario
         self.simulator.reset()
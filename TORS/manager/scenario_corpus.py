@@ -0,0 +1,133 @@
+from pyTORS import Scenario
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+
+MANIFEST_FILE = ".scenario_manifest.json"
+MANIFEST_VERSION = 1
+SCENARIO_EXTENSIONS = (".json", ".json.gz", ".pb", ".pb.gz")
+
+
+def _is_scenario_file(file):
+    return (
+        file.endswith(SCENARIO_EXTENSIONS)
+        and not file.startswith(".")
+        and file not in ("config.json", "vis_config.json")
+        and not file.startswith("location.")
+    )
+
+
+def _read_entry(path):
+    try:
+        stat = os.stat(path)
+        info = Scenario.read_info(path)
+    except (RuntimeError, ValueError, OSError):
+        return None
+    return {
+        "file": os.path.basename(path),
+        "size": stat.st_size,
+        "mtime": stat.st_mtime,
+        "n_trains": info.number_of_trains,
+        "n_incoming": info.number_of_incoming,
+        "n_outgoing": info.number_of_outgoing,
+        "start_time": info.start_time,
+        "end_time": info.end_time,
+        "train_types": list(info.train_types),
+    }
+
+
+class ScenarioCorpus:
+    """
+    Index of the scenario files in a folder.
+
+    The metadata of every scenario (number of trains, time window and train types) is
+    stored in a manifest file in the folder. The manifest is built once, in parallel, and only
+    entries of new or changed files are read again. Scenarios are parsed lazily when requested,
+    and at most cache_size parsed scenarios are kept in memory (least recently used first out).
+    """
+
+    def __init__(self, engine, folder, cache_size=16, n_threads=None):
+        self.engine = engine
+        self.folder = folder
+        self.cache_size = cache_size
+        self.n_threads = n_threads
+        self.cache = OrderedDict()
+        self.entries = self._load_manifest()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, path):
+        return path in self.entries
+
+    def paths(self):
+        return list(self.entries.keys())
+
+    def get_info(self, path):
+        """Get the manifest entry of the scenario at path"""
+        return self.entries[path]
+
+    def filter(self, min_trains=None):
+        """Get the paths of all scenarios with at least min_trains trains"""
+        return [
+            path
+            for path, entry in self.entries.items()
+            if min_trains is None or entry["n_trains"] >= min_trains
+        ]
+
+    def get_scenario(self, path) -> Scenario:
+        """Get the scenario at path, parsing it if it is not in the cache"""
+        scenario = self.cache.get(path)
+        if scenario is None:
+            scenario = self.engine.load_scenario(path)
+            self.cache[path] = scenario
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        else:
+            self.cache.move_to_end(path)
+        return scenario
+
+    def _manifest_path(self):
+        return os.path.join(self.folder, MANIFEST_FILE)
+
+    def _load_manifest(self):
+        old_entries = {}
+        try:
+            with open(self._manifest_path()) as f:
+                manifest = json.load(f)
+            if manifest.get("version") == MANIFEST_VERSION:
+                old_entries = {e["file"]: e for e in manifest["scenarios"]}
+        except (OSError, ValueError, KeyError):
+            pass
+        files = sorted(f for f in os.listdir(self.folder) if _is_scenario_file(f))
+        entries = {}
+        stale = []
+        for file in files:
+            path = os.path.join(self.folder, file)
+            stat = os.stat(path)
+            entry = old_entries.get(file)
+            if (
+                entry is not None
+                and entry["size"] == stat.st_size
+                and entry["mtime"] == stat.st_mtime
+            ):
+                entries[path] = entry
+            else:
+                stale.append(path)
+        if len(stale) > 0 or len(old_entries) != len(entries):
+            with ThreadPoolExecutor(self.n_threads) as executor:
+                for path, entry in zip(stale, executor.map(_read_entry, stale)):
+                    if entry is not None:
+                        entries[path] = entry
+            entries = {path: entries[path] for path in sorted(entries)}
+            self._write_manifest(entries)
+        return entries
+
+    def _write_manifest(self, entries):
+        manifest = {"version": MANIFEST_VERSION, "scenarios": list(entries.values())}
+        try:
+            with open(self._manifest_path(), "w") as f:
+                json.dump(manifest, f, indent=1)
+        except OSError:
+            pass  # The corpus still works with a read-only folder, the manifest is then rebuilt every time
@@ -16,8 +16,11 @@ import itertools
 from functools import reduce
 import operator as op
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 import os
 
+from manager.scenario_corpus import ScenarioCorpus
+
 from warnings import warn
 
 
@@ -30,6 +33,8 @@ class ScenarioGenerator(ABC):
         match_outgoing_trains=False,
         max_length=None,
         max_trains_per_track=None,
+        screen_scenarios=False,
+        max_screening_attempts=100,
     ):
         self.n_trains = n_trains
         self.n_disturbances = n_disturbances
@@ -40,12 +45,21 @@ class ScenarioGenerator(ABC):
         self.max_length = n_trains if max_length is None else max_length
         self.enforce_max_length = not max_length is None
         self.max_trains_per_track = max_trains_per_track
+        self.corpus = None
+        self.screen_scenarios = screen_scenarios
+        self.max_screening_attempts = max_screening_attempts
+        self.n_rejected = 0
 
     def initialize(self, engine, scenario_file_string) -> None:
         self.engine = engine
         self.location = engine.get_location()
         self.scenario_file_string = scenario_file_string
 
+    def _load_scenario(self, scenario_file_string) -> Scenario:
+        if self.corpus is not None and scenario_file_string in self.corpus:
+            return self.corpus.get_scenario(scenario_file_string)
+        return self.engine.get_scenario(scenario_file_string)
+
     @abstractmethod
     def generate_scenario(self) -> Scenario:
         pass
@@ -55,11 +69,30 @@ class ScenarioGenerator(ABC):
         pass
 
     def get_scenario(self) -> Scenario:
-        scenario = self.generate_scenario()
-        self.match_trains(scenario)
+        """
+        Generate a scenario. If screen_scenarios is set, scenarios that are infeasible from the start
+        (see Engine.screen_scenario) are rejected and a new one is generated, up to max_screening_attempts times.
+        """
+        for attempt in range(1, self.max_screening_attempts + 1):
+            scenario = self.generate_scenario()
+            self.match_trains(scenario)
+            if not self.screen_scenarios:
+                return scenario
+            result = self.engine.screen_scenario(scenario)
+            if result.feasible:
+                return scenario
+            self.n_rejected += 1
+        warn(
+            "No feasible scenario was generated in {} attempts: {}".format(
+                self.max_screening_attempts, " ".join(result.messages)
+            )
+        )
         return scenario
 
     def match_trains(self, scenario: Scenario) -> None:
+        # The train ids are changed in place, so copy the trains that are shared with other scenarios
+        scenario.detach_incoming_trains()
+        scenario.detach_outgoing_trains()
         if self.match_outgoing_trains:
             incoming = [
                 t
@@ -88,7 +121,7 @@ class ScenarioGeneratorFromFile(ScenarioGenerator):
 
     def initialize(self, engine: Engine, scenario_file_string: str) -> None:
         super().initialize(engine, scenario_file_string)
-        self.scenario = engine.get_scenario(scenario_file_string)
+        self.scenario = self._load_scenario(scenario_file_string)
 
     def generate_scenario(self) -> Scenario:
         return self.scenario
@@ -110,7 +143,7 @@ class ScenarioGeneratorFromScenario(ScenarioGenerator):
 
     def initialize(self, engine, scenario_file: str) -> None:
         super(ScenarioGeneratorFromScenario, self).initialize(engine, scenario_file)
-        self.scenario = engine.get_scenario(scenario_file)
+        self.scenario = self._load_scenario(scenario_file)
         self._set_valid_trains()
         self.max_trains = len(self.valid_trains)
         max_disturbances = len(self.scenario.get_disturbance_list())
@@ -124,6 +157,8 @@ class ScenarioGeneratorFromScenario(ScenarioGenerator):
 
     def _set_valid_trains(self):
         if self.enforce_max_length:
+            self.scenario.detach_incoming_trains()
+            self.scenario.detach_outgoing_trains()
             _match_trains(
                 [
                     t
@@ -509,44 +544,68 @@ class RandomScenarioGenerator(ScenarioGenerator):
 
 
 class ScenarioGeneratorFromFolder(ScenarioGenerator):
-    def __init__(self, subclass, *args, **kwargs):
+    def __init__(self, subclass, *args, cache_size=16, **kwargs):
         super().__init__(*args, **kwargs)
         self.subclass = subclass
         self.args = args
         self.kwargs = kwargs
+        self.cache_size = cache_size
 
     def initialize(self, engine, scenario_file_string) -> None:
         super().initialize(engine, scenario_file_string)
-        self.generators = {}
-        scenarios = []
+        self.generators = OrderedDict()
+        self.scenarios = []
         if isinstance(scenario_file_string, list):
-            scenarios = scenario_file_string
+            self.scenarios = list(scenario_file_string)
         elif os.path.isdir(scenario_file_string):
-            for file in os.listdir(scenario_file_string):
-                scenarios.append(os.path.join(scenario_file_string, file))
+            self.corpus = ScenarioCorpus(
+                engine, scenario_file_string, cache_size=self.cache_size
+            )
+            # The manifest gives an upper bound on the number of trains per scenario
+            min_trains = (
+                self.n_trains
+                if issubclass(self.subclass, ScenarioGeneratorFromScenario)
+                and isinstance(self.n_trains, int)
+                else None
+            )
+            self.scenarios = self.corpus.filter(min_trains=min_trains)
         elif os.path.isfile(scenario_file_string):
-            scenarios = [scenario_file_string]
+            self.scenarios = [scenario_file_string]
         else:
             raise NotImplementedError(
                 "No scenarios can be obtained from " + scenario_file_string
             )
-        to_be_deleted = []
-        for scenario in scenarios:
-            self.generators[scenario] = self.subclass(*self.args, **self.kwargs)
-            self.generators[scenario].initialize(self.engine, scenario)
-            if self.generators[scenario].get_max_trains() < self.n_trains:
-                to_be_deleted.append(scenario)
-        for scenario in to_be_deleted:
-            del self.generators[scenario]
 
     def get_max_trains(self):
         return super().get_max_trains()
 
+    def _get_generator(self, scenario):
+        generator = self.generators.get(scenario)
+        if generator is not None:
+            self.generators.move_to_end(scenario)
+            return generator
+        generator = self.subclass(*self.args, **self.kwargs)
+        generator.corpus = self.corpus
+        generator.initialize(self.engine, scenario)
+        if isinstance(self.n_trains, int) and generator.get_max_trains() < self.n_trains:
+            self.scenarios.remove(scenario)
+            return None
+        self.generators[scenario] = generator
+        if len(self.generators) > self.cache_size:
+            self.generators.popitem(last=False)
+        return generator
+
     def generate_scenario(self) -> Scenario:
-        while True:
-            scenario_key = random.choice(list(self.generators.keys()))
-            scenario_gen = self.generators[scenario_key]
-            return scenario_gen.generate_scenario()
+        while len(self.scenarios) > 0:
+            scenario_key = random.choice(self.scenarios)
+            scenario_gen = self._get_generator(scenario_key)
+            if scenario_gen is not None:
+                return scenario_gen.generate_scenario()
+        raise RuntimeError(
+            "No scenario with {} trains can be obtained from {}".format(
+                self.n_trains, self.scenario_file_string
+            )
+        )
 
 
 def _find_matching_train(train, train_list):
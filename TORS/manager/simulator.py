@@ -24,17 +24,22 @@ class Simulator:
     def start(self):
         self.assert_start_conditions()
         self.engine = Simulator.load_engine(str(self.config.data_folder))
+        # Fail sessions as soon as they can no longer succeed, see Engine.feasibility_monitor
+        self.engine.feasibility_monitor = self.config.feasibility_monitor
+        # List one action per class of symmetric actions, see Engine.symmetry_reduction
+        self.engine.symmetry_reduction = self.config.symmetry_reduction
 
     def reset(self):
-        if not self.state is None:
-            self.engine.end_session(self.state)
         del self.scenario
 
         self.scenario = self.scenario_generator.get_scenario()
         if self.config.verbose >= 1:
             self.scenario.print_scenario_info()
-        self.state = self.engine.start_session(self.scenario)
-        self.engine.step(self.state)
+        if self.state is None:
+            self.state = self.engine.start_session(self.scenario)
+            self.engine.step(self.state)
+        else:
+            self.engine.reset_session(self.state, self.scenario)
         self.result = 0
         if self.config.verbose >= 2:
             self.state.print_state_info()
@@ -91,7 +96,7 @@ class Simulator:
         self.scenario = scenario
 
     def get_result(self):
-        """Get the result of the current state of the simulator"""
+        """Get a live view on the result of the current state of the simulator, see RunResultView"""
         return self.engine.get_result(self.state)
 
     def assert_start_conditions(self):
@@ -112,8 +117,15 @@ class Simulator:
         _module = importlib.import_module(".".join(generator_lst[:-1]))
         _class = getattr(_module, generator_lst[-1])
         if generator_lst[-1] == "ScenarioGeneratorFromFile":
-            return ScenarioGeneratorFromFile(_class)
-        return ScenarioGeneratorFromFolder(_class, n_trains=n_trains)
+            return ScenarioGeneratorFromFile(
+                _class, screen_scenarios=self.config.generator.screen_scenarios
+            )
+        return ScenarioGeneratorFromFolder(
+            _class,
+            n_trains=n_trains,
+            cache_size=self.config.generator.cache_size,
+            screen_scenarios=self.config.generator.screen_scenarios,
+        )
 
 
 def _has_matching_shunting_unit(o_su, sus):
@@ -0,0 +1,36 @@
+from manager.config import AgentConfig
+from planner.search_planner import SearchPlanner
+from pyTORS import State
+from typing import List
+
+
+class AStarPlanner(SearchPlanner):
+    """
+    Deterministic planner that searches a plan of minimum cost with a native weighted A* search (see
+    Engine.astar_search) and replays it (see SearchPlanner). The cost of a plan is the summed duration of its
+    actions, except wait actions, and the search is guided by an admissible lower bound (see LowerBoundTable).
+
+    The agent specific config may contain:
+    weight: the weight of the lower bound, 1.0 gives optimal plans and w > 1 plans within a factor w of the
+        optimum (default 1.0)
+    max_expansions: the maximum number of expanded states per search (default 100000)
+    time_per_search: the maximum number of seconds per search (default 10.0)
+    budget_fraction: the maximum fraction of the remaining time_limit per search (default 0.5)
+    """
+
+    def __init__(self, config: AgentConfig, astar_config: dict):
+        super(AStarPlanner, self).__init__(config, astar_config)
+        self.weight = astar_config.get("weight", 1.0)
+        self.max_expansions = astar_config.get("max_expansions", 100000)
+
+    def search(self, state: State, budget: float) -> List[int]:
+        result = self._engine.astar_search(
+            state, weight=self.weight, max_expansions=self.max_expansions, time_limit=budget
+        )
+        self.logger.debug(
+            f"A* search found a {'complete' if result.complete else 'partial'} plan of {len(result.actions)} actions "
+            f"with cost {result.cost:.0f} and lower bound {result.lower_bound:.0f} in {result.elapsed:.3f}s "
+            f"({result.number_of_expansions} expansions, {result.number_of_generated} generated, "
+            f"{result.expansion_rate:.0f} expansions/s)"
+        )
+        return list(result.actions)
@@ -0,0 +1,45 @@
+from manager.config import AgentConfig
+from planner.search_planner import SearchPlanner
+from pyTORS import State, SearchHeuristic
+from time import perf_counter
+from typing import List
+
+
+class BeamSearchPlanner(SearchPlanner):
+    """
+    Deterministic planner that searches a plan with a native beam search (see Engine.beam_search) and replays it
+    (see SearchPlanner).
+
+    The agent specific config may contain:
+    width: the beam width (default 8)
+    heuristic: the weights of the heuristic, with the keys trains_served, slack, tasks and distance
+        (default see SearchHeuristic)
+    max_depth: the maximum number of actions per search (default 1000)
+    n_threads: the number of expansion threads, or 0 for one per core (default 0)
+    time_per_search: the maximum number of seconds per search (default 10.0)
+    budget_fraction: the maximum fraction of the remaining time_limit per search (default 0.5)
+    """
+
+    def __init__(self, config: AgentConfig, beam_config: dict):
+        super(BeamSearchPlanner, self).__init__(config, beam_config)
+        self.width = beam_config.get("width", 8)
+        self.heuristic = SearchHeuristic(**beam_config.get("heuristic", {}))
+        self.max_depth = beam_config.get("max_depth", 1000)
+        self.n_threads = beam_config.get("n_threads", 0)
+
+    def search(self, state: State, budget: float) -> List[int]:
+        start = perf_counter()
+        result = self._engine.beam_search(
+            state,
+            width=self.width,
+            heuristic=self.heuristic,
+            max_depth=self.max_depth,
+            time_limit=budget,
+            n_threads=self.n_threads,
+        )
+        self.logger.debug(
+            f"Beam search found a {'complete' if result.complete else 'partial'} plan of {len(result.actions)} actions "
+            f"with score {result.score:.3f} in {perf_counter() - start:.3f}s "
+            f"({result.number_of_expansions} expansions, {result.number_of_duplicates} duplicates)"
+        )
+        return list(result.actions)
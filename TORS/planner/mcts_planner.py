@@ -0,0 +1,208 @@
+from manager.config import AgentConfig
+from planner.planner import Planner
+from pyTORS import (
+    State,
+    Action,
+    RolloutPolicy,
+    ScenarioFailedError,
+    InvalidActionError,
+)
+from time import perf_counter
+from typing import List, Optional
+import math
+
+
+class MCTSPlanner(Planner):
+    """
+    Monte Carlo Tree Search over the valid actions of the engine.
+
+    Every node in the tree is identified by the indices of the valid actions that lead to it from the current state.
+    The state of a node is rebuilt in a scratch session by copying the current session and applying these actions.
+    Leaves are evaluated with native rollouts (see Engine.rollout), which are played in parallel on all cores.
+    The subtree of the chosen action is kept for the next call of get_action.
+
+    The agent specific config may contain:
+    exploration: the UCT exploration constant (default 0.5)
+    policy: the rollout policy, one of Random, Greedy or Mix (default Mix)
+    rollouts: the number of rollouts per evaluated leaf (default 16)
+    max_steps: the maximum number of actions per rollout (default 1000)
+    n_threads: the number of rollout threads, or 0 for one per core (default 0)
+    iterations: the maximum number of iterations per decision (default 500)
+    time_per_action: the maximum number of seconds per decision (default 1.0)
+    budget_fraction: the maximum fraction of the remaining time_limit per decision (default 0.05)
+    """
+
+    def __init__(self, config: AgentConfig, mcts_config: dict):
+        super(MCTSPlanner, self).__init__(config)
+        self.exploration = mcts_config.get("exploration", 0.5)
+        self.policy = RolloutPolicy.__members__[mcts_config.get("policy", "Mix")]
+        self.rollouts = mcts_config.get("rollouts", 16)
+        self.max_steps = mcts_config.get("max_steps", 1000)
+        self.n_threads = mcts_config.get("n_threads", 0)
+        self.iterations = mcts_config.get("iterations", 500)
+        self.time_per_action = mcts_config.get("time_per_action", 1.0)
+        self.budget_fraction = mcts_config.get("budget_fraction", 0.05)
+        self._scratch = None
+        self.reset()
+
+    def initialize(self, engine, location):
+        self._end_scratch()
+        super(MCTSPlanner, self).initialize(engine, location)
+
+    def get_action(self, state: State) -> Optional[Action]:
+        start = perf_counter()
+        if self.deadline is None and self.time_limit != -1:
+            self.deadline = start + self.time_limit
+        actions = self.get_valid_actions(state)
+        if len(actions) == 0:
+            return None
+        if len(actions) == 1:
+            self.root = None
+            return actions[0]
+        if self._scratch is None:
+            self._scratch = self._engine.copy_session(state)
+        self._set_root(state, len(actions))
+
+        end = start + self._get_budget()
+        iterations = 0
+        while iterations < self.iterations and (iterations == 0 or perf_counter() < end):
+            self._iterate(state)
+            iterations += 1
+
+        best = max(self.root.children, key=lambda child: (child.visits, child.get_mean()))
+        self.logger.debug(
+            f"{iterations} iterations in {perf_counter() - start:.3f}s, "
+            f"chose action {best.index} with {best.visits} visits and mean score {best.get_mean():.3f}"
+        )
+        self.root = best
+        self.root.parent = None
+        return actions[best.index]
+
+    def reset(self):
+        self.root = None
+        self.deadline = None
+
+    def close(self):
+        self._end_scratch()
+        self.root = None
+
+    def _end_scratch(self):
+        if self._scratch is not None:
+            self._engine.end_session(self._scratch)
+            self._scratch = None
+
+    def _get_budget(self) -> float:
+        """Get the number of seconds for the next decision"""
+        budget = self.time_per_action
+        if self.deadline is not None:
+            budget = min(budget, max(0.0, self.deadline - perf_counter()) * self.budget_fraction)
+        return budget
+
+    def _set_root(self, state: State, n_actions: int):
+        """Reuse the subtree of the previous decision if it describes the given state, otherwise start a new tree"""
+        plan_length = len(self._engine.get_result(state))
+        root = self.root
+        if (
+            root is None
+            or root.terminal
+            or root.time != state.time
+            or root.plan_length != plan_length
+            or root.n_actions != n_actions
+        ):
+            root = _Node(None, -1)
+            root.expand(n_actions, state.time, plan_length, self.random)
+        self.root = root
+
+    def _iterate(self, state: State):
+        """Select a leaf with UCT, expand it, evaluate it with rollouts and backpropagate the score"""
+        node = self.root
+        while not node.terminal and len(node.untried) == 0:
+            node = max(node.children, key=lambda child: child.get_uct(node.visits, self.exploration))
+        if node.terminal:
+            node.backpropagate(node.score)
+            return
+        self._copy_state(state, node)
+        # The child is only added to the tree once it is evaluated, so that an exception leaves the tree unchanged
+        child = _Node(node, node.untried[-1])
+        try:
+            self._engine.apply_action_by_index(self._scratch, child.index)
+            self._engine.step(self._scratch)
+        except (ScenarioFailedError, InvalidActionError):
+            child.set_terminal(0.0)
+            node.add_child(child)
+            child.backpropagate(0.0)
+            return
+        n_actions = len(self._engine.get_valid_actions(self._scratch))
+        child.expand(n_actions, self._scratch.time, len(self._engine.get_result(self._scratch)), self.random)
+        result = self._engine.rollout(
+            self._scratch,
+            self.policy,
+            n=self.rollouts,
+            seed=self.random.randrange(2**31),
+            max_steps=self.max_steps,
+            n_threads=self.n_threads,
+        )
+        if n_actions == 0:
+            child.set_terminal(result.mean_score)
+        node.add_child(child)
+        child.backpropagate(result.mean_score)
+
+    def _copy_state(self, state: State, node: "_Node"):
+        """Bring the scratch session to the state of the given node"""
+        path = []
+        while node.parent is not None:
+            path.append(node.index)
+            node = node.parent
+        self._engine.copy_session(state, self._scratch)
+        for index in reversed(path):
+            self._engine.apply_action_by_index(self._scratch, index)
+            self._engine.step(self._scratch)
+
+
+class _Node:
+    __slots__ = ("parent", "index", "children", "untried", "visits", "total", "terminal", "score",
+                 "time", "plan_length", "n_actions")
+
+    def __init__(self, parent: Optional["_Node"], index: int):
+        self.parent = parent
+        self.index = index
+        self.children: List[_Node] = []
+        self.untried: List[int] = []
+        self.visits = 0
+        self.total = 0.0
+        self.terminal = False
+        self.score = 0.0
+        self.time = -1
+        self.plan_length = -1
+        self.n_actions = 0
+
+    def expand(self, n_actions: int, time: int, plan_length: int, random):
+        self.untried = list(range(n_actions))
+        random.shuffle(self.untried)
+        self.time = time
+        self.plan_length = plan_length
+        self.n_actions = n_actions
+
+    def add_child(self, child: "_Node"):
+        self.untried.remove(child.index)
+        self.children.append(child)
+
+    def set_terminal(self, score: float):
+        self.terminal = True
+        self.score = score
+        self.untried = []
+
+    def get_mean(self) -> float:
+        return self.total / self.visits if self.visits > 0 else 0.0
+
+    def get_uct(self, parent_visits: int, exploration: float) -> float:
+        if self.visits == 0:
+            return math.inf
+        return self.get_mean() + exploration * math.sqrt(math.log(parent_visits) / self.visits)
+
+    def backpropagate(self, score: float):
+        node = self
+        while node is not None:
+            node.visits += 1
+            node.total += score
+            node = node.parent
@@ -0,0 +1,97 @@
+from pyTORS import Engine, State, RolloutPolicy, ScenarioFailedError
+from typing import Callable, List, Optional, Sequence
+import multiprocessing
+import os
+
+# The Engine, the evaluation function and the State of a worker process
+_engine = None
+_evaluate = None
+_state = None
+
+
+def rollout_score(
+    engine: Engine, state: State, policy: str = "Mix", n: int = 16, seed: int = 0, max_steps: int = 1000
+) -> float:
+    """
+    Score the state by the mean score of n native rollouts (see Engine.rollout) that are played in this process.
+    Use functools.partial to change the parameters, e.g. partial(rollout_score, policy="Greedy").
+    """
+    result = engine.rollout(
+        state, RolloutPolicy.__members__[policy], n=n, seed=seed, max_steps=max_steps, n_threads=1
+    )
+    return result.mean_score
+
+
+def _init_worker(data_folder: str, evaluate: Callable[[Engine, State], float]):
+    global _engine, _evaluate
+    _engine = Engine(data_folder)
+    _evaluate = evaluate
+
+
+def _evaluate_action(session: bytes, index: int, symmetry_reduction: bool, feasibility_monitor: bool) -> float:
+    global _state
+    # Use the settings of the caller's engine, so the valid actions and their indices match
+    _engine.symmetry_reduction = symmetry_reduction
+    _engine.feasibility_monitor = feasibility_monitor
+    # Load the snapshot in the session of the previous task
+    _state = _engine.load_state(session, _state)
+    action = _engine.get_valid_actions(_state)[index]
+    try:
+        _engine.apply_action_and_step(_state, action)
+    except ScenarioFailedError:
+        return float("-inf")
+    return _evaluate(_engine, _state)
+
+
+class ParallelEvaluator:
+    """
+    Evaluate the valid actions of a state in a pool of worker processes.
+
+    Every worker holds its own Engine for the same data folder, which is loaded once when the pool starts. To
+    evaluate the actions of a state, a snapshot of the state is sent to the workers (see Engine.save_state), which
+    load it (see Engine.load_state), apply one of the actions and score the resulting state with the evaluation
+    function. If the session fails by the action, its score is -inf. The evaluation function is called with the
+    Engine and the State of the worker, and must be picklable (a module level function or a functools.partial of
+    one).
+
+    The workers use the business rules and pruning rules of the config in the data folder, so the engine that is
+    passed to evaluate should use the same, or else the action indices do not match. The symmetry reduction and
+    feasibility monitor settings of that engine are sent with every evaluation.
+    """
+
+    def __init__(
+        self,
+        data_folder: str,
+        evaluate: Callable[[Engine, State], float] = rollout_score,
+        n_workers: Optional[int] = None,
+    ):
+        self.n_workers = n_workers if n_workers is not None else os.cpu_count()
+        self._pool = multiprocessing.Pool(
+            self.n_workers, initializer=_init_worker, initargs=(data_folder, evaluate)
+        )
+
+    def evaluate(self, engine: Engine, state: State, actions: Optional[Sequence[int]] = None) -> List[float]:
+        """
+        Get the score of the given actions in the state, as indices of the valid actions (see Engine.get_valid_actions),
+        or of all the valid actions if actions is None
+        """
+        if actions is None:
+            actions = range(len(engine.get_valid_actions(state)))
+        session = engine.save_state(state)
+        settings = (engine.symmetry_reduction, engine.feasibility_monitor)
+        return self._pool.starmap(
+            _evaluate_action, [(session, index) + settings for index in actions], chunksize=1
+        )
+
+    def close(self):
+        """Stop the worker processes"""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
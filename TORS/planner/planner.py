@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 import random
+import numpy as np
 from pyTORS import Engine, InvalidActionError, State, Action, SimpleAction, Location
 from typing import Union, List, Tuple, Optional
 from manager.config import AgentConfig
@@ -53,6 +54,14 @@ class Planner(ABC):
         """
         return self._engine.get_valid_actions(state)
 
+    def get_valid_action_table(self, state: State) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return a tuple (table, train_ids) describing all the valid actions in the given state, with
+        table: a structured array with one row per action, in the order of get_valid_actions
+        train_ids: the train ids of the actions, see the train_offset and train_count columns of table
+        """
+        return self._engine.get_valid_action_table(state)
+
     def is_valid_action(
         self, state: State, action: Union[Action, SimpleAction]
     ) -> Tuple[bool, str]:
@@ -63,6 +72,16 @@ class Planner(ABC):
         """
         return self._engine.is_valid_action(state, action)
 
+    def validate_many(
+        self, state: State, actions: List[SimpleAction], return_reasons: bool = False
+    ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Return a boolean mask with the validity of all the simple actions in the given state.
+        If return_reasons is true, return a tuple (mask, reasons), with
+        reasons: a ValidationCode for every action, or k > 0 if the action violates business rule k-1
+        """
+        return self._engine.validate_many(state, actions, return_reasons)
+
     def generate_action(self, state: State, action: SimpleAction) -> Action:
         """
         Generate an Action from the simple action in the given state
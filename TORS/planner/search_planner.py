@@ -0,0 +1,59 @@
+from abc import abstractmethod
+from manager.config import AgentConfig
+from planner.planner import Planner
+from pyTORS import State, Action
+from time import perf_counter
+from typing import List, Optional
+
+
+class SearchPlanner(Planner):
+    """
+    Abstract base class for planners that search a plan with a native search and replay it.
+
+    The plan consists of indices of valid actions. It is replayed one action per call of get_action, so the
+    Manager applies and records every action as usual. A new search is started from the current state if the
+    state no longer matches the plan, or if the previous search did not find a complete plan and its actions
+    have been replayed.
+
+    The agent specific config may contain:
+    time_per_search: the maximum number of seconds per search (default 10.0)
+    budget_fraction: the maximum fraction of the remaining time_limit per search (default 0.5)
+    """
+
+    def __init__(self, config: AgentConfig, search_config: dict):
+        super(SearchPlanner, self).__init__(config)
+        self.time_per_search = search_config.get("time_per_search", 10.0)
+        self.budget_fraction = search_config.get("budget_fraction", 0.5)
+        self.reset()
+
+    def get_action(self, state: State) -> Optional[Action]:
+        start = perf_counter()
+        if self.deadline is None and self.time_limit != -1:
+            self.deadline = start + self.time_limit
+        actions = self.get_valid_actions(state)
+        if len(actions) == 0:
+            return None
+        plan_length = len(self._engine.get_result(state))
+        if len(self.plan) == 0 or plan_length != self.plan_length:
+            budget = self.time_per_search
+            if self.deadline is not None:
+                budget = min(budget, max(0.001, (self.deadline - start) * self.budget_fraction))
+            self.plan = self.search(state, budget)
+            self.plan_length = plan_length
+        self.plan_length += 1
+        if len(self.plan) == 0:
+            # Every action fails the session
+            return actions[0]
+        return actions[self.plan.pop(0)]
+
+    @abstractmethod
+    def search(self, state: State, budget: float) -> List[int]:
+        """Search a plan from the given state in at most budget seconds and return the indices of its actions"""
+
+    def reset(self):
+        self.plan = []
+        self.plan_length = -1
+        self.deadline = None
+
+    def close(self):
+        pass
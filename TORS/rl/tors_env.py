@@ -1,22 +1,56 @@
 import gym
 import importlib
+import logging
 from gym import spaces
 from rl.conv import TORSConverter
 from manager.scenario_generator import ScenarioGeneratorFromFolder
 from pyTORS import Engine, Action, ScenarioFailedError, InvalidActionError
 
+
+def get_generator(episode_config):
+    """Get the scenario generator of the episode config. The number of trains (n_trains) is set in the generator config"""
+    generator_str = episode_config.generator['class']
+    generator_lst = generator_str.split('.')
+    _module = importlib.import_module(".".join(generator_lst[:-1]))
+    _class = getattr(_module, generator_lst[-1])
+    config = episode_config.generator.copy()
+    del config['class']
+    if generator_str in episode_config:
+        config.update(episode_config[generator_str])
+    return ScenarioGeneratorFromFolder(_class, **config)
+
+
+def get_converter(agent_config, engine, location):
+    planner = agent_config["class"]
+    if not planner in agent_config:
+        raise ValueError("The configured agent class {} does not have a converter class specified".format(planner))
+    planner_config = agent_config[planner]
+    if not "converter" in planner_config or not "class" in planner_config.converter:
+        raise ValueError("The configured agent class {} does not have a converter class specified".format(planner))
+    converter_str = planner_config.converter['class']
+    converter_lst = converter_str.split('.')
+    _module = importlib.import_module(".".join(converter_lst[:-1]))
+    _class = getattr(_module, converter_lst[-1])
+    config = planner_config.converter.copy()
+    del config['class']
+    if converter_str in planner_config:
+        config.update(planner_config[converter_str])
+    return _class(engine, location, **config)
+
+
 class TORSEnv(gym.Env):
     metadata = {'render.modes': ['human']}
 
     def __init__(self, episode_config, agent_config):
         super(TORSEnv, self).__init__()
-        print("Init Env")
+        self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        self.logger.debug("Init Env")
         self.episode_config = episode_config
         self.agent_config = agent_config
         self.engine = Engine(episode_config['data folder']) 
         self.location = self.engine.get_location()
-        self.number_of_trains = 2
-        self.scenario_generator = self._get_generator(self.number_of_trains)
+        self.number_of_trains = 0
+        self.scenario_generator = self._get_generator()
         self.scenario_generator.initialize(self.engine, episode_config['scenario'])
         self.state = None
         self.scenario = None
@@ -34,21 +68,21 @@ class TORSEnv(gym.Env):
             try:
                 action = self.converter.convert_action(self.state, action)
             except Exception as e:
-                print("Exception in converting action (" + str(action) +  "): ", e)
+                self.logger.debug("Exception in converting action (%s): %s", action, e)
                 reward = 0
                 done=True
         if not done:
             try:
-                print("Applying action " +str(action))
+                self.logger.debug("Applying action %s", action)
                 self.engine.apply_action_and_step(self.state, action)
                 reward -= 0.005
                 pos_actions = self.engine.get_valid_actions(self.state)
             except ScenarioFailedError:
-                print("Scenario failed after action " + str(action))
+                self.logger.debug("Scenario failed after action %s", action)
                 reward = 0
                 done = True
             except InvalidActionError:
-                print("Invalid action " + str(action))
+                self.logger.debug("Invalid action %s", action)
                 reward = 0
                 done = True
         if not done:
@@ -60,70 +94,45 @@ class TORSEnv(gym.Env):
                     for out in self.state.outgoing_trains:
                         n_trains_left += out.shunting_unit.number_of_trains
                     reward = 1.0 - float(n_trains_left) / float(self.number_of_trains)
-                print("End of scenario. Reward: " + str(reward))
+                self.logger.debug("End of scenario. Reward: %s", reward)
         return self.converter.convert_state(self.state), reward, done, info
         
     def reset(self):
-        print("Reset Env")
+        self.logger.debug("Reset Env")
         self._reset()
-        self.engine.step(self.state)
         return self.converter.convert_state(self.state)
         
     def render(self, mode='human'):
         pass
 
     def close (self):
-        print("Close Env")
+        self.logger.debug("Close Env")
         if not self.state is None:
             self.engine.end_session(self.state)
 
 
     def _reset(self):
-        if not self.state is None:
-            self.engine.end_session(self.state)
-            self.state = None
         del self.scenario
-
-        # TODO: Shunting units are stored in incoming and outgoin goals, which are deleted when the scenario is deleted,
-        # and also in the state, which is deleted when the state is deleted.
-
         self.scenario = self.scenario_generator.generate_scenario()
-        self.state = self.engine.start_session(self.scenario)
+        self.number_of_trains = self.scenario.number_of_trains
+        if self.state is None:
+            self.state = self.engine.start_session(self.scenario)
+            self.engine.step(self.state)
+        else:
+            self.engine.reset_session(self.state, self.scenario)
         self.result = 0
 
-    def _get_generator(self, n_trains):
-        generator_str = self.episode_config.generator['class']
-        generator_lst = generator_str.split('.')
-        _module = importlib.import_module(".".join(generator_lst[:-1]))
-        _class = getattr(_module, generator_lst[-1])
-        config = self.episode_config.generator.copy()
-        del config['class']
-        if generator_str in self.episode_config:
-            config.update(self.episode_config[generator_str])
-        return ScenarioGeneratorFromFolder(_class, n_trains=n_trains, **config)
+    def _get_generator(self):
+        return get_generator(self.episode_config)
 
     def _get_converter(self):
-        planner = self.agent_config["class"]
-        if not planner in self.agent_config:
-            raise ValueError("The configured agent class {} does not have a converter class specified".format(planner))
-        planner_config = self.agent_config[planner]
-        if not "converter" in planner_config or not "class" in planner_config.converter:
-            raise ValueError("The configured agent class {} does not have a converter class specified".format(planner))
-        converter_str = planner_config.converter['class']
-        converter_lst = converter_str.split('.')
-        _module = importlib.import_module(".".join(converter_lst[:-1]))
-        _class = getattr(_module, converter_lst[-1])
-        config = planner_config.converter.copy()
-        del config['class']
-        if converter_str in planner_config:
-            config.update(planner_config[converter_str])
-        return _class(self.engine, self.location, **config)
+        return get_converter(self.agent_config, self.engine, self.location)
 	
     def print(self, text):
     	print(text)
 
     def write_to_file(self, filename):
-        print("Get Result")
+        self.logger.debug("Get Result")
         result = self.engine.get_result(self.state)
-        print("Serialize result")
+        self.logger.debug("Serialize result")
         result.serialize_to_file(self.engine, filename)
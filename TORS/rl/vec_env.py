@@ -0,0 +1,110 @@
+import random
+import numpy as np
+from gym import spaces
+from stable_baselines3.common.vec_env import VecEnv
+from rl.tors_env import get_generator, get_converter
+from pyTORS import Engine, SessionBatch
+
+
+class TORSVecEnv(VecEnv):
+    """
+    Vectorized TORS environment with n_envs sessions on one shared engine.
+
+    All sessions are stepped in a single native call (see pyTORS.SessionBatch) that releases the GIL
+    and divides the sessions over n_threads threads (0 for one per core). The observations, rewards,
+    dones and action masks are written into preallocated arrays. Two sets of arrays are used in turn,
+    so the arrays returned by a step stay valid during the next step, but not longer.
+
+    Finished sessions are reset with a new scenario from the scenario generator. Their last observation
+    is stored in the info dict as 'terminal_observation'. The rewards are the same as in TORSEnv.
+    The converter should have a featurizer, like TORSConverter.
+    """
+
+    def __init__(self, episode_config, agent_config, n_envs=8, n_threads=0):
+        self.episode_config = episode_config
+        self.agent_config = agent_config
+        self.engine = Engine(episode_config['data folder'])
+        self.location = self.engine.get_location()
+        self.scenario_generator = get_generator(episode_config)
+        self.scenario_generator.initialize(self.engine, episode_config['scenario'])
+        self.converter = get_converter(agent_config, self.engine, self.location)
+        featurizer = self.converter.featurizer
+        self.batch = SessionBatch(self.engine, featurizer, n_envs, n_threads=n_threads)
+        self.scenarios = [None] * n_envs
+        self.actions = np.zeros(n_envs, dtype=np.int64)
+        self.buffers = [self._make_buffers(n_envs, featurizer.n_actions) for _ in range(2)]
+        self.current = 0
+        observation_space = spaces.Box(low=0, high=1, shape=(self.batch.observation_size,), dtype=np.float32)
+        action_space = spaces.Discrete(featurizer.n_actions)
+        super(TORSVecEnv, self).__init__(n_envs, observation_space, action_space)
+
+    def _make_buffers(self, n_envs, n_actions):
+        obs = np.zeros((n_envs, self.batch.observation_size), dtype=np.float32)
+        rewards = np.zeros(n_envs, dtype=np.float32)
+        dones = np.zeros(n_envs, dtype=bool)
+        masks = np.zeros((n_envs, n_actions), dtype=bool)
+        return obs, rewards, dones, masks
+
+    def reset(self):
+        obs, _, _, masks = self.buffers[self.current]
+        for i in range(self.num_envs):
+            self._reset_session(i, obs, masks)
+        return obs
+
+    def step_async(self, actions):
+        self.actions[:] = actions
+
+    def step_wait(self):
+        self.current = 1 - self.current
+        obs, rewards, dones, masks = self.buffers[self.current]
+        self.batch.step(self.actions, obs, rewards, dones, masks)
+        infos = [{} for _ in range(self.num_envs)]
+        for i in np.flatnonzero(dones):
+            infos[i]['terminal_observation'] = obs[i].copy()
+            self._reset_session(i, obs, masks)
+        return obs, rewards, dones, infos
+
+    def action_masks(self):
+        """Get the masks of the valid actions of all sessions"""
+        return self.buffers[self.current][3]
+
+    def close(self):
+        # End the sessions before their scenarios are deleted
+        self.batch = None
+        self.scenarios = []
+
+    def seed(self, seed=None):
+        random.seed(seed)
+        return [seed] * self.num_envs
+
+    def get_attr(self, attr_name, indices=None):
+        """Get the scenario or state of the sessions"""
+        if attr_name == 'scenario':
+            return [self.scenarios[i] for i in self._get_indices(indices)]
+        if attr_name == 'state':
+            return [self.batch.get_state(i) for i in self._get_indices(indices)]
+        raise NotImplementedError("The sessions of TORSVecEnv have no attribute '{}'".format(attr_name))
+
+    def set_attr(self, attr_name, value, indices=None):
+        raise NotImplementedError("The attributes of the sessions of TORSVecEnv cannot be set")
+
+    def env_method(self, method_name, *method_args, indices=None, **method_kwargs):
+        """Call action_masks or write_to_file for the sessions"""
+        if method_name == 'action_masks':
+            masks = self.action_masks()
+            return [masks[i] for i in self._get_indices(indices)]
+        if method_name == 'write_to_file':
+            return [self.write_to_file(i, *method_args, **method_kwargs) for i in self._get_indices(indices)]
+        raise NotImplementedError("The sessions of TORSVecEnv have no method '{}'".format(method_name))
+
+    def env_is_wrapped(self, wrapper_class, indices=None):
+        return [False for _ in self._get_indices(indices)]
+
+    def write_to_file(self, index, filename):
+        result = self.engine.get_result(self.batch.get_state(index))
+        result.serialize_to_file(self.engine, filename)
+
+    def _reset_session(self, index, obs, masks):
+        scenario = self.scenario_generator.generate_scenario()
+        self.batch.reset(index, scenario, obs, masks)
+        self.scenarios[index] = scenario
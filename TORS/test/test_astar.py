@@ -0,0 +1,37 @@
+from pathlib import Path
+
+from manager.config import AgentConfig
+from planner.astar_planner import AStarPlanner
+from pyTORS import Engine, LowerBoundTable
+
+TWO_TRACK = Path(__file__).resolve().parents[2] / "data" / "TwoTrack"
+
+
+def test_astar_search():
+    engine = Engine(str(TWO_TRACK))
+    scenario = engine.get_scenario(str(TWO_TRACK / "scenario.json"))
+    state = engine.start_session(scenario)
+    engine.step(state)
+    bound = LowerBoundTable(engine, scenario).get_lower_bound(state)
+    result = engine.astar_search(state)
+    assert result.complete
+    assert bound <= result.lower_bound == result.cost
+    assert result.number_of_expansions <= result.number_of_generated + 1
+    engine.end_session(state)
+
+
+def test_astar_planner():
+    engine = Engine(str(TWO_TRACK))
+    state = engine.start_session(engine.get_scenario(str(TWO_TRACK / "scenario.json")))
+    engine.step(state)
+    config = AgentConfig(seed=1, verbose=0)
+    planner = AStarPlanner(config, {"weight": 2.0, "max_expansions": 1000})
+    planner.initialize(engine, engine.get_location())
+    while engine.is_state_active(state):
+        action = planner.get_action(state)
+        if action is None:
+            break
+        engine.apply_action_and_step(state, action)
+    planner.close()
+    assert len(state.incoming_trains) == 0 and len(state.outgoing_trains) == 0
+    engine.end_session(state)
@@ -0,0 +1,25 @@
+from pathlib import Path
+
+from manager.config import AgentConfig
+from planner.beam_planner import BeamSearchPlanner
+from pyTORS import Engine
+
+TWO_TRACK = Path(__file__).resolve().parents[2] / "data" / "TwoTrack"
+
+
+def test_beam_search_planner():
+    engine = Engine(str(TWO_TRACK))
+    state = engine.start_session(engine.get_scenario(str(TWO_TRACK / "scenario.json")))
+    engine.step(state)
+    config = AgentConfig(seed=1, verbose=0)
+    planner = BeamSearchPlanner(config, {"width": 4, "heuristic": {"slack": 0.1}, "n_threads": 2})
+    assert planner.heuristic.slack == 0.1
+    planner.initialize(engine, engine.get_location())
+    while engine.is_state_active(state):
+        action = planner.get_action(state)
+        if action is None:
+            break
+        engine.apply_action_and_step(state, action)
+    planner.close()
+    assert len(state.incoming_trains) == 0 and len(state.outgoing_trains) == 0
+    engine.end_session(state)
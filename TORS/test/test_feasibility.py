@@ -0,0 +1,56 @@
+import json
+from pathlib import Path
+
+import pytest
+from pyTORS import Engine, DeadEndError, DeadEndReason, ScenarioFailedError
+from manager.scenario_generator import ScenarioGeneratorFromFile
+
+DEMO = Path(__file__).resolve().parents[2] / "data" / "Demo"
+
+
+def test_feasibility_monitor():
+    engine = Engine(str(DEMO))
+    engine.feasibility_monitor = True
+    assert engine.feasibility_monitor
+    state = engine.start_session(engine.get_scenario(str(DEMO / "scenario.json")))
+    with pytest.raises(DeadEndError) as error:
+        engine.step(state)
+        while engine.is_state_active(state):
+            engine.apply_action_and_step(state, engine.get_valid_actions(state)[0])
+    assert isinstance(error.value, ScenarioFailedError)
+    assert error.value.reason == DeadEndReason.LateDeparture
+    assert state.time < state.end_time
+    engine.end_session(state)
+
+
+def _write_early_departure(tmp_path: Path) -> str:
+    with open(DEMO / "scenario.json") as f:
+        scenario = json.load(f)
+    scenario["out"][0]["time"] = "0"
+    path = tmp_path / "early.json"
+    with open(path, "w") as f:
+        json.dump(scenario, f)
+    return str(path)
+
+
+def test_screen_scenario(tmp_path: Path):
+    engine = Engine(str(DEMO))
+    assert engine.screen_scenario(engine.get_scenario(str(DEMO / "scenario.json"))).feasible
+    result = engine.screen_scenario(engine.get_scenario(_write_early_departure(tmp_path)))
+    assert not result
+    assert DeadEndReason.LateDeparture in result.reasons
+    assert len(result.messages) == len(result.reasons)
+
+
+def test_generator_screening(tmp_path: Path):
+    engine = Engine(str(DEMO))
+    generator = ScenarioGeneratorFromFile(screen_scenarios=True, max_screening_attempts=3)
+    generator.initialize(engine, str(DEMO / "scenario.json"))
+    generator.get_scenario()
+    assert generator.n_rejected == 0
+
+    generator = ScenarioGeneratorFromFile(screen_scenarios=True, max_screening_attempts=3)
+    generator.initialize(engine, _write_early_departure(tmp_path))
+    with pytest.warns(UserWarning):
+        generator.get_scenario()
+    assert generator.n_rejected == 3
@@ -0,0 +1,83 @@
+import gc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from pyTORS import Engine, MultiLocationEngine, RolloutPolicy
+
+DEMO = Path(__file__).resolve().parents[2] / "data" / "Demo"
+TWO_TRACK = Path(__file__).resolve().parents[2] / "data" / "TwoTrack"
+
+
+def test_interned_tracks():
+    engine = Engine(str(DEMO))
+    location = engine.get_location()
+    track = location.track_parts[1]
+    assert track is engine.get_location().track_parts[1]
+    assert track is location.get_track_by_index(1)
+    assert all(neighbor is location.track_parts[neighbor.index] for neighbor in track.neighbors)
+    assert {t: t.index for t in location.track_parts}[track] == 1
+    facility = location.facilities[0]
+    assert facility is location.facilities[0]
+    assert facility in set(location.facilities)
+
+
+def test_hash_matches_eq():
+    demo = Engine(str(DEMO)).get_location()
+    two_track = Engine(str(TWO_TRACK)).get_location()
+    for track in demo.track_parts:
+        for other in two_track.track_parts:
+            assert (track == other) <= (hash(track) == hash(other))
+    for facility in demo.facilities:
+        for other in two_track.facilities:
+            assert (facility == other) <= (hash(facility) == hash(other))
+
+
+def test_hashable_shunting_units():
+    engine = Engine(str(DEMO))
+    state = engine.start_session(engine.get_scenario(str(DEMO / "scenario.json")))
+    engine.step(state)
+    engine.apply_action_and_step(state, engine.get_valid_actions(state)[0])
+    shunting_units = set(state.shunting_units)
+    assert len(shunting_units) == len(state.shunting_units)
+    assert all(su in shunting_units for su in state.shunting_units)
+    engine.end_session(state)
+
+
+def test_location_kept_alive():
+    engine = MultiLocationEngine()
+    scenario = engine.get_scenario(str(DEMO), str(DEMO / "scenario.json"))
+    location = engine.get_location(str(DEMO))
+    engine.get_location_engine(str(TWO_TRACK))
+    engine.set_memory_budget(1)
+    assert engine.get_loaded_locations() == [str(DEMO)]
+    assert len(location.track_parts) > 0
+    state = engine.start_session(str(DEMO), scenario)
+    engine.end_session(state)
+    del scenario, location
+    engine.set_memory_budget(1)
+    assert engine.get_loaded_locations() == []
+
+
+def test_concurrent_multi_location_rollouts():
+    engine = MultiLocationEngine()
+    states = []
+    for folder in [DEMO, TWO_TRACK]:
+        state = engine.start_session(str(folder), engine.get_scenario(str(folder), str(folder / "scenario.json")))
+        engine.step(state)
+        states.append(state)
+    rollout = lambda state: engine.rollout(state, RolloutPolicy.Random, n=20, seed=1, n_threads=1)
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(rollout, states * 4))
+    assert [r.mean_score for r in results[:2]] * 4 == [r.mean_score for r in results]
+    for state in states:
+        engine.end_session(state)
+
+
+def test_csr_outlives_engine():
+    engine = Engine(str(DEMO))
+    graph = engine.get_location().graph
+    csr = engine.get_location().to_csr()
+    del engine
+    gc.collect()
+    assert csr["indptr"][-1] == len(csr["indices"])
+    assert (graph.to_csr()["indices"] == csr["indices"]).all()
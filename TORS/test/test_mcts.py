@@ -0,0 +1,71 @@
+import math
+from pathlib import Path
+
+import pytest
+
+from manager.config import AgentConfig
+from planner.mcts_planner import MCTSPlanner, _Node
+from pyTORS import Engine
+
+TWO_TRACK = Path(__file__).resolve().parents[2] / "data" / "TwoTrack"
+
+
+def test_copy_session():
+    engine = Engine(str(TWO_TRACK))
+    state = engine.start_session(engine.get_scenario(str(TWO_TRACK / "scenario.json")))
+    engine.step(state)
+    for _ in range(3):
+        engine.apply_action_and_step(state, engine.get_valid_actions(state)[0])
+    copy = engine.copy_session(state)
+    assert copy.time == state.time
+    assert len(engine.get_result(copy)) == len(engine.get_result(state))
+    assert [str(a) for a in engine.get_valid_actions(copy)] == [str(a) for a in engine.get_valid_actions(state)]
+    engine.end_session(copy)
+    engine.end_session(state)
+
+
+def test_mcts_planner():
+    engine = Engine(str(TWO_TRACK))
+    state = engine.start_session(engine.get_scenario(str(TWO_TRACK / "scenario.json")))
+    engine.step(state)
+    config = AgentConfig(seed=1, verbose=0)
+    planner = MCTSPlanner(config, {"iterations": 30, "time_per_action": 0.1, "n_threads": 2})
+    planner.initialize(engine, engine.get_location())
+    while engine.is_state_active(state):
+        action = planner.get_action(state)
+        if action is None:
+            break
+        engine.apply_action_and_step(state, action)
+    planner.close()
+    assert len(state.incoming_trains) == 0 and len(state.outgoing_trains) == 0
+    engine.end_session(state)
+
+
+class _FailingRollouts:
+    """An engine of which the rollouts fail"""
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    def __getattr__(self, name):
+        return getattr(self.engine, name)
+
+    def rollout(self, *args, **kwargs):
+        raise RuntimeError("rollout failed")
+
+
+def test_failed_rollout_leaves_tree_unchanged():
+    assert _Node(None, 0).get_uct(1, 1.0) == math.inf
+    engine = Engine(str(TWO_TRACK))
+    state = engine.start_session(engine.get_scenario(str(TWO_TRACK / "scenario.json")))
+    engine.step(state)
+    while len(engine.get_valid_actions(state)) < 2:
+        engine.apply_action_and_step(state, engine.get_valid_actions(state)[0])
+    planner = MCTSPlanner(AgentConfig(seed=1, verbose=0), {"iterations": 5})
+    planner.initialize(_FailingRollouts(engine), engine.get_location())
+    with pytest.raises(RuntimeError):
+        planner.get_action(state)
+    assert planner.root.children == []
+    assert len(planner.root.untried) == len(engine.get_valid_actions(state))
+    planner.close()
+    engine.end_session(state)
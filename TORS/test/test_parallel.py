@@ -0,0 +1,71 @@
+import json
+from functools import partial
+from pathlib import Path
+
+from pyTORS import Engine
+from planner.parallel_evaluator import ParallelEvaluator, rollout_score
+
+TWO_TRACK = str(Path(__file__).resolve().parents[2] / "data" / "TwoTrack")
+
+
+def _write_symmetric_scenario(tmp_path: Path) -> str:
+    # Two interchangeable units arrive at the same time on the same track, see test_symmetry
+    with open(TWO_TRACK + "/scenario.json") as f:
+        scenario = json.load(f)
+    scenario["in"][1]["time"] = scenario["in"][0]["time"]
+    scenario["in"][1]["members"][0].update(id="2423", typeDisplayName="SLT4")
+    for outgoing in scenario["out"]:
+        outgoing["members"][0].update(id="****", typeDisplayName="SLT4")
+    path = tmp_path / "symmetric.json"
+    with open(path, "w") as f:
+        json.dump(scenario, f)
+    return str(path)
+
+
+def _reduction_score(engine: Engine, state) -> float:
+    return float(engine.symmetry_reduction)
+
+
+def _start(engine: Engine):
+    state = engine.start_session(engine.get_scenario(TWO_TRACK + "/scenario.json"))
+    engine.step(state)
+    engine.apply_action_and_step(state, engine.get_valid_actions(state)[0])
+    return state
+
+
+def test_restore_session(tmp_path):
+    engine = Engine(TWO_TRACK)
+    state = _start(engine)
+    engine.get_result(state).serialize_to_file(engine, str(tmp_path / "run.json"))
+    restored = engine.restore_session(engine.import_result(str(tmp_path / "run.json")))
+    assert restored.time == state.time
+    assert restored.fingerprint == state.fingerprint
+    assert [str(a) for a in engine.get_valid_actions(restored)] == [str(a) for a in engine.get_valid_actions(state)]
+    engine.end_session(restored)
+    engine.end_session(state)
+
+
+def test_parallel_evaluator():
+    engine = Engine(TWO_TRACK)
+    state = _start(engine)
+    n_actions = len(engine.get_valid_actions(state))
+    evaluate = partial(rollout_score, policy="Greedy", n=2)
+    with ParallelEvaluator(TWO_TRACK, evaluate, n_workers=2) as evaluator:
+        scores = evaluator.evaluate(engine, state)
+        assert len(scores) == n_actions
+        assert evaluator.evaluate(engine, state, [n_actions - 1, 0]) == [scores[-1], scores[0]]
+    # The session of the state is not changed
+    assert len(engine.get_valid_actions(state)) == n_actions
+    engine.end_session(state)
+
+
+def test_parallel_evaluator_symmetry_reduction(tmp_path):
+    engine = Engine(TWO_TRACK)
+    state = engine.start_session(engine.get_scenario(_write_symmetric_scenario(tmp_path)))
+    engine.step(state)
+    with ParallelEvaluator(TWO_TRACK, _reduction_score, n_workers=2) as evaluator:
+        assert evaluator.evaluate(engine, state) == [0.0, 0.0]
+        # The workers list the same reduced actions as the engine
+        engine.symmetry_reduction = True
+        assert evaluator.evaluate(engine, state) == [1.0]
+    engine.end_session(state)
@@ -0,0 +1,55 @@
+import json
+import random
+from pathlib import Path
+
+from pyTORS import Engine, ExitAction, ScenarioFailedError, WaitAction
+
+TWO_TRACK = Path(__file__).resolve().parents[2] / "data" / "TwoTrack"
+
+
+def _write_config(tmp_path: Path) -> str:
+    with open(TWO_TRACK / "config.json") as f:
+        config = json.load(f)
+    for rule in config["pruning_rules"]["rules"].values():
+        rule["on"] = True
+    with open(tmp_path / "config.json", "w") as f:
+        json.dump(config, f)
+    return str(tmp_path)
+
+
+def test_pruning_rules(tmp_path: Path):
+    engine = Engine(str(TWO_TRACK))
+    pruned_engine = Engine(str(TWO_TRACK), _write_config(tmp_path))
+    assert engine.pruning_rule_names == []
+    assert set(pruned_engine.pruning_rule_names) == {
+        "wait_at_departure_rule",
+        "exit_order_move_rule",
+        "fastest_route_rule",
+    }
+    scenario = engine.get_scenario(str(TWO_TRACK / "scenario.json"))
+    random.seed(3)
+    n_pruned = 0
+    for _ in range(20):
+        state = engine.start_session(scenario)
+        pruned_state = pruned_engine.start_session(scenario)
+        engine.step(state)
+        pruned_engine.step(pruned_state)
+        while engine.is_state_active(state):
+            valid = engine.get_valid_actions(state)
+            actions = [str(a) for a in valid]
+            pruned = pruned_engine.get_valid_actions(pruned_state)
+            if len(pruned) == 0:
+                break
+            assert set(str(a) for a in pruned) <= set(actions)
+            n_pruned += len(actions) - len(pruned)
+            if any(isinstance(a, ExitAction) and a.outgoing.time <= pruned_state.time for a in pruned):
+                assert not any(isinstance(a, WaitAction) for a in pruned)
+            action = random.choice(pruned)
+            try:
+                engine.apply_action_and_step(state, valid[actions.index(str(action))])
+            except ScenarioFailedError:
+                break
+            pruned_engine.apply_action_and_step(pruned_state, action)
+        engine.end_session(state)
+        pruned_engine.end_session(pruned_state)
+    assert n_pruned > 0
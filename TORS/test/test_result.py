@@ -0,0 +1,49 @@
+from pathlib import Path
+
+import pytest
+
+from pyTORS import Engine
+
+DEMO = Path(__file__).resolve().parents[2] / "data" / "Demo"
+
+
+def test_result_view():
+    engine = Engine(str(DEMO))
+    state = engine.start_session(engine.get_scenario(str(DEMO / "scenario.json")))
+    engine.step(state)
+    result = engine.get_result(state)
+    assert len(result) == 0
+    engine.apply_action_and_step(state, engine.get_valid_actions(state)[0])
+    assert len(result) == 1
+    assert [a.id for a in result] == [a.id for a in result.get_actions()]
+    assert result[-1].id == result[0].id
+    # The POSActions share their action with the RunResult instead of cloning it
+    action = result[0].action
+    assert result[0].action is action and result.get_actions()[0].action is action
+    assert len(result.plan.get_actions()) == 1
+    snapshot = result.snapshot()
+    engine.apply_action_and_step(state, engine.get_valid_actions(state)[0])
+    assert len(result) == 2 and len(snapshot) == 1
+    engine.end_session(state)
+    with pytest.raises(ValueError):
+        len(result)
+    assert snapshot[0].id == snapshot.get_actions()[0].id
+
+
+def test_result_view_of_reused_state():
+    engine = Engine(str(DEMO))
+    scenario = engine.get_scenario(str(DEMO / "scenario.json"))
+    state = engine.start_session(scenario)
+    engine.step(state)
+    engine.apply_action_and_step(state, engine.get_valid_actions(state)[0])
+    result = engine.get_result(state)
+    action = result[0]
+    engine.end_session(state)
+    # A new session may reuse the State of the ended session, but the view does not follow it
+    for _ in range(10):
+        engine.end_session(engine.start_session(scenario))
+    state = engine.start_session(scenario)
+    with pytest.raises(ValueError):
+        len(result)
+    assert action.id >= 0 and str(action.action) != ""
+    engine.end_session(state)
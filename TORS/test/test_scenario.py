@@ -0,0 +1,32 @@
+from pathlib import Path
+
+from pyTORS import Engine, Scenario
+
+DEMO = Path(__file__).resolve().parents[2] / "data" / "Demo"
+
+
+def test_copy_is_independent():
+    engine = Engine(str(DEMO))
+    scenario = engine.get_scenario(str(DEMO / "scenario.json"))
+    incoming = scenario.incoming_trains
+    n_trains = len(incoming[0].shunting_unit.trains)
+    # Reading the trains does not copy them
+    assert scenario.incoming_trains[0] is incoming[0]
+    copy = scenario.get_copy()
+    assert copy.incoming_trains[0] is not incoming[0]
+    copy.incoming_trains[0].shunting_unit.trains = []
+    assert len(scenario.incoming_trains[0].shunting_unit.trains) == n_trains
+
+
+def test_set_trains_of_other_scenario():
+    engine = Engine(str(DEMO))
+    other = engine.get_scenario(str(DEMO / "scenario.json"))
+    scenario = Scenario()
+    scenario.set_outgoing_trains(other.outgoing_trains)
+    scenario.add_incoming_train(other.incoming_trains[0])
+    assert scenario.outgoing_trains[0] is not other.outgoing_trains[0]
+    assert str(scenario.outgoing_trains[0]) == str(other.outgoing_trains[0])
+    kept = scenario.outgoing_trains[1:]
+    scenario.set_outgoing_trains(kept)
+    assert len(scenario.outgoing_trains) == len(kept)
+    assert all(a is b for a, b in zip(scenario.outgoing_trains, kept))
@@ -0,0 +1,72 @@
+import shutil
+from pathlib import Path
+
+import pytest
+from pyTORS import Engine, Scenario
+from manager.scenario_corpus import ScenarioCorpus, MANIFEST_FILE
+from manager.scenario_generator import (
+    ScenarioGeneratorFromFile,
+    ScenarioGeneratorFromFolder,
+)
+
+DEMO = Path(__file__).resolve().parents[2] / "data" / "Demo"
+
+
+def _make_corpus_folder(tmp_path: Path) -> Path:
+    folder = tmp_path / "scenarios"
+    folder.mkdir()
+    shutil.copy(DEMO / "scenario.json", folder / "a.json")
+    shutil.copy(DEMO / "scenario - simple.json", folder / "b.json")
+    return folder
+
+
+def test_manifest(tmp_path: Path):
+    engine = Engine(str(DEMO))
+    folder = _make_corpus_folder(tmp_path)
+    corpus = ScenarioCorpus(engine, str(folder), cache_size=1)
+    assert len(corpus) == 2
+    assert (folder / MANIFEST_FILE).exists()
+    info = corpus.get_info(str(folder / "a.json"))
+    scenario = engine.get_scenario(str(DEMO / "scenario.json"))
+    assert info["n_trains"] == scenario.number_of_trains
+    assert info["end_time"] == scenario.end_time
+    assert len(corpus.filter(min_trains=info["n_trains"] + 1000)) == 0
+
+    # A second corpus reads the manifest instead of the files
+    assert ScenarioCorpus(engine, str(folder)).entries == corpus.entries
+
+
+def test_lazy_lru(tmp_path: Path):
+    engine = Engine(str(DEMO))
+    folder = _make_corpus_folder(tmp_path)
+    corpus = ScenarioCorpus(engine, str(folder), cache_size=1)
+    assert len(corpus.cache) == 0
+    a = corpus.get_scenario(str(folder / "a.json"))
+    assert corpus.get_scenario(str(folder / "a.json")) is a
+    corpus.get_scenario(str(folder / "b.json"))
+    assert list(corpus.cache.keys()) == [str(folder / "b.json")]
+
+
+def test_generator_from_folder(tmp_path: Path):
+    engine = Engine(str(DEMO))
+    folder = _make_corpus_folder(tmp_path)
+    generator = ScenarioGeneratorFromFolder(
+        ScenarioGeneratorFromFile, n_trains=-1, cache_size=1
+    )
+    generator.initialize(engine, str(folder))
+    assert len(generator.generators) == 0
+    for _ in range(5):
+        scenario = generator.get_scenario()
+        assert scenario.number_of_trains > 0
+    assert len(generator.generators) == 1
+
+
+def test_skip_invalid_scenario(tmp_path: Path):
+    engine = Engine(str(DEMO))
+    folder = _make_corpus_folder(tmp_path)
+    (folder / "c.json").write_text('{"businessRules": {"maxTrains": 3}}')
+    with pytest.raises(RuntimeError):
+        Scenario.read_info(str(folder / "c.json"))
+    corpus = ScenarioCorpus(engine, str(folder))
+    assert len(corpus) == 2
+    assert str(folder / "c.json") not in corpus.entries
@@ -0,0 +1,85 @@
+import pickle
+import random
+import shutil
+from pathlib import Path
+
+import pytest
+from pyTORS import Engine, ScenarioFailedError
+
+TWO_TRACK = str(Path(__file__).resolve().parents[2] / "data" / "TwoTrack")
+DEMO = str(Path(__file__).resolve().parents[2] / "data" / "Demo")
+
+
+def _actions(engine: Engine, state):
+    return [str(a) for a in engine.get_valid_actions(state)]
+
+
+def test_save_and_load_state():
+    engine = Engine(TWO_TRACK)
+    state = engine.start_session(engine.get_scenario(TWO_TRACK + "/scenario.json"))
+    engine.step(state)
+    random.seed(5)
+    target = None
+    for _ in range(20):
+        data = engine.save_state(state)
+        assert isinstance(data, bytes)
+        target = engine.load_state(data, target)
+        assert target.time == state.time
+        assert target.fingerprint == state.fingerprint
+        assert _actions(engine, target) == _actions(engine, state)
+        assert engine.save_state(target) == data
+        actions = engine.get_valid_actions(state)
+        if len(actions) == 0:
+            break
+        try:
+            engine.apply_action_and_step(state, random.choice(actions))
+        except ScenarioFailedError:
+            break
+    engine.end_session(target)
+    engine.end_session(state)
+
+
+def test_load_invalid_state():
+    engine = Engine(TWO_TRACK)
+    state = engine.start_session(engine.get_scenario(TWO_TRACK + "/scenario.json"))
+    engine.step(state)
+    data = engine.save_state(state)
+    with pytest.raises(ValueError):
+        engine.load_state(b"not a snapshot")
+    with pytest.raises(ValueError):
+        engine.load_state(data[:-3])
+    with pytest.raises(ValueError):
+        Engine(DEMO).load_state(data)
+    engine.end_session(state)
+
+
+def test_load_state_in_other_folder(tmp_path):
+    engine = Engine(TWO_TRACK)
+    state = engine.start_session(engine.get_scenario(TWO_TRACK + "/scenario.json"))
+    engine.step(state)
+    data = engine.save_state(state)
+    # A copy of the location in another folder is the same location
+    copy = shutil.copytree(TWO_TRACK, str(tmp_path / "TwoTrack"))
+    other = Engine(copy)
+    target = other.load_state(data)
+    assert target.fingerprint == state.fingerprint
+    other.end_session(target)
+    # A location with other contents is not
+    with open(copy + "/location.json", "a") as f:
+        f.write("\n")
+    with pytest.raises(ValueError):
+        Engine(copy).load_state(data)
+    engine.end_session(state)
+
+
+def test_pickle_state():
+    engine = Engine(TWO_TRACK)
+    state = engine.start_session(engine.get_scenario(TWO_TRACK + "/scenario.json"))
+    engine.step(state)
+    engine.apply_action_and_step(state, engine.get_valid_actions(state)[0])
+    restored = pickle.loads(pickle.dumps(state))
+    assert restored is not state
+    assert restored.fingerprint == state.fingerprint
+    assert _actions(engine, restored) == _actions(engine, state)
+    engine.end_session(restored)
+    engine.end_session(state)
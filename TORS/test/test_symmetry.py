@@ -0,0 +1,39 @@
+import json
+from pathlib import Path
+
+from pyTORS import Engine
+
+TWO_TRACK = Path(__file__).resolve().parents[2] / "data" / "TwoTrack"
+
+
+def _write_symmetric_scenario(tmp_path: Path) -> str:
+    # Two interchangeable units without tasks arrive at the same time on the same track
+    with open(TWO_TRACK / "scenario.json") as f:
+        scenario = json.load(f)
+    scenario["in"][1]["time"] = scenario["in"][0]["time"]
+    scenario["in"][1]["members"][0].update(id="2423", typeDisplayName="SLT4")
+    for outgoing in scenario["out"]:
+        outgoing["members"][0].update(id="****", typeDisplayName="SLT4")
+    path = tmp_path / "symmetric.json"
+    with open(path, "w") as f:
+        json.dump(scenario, f)
+    return str(path)
+
+
+def test_symmetry_reduction(tmp_path: Path):
+    engine = Engine(str(TWO_TRACK))
+    state = engine.start_session(engine.get_scenario(_write_symmetric_scenario(tmp_path)))
+    engine.step(state)
+    assert len(engine.get_valid_actions(state)) == 2
+    assert [len(c) for c in engine.get_symmetry_classes(state)] == [1, 1]
+
+    engine.symmetry_reduction = True
+    assert engine.symmetry_reduction
+    actions = engine.get_valid_actions(state)
+    classes = engine.get_symmetry_classes(state)
+    assert len(actions) == 1
+    assert [len(c) for c in classes] == [2]
+    assert str(classes[0][0]) == str(actions[0])
+    engine.apply_action_and_step(state, actions[0])
+    assert len(state.shunting_units) == 1
+    engine.end_session(state)
@@ -0,0 +1,56 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("gym")
+pytest.importorskip("stable_baselines3")
+
+from rl.vec_env import TORSVecEnv
+
+DEMO = Path(__file__).resolve().parents[2] / "data" / "Demo"
+
+
+class _Config(dict):
+    __getattr__ = dict.__getitem__
+
+
+def _configs():
+    generator_class = "manager.scenario_generator.ScenarioGeneratorFromFile"
+    episode_config = _Config({
+        "data folder": str(DEMO),
+        "scenario": str(DEMO / "scenario.json"),
+        "generator": _Config({"class": generator_class}),
+    })
+    agent_config = _Config({
+        "class": "planner.random_planner.RandomPlanner",
+        "planner.random_planner.RandomPlanner": _Config({
+            "converter": _Config({"class": "rl.conv.TORSConverter"}),
+        }),
+    })
+    return episode_config, agent_config
+
+
+def test_step_vec_env():
+    env = TORSVecEnv(*_configs(), n_envs=4, n_threads=2)
+    env.seed(3)
+    rng = np.random.default_rng(3)
+    obs = env.reset()
+    assert obs.shape == (4, env.batch.observation_size)
+    n_done = 0
+    for _ in range(50):
+        masks = env.action_masks()
+        actions = [rng.choice(np.flatnonzero(mask)) if mask.any() else 0 for mask in masks]
+        obs, rewards, dones, infos = env.step(np.array(actions))
+        assert obs.shape == (4, env.batch.observation_size)
+        assert ((rewards >= -1) & (rewards <= 1)).all()
+        for i in np.flatnonzero(dones):
+            assert "terminal_observation" in infos[i]
+        n_done += int(dones.sum())
+    assert n_done > 0
+    masks = env.env_method("action_masks", indices=[1, 3])
+    assert len(masks) == 2 and (masks[1] == env.action_masks()[3]).all()
+    assert env.get_attr("state", indices=[2])[0] is env.batch.get_state(2)
+    with pytest.raises(NotImplementedError):
+        env.env_method("reset")
+    env.close()
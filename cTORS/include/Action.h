@@ -15,6 +15,7 @@ using namespace std;
 class ShuntingUnit;
 class Track;
 class BusinessRule;
+class PruningRule;
 class State;
 
 
@@ -32,6 +33,7 @@ class State;
 class SimpleAction {
 private:
 	vector<int> trainIDs;
+	const ShuntingUnit* su;
 protected:
 	/**
 	 * Return a string representation of the ShuntingUnit that this action is acting on.
@@ -44,12 +46,12 @@ public:
 	/**
 	 * Construct a SimpleAction for the given ShuntingUnit. The Train ids are stored.
 	 */
-	SimpleAction(const ShuntingUnit* su) : trainIDs(su->GetTrainIDs()) {}
+	SimpleAction(const ShuntingUnit* su) : trainIDs(su->GetTrainIDs()), su(su) {}
 	
 	/**
 	 * Construct a SimpleAction for a ShuntingUnit with the given train ids.
 	 */
-	SimpleAction(const vector<int>& trainIDs) : trainIDs(trainIDs) {}
+	SimpleAction(const vector<int>& trainIDs) : trainIDs(trainIDs), su(nullptr) {}
 
 	/**
 	 * Default copy constructor
@@ -60,6 +62,14 @@ public:
 	 * Get the train ids of the ShuntingUnit
 	 */
 	inline const vector<int>& GetTrainIDs() const { return trainIDs; }
+
+	/**
+	 * Get the ShuntingUnit this action was constructed with, or nullptr.
+	 * 
+	 * The handle is only used as a shortcut when resolving the ShuntingUnit in a State,
+	 * see State::ResolveShuntingUnit.
+	 */
+	inline const ShuntingUnit* GetShuntingUnitHandle() const { return su; }
 	
 	/**
 	 * Get a string representation of this action
@@ -147,7 +157,7 @@ public:
 	
 	/** Construct a Service action from the given parameters */
 	Service(const ShuntingUnit* su, const Task& task, const Train& train, const Facility* facility)
-		: Service(su->GetTrainIDs(), task, train, facility->GetID()) {}
+		: SimpleAction(su), task(task), train(train), facilityID(facility->GetID()) {}
 	
 	/** Default copy constructor */
 	Service(const Service& service) = default;
@@ -213,7 +223,7 @@ public:
 	 * some type, with no set id. Therefore the ShuntingUnit in the shunting yard need to 
 	 * be specified seperately.
 	 */
-	Exit(const ShuntingUnit* su, const Outgoing* out) : Exit(su->GetTrainIDs(), out->GetID()) {}
+	Exit(const ShuntingUnit* su, const Outgoing* out) : SimpleAction(su), outgoingID(out->GetID()) {}
 	/** The default copy constructor */
 	Exit(const Exit& exit) = default;
 	/** Get the id of the Outgoing event */
@@ -229,18 +239,23 @@ public:
 class Move : public SimpleAction {
 private:
 	string destinationID;
+	int destinationIndex;
 public:
 	Move() = delete;
 	/** Construct a Move action for the ShuntingUnit described by the train ids to the Track with id destinationID */
-	Move(const vector<int>& trainIDs, string destinationID) : SimpleAction(trainIDs), destinationID(destinationID) {}
+	Move(const vector<int>& trainIDs, string destinationID) : SimpleAction(trainIDs), destinationID(destinationID), destinationIndex(-1) {}
 	/** Construct a Move action for the ShuntingUnit described by the train ids to the destination Track */
-	Move(const vector<int>& trainIDs, const Track* destination) : Move(trainIDs, destination->GetID()) {}
+	Move(const vector<int>& trainIDs, const Track* destination) 
+		: SimpleAction(trainIDs), destinationID(destination->GetID()), destinationIndex(destination->GetIndex()) {}
 	/** Construct a Move action for the ShuntingUnit su to the destination Track */
-	Move(const ShuntingUnit* su, const Track* destination) : Move(su->GetTrainIDs(), destination->GetID()) {}
+	Move(const ShuntingUnit* su, const Track* destination) 
+		: SimpleAction(su), destinationID(destination->GetID()), destinationIndex(destination->GetIndex()) {}
 	/** Default copy constructor */
 	Move(const Move& move) = default;
 	/** Get the id of the destination track */
 	inline const string& GetDestinationID() const { return destinationID; }
+	/** Get the index of the destination track, or -1 if unknown */
+	inline int GetDestinationIndex() const { return destinationIndex; }
 	inline const string toString() const override { return "Move: " + GetTrainsToString() + " to track with id " + destinationID; }
 	inline const string GetGeneratorName() const override { return "move"; }
 	inline const Move* Clone() const override { return new Move(*this); }
@@ -252,6 +267,7 @@ public:
 class MultiMove : public SimpleAction {
 private:
 	vector<string> trackIDs;
+	vector<int> trackIndices;
 public:
 	MultiMove() = delete;
 	/** Construct a MultiMove action for the ShuntingUnit described by the train ids over the given list of Track IDs */
@@ -270,6 +286,8 @@ public:
 	inline const string& GetDestinationID() const { return trackIDs.back(); }
 	/** Get the Track IDs of the route */
 	inline const vector<string>& GetTrackIDs() const {return trackIDs; }
+	/** Get the Track indices of the route, or an empty vector if unknown */
+	inline const vector<int>& GetTrackIndices() const {return trackIndices; }
 	inline const string toString() const override { return "Move: " + GetTrainsToString() + " along path " + Join(trackIDs," - "); }
 	inline const string GetGeneratorName() const override { return "move"; }
 	inline const MultiMove* Clone() const override { return new MultiMove(*this); }
@@ -286,7 +304,7 @@ public:
 	/** Construct a Split action for the ShuntingUnit described by the train ids. Split the ShuntingUnit at the specified index */
 	Split(const vector<int>& trainIDs, const int splitIndex) : SimpleAction(trainIDs), splitIndex(splitIndex) {}
 	/** Construct a Split action for the ShuntingUnit su. Split the ShuntingUnit at the specified index */
-	Split(const ShuntingUnit* su, const int splitIndex) : Split(su->GetTrainIDs(), splitIndex) {}
+	Split(const ShuntingUnit* su, const int splitIndex) : SimpleAction(su), splitIndex(splitIndex) {}
 	/** The default copy constructor */
 	Split(const Split& s) = default;
 	
@@ -320,7 +338,7 @@ public:
 		: SimpleAction(trainIDs), secondTrainIDs(secondTrainIDs) {}
 	/** Construct a Combine action for the two shunting units su and secondShuntingUnit */
 	Combine(const ShuntingUnit* su, const ShuntingUnit* secondShuntingUnit)
-		: Combine(su->GetTrainIDs(), secondShuntingUnit->GetTrainIDs()) {}
+		: SimpleAction(su), secondTrainIDs(secondShuntingUnit->GetTrainIDs()) {}
 	/** Default copy constructor */
 	Combine(const Combine& c) = default;
 	/** Get the IDs of the second ShuntingUnit */
@@ -341,9 +359,46 @@ public:
 	void Start(State* state) const override; \
 	void Finish(State* state) const override; \
 	inline name* Clone() const override { return new name(*this); } \
+	inline ActionKind GetKind() const override { return ActionKind::name; } \
 	const string toString() const override;
 #endif
 
+/**
+ * The kind of an Action, one value per Action subclass
+ */
+enum class ActionKind : int32_t {
+	ArriveAction,    /**< An ArriveAction */
+	ExitAction,      /**< An ExitAction */
+	BeginMoveAction, /**< A BeginMoveAction */
+	EndMoveAction,   /**< An EndMoveAction */
+	MoveAction,      /**< A MoveAction */
+	CombineAction,   /**< A CombineAction */
+	SplitAction,     /**< A SplitAction */
+	ServiceAction,   /**< A ServiceAction */
+	SetbackAction,   /**< A SetbackAction */
+	WaitAction       /**< A WaitAction */
+};
+
+/**
+ * A flat description of an Action, as one row of the valid action table (see LocationEngine::GetValidActionTable).
+ * 
+ * Fields that do not apply to the kind of Action are -1.
+ */
+struct ActionRow {
+	int32_t kind;				/**< The ActionKind of the Action */
+	int32_t shuntingUnit;		/**< The index of the ShuntingUnit in State::GetShuntingUnits (-1 for an ArriveAction) */
+	int32_t trainOffset;		/**< The offset of the ShuntingUnit's train IDs in the train ID array of the table */
+	int32_t trainCount;			/**< The number of train IDs of the ShuntingUnit */
+	int32_t destinationTrack;	/**< The index of the destination Track */
+	int32_t previousTrack;		/**< The index of the previous Track when the ShuntingUnit arrives at its destination */
+	int32_t duration;			/**< The duration of the Action in seconds */
+	int32_t facility;			/**< The ID of the Facility of a ServiceAction */
+	int32_t task;				/**< The index of the Task in State::GetTasksForTrain of a ServiceAction */
+	int32_t train;				/**< The ID of the Train of a ServiceAction */
+	int32_t secondShuntingUnit;	/**< The index of the rear ShuntingUnit of a CombineAction */
+	int32_t splitIndex;			/**< The split index of a SplitAction */
+};
+
 /**
  * The abstract base class for action descriptions.
  * Action describes an action more extensively than SimpleAction.
@@ -354,7 +409,7 @@ public:
 class Action
 {
 private:
-	static int newUID;
+	static atomic<int> newUID;
 protected:
 	const int uid;								/**< The unique id of this Action */
 	const ShuntingUnit* su;						/**< The ShuntingUnit that this Action operates on */
@@ -419,6 +474,11 @@ public:
 	 */
 	virtual const string toString() const = 0;
 
+	/**
+	 * Get the ActionKind of this action.
+	 */
+	virtual ActionKind GetKind() const = 0;
+
 	/**
 	 * Check if two actions are equal by comparing their unique id.
 	 */
@@ -571,14 +631,28 @@ public:
 	 */
 	CombineAction(const ShuntingUnit* frontSU, const ShuntingUnit* rearSU, const ShuntingUnit& combinedSU,
 		const Track* track, int duration, bool inNeutral, int position) :
+		CombineAction(frontSU, rearSU, combinedSU, track, duration, inNeutral, position,
+			frontSU->GetTrainString() + " and " +rearSU->GetTrainString()) {};
+	/**
+	 * Generate a CombineAction from the given parameters, with the given description of the Train%s of the two
+	 * ShuntingUnit%s (see GetShuntingUnitsString)
+	 */
+	CombineAction(const ShuntingUnit* frontSU, const ShuntingUnit* rearSU, const ShuntingUnit& combinedSU,
+		const Track* track, int duration, bool inNeutral, int position, const string& suString) :
 		Action(frontSU, {track}, {}, duration), rearSU(rearSU), combinedSU(combinedSU),
-		inNeutral(inNeutral), position(position), suString(frontSU->GetTrainString() + " and " +rearSU->GetTrainString()) {};
+		inNeutral(inNeutral), position(position), suString(suString) {};
 	/** Get the front ShuntingUnit to be combined */
 	inline const ShuntingUnit* GetFrontShuntingUnit() const { return GetShuntingUnit(); }
 	/** Get the rear ShuntingUnit to be combined */
 	inline const ShuntingUnit* GetRearShuntingUnit() const { return rearSU; }
 	/** Get the combined ShuntingUnit */
 	inline const ShuntingUnit* GetCombinedShuntingUnit() const { return &combinedSU; }
+	/** Returns true iff the combined ShuntingUnit will be in neutral direction */
+	inline bool IsInNeutral() const { return inNeutral; }
+	/** Get the index of the combined ShuntingUnit on the Track */
+	inline int GetPosition() const { return position; }
+	/** Get a description of the Train%s of the two ShuntingUnit%s that are combined */
+	inline const string& GetShuntingUnitsString() const { return suString; }
 	inline const Combine* CreateSimple() const {return new Combine(GetShuntingUnit(), rearSU); }
 	ACTION_OVERRIDE(CombineAction)
 };
@@ -682,10 +756,13 @@ protected:
 	const Location* location; /**< a reference to the Location object */
 	/** Run an initial error check on the action and return the ShuntingUnit from the State */
 	inline const ShuntingUnit* InitialCheck(const State* state, const SimpleAction& action) const {
-		return InitialCheck(state, action.GetTrainIDs());
+		return InitialCheck(state, action.GetTrainIDs(), action.GetShuntingUnitHandle());
 	}
-	/** Run an initial error check on ShuntingUnit described the train IDs and return the ShuntingUnit from the State */
-	const ShuntingUnit* InitialCheck(const State* state, const vector<int>& trainIDs) const;
+	/** 
+	 * Run an initial error check on ShuntingUnit described the train IDs and return the ShuntingUnit from the State.
+	 * If given, the ShuntingUnit handle su is used as a lookup shortcut.
+	 */
+	const ShuntingUnit* InitialCheck(const State* state, const vector<int>& trainIDs, const ShuntingUnit* su = nullptr) const;
 public:
 	ActionGenerator() = delete;
 	ActionGenerator(const ActionGenerator& am) = delete;
@@ -709,10 +786,14 @@ private:
 	unordered_map<string,const ActionGenerator*> generatorMap;
 	vector<const ActionGenerator*> generators;
 	vector<const BusinessRule*> validators;
+	vector<string> validatorNames;
+	vector<const PruningRule*> pruners;
+	vector<string> prunerNames;
 	const Config* config;
 	const Location* location;
 	void AddGenerators();
 	void AddValidators();
+	void AddPruners();
 	void AddGenerator(const string& name, const ActionGenerator* generator);
 public:
 	ActionManager() = delete;
@@ -721,10 +802,11 @@ public:
 	ActionManager(const Config* config, const Location* location) : config(config), location(location) {
 		AddGenerators();
 		AddValidators();
+		AddPruners();
 	}
 	/** Destruct this ActionManager by destructing all its ActionGenerators */
 	~ActionManager();
-	/** Generate valid Action%s given the State and store the result in the out list */
+	/** Generate valid Action%s given the State and store the result in the out list. The active PruningRule%s are applied to the valid Action%s */
 	void Generate(const State* state, list<const Action*>& out) const;
 	/** Get the ActionGenerator based on its name */
 	inline const ActionGenerator* GetGenerator(const string& name) const { return generatorMap.at(name); }
@@ -737,7 +819,15 @@ public:
 	 * 2. If not valid, why
 	 */
 	pair<bool, string> IsValid(const State* state, const Action* action) const;
-	
+
+	/** Get the index of the first business rule that the Action violates in the given State, or -1 if the Action is valid */
+	int GetViolatedBusinessRule(const State* state, const Action* action) const;
+
+	/** Get the names of the active business rules, in the order used by GetViolatedBusinessRule */
+	inline const vector<string>& GetBusinessRuleNames() const { return validatorNames; }
+
+	/** Get the names of the active pruning rules, in the order in which they are applied */
+	inline const vector<string>& GetPruningRuleNames() const { return prunerNames; }
 };
 
 #ifndef OVERRIDE_ACTIONGENERATOR
@@ -27,9 +27,12 @@ private:
 	map<string, bool> businessRules;
 	map<string, bool> actionRules;
 	map<string, json> actionParams;
+	map<string, bool> pruningRules;
+	map<string, json> pruningParams;
 
 	void ImportBusinessRules(const json& j);
 	void ImportActionRules(const json& j);
+	void ImportPruningRules(const json& j);
 public:
 	/** Construct a default Config object */
 	Config() = default;
@@ -41,6 +44,10 @@ public:
 	bool IsGeneratorActive(const string& name) const;
 	/** Get the parameters for the ActionGenerator defined by the name */
 	const json GetActionParameters(const string& name) const;
+	/** Returns true iff the PruningRule defined by the name is active. Pruning rules are inactive unless configured */
+	bool IsPruningRuleActive(const string& name) const;
+	/** Get the parameters for the PruningRule defined by the name */
+	const json GetPruningParameters(const string& name) const;
 };
 
 #endif
\ No newline at end of file
@@ -6,11 +6,25 @@
 #define ENGINE_H
 #include "State.h"
 #include "Plan.h"
+#include "Featurizer.h"
+#include "Feasibility.h"
 
 using namespace std;
 
 class RunResult;
 class POSPlan;
+class LowerBoundTable;
+
+/**
+ * The reason codes of LocationEngine::ValidateMany. 
+ * 
+ * A positive code k means that the Action violates the business rule at index k-1 of LocationEngine::GetBusinessRuleNames
+ */
+enum class ValidationCode : int32_t {
+	Valid = 0,				/**< The Action is valid */
+	GeneratorDisabled = -1,	/**< The ActionGenerator for the SimpleAction is disabled */
+	GenerationFailed = -2	/**< No Action could be generated from the SimpleAction in the State */
+};
 
 /**
  * A TORS engine for a specific Location
@@ -19,24 +33,87 @@ class LocationEngine
 {
 private:
 	string path;
-	Location location;
+	shared_ptr<const Location> location;
 	Config config;
 	ActionManager actionManager;
 	unordered_map<State*, list<const Action*>> stateActionMap;
+	unordered_map<State*, vector<vector<const Action*>>> symmetryClasses;
 	unordered_map<State*, RunResult*> results;
+	unordered_map<State*, size_t> sessionIDs;
+	static atomic<size_t> sessionCounter;
+	/** The LowerBoundTable%s of the sessions, which are built when they are first used, see GetLowerBoundTable */
+	mutable unordered_map<const State*, shared_ptr<const LowerBoundTable>> lowerBoundTables;
+	/** Guards lowerBoundTables, which is used by searches in several threads */
+	mutable mutex lowerBoundMutex;
 	unordered_map<string, Scenario*> scenarios;
+	map<vector<int>, pair<int, EventQueue>> initialStates;
+	unique_ptr<const FeasibilityMonitor> feasibilityMonitor;
+	bool monitorFeasibility = false;
+	bool reduceSymmetry = false;
 
 	void ExecuteEvent(State* state, const Event* e);
 	void ExecuteImmediateEvents(State * state);
+	void ClearValidActions(State* state);
+	void ClearLowerBoundTable(const State* state);
+	void ReduceSymmetry(const State* state, list<const Action*>& actions, vector<vector<const Action*>>& classes) const;
 public:
+	/** The maximum number of initial States that are cached by ResetSession */
+	static constexpr size_t maxInitialStates = 1024;
+
 	LocationEngine() = delete;
 	/** Construct a LocationEngine based on the configuration files found in the given folder */
 	LocationEngine(const string &path);
+	/** 
+	 * Construct a LocationEngine for the Location in the folder path, with the config.json found in the folder configPath.
+	 * 
+	 * The Location is shared with all other engines for the same Location, see Location::GetShared
+	 */
+	LocationEngine(const string &path, const string &configPath);
 	/** Destroy this LocationEngine */
 	~LocationEngine();
-	/** Get a list of valid Action%s for the given State */
+	/** Get a list of valid Action%s for the given State. If symmetry reduction is active, only one Action per symmetry class is listed, see SetSymmetryReduction */
 	list<const Action*> &GetValidActions(State* state);
-	/** Go to the next Step in the simulation and update the State */
+	/**
+	 * Activate or deactivate symmetry reduction of the valid Action%s. If active, GetValidActions lists only the first
+	 * generated Action of every symmetry class. Two Action%s are symmetric if they are of the same kind, have the
+	 * same duration, employees, reserved Track%s and parameters (such as the route, the Outgoing train or the split
+	 * index), and their ShuntingUnit%s are interchangeable. ShuntingUnit%s are interchangeable if:
+	 * 
+	 * 1. Their Train%s have the same TrainUnitType%s, in the order of their direction.
+	 * 2. None of their Train%s has a remaining or active Task.
+	 * 3. Their Train%s have the same goal: the same matching Outgoing train, or none if their IDs are not matched.
+	 * 4. They are in an equivalent position: on the same Track, coming from the same previous Track, with the same
+	 *    status (moving, waiting, in neutral) and with the same free sides of the Track.
+	 * 
+	 * The classes are available through GetSymmetryClasses. Changing the mode regenerates the valid Action%s of all
+	 * active sessions.
+	 */
+	void SetSymmetryReduction(bool active);
+	/** Returns true iff symmetry reduction is active, see SetSymmetryReduction */
+	inline bool IsSymmetryReductionActive() const { return reduceSymmetry; }
+	/**
+	 * Get the symmetry classes of the valid Action%s of the given State, see SetSymmetryReduction.
+	 * 
+	 * @return one class per Action of GetValidActions, in the same order. Every class starts with that Action,
+	 * followed by the Action%s that are symmetric to it. Without symmetry reduction every class contains one Action
+	 */
+	const vector<vector<const Action*>>& GetSymmetryClasses(State* state);
+	/**
+	 * Get the valid Action%s for the given State as a table, with one ActionRow per Action in the order of GetValidActions.
+	 * 
+	 * The train IDs of every row are stored in trainIDs, starting at the row's trainOffset.
+	 */
+	void GetValidActionTable(State* state, vector<ActionRow>& rows, vector<int>& trainIDs);
+	/** Get the valid Action at the given index of GetValidActions */
+	const Action* GetValidAction(State* state, size_t index);
+	/** Apply the valid Action at the given index of GetValidActions (or GetValidActionTable) to the State */
+	inline void ApplyActionByIndex(State* state, size_t index) { ApplyAction(state, GetValidAction(state, index)); }
+	/**
+	 * Go to the next Step in the simulation and update the State.
+	 * 
+	 * If the feasibility monitor is active, a DeadEndException is thrown as soon as the session can no longer
+	 * succeed, see SetFeasibilityMonitor.
+	 */
 	void Step(State* state);
 	/** Apply the Action to the State and go to the next step in the simulation */
 	void ApplyActionAndStep(State* state, const Action* action);
@@ -56,18 +133,101 @@ public:
 	/** Checks if the given Action is valid in the given State or not. If not
 	 * provides a reason why. */
 	pair<bool, string> IsValidAction(const State* state, const Action* action) const; 
+	/**
+	 * Check the validity of all the given SimpleAction%s in the given State at once.
+	 * 
+	 * @return a reason code for every SimpleAction, see ValidationCode
+	 */
+	vector<int> ValidateMany(const State* state, const vector<const SimpleAction*>& actions) const;
+	/** Get the names of the active business rules, in the order used by the reason codes of ValidateMany */
+	inline const vector<string>& GetBusinessRuleNames() const { return actionManager.GetBusinessRuleNames(); }
+	/** Get the names of the active pruning rules, see ActionManager::GetPruningRuleNames */
+	inline const vector<string>& GetPruningRuleNames() const { return actionManager.GetPruningRuleNames(); }
 	/** Returns true iff the given state is still active (ie the scenario is not ended or failed yet) */
 	bool IsStateActive(const State* state) const;
+	/**
+	 * Activate or deactivate the FeasibilityMonitor, that is evaluated after every Step. The travel times of the
+	 * monitor are calculated when it is activated, so this should not be called while other threads use this
+	 * LocationEngine.
+	 */
+	void SetFeasibilityMonitor(bool active);
+	/** Returns true iff the FeasibilityMonitor is active, see SetFeasibilityMonitor */
+	inline bool IsFeasibilityMonitorActive() const { return monitorFeasibility; }
+	/** Get the FeasibilityMonitor of this LocationEngine, and construct it on first use */
+	const FeasibilityMonitor& GetFeasibilityMonitor();
+	/** Screen the Scenario for reasons why it is infeasible from the start, see FeasibilityMonitor::Screen */
+	inline ScreeningResult ScreenScenario(const Scenario& scenario) { return GetFeasibilityMonitor().Screen(scenario); }
 	/** Evaluate the given POSPlan for the given Scenario */
 	bool EvaluatePlan(const Scenario& scenario, const POSPlan& plan);
 	/** Start a session for the given Scenario and generate an initial State */
 	State* StartSession(const Scenario& scenario);
 	/** End the session that belongs to the given State */
 	void EndSession(State* state);
+	/**
+	 * Reset the session that belongs to the given State to a new session for the given Scenario, and Step it
+	 * to the first decision. The State is reused and restored in place.
+	 * 
+	 * The first Step of a Scenario only depends on the times of its Incoming and Outgoing trains. The time and
+	 * the remaining Event%s after the first Step are therefore cached per combination of these times, so that
+	 * the first Step is only executed once for Scenario%s that are reset often. At most maxInitialStates
+	 * combinations are cached.
+	 */
+	void ResetSession(State* state, const Scenario& scenario);
+	/**
+	 * Copy the session that belongs to the source State to the session of the target State, by resetting the target
+	 * session to the Scenario of the source (see ResetSession) and replaying the RunResult of the source session.
+	 * A new session is started for the copy if no target State is given.
+	 * 
+	 * @return the target State
+	 */
+	State* CopySession(const State* source, State* target = nullptr);
+	/**
+	 * Restore the session of the given RunResult to the session of the target State, by resetting the target session
+	 * to the Scenario of the RunResult (see ResetSession) and replaying its plan. A new session is started if no
+	 * target State is given.
+	 * 
+	 * @return the target State
+	 */
+	State* RestoreSession(const RunResult& result, State* target = nullptr);
+	/**
+	 * Save the session that belongs to the given State to a compact binary snapshot, that can be restored with
+	 * LoadState. The snapshot contains the canonical location string, the identity of the Location (see GetLocationID)
+	 * and the Scenario of the session, and the mutable part of the session relative to the Scenario: the time, the
+	 * remaining Incoming and Outgoing trains, the ShuntingUnit%s with their position, status and Task%s, the Track
+	 * reservations, the active Action%s, the EventQueue and the plan so far. The format is versioned, see snapshotVersion.
+	 */
+	string SaveState(const State* state) const;
+	/**
+	 * Restore the session of a snapshot that was saved by SaveState into the session of the target State, or into a
+	 * new session if no target State is given. Unlike RestoreSession, no Action%s are replayed, and the restored
+	 * session generates the same valid Action%s in the same order as the saved session. The Location is identified by
+	 * GetLocationID, so a snapshot can be loaded by an engine for a copy of the Location in another folder. An 
+	 * invalid_argument exception is thrown if the snapshot is invalid or belongs to another location. In that case, the 
+	 * target session is unchanged if the location or the Scenario of the snapshot is invalid, and otherwise it is reset to
+	 * the start of the Scenario of the snapshot (see ResetSession).
+	 * 
+	 * @return the target State
+	 */
+	State* LoadState(const string& data, State* target = nullptr);
+	/** Returns true iff the given State belongs to a session of this LocationEngine */
+	inline bool HasSession(const State* state) const { return results.find(const_cast<State*>(state)) != results.end(); }
+	/** Get the id of the session that belongs to the given State, which is unique among all the sessions in this process */
+	inline size_t GetSessionID(const State* state) const { return sessionIDs.at(const_cast<State*>(state)); }
+	/**
+	 * Get the LowerBoundTable for the Scenario of the session that belongs to the given State. The table is built
+	 * when it is first used, and is kept until the session ends or its Scenario changes (see ResetSession and LoadState).
+	 */
+	shared_ptr<const LowerBoundTable> GetLowerBoundTable(const State* state) const;
+	/** Get the location string of this Engine, which is the folder of its Location */
+	inline const string& GetLocationString() const { return path; }
 	/** Get a reference to the Location of this Engine */
-	inline const Location& GetLocation() const { return location; }
+	inline const Location& GetLocation() const { return *location; }
+	/** Get the shared pointer to the Location of this Engine, see Location::GetShared */
+	inline const shared_ptr<const Location>& GetSharedLocation() const { return location; }
 	/** Get the Scenario given in the file path */
 	const Scenario& GetScenario(const string& scenarioFileString);
+	/** Load the Scenario given in the file path without storing it in this Engine. The caller owns the result */
+	inline Scenario* LoadScenario(const string& scenarioFileString) const { return new Scenario(scenarioFileString, *location); }
 	
 	/** Calculate all the shortest paths (run this once before requesting shortest paths) */ 
 	void CalcShortestPaths();
@@ -79,16 +239,30 @@ public:
 	RunResult* GetResult(State* state) const { return results.at(state); }
 	/** Import a RunResult from a protobuf file */
 	RunResult* ImportResult(const string& path);
+	/** Returns true iff there are no active sessions in this LocationEngine */
+	inline bool IsIdle() const { return stateActionMap.empty(); }
 };
 
 /**
  * The TORS Engine for several Location%s
+ * 
+ * Location%s are loaded when they are first used. If a memory budget is set, the least recently used
+ * Location%s without active sessions are unloaded when the estimated memory usage exceeds the budget.
+ * A Location is not unloaded while its shared pointer (see LocationEngine::GetSharedLocation) is held outside the Engine.
+ * Note that Scenario%s obtained through GetScenario are invalid after their Location is unloaded.
  */
 class Engine
 {
 private:
 	map<const string, LocationEngine> engines;
 	map<const State*, LocationEngine*> engineMap;
+	map<const LocationEngine*, size_t> lastUse;
+	size_t useCounter = 0;
+	size_t memoryBudget = 0;
+	bool feasibilityMonitor = false;
+	bool symmetryReduction = false;
+
+	void UnloadIdleLocationEngines(const LocationEngine* keep);
 public:
 	/** The default constructor */
 	Engine() = default;
@@ -98,8 +272,42 @@ public:
 	~Engine() = default;
 	/** Get or load the LocationEngine based on its file location */
 	LocationEngine* GetOrLoadLocationEngine(const string& location);
+	/**
+	 * Get the LocationEngine for the location string of a RunResult. 
+	 * 
+	 * The location is looked up as a loaded location, as a loaded location with the same canonical path, as a folder,
+	 * as a folder relative to relativeTo,
+	 * and finally as a loaded location with the same folder name.
+	 */
+	LocationEngine* ResolveLocationEngine(const string& location, const string& relativeTo = "");
+	/** Get the location strings of all loaded Location%s */
+	vector<string> GetLoadedLocations() const;
+	/** Set the memory budget in bytes for the loaded Location%s (0 means unlimited) */
+	void SetMemoryBudget(size_t budget);
+	/** Get the memory budget in bytes for the loaded Location%s (0 means unlimited) */
+	inline size_t GetMemoryBudget() const { return memoryBudget; }
+	/** Get an estimate of the memory used by the loaded Location%s, in bytes */
+	size_t GetMemoryUsage() const;
+	/** Activate or deactivate the FeasibilityMonitor of all loaded and future LocationEngine%s, see LocationEngine::SetFeasibilityMonitor */
+	void SetFeasibilityMonitor(bool active);
+	/** Returns true iff the FeasibilityMonitor is active, see SetFeasibilityMonitor */
+	inline bool IsFeasibilityMonitorActive() const { return feasibilityMonitor; }
+	/** Activate or deactivate symmetry reduction of all loaded and future LocationEngine%s, see LocationEngine::SetSymmetryReduction */
+	void SetSymmetryReduction(bool active);
+	/** Returns true iff symmetry reduction is active, see SetSymmetryReduction */
+	inline bool IsSymmetryReductionActive() const { return symmetryReduction; }
+	/** Get the symmetry classes of the valid Action%s of the given State, see LocationEngine::GetSymmetryClasses */
+	inline const vector<vector<const Action*>>& GetSymmetryClasses(State* state) const { return engineMap.at(state)->GetSymmetryClasses(state); }
+	/** Screen the Scenario for the given location string, see LocationEngine::ScreenScenario */
+	inline ScreeningResult ScreenScenario(const string& location, const Scenario& scenario) {
+		return GetOrLoadLocationEngine(location)->ScreenScenario(scenario); }
 	/** Get the valid actions for the session with the given State */
 	inline list<const Action*> &GetValidActions(State* state) const { return engineMap.at(state)->GetValidActions(state); }
+	/** Get the valid Action%s for the given State as a table, see LocationEngine::GetValidActionTable */
+	inline void GetValidActionTable(State* state, vector<ActionRow>& rows, vector<int>& trainIDs) const { 
+		engineMap.at(state)->GetValidActionTable(state, rows, trainIDs); }
+	/** Apply the valid Action at the given index of GetValidActions (or GetValidActionTable) to the State */
+	inline void ApplyActionByIndex(State* state, size_t index) const { engineMap.at(state)->ApplyActionByIndex(state, index); }
 	/** Go to the next Step in the simulation and update the State */
 	void Step(State* state) const { return engineMap.at(state)->Step(state); }
 	/** Apply the given Action to the State */
@@ -121,16 +329,33 @@ public:
 	/** Checks if the given Action is valid in the given State or not. If not
 	 * provides a reason why. */
 	inline pair<bool, string> IsValidAction(const State* state, const Action* action) const { return engineMap.at(state)->IsValidAction(state, action); }
+	/** Check the validity of all the given SimpleAction%s in the given State at once, see LocationEngine::ValidateMany */
+	inline vector<int> ValidateMany(const State* state, const vector<const SimpleAction*>& actions) const { return engineMap.at(state)->ValidateMany(state, actions); }
+	/** Returns true iff the given state is still active (ie the scenario is not ended or failed yet) */
+	inline bool IsStateActive(const State* state) const { return engineMap.at(state)->IsStateActive(state); }
 	/** Start a session for the given Scenario and location and generate an initial State */
 	State* StartSession(const string& location, const Scenario& scenario);
 	/** End the session that belongs to the given State */
 	void EndSession(State* state);
+	/** Reset the session that belongs to the given State to a new session for the given Scenario, see LocationEngine::ResetSession */
+	inline void ResetSession(State* state, const Scenario& scenario) { engineMap.at(state)->ResetSession(state, scenario); }
+	/** Copy the session that belongs to the source State to the session of the target State, see LocationEngine::CopySession */
+	State* CopySession(const State* source, State* target = nullptr);
+	/** Restore the session of the given RunResult to the session of the target State, see LocationEngine::RestoreSession */
+	State* RestoreSession(const RunResult& result, State* target = nullptr);
+	/** Save the session that belongs to the given State to a binary snapshot, see LocationEngine::SaveState */
+	inline string SaveState(const State* state) const { return engineMap.at(state)->SaveState(state); }
+	/**
+	 * Restore the session of a snapshot into the session of the target State, see LocationEngine::LoadState. If no
+	 * target State is given, the location string of the snapshot is resolved as by ResolveLocationEngine.
+	 */
+	State* LoadState(const string& data, State* target = nullptr);
 	
 	/** Get a reference to the Location of the given location string */
-	inline const Location& GetLocation(const string& location) const { return engines.at(location).GetLocation(); }
+	inline const Location& GetLocation(const string& location) { return GetOrLoadLocationEngine(location)->GetLocation(); }
 	/** Get a reference to the Scenario given by the path and the given location string */
 	inline const Scenario& GetScenario(const string& location, const string& scenarioFileString) {
-		return engines.at(location).GetScenario(scenarioFileString);
+		return GetOrLoadLocationEngine(location)->GetScenario(scenarioFileString);
 	}
 	/** Calculate all the shortest paths (run this once before requesting shortest paths) */ 
 	void CalcShortestPaths();
@@ -140,6 +365,10 @@ public:
 	inline const Path GetPath(const State* state, const Move& move) const { return engineMap.at(state)->GetPath(state, move); }
 	/** Get the RunResult for the given State/session */
 	inline RunResult* GetResult(State* state) const { return engineMap.at(state)->GetResult(state); }
+	/** Get the id of the session that belongs to the given State, see LocationEngine::GetSessionID */
+	inline size_t GetSessionID(const State* state) const { return engineMap.at(state)->GetSessionID(state); }
+	/** Get the LocationEngine that runs the session of the given State */
+	inline LocationEngine* GetLocationEngine(const State* state) const { return engineMap.at(state); }
 	/** Import a RunResult from a protobuf file */
 	RunResult* ImportResult(const string& path);
 };
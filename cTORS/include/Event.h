@@ -33,6 +33,8 @@ public:
 	Event(const Incoming* in);
 	/** Construct an Event with type OutgoingTrain from the given Outgoing object */
 	Event(const Outgoing* out);
+	/** Construct an Event of the given type without an Action */
+	Event(int time, EventType type) : time(time), action(nullptr), type(type) {}
 	/** Copy the Event */
 	Event(const Event &e);
 	/** Destroy the Event */
@@ -72,12 +74,30 @@ STREAM_OPERATOR(Event);
  */
 class EventQueue : public priority_queue < const Event*, vector<const Event*>, EventCompare> {
 public:
+/** Construct an empty EventQueue */
+EventQueue() = default;
+/** Copy the EventQueue and its Event%s */
+EventQueue(const EventQueue& queue) : priority_queue(queue) {
+    for(auto& e: c) e = new Event(*e);
+}
+/** Replace the Event%s of this EventQueue by copies of the Event%s in the given EventQueue */
+EventQueue& operator=(const EventQueue& queue) {
+    if(this == &queue) return *this;
+    Clear();
+    priority_queue::operator=(queue);
+    for(auto& e: c) e = new Event(*e);
+    return *this;
+}
 /** Destroy the EventQueue */
 ~EventQueue() {
-    while(size() > 0) {
-        delete top();
-        pop();
-    }
+    Clear();
+}
+/** Get the Event%s in this EventQueue, in no particular order */
+inline const vector<const Event*>& GetEvents() const { return c; }
+/** Remove and delete all the Event%s */
+void Clear() {
+    for(auto e: c) delete e;
+    c.clear();
 }
 };
 
@@ -20,12 +20,14 @@ private:
 	const int simultaneousUsageCount;
 	const double tStart;
 	const double tEnd;
+	int index;						/**< the dense index of this Facility in its Location, or -1 */
+	friend class Location;
 public:
 	Facility() = delete;
 	/** Construct a Facility given the parameters */
 	Facility(const int id, const string& type,
 		const vector<string>& tasks, int simultaneousUsageCount, double tStart, double tEnd) : 
-			id(id), type(type), tasks(tasks), simultaneousUsageCount(simultaneousUsageCount), tStart(tStart), tEnd(tEnd) {}
+			id(id), type(type), tasks(tasks), simultaneousUsageCount(simultaneousUsageCount), tStart(tStart), tEnd(tEnd), index(-1) {}
 	/** Construct a Facility given the protobuf object */
 	Facility(const PBFacility& pb_facility) : Facility(pb_facility.id(), pb_facility.type(), ConvertPBTaskTypes(pb_facility.tasktypes()),
 			pb_facility.simultaneoususagecount(), pb_facility.timewindow().start(), pb_facility.timewindow().end()) {}
@@ -49,6 +51,8 @@ public:
 	inline const string toString() const { return "Facility " + to_string(id); }
 	/** Get the id of this Facility */
 	inline const int GetID() const { return id; }
+	/** Get the index of this Facility in the Location's facility list, or -1 if it is not part of a Location */
+	inline int GetIndex() const { return index; }
 	/** Get the type of this Facility */
 	inline const string& GetType() const { return type; }
 	
@@ -0,0 +1,126 @@
+/** \file Feasibility.h
+ * Describes the DeadEndReason, the DeadEndException, the ScreeningResult and the FeasibilityMonitor
+ */
+#pragma once
+#ifndef FEASIBILITY_H
+#define FEASIBILITY_H
+#include "State.h"
+
+using namespace std;
+
+/**
+ * The reason codes of a DeadEndException
+ */
+enum class DeadEndReason : int32_t {
+	MissingTrain = 1,		/**< No remaining Train matches a Train of a remaining Outgoing train */
+	LateDeparture = 2,		/**< No matching Train can reach the parking Track of a remaining Outgoing train before its deadline */
+	ServiceCapacity = 3,	/**< The remaining mandatory service Task%s of a type need more time than the Facility%s have left */
+	MissingFacility = 4,	/**< No Facility executes a mandatory service Task of a Train that must leave (only by FeasibilityMonitor::Screen) */
+	ParkingLength = 5,		/**< The Train%s on the shunting yard do not fit on its Track%s (only by FeasibilityMonitor::Screen) */
+	Electrification = 6		/**< A ShuntingUnit that needs electricity arrives or leaves on a Track that is not electrified (only by FeasibilityMonitor::Screen) */
+};
+
+/** Get a string representation of the DeadEndReason */
+inline string ToString(DeadEndReason reason) {
+	switch(reason) {
+		case DeadEndReason::MissingTrain: return "MissingTrain";
+		case DeadEndReason::LateDeparture: return "LateDeparture";
+		case DeadEndReason::ServiceCapacity: return "ServiceCapacity";
+		case DeadEndReason::MissingFacility: return "MissingFacility";
+		case DeadEndReason::ParkingLength: return "ParkingLength";
+		case DeadEndReason::Electrification: return "Electrification";
+	}
+	return "Unknown";
+}
+
+/**
+ * A DeadEndException is a ScenarioFailedException that is raised by the FeasibilityMonitor as soon as the session
+ * can no longer succeed
+ */
+class DeadEndException : public ScenarioFailedException {
+private:
+	DeadEndReason reason;
+public:
+	DeadEndException() = delete;
+	/** Construct a DeadEndException with the given reason and extra info */
+	DeadEndException(DeadEndReason reason, const string& message) :
+		ScenarioFailedException("Dead end (" + ToString(reason) + "): " + message), reason(reason) {}
+	/** Get the reason code of this DeadEndException */
+	inline DeadEndReason GetReason() const { return reason; }
+};
+
+/** The outcome of FeasibilityMonitor::Screen */
+struct ScreeningResult {
+	vector<DeadEndReason> reasons;	/**< The reasons why the Scenario is infeasible, empty if no reason was found */
+	vector<string> messages;		/**< A description for every reason */
+	/** Returns true iff no reason for infeasibility was found */
+	inline bool IsFeasible() const { return reasons.empty(); }
+};
+
+/**
+ * Calculate the minimum travel time between every pair of Railroad Track%s of the Location, where setbacks are free
+ * and the direction is ignored (Dijkstra over the neighboring paths, see Location::GetNeighboringPaths).
+ *
+ * @return the travel times, flattened as [from * #tracks + to] by Track index, or MAX_PATH_LENGTH if there is no path
+ */
+vector<int> CalcTravelTimes(const Location& location);
+
+/**
+ * The FeasibilityMonitor detects States from which a session can no longer succeed, using precomputed travel times
+ * (see CalcTravelTimes) and the durations of the remaining Task%s. All checks are relaxations, so a State is only
+ * reported if failure is certain:
+ *
+ * 1. Every Train of every remaining Outgoing train must be matched by a Train on the shunting yard or of a
+ *    remaining Incoming train (only if the out_correct_order_rule is active).
+ * 2. One of these Train%s must be able to reach the parking Track of the Outgoing train, via the Facility%s for its
+ *    remaining mandatory service Task%s and after executing them, before the departure time (if the
+ *    out_correct_time_rule is active) or the end of the Scenario.
+ * 3. If all Train%s must leave, the remaining mandatory service Task%s of every type must fit in the capacity of
+ *    the Facility%s until the end of the Scenario (only if the capacity_facility_rule is active).
+ *
+ * Service Task%s are only taken into account if the mandatory_service_task_rule is active.
+ */
+class FeasibilityMonitor {
+private:
+	struct Candidate {
+		const Train* train;
+		int position;
+		int earliest;
+		const vector<Task>* tasks;
+	};
+	size_t numberOfTracks;
+	vector<int> distances;
+	unordered_map<string, vector<int>> serviceTracks;
+	unordered_map<string, int> serviceCapacity;
+	vector<int> facilityTracks;
+	int facilityCapacity = 0;
+	double totalLength = 0;
+	bool matchTrains, fixedDepartureTimes, fixedArrivalTimes, mandatoryServices, correctFacilities, limitedCapacity,
+		limitedLength, electricTracks;
+	int GetRequiredTime(const vector<Task>& tasks, int from, int to) const;
+	void CheckCandidates(const vector<Candidate>& candidates, const vector<const Outgoing*>& outgoing, int time,
+		int endTime, ScreeningResult* result) const;
+public:
+	FeasibilityMonitor() = delete;
+	/** Construct a FeasibilityMonitor for the Location with the given active business rules */
+	FeasibilityMonitor(const Location& location, const vector<string>& businessRules);
+	/** Throws a DeadEndException if the session of the given State can no longer succeed */
+	void Check(const State* state) const;
+	/**
+	 * Screen the Scenario for reasons why it is infeasible from the start, without starting a session. Next to the
+	 * checks of Check for the start of the Scenario, this checks that:
+	 *
+	 * 1. Every mandatory service Task of a Train that must leave can be executed by a Facility (only if the
+	 *    correct_facility_rule is active).
+	 * 2. Every Incoming and Outgoing train fits on its parking Track, and the Train%s that are certainly on the
+	 *    shunting yard after every arrival fit on all Railroad Track%s together (only if the length_track_rule
+	 *    is active, and the in_correct_time_rule for the latter).
+	 * 3. Every Incoming and Outgoing train that needs electricity has an electrified parking Track (only if the
+	 *    electric_track_rule is active).
+	 *
+	 * The checks of Outgoing trains that depend on their Train types require the out_correct_order_rule.
+	 */
+	ScreeningResult Screen(const Scenario& scenario) const;
+};
+
+#endif
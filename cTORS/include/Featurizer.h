@@ -0,0 +1,92 @@
+/** \file Featurizer.h
+ * Describes the Featurizer class
+ */
+#pragma once
+#ifndef FEATURIZER_H
+#define FEATURIZER_H
+#include "State.h"
+
+using namespace std;
+
+/**
+ * The Featurizer writes a fixed-size observation of a State into a float buffer.
+ *
+ * The observation consists of the following blocks, in this order:
+ * 1. The next nIncoming Incoming trains, ordered by time. Per train: the relative time,
+ * the one-hot parking Track and the one-hot TrainUnitType of its first nTrains Train%s.
+ * 2. The next nOutgoing Outgoing trains, in the same format as the Incoming trains.
+ * 3. Per railroad Track: for its first nShuntingUnits occupations the one-hot index of the ShuntingUnit
+ * in State::GetShuntingUnits, followed by whether the Track is reserved and its occupied length fraction.
+ * 4. The first nShuntingUnits ShuntingUnit%s. Per ShuntingUnit: the moving, waiting, in neutral and
+ * active action flags, the one-hot position, the direction, the one-hot TrainUnitType of its first
+ * nTrains Train%s (in order) and its number of remaining Task%s.
+ * 5. The relative time of the State.
+ *
+ * Relative times are scaled to the interval of the State, with 0 the start time and 1 the end time.
+ *
+ * The Featurizer also maps Action%s to a fixed index space of GetNumberOfActions indices:
+ * 1. Arrive for the next nIncoming Incoming trains, ordered by time.
+ * 2. Exit for the next nOutgoing Outgoing trains, ordered by time.
+ * 3. Per ShuntingUnit (the first nShuntingUnits in State::GetShuntingUnits): BeginMove, EndMove, Wait, Setback, 
+ * Service, Split at split index 1 to nTrains-1, Combine with each of the other ShuntingUnit%s and 
+ * Move to each of the railroad Track%s.
+ */
+class Featurizer {
+private:
+	const Location* location;
+	int nIncoming, nOutgoing, nShuntingUnits, nTrains;
+	vector<string> trainTypes;
+	unordered_map<string, int> trainTypeIndex;
+	vector<const Track*> tracks;
+	vector<int> trackSlots;
+	size_t trainSize, goalSize, trackSize, shuntingUnitSize, observationSize;
+	int nShuntingUnitActions, nActions;
+
+	float* WriteTrack(const Track* track, float* out) const;
+	float* WriteTrains(const vector<Train>& trains, float* out) const;
+	float* WriteTime(const State* state, int time, float* out) const;
+	template<class G>
+	float* WriteGoals(const State* state, const vector<const G*>& goals, int n, float* out) const;
+	template<class G>
+	static vector<const G*> SortByTime(const vector<const G*>& goals, int n);
+public:
+	Featurizer() = delete;
+	/**
+	 * Construct a Featurizer for the given Location.
+	 *
+	 * The observation describes at most nIncoming Incoming trains, nOutgoing Outgoing trains, nShuntingUnits ShuntingUnit%s
+	 * on the shunting yard and nTrains Train%s per ShuntingUnit. Train%s are encoded by the given TrainUnitType names. If
+	 * no names are given, all the TrainUnitType%s of the Location are used.
+	 */
+	Featurizer(const Location& location, int nIncoming, int nOutgoing, int nShuntingUnits, int nTrains, const vector<string>& trainTypes = {});
+	/** Write the observation of the State to out, which should have room for GetObservationSize values */
+	void Featurize(const State* state, float* out) const;
+	/** Get the number of values in an observation */
+	inline size_t GetObservationSize() const { return observationSize; }
+	/** Get the index of the Action in the action index space, or -1 if the Action has no index */
+	int GetActionIndex(const State* state, const Action* action) const;
+	/** Set out[i] to true for the index i of every given Action, and to false for all other indices. out should have room for GetNumberOfActions values */
+	void GetActionMask(const State* state, const list<const Action*>& actions, bool* out) const;
+	/** Get the SimpleAction for the given index of the action index space. The caller owns the result */
+	const SimpleAction* GetSimpleAction(const State* state, int index) const;
+	/** Get the size of the action index space */
+	inline int GetNumberOfActions() const { return nActions; }
+	/** Get the number of actions per ShuntingUnit in the action index space */
+	inline int GetNumberOfShuntingUnitActions() const { return nShuntingUnitActions; }
+	/** Get the railroad Track%s, in the order used in the observation */
+	inline const vector<const Track*>& GetTracks() const { return tracks; }
+	/** Get the slot of the Track in GetTracks, or -1 if the Track is not a railroad */
+	inline int GetTrackSlot(const Track* track) const { return track == nullptr ? -1 : trackSlots.at(track->GetIndex()); }
+	/** Get the TrainUnitType names, in the order used in the observation */
+	inline const vector<string>& GetTrainTypes() const { return trainTypes; }
+	/** Get the maximum number of Incoming trains in the observation */
+	inline int GetNumberOfIncoming() const { return nIncoming; }
+	/** Get the maximum number of Outgoing trains in the observation */
+	inline int GetNumberOfOutgoing() const { return nOutgoing; }
+	/** Get the maximum number of ShuntingUnit%s in the observation */
+	inline int GetNumberOfShuntingUnits() const { return nShuntingUnits; }
+	/** Get the maximum number of Train%s per ShuntingUnit in the observation */
+	inline int GetNumberOfTrains() const { return nTrains; }
+};
+
+#endif
@@ -42,26 +42,49 @@ typedef pair<const Track*, const Track*> Position;
  * 
  * It contains a list of Track%s and Facilities.
  * It also has helper functions to find (shortest) Path%s and distances
+ * 
+ * A Location is immutable after loading, except for the path tables that are calculated on request.
+ * Use Location::GetShared to share one Location between several engines.
  */
+class LocationGraph;
+
 class Location
 {
 private:
 	static const string locationFileString;
+	static map<tuple<string, size_t, bool>, weak_ptr<const Location>> sharedLocations;
+	static mutex sharedLocationsMutex;
 	
 	string path;
+	size_t fileHash;
 	vector<Track*> tracks;
 	vector<Facility*> facilities;
 	unordered_map<Position, double> distanceMatrix;
 	/** A shortest path map for each setbackTime. The map is from (start_position, end_position) -> path */
-	map<int, unordered_map<pair<Position, Position>, Path>> shortestPath;
+	mutable map<int, unordered_map<pair<Position, Position>, Path>> shortestPath;
 	/** Path from a Railroad position to all neighboring RailRoad positions */
-	unordered_map<Position, unordered_map<Position, Path>> neighborPaths;
+	mutable unordered_map<Position, unordered_map<Position, Path>> neighborPaths;
 	/** A list of all possible paths. The map is from (start_position, end_position), without setbacks */
-	unordered_map<pair<Position, Position>, vector<Path>> possiblePaths;
+	mutable unordered_map<pair<Position, Position>, vector<Path>> possiblePaths;
 	/** A list of all possible paths starting from a Position, without setbacks */
-	unordered_map<Position, vector<Path>> possibleMovements;
-	/** All the tracks indexed by their string id */
-	map<string, Track*> trackIndex;
+	mutable unordered_map<Position, vector<Path>> possibleMovements;
+	/**
+	 * Guards the calculation of the path tables. The neighboring and possible paths are calculated when the
+	 * Location is constructed, so they are read without locking
+	 */
+	mutable recursive_mutex pathMutex;
+	/** Guards shortestPath, which is read while the shortest paths for another setbackTime are calculated */
+	mutable shared_mutex shortestPathMutex;
+	/** The TrainUnitType%s used in the scenarios of this Location, by name */
+	mutable map<string, TrainUnitType*> trainUnitTypes;
+	/** Guards trainUnitTypes */
+	mutable mutex typeMutex;
+	/** The track part graph, built on first request */
+	mutable unique_ptr<const LocationGraph> graph;
+	/** Guards the construction of graph */
+	mutable once_flag graphOnce;
+	/** All the tracks indexed by their numeric id */
+	unordered_map<UInt, Track*> trackIndex;
 	int movementConstant;
 	map<const TrackPartType, int> moveDuration;
 	bool byType;
@@ -76,21 +99,53 @@ public:
 	 * The parameter byType determines if distances are calculated by TrackPartType or by using the distance matrix
 	 */
 	Location(const string &path, bool byType);
-	/** Default copy constructor */
-	Location(const Location& location) = default;
+	/** Locations own their Track%s, Facilities and TrainUnitType%s, and are shared instead of copied */
+	Location(const Location& location) = delete;
 	/** Destruct this location */
 	~Location();
+
+	/**
+	 * Get the Location described in the given folder, shared with all other users of the same Location.
+	 * 
+	 * Locations are identified by their folder, the contents of their protobuf file and byType. 
+	 * A shared Location is loaded once and destroyed when its last user releases it.
+	 */
+	static shared_ptr<const Location> GetShared(const string &path, bool byType);
 	
 	/** Get the path of the protobuf file */
 	inline const string& GetLocationFilePath() const { return path; }
+	/** Get the hash of the contents of the protobuf file, see GetShared */
+	inline size_t GetFileHash() const { return fileHash; }
 	/** Get a reference to the Track by its id */
-	inline Track* GetTrackByID(const string& id) const { return trackIndex.at(id); }
+	Track* GetTrackByID(const string& id) const;
+	/** Get a reference to the Track by its index in the list of Track%s */
+	inline Track* GetTrackByIndex(int index) const { return tracks.at(index); }
+	/** 
+	 * Get a reference to the Track by its index, if the Track at that index has the given id.
+	 * Otherwise the Track is looked up by its id.
+	 */
+	inline const Track* ResolveTrack(int index, const string& id) const {
+		if(index >= 0 && index < tracks.size() && tracks[index]->GetID() == id) return tracks[index];
+		return GetTrackByID(id);
+	}
 	/** Get all the Track%s */
 	inline const vector<Track*>& GetTracks() const { return tracks; }
 	/** Get all the facilities */
 	inline const vector<Facility*>& GetFacilities() const { return facilities; }
 	/** Get a reference to a Facility by its id */
 	const Facility* GetFacilityByID(int id) const;
+	
+	/**
+	 * Add the TrainUnitType%s to this Location, unless a TrainUnitType with the same name is already known.
+	 * Returns all TrainUnitType%s of this Location by name
+	 */
+	map<string, TrainUnitType*> AddTrainUnitTypes(const PBList<PBTrainUnitType>& pb_types) const;
+	/** Get all the TrainUnitType%s of this Location by name */
+	map<string, TrainUnitType*> GetTrainUnitTypes() const;
+	/** Get the track part graph of this Location. It is built on the first call and shared afterwards */
+	const LocationGraph& GetGraph() const;
+	/** Get an estimate of the memory used by this Location and its path tables, in bytes */
+	size_t GetMemoryUsage() const;
 
 	/**
 	 * Get the distance from one Track to another based on the provided distance matrix
@@ -105,6 +160,13 @@ public:
 	inline int GetDurationByType(const Track* track) const { 
 		return (track->GetType() == TrackPartType::Railroad && track->GetLength() == 0) ? 0  : moveDuration.at(track->GetType()); }
 	
+	/**
+	 * Get the duration of moving from a Track onto its neighbor to, as used by GetDistance.
+	 * 
+	 * This is the duration of to by type, or the distance between the Track%s in the distance matrix (0 if unknown)
+	 */
+	int GetEdgeDuration(const Track* from, const Track* to) const;
+
 	/**
 	 * Get the duration for the route described by the Track%s
 	 */
@@ -120,7 +182,7 @@ public:
 	 * 
 	 * Calling this method once is required if you want to use GetNeighborPath.
 	 */
-	void CalcNeighboringPaths();
+	void CalcNeighboringPaths() const;
 	
 	/**
 	 * Calculate all the shortest paths. 
@@ -128,14 +190,14 @@ public:
 	 * Calling this method once (per TrainUnitType) is required if you want to use GetShortestPath.
 	 * The parameter type is used because different train types have different Setback times.
 	 */
-	void CalcShortestPaths(const TrainUnitType* type);
+	void CalcShortestPaths(const TrainUnitType* type) const;
 	
 	/**
 	 * Calculate all the possible paths. 
 	 * 
 	 * Calling this method once is required if you want to use GetPossiblePaths.
 	 */
-	void CalcAllPossiblePaths();
+	void CalcAllPossiblePaths() const;
 
 	/**
 	 * Get the shortest path from a certain position to a destination.
@@ -144,8 +206,7 @@ public:
 	 * position and its previous position. The current position must always be a track of type Railroad
 	 * Call CalcShortestPaths (once) to calculate all the shortest paths
 	 */
-	inline Path GetShortestPath(const TrainUnitType* type, const Position& from, const Position& to) const {
-		return shortestPath.at(type->setbackTime).at({from, to}); }
+	Path GetShortestPath(const TrainUnitType* type, const Position& from, const Position& to) const;
 	
 	/**
 	 * Get all the neighboring paths from a certain position
@@ -0,0 +1,84 @@
+/** \file LocationGraph.h
+ * Describes the LocationGraph class
+ */
+#pragma once
+#ifndef LOCATION_GRAPH_H
+#define LOCATION_GRAPH_H
+#include "State.h"
+
+using namespace std;
+
+/**
+ * The track part graph of a Location in compressed sparse row (CSR) form.
+ *
+ * The nodes are all the Track%s of the Location, in the order of Location::GetTracks (so node i is the Track with index i).
+ * Node u has an edge to every neighbor v, first to its A-side Track%s and then to its B-side Track%s.
+ * The edges of node u are the entries GetIndptr()[u] up to GetIndptr()[u+1] of the edge arrays.
+ * The duration of an edge is the duration of moving onto Track v, see Location::GetEdgeDuration.
+ *
+ * The direction of movement is described by the transitions between edges: a ShuntingUnit that moved over edge (u, v)
+ * can continue over edge (v, w) for every Track w in Track::GetNextTrackParts of v with u as previous Track.
+ * The transitions are also stored in CSR form, with one row per edge.
+ *
+ * Use Location::GetGraph to get the shared LocationGraph of a Location.
+ */
+class LocationGraph {
+private:
+	vector<const Track*> tracks;
+	vector<int32_t> indptr, indices, edgeDurations;
+	vector<int8_t> edgeSides;
+	vector<int32_t> transitionIndptr, transitionIndices;
+	vector<int32_t> types;
+	vector<double> lengths;
+	vector<uint8_t> electrified, parkingAllowed, sawMovementAllowed;
+	vector<int32_t> facilityIndptr, facilityIDs;
+	int FindEdge(int from, int to) const;
+public:
+	/** The number of dynamic features per node, see FeaturizeNodes */
+	static constexpr int numberOfNodeFeatures = 5;
+
+	LocationGraph() = delete;
+	/** Construct the LocationGraph of the given Location */
+	LocationGraph(const Location& location);
+	/**
+	 * Write the dynamic features of every node in the given State into out, which should have room for
+	 * GetNumberOfNodes() * numberOfNodeFeatures values.
+	 *
+	 * Per node, the features are the number of ShuntingUnit%s on the Track, the occupied fraction of its length,
+	 * whether the Track is reserved, the number of moving ShuntingUnit%s on the Track and the number of remaining
+	 * Task%s of the Train%s on the Track.
+	 */
+	void FeaturizeNodes(const State* state, float* out) const;
+	/** Get the number of nodes (Track%s) */
+	inline size_t GetNumberOfNodes() const { return types.size(); }
+	/** Get the number of directed edges */
+	inline size_t GetNumberOfEdges() const { return indices.size(); }
+	/** Get the row pointers of the edges, with GetNumberOfNodes()+1 values */
+	inline const vector<int32_t>& GetIndptr() const { return indptr; }
+	/** Get the target node of every edge */
+	inline const vector<int32_t>& GetIndices() const { return indices; }
+	/** Get the duration of every edge */
+	inline const vector<int32_t>& GetEdgeDurations() const { return edgeDurations; }
+	/** Get for every edge whether its target is an A-side (0) or a B-side (1) neighbor of its source */
+	inline const vector<int8_t>& GetEdgeSides() const { return edgeSides; }
+	/** Get the row pointers of the transitions, with GetNumberOfEdges()+1 values */
+	inline const vector<int32_t>& GetTransitionIndptr() const { return transitionIndptr; }
+	/** Get the edge index that every transition continues with */
+	inline const vector<int32_t>& GetTransitionIndices() const { return transitionIndices; }
+	/** Get the TrackPartType of every node */
+	inline const vector<int32_t>& GetTypes() const { return types; }
+	/** Get the length of every node */
+	inline const vector<double>& GetLengths() const { return lengths; }
+	/** Get for every node whether it is electrified */
+	inline const vector<uint8_t>& GetElectrified() const { return electrified; }
+	/** Get for every node whether parking is allowed */
+	inline const vector<uint8_t>& GetParkingAllowed() const { return parkingAllowed; }
+	/** Get for every node whether saw movements are allowed */
+	inline const vector<uint8_t>& GetSawMovementAllowed() const { return sawMovementAllowed; }
+	/** Get the row pointers of the facilities, with GetNumberOfNodes()+1 values */
+	inline const vector<int32_t>& GetFacilityIndptr() const { return facilityIndptr; }
+	/** Get the Facility ids of every node */
+	inline const vector<int32_t>& GetFacilityIDs() const { return facilityIDs; }
+};
+
+#endif
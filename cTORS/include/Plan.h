@@ -15,22 +15,21 @@ class LocationEngine;
  */
 class POSAction {
 private:
-    static int newUID;
+    static atomic<int> newUID;
     int id;
     int suggestedStart, suggestedEnd, minDuration;
-    const SimpleAction* action;
+    shared_ptr<const SimpleAction> action;
 public:
     POSAction() = delete;
-    /** Construct a POSAction from the given parameters */
+    /** Construct a POSAction from the given parameters. The POSAction takes ownership of the action */
     POSAction(int suggestedStart, int suggestedEnd, int minDuration, const SimpleAction* action) :
         id(newUID++), suggestedStart(suggestedStart), suggestedEnd(suggestedEnd), minDuration(minDuration), action(action) {}
-    /** Copy constructor */
-    POSAction(const POSAction& pa) : id(pa.id), suggestedStart(pa.suggestedStart), suggestedEnd(pa.suggestedEnd),
-        minDuration(pa.minDuration), action(pa.action->Clone()) {}
+    /** Copy constructor. The copy shares the (immutable) SimpleAction */
+    POSAction(const POSAction& pa) = default;
     /** POSAction destructor */
-    ~POSAction() { delete action; }
-    /** Assignment operator */
-    POSAction& operator=(const POSAction& pa);
+    ~POSAction() = default;
+    /** Assignment operator. The SimpleAction is shared */
+    POSAction& operator=(const POSAction& pa) = default;
     /** Get the unique id of the action */
     inline int GetID() const { return id; }
     /** Get the suggested start time of the action */
@@ -40,7 +39,7 @@ public:
     /** Get the suggested minimum duration time of the action */
     inline int GetMinimumDuration() const { return minDuration; }
     /** Get the SimpleAction of this POSAction */
-    inline const SimpleAction* GetAction() const { return action; }
+    inline const SimpleAction* GetAction() const { return action.get(); }
     /** Serialize this POSAction to a protobuf object */
     void Serialize(const LocationEngine& engine, const State* state, PBAction* pb_action) const;
     /** Construct a POSAction from a protobuf action */
@@ -131,7 +130,7 @@ public:
     /** Serialize this object to a protobuf file */
     void SerializeToFile(LocationEngine& engine, const string& outfile) const;
     /** Construct a RunResult from a protobuf object by using the provided Engine */
-    static RunResult* CreateRunResult(const Engine& engine, const PBRun& pb_run);
+    static RunResult* CreateRunResult(Engine& engine, const PBRun& pb_run);
     /** Construct a RunResult from a protobuf object by using the provided Location */
     static RunResult* CreateRunResult(const Location* location, const PBRun& pb_run);
 };
@@ -9,6 +9,8 @@
 #include <list>
 #include <google/protobuf/message.h>
 #include <google/protobuf/util/json_util.h>
+#include <google/protobuf/io/gzip_stream.h>
+#include <google/protobuf/io/zero_copy_stream_impl_lite.h>
 #include "Location.pb.h"
 #include "Scenario.pb.h"
 #include "TrainUnitTypes.pb.h"
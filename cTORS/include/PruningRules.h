@@ -0,0 +1,64 @@
+/** \file PruningRules.h
+ * Describes the PruningRule class with its subclasses
+ */
+#pragma once
+#ifndef PRUNING_RULES_H
+#define PRUNING_RULES_H
+#include "State.h"
+#include "Action.h"
+
+
+#ifndef DEFINE_PRUNINGRULE
+/** MACRO for defining PruningRule's subclasses to prevent duplicate code */
+#define DEFINE_PRUNINGRULE(name) \
+class name : public PruningRule { \
+public: \
+	name() = delete; \
+	/** Construct this name based on the parameters defined in the json object */ \
+	name(const json& params, const Location* location) : PruningRule(params, location) {}; \
+	void Prune(const State* state, list<const Action*>& actions) const override; \
+};
+#endif
+
+/**
+ * Abstract base class for all the pruning rules. The ActionManager applies the active pruning rules (see
+ * Config::IsPruningRuleActive) to the valid Action%s, in order to remove Action%s that are dominated by other valid
+ * Action%s.
+ */
+class PruningRule {
+protected:
+	const Location* location; /**< a reference to the Location object */
+public:
+	PruningRule() = delete;
+	/** Construct this PruningRule based on the parameters defined in the json object */
+	PruningRule(const json& params, const Location* location) : location(location) {};
+	/** The default destructor */
+	virtual ~PruningRule() = default;
+	/** Remove and delete the dominated Action%s from the valid Action%s of the given State */
+	virtual void Prune(const State* state, list<const Action*>& actions) const = 0;
+};
+
+/**
+ * Rule that removes all WaitAction%s while a valid ExitAction is available for an Outgoing train that is due
+ * (its departure time is now or past). Waiting never enables the ExitAction, so any plan can first apply the
+ * ExitAction and then wait.
+ */
+DEFINE_PRUNINGRULE(wait_at_departure_rule)
+
+/**
+ * Rule that removes MoveAction%s onto a dead-end Track (a Track that can only be left via the side it is entered)
+ * if a ShuntingUnit on that Track must leave before the moving ShuntingUnit. The departure of a ShuntingUnit is the
+ * earliest time of the remaining Outgoing trains that contain one of its Train%s by ID, or by TrainUnitType if the
+ * Outgoing train is not matched. This rule is a heuristic: a plan may still move the blocking ShuntingUnit away
+ * before the departure.
+ */
+DEFINE_PRUNINGRULE(exit_order_move_rule)
+
+/**
+ * Rule that keeps only the fastest MoveAction for every ShuntingUnit, destination Track and arrival side, and
+ * removes the slower routes to the same destination. This rule ignores the difference in the Track%s that are
+ * reserved by the routes.
+ */
+DEFINE_PRUNINGRULE(fastest_route_rule)
+
+#endif
@@ -0,0 +1,47 @@
+/** \file Rollout.h
+ * Describes the RolloutPolicy, the RolloutResult and the PlayRollouts function
+ */
+#pragma once
+#ifndef ROLLOUT_H
+#define ROLLOUT_H
+#include "Engine.h"
+#include "Plan.h"
+
+using namespace std;
+
+/** The policies for choosing an Action in a rollout, see PlayRollouts */
+enum class RolloutPolicy : int32_t {
+	Random, /**< Choose a valid Action uniformly at random */
+	Greedy, /**< Choose the valid Action with the highest priority (see GetRolloutPriority), breaking ties at random */
+	Mix     /**< Choose a valid Action at random, with a probability proportional to its priority */
+};
+
+/** The aggregated outcome of a number of rollouts, see PlayRollouts */
+struct RolloutResult {
+	size_t numberOfRollouts = 0;  /**< The number of rollouts that were played */
+	size_t numberOfSuccesses = 0; /**< The number of rollouts that handled all the Incoming and Outgoing trains */
+	double meanScore = 0;         /**< The mean score of the rollouts */
+	double meanTrainsLeft = 0;    /**< The mean number of Train%s in the remaining Outgoing trains at the end of a rollout */
+	double meanEndTime = 0;       /**< The mean time at the end of a rollout */
+	double bestScore = 0;         /**< The highest score of a rollout */
+	POSPlan bestPlan;             /**< The POSAction%s that the best rollout applied after the given State, if requested */
+};
+
+/** Get the priority of an Action of the given ActionKind for the Greedy and Mix RolloutPolicy */
+int GetRolloutPriority(ActionKind kind);
+
+/**
+ * Play n rollouts from the given State until no valid Action remains, the session fails, or maxSteps Action%s are applied.
+ * 
+ * The given State is not changed. Every rollout starts from a copy of its session, see LocationEngine::CopySession.
+ * The rollouts are divided over nThreads threads, or one per hardware thread if nThreads <= 0. Rollout i uses random
+ * seed seed + i, so the result does not depend on the number of threads. The LocationEngine should not be used by other
+ * threads meanwhile.
+ * 
+ * The score of a rollout is 0 if it failed or not all Incoming trains arrived, and otherwise the fraction of the Train%s
+ * of the Scenario that left the shunting yard. The best rollout is the first rollout with the highest score.
+ */
+RolloutResult PlayRollouts(LocationEngine& engine, State* state, RolloutPolicy policy, size_t n, unsigned int seed = 0,
+	int maxSteps = 1000, int nThreads = 0, bool keepBestPlan = false);
+
+#endif
@@ -9,6 +9,24 @@
 namespace fs = std::filesystem;
 using namespace std;
 
+/**
+ * Summary of a scenario file: the metadata that can be read without constructing the Scenario
+ */
+struct ScenarioInfo {
+	/** The number of Train%s in the incoming trains */
+	int numberOfTrains;
+	/** The number of Incoming trains */
+	int numberOfIncoming;
+	/** The number of Outgoing trains */
+	int numberOfOutgoing;
+	/** The start time of the scenario */
+	int startTime;
+	/** The end time of the scenario */
+	int endTime;
+	/** The (unique) names of the TrainUnitType%s of the incoming trains */
+	vector<string> trainTypes;
+};
+
 /**
  * The Scenario class describes a session by its Incoming trains, Outgoing trains
  * Employee%s and Disturbance%s. An initial State is generated from a Scenario object.
@@ -22,7 +40,13 @@ private:
 	vector<const Incoming*> incomingTrains;
 	vector<const Outgoing*> outgoingTrains;
 	vector<const Event*> disturbanceList;
+	shared_ptr<unordered_map<const void*, shared_ptr<const void>>> owned;
 
+	template<class T> const T* Own(const T* object);
+	template<class T> void Adopt(vector<const T*>& objects);
+	template<class T> void Detach(vector<const T*>& objects);
+	template<class T> void Replace(vector<const T*>& objects, const vector<const T*>& replacement);
+	void Unshare();
 	void ImportEmployees(const PBScenario& pb_scenario, const Location& location);
 	void ImportShuntingUnits(const PBScenario& pb_scenario, const Location& location);
 	void Init(const PBScenario& pb_scenario, const Location& location);
@@ -33,10 +57,17 @@ public:
 	Scenario(string path, const Location& location);
 	/** Generate a Scenario according to the protobuf object for the provided Location */
 	Scenario(const PBScenario& pb_scenario, const Location& location);
-	/** Copy constructor */
+	/**
+	 * Copy constructor.
+	 *
+	 * The Incoming trains, Outgoing trains and Employee%s that are owned by the given Scenario are shared with the copy, 
+	 * the others are copied. Shared objects are copied when they are detached, see DetachIncomingTrains.
+	 */
 	Scenario(const Scenario& scenario);
+	/** Assign the given Scenario to this Scenario, sharing its objects like the copy constructor */
+	Scenario& operator=(const Scenario& scenario);
 	/** Scenario destructor */
-	~Scenario();
+	~Scenario() = default;
 
 	/** Print the Scenario Info */
 	void PrintScenarioInfo() const;
@@ -55,6 +86,12 @@ public:
 	inline const vector<const Incoming*>& GetIncomingTrains() const { return incomingTrains; }
 	/** Get all the employees (not yet implemented) */
 	inline const vector<const Employee*>& GetEmployees() const { return employees; }
+	/** Copy the Outgoing trains that are shared with other Scenario%s and get all the Outgoing trains, so they can be modified */
+	const vector<const Outgoing*>& DetachOutgoingTrains();
+	/** Copy the Incoming trains that are shared with other Scenario%s and get all the Incoming trains, so they can be modified */
+	const vector<const Incoming*>& DetachIncomingTrains();
+	/** Copy the Employee%s that are shared with other Scenario%s and get all the Employee%s, so they can be modified */
+	const vector<const Employee*>& DetachEmployees();
 	/** Get the number of Train%s in this Scenario */
 	const size_t GetNumberOfTrains() const;
 	/** Get a Train by its id from this Scenario */
@@ -82,26 +119,41 @@ public:
 	inline void SetStartTime(int startTime) { this->startTime = startTime; }
 	/** Set the end time of this scenario */
 	inline void SetEndTime(int endTime) { this->endTime = endTime; }
-	/** Set the list of Outgoing trains in this Scenario */
-	inline void SetOutgoingTrains(vector<const Outgoing*> outgoingTrains) { this->outgoingTrains = outgoingTrains; }
-	/** Set the list of Incoming trains in this Scenario */
-	inline void SetIncomingTrains(vector<const Incoming*> incomingTrains) { this->incomingTrains = incomingTrains; }
-	/** Set the list of Employee%s in this Scenario (not yet implemented) */
-	inline void SetEmployees(vector<const Employee*> employees) { this->employees = employees; }
+	/** 
+	 * Set the list of Outgoing trains in this Scenario. The Scenario takes ownership of the Outgoing trains 
+	 * it did not own yet. The ones that are no longer in the list are kept until the Scenario is deleted
+	 */
+	void SetOutgoingTrains(const vector<const Outgoing*>& outgoingTrains);
+	/** 
+	 * Set the list of Incoming trains in this Scenario. The Scenario takes ownership of the Incoming trains 
+	 * it did not own yet. The ones that are no longer in the list are kept until the Scenario is deleted
+	 */
+	void SetIncomingTrains(const vector<const Incoming*>& incomingTrains);
+	/** 
+	 * Set the list of Employee%s in this Scenario (not yet implemented). The Scenario takes ownership of the Employee%s 
+	 * it did not own yet. The ones that are no longer in the list are kept until the Scenario is deleted
+	 */
+	void SetEmployees(const vector<const Employee*>& employees);
 	/** Set the queue of Disturbance%s in this Scenario (not yet implemented) */
 	inline void SetDisturbances(EventQueue disturbances) { this->disturbances = disturbances; }
 
-	/** Add an Outgoing train to this Scenario */
-	inline void AddOutgoingTrain(const Outgoing* outgoingTrain) { outgoingTrains.push_back(outgoingTrain); }
-	/** Add an Incoming train to this Scenario */
-	inline void AddIncomingTrain(const Incoming* incomingTrain) { incomingTrains.push_back(incomingTrain); }
+	/** Add an Outgoing train to this Scenario. The Scenario takes ownership of the Outgoing train */
+	void AddOutgoingTrain(const Outgoing* outgoingTrain);
+	/** Add an Incoming train to this Scenario. The Scenario takes ownership of the Incoming train */
+	void AddIncomingTrain(const Incoming* incomingTrain);
 	/** Add a Disturbance to this Scenario (not yet implemented) */
 	inline void AddDisturbance(const Event* disturbance) { disturbances.push(disturbance); }
-	/** Add an Employee to this Scenario (not yet implemented) */
-	inline void AddEmployee(const Employee* employee) { employees.push_back(employee); }
+	/** Add an Employee to this Scenario (not yet implemented). The Scenario takes ownership of the Employee */
+	void AddEmployee(const Employee* employee);
 
 	/** Serialize this object to a protobuf object */
 	void Serialize(PBScenario* pb_scenario) const;
+
+	/**
+	 * Read the ScenarioInfo from the protobuf file on the given path, without constructing a Scenario.
+	 * Throws a runtime_error if the file is not a valid Scenario file.
+	 */
+	static ScenarioInfo ReadInfo(const string& path);
 };
 
 #endif
\ No newline at end of file
@@ -0,0 +1,122 @@
+/** \file Search.h
+ * Describes the SearchHeuristic, the LowerBoundTable, the search results and the BeamSearch and AStarSearch functions
+ */
+#pragma once
+#ifndef SEARCH_H
+#define SEARCH_H
+#include "Engine.h"
+
+using namespace std;
+
+/**
+ * The weights of the terms of the heuristic score of a State, see GetHeuristicScore. A higher score is better.
+ */
+struct SearchHeuristic {
+	double trainsServed = 1.0;	/**< The reward per Train that left the shunting yard */
+	double slack = 0.0;			/**< The reward per hour until the departure of the remaining Outgoing trains */
+	double tasks = 0.1;			/**< The penalty per remaining Task of the Train%s on the shunting yard and the remaining Incoming trains */
+	double distance = 0.001;	/**< The penalty per second of the summed shortest paths of the ShuntingUnit%s to their next target */
+};
+
+/** The outcome of a BeamSearch */
+struct BeamSearchResult {
+	vector<size_t> actions;			/**< The indices of the valid Action%s (see LocationEngine::GetValidActions) that the best plan applies, starting from the given State */
+	bool complete = false;			/**< True iff the best plan handles all the Incoming and Outgoing trains */
+	double score = 0;				/**< The heuristic score of the State at the end of the best plan */
+	size_t numberOfExpansions = 0;	/**< The number of States that were generated */
+	size_t numberOfDuplicates = 0;	/**< The number of generated States that were discarded because a State with the same fingerprint was generated before */
+};
+
+/** The outcome of an AStarSearch */
+struct AStarResult {
+	vector<size_t> actions;			/**< The indices of the valid Action%s (see LocationEngine::GetValidActions) of the plan, starting from the given State */
+	bool complete = false;			/**< True iff the plan handles all the Incoming and Outgoing trains */
+	double cost = 0;				/**< The cost of the plan: the summed duration of its Action%s, except WaitAction%s */
+	double lowerBound = 0;			/**< A proven lower bound on the cost of any complete plan from the given State, infinite if there is none */
+	size_t numberOfExpansions = 0;	/**< The number of States that were expanded */
+	size_t numberOfGenerated = 0;	/**< The number of States that were generated */
+	double elapsed = 0;				/**< The duration of the search in seconds */
+};
+
+/**
+ * The LowerBoundTable stores precomputed data of a Scenario to compute an admissible lower bound on the cost (see
+ * AStarResult::cost) to handle all Incoming and Outgoing trains from a State in O(#units).
+ *
+ * The table contains the minimum travel time between every pair of Railroad Track%s (see CalcTravelTimes), the
+ * Track%s of the Facility%s for every Task type and the candidate exit Track%s of every Train. Service Task%s are
+ * only taken into account if the mandatory_service_task_rule is active, and exit Track%s only if the
+ * out_correct_track_rule is active.
+ */
+class LowerBoundTable {
+private:
+	size_t numberOfTracks;
+	vector<int> distances;
+	unordered_map<string, vector<int>> serviceTracks;
+	unordered_map<string, int> serviceCapacity;
+	unordered_map<int, vector<int>> exitTracks;
+	bool mandatoryServices, fixedExitTracks;
+	int GetTrainBound(const Train& train, const Track* position, const vector<Task>& tasks) const;
+public:
+	LowerBoundTable() = delete;
+	/** Construct the LowerBoundTable for the given Scenario in the Location of the given LocationEngine */
+	LowerBoundTable(const LocationEngine& engine, const Scenario& scenario);
+	/** Get the minimum travel time from one Railroad Track to another, or MAX_PATH_LENGTH if there is no path */
+	inline int GetDistance(const Track* from, const Track* to) const {
+		return distances.at(from->GetIndex() * numberOfTracks + to->GetIndex()); }
+	/**
+	 * Get a lower bound on the cost to handle all Incoming and Outgoing trains from the given State. The bound is
+	 * the summed duration of the remaining mandatory service Task%s plus the maximum over all Train%s of the
+	 * travel time to their exit Track via the Facility%s for each of their remaining mandatory service Task%s.
+	 *
+	 * @return the lower bound, or infinity if the remaining mandatory service Task%s of a type cannot be executed
+	 * before the end of the Scenario by the Facility%s that execute that type, or if a Train cannot reach its targets
+	 */
+	double GetLowerBound(const State* state) const;
+};
+
+/**
+ * Get the heuristic score of the State. The score combines the number of Train%s that left, the time until the
+ * departure of the remaining Outgoing trains, the number of remaining Task%s and the summed shortest path lengths
+ * from the ShuntingUnit%s to their next target: a Track of a Facility for their first remaining Task, or the
+ * parking Track of a matching Outgoing train.
+ *
+ * The distance term requires LocationEngine::CalcShortestPaths.
+ */
+double GetHeuristicScore(const LocationEngine& engine, const State* state, const SearchHeuristic& heuristic);
+
+/**
+ * Search for a plan from the given State with a beam search of the given width.
+ *
+ * Every epoch, every State in the beam is expanded by applying each of its valid Action%s. Generated States that
+ * have the same fingerprint as an earlier generated State (see State::GetFingerprint) are discarded, as are States in
+ * which the session failed. Only the fingerprints are compared, so the search is lossy: a State of which the
+ * fingerprint collides with that of another State is discarded as well. The width best States by their heuristic
+ * score (see GetHeuristicScore) form the next beam. The search stops when a State is generated in which all Incoming
+ * and Outgoing trains are handled, when the beam is empty, or after maxDepth epochs or timeLimit seconds (if
+ * positive). The time limit is also checked during an epoch. The result describes the best State found in the last
+ * completed epoch.
+ *
+ * The expansions are divided over nThreads threads, or one per hardware thread if nThreads <= 0. Unless the time
+ * limit is reached, the result does not depend on the number of threads. The given State is not changed and the
+ * LocationEngine should not be used by other threads meanwhile.
+ */
+BeamSearchResult BeamSearch(LocationEngine& engine, State* state, size_t width, const SearchHeuristic& heuristic,
+	int maxDepth = 1000, double timeLimit = -1, int nThreads = 0);
+
+/**
+ * Search for a plan with minimum cost (see AStarResult::cost) from the given State with a weighted A* search,
+ * using the admissible lower bound of the LowerBoundTable of the session (see LocationEngine::GetLowerBoundTable)
+ * as heuristic.
+ *
+ * States are expanded in the order of cost + weight * lower bound. With weight 1 a complete plan is optimal, and
+ * with weight w > 1 its cost is at most w times the optimal cost. Generated States with the same fingerprint (see
+ * State::GetFingerprint) as an earlier generated State with lower or equal cost are discarded. Only the fingerprints
+ * are compared, so a collision of the fingerprints of different States may discard a State. The search stops
+ * when a complete plan is found, no State is left, or after maxExpansions expansions or timeLimit seconds (if
+ * positive). If no complete plan is found, the result describes the plan to the expanded State with the lowest
+ * lower bound. The given State is not changed.
+ */
+AStarResult AStarSearch(LocationEngine& engine, State* state, double weight = 1.0, size_t maxExpansions = 100000,
+	double timeLimit = -1);
+
+#endif
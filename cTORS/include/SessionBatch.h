@@ -0,0 +1,71 @@
+/** \file SessionBatch.h
+ * Describes the SessionBatch class
+ */
+#pragma once
+#ifndef SESSION_BATCH_H
+#define SESSION_BATCH_H
+#include "Engine.h"
+
+using namespace std;
+
+/**
+ * A batch of sessions on one LocationEngine that are stepped together, for vectorized reinforcement learning.
+ *
+ * Every call writes into buffers with one row per session. The observation of a session is the observation
+ * of the Featurizer followed by its action mask as zeros and ones, and has GetObservationSize values.
+ *
+ * Step may step the sessions on several threads. Reset starts and ends sessions on the LocationEngine,
+ * and should therefore not be called while another thread uses the LocationEngine.
+ */
+class SessionBatch {
+private:
+	LocationEngine* engine;
+	const Featurizer* featurizer;
+	vector<State*> states;
+	vector<size_t> numberOfTrains;
+	float stepPenalty;
+	int nThreads;
+
+	void WriteObservation(size_t index, float* obs, bool* masks);
+	void StepSession(size_t index, int action, float* obs, float* rewards, bool* dones, bool* masks);
+public:
+	SessionBatch() = delete;
+	SessionBatch(const SessionBatch& batch) = delete;
+	/**
+	 * Construct a SessionBatch of size sessions on the given LocationEngine.
+	 *
+	 * Every Step costs stepPenalty reward. Step uses nThreads threads, or one per hardware thread if nThreads <= 0.
+	 */
+	SessionBatch(LocationEngine& engine, const Featurizer& featurizer, size_t size, float stepPenalty = 0.005, int nThreads = 0);
+	/** Destroy this SessionBatch and end its sessions */
+	~SessionBatch();
+	/**
+	 * Start a new session for the given Scenario at the given index. The previous session at that index is reset
+	 * in place, see LocationEngine::ResetSession.
+	 *
+	 * The first observation and action mask are written into row index of obs and masks.
+	 */
+	void Reset(size_t index, const Scenario& scenario, float* obs, bool* masks);
+	/**
+	 * Apply the given action indices (see Featurizer::GetSimpleAction) to all the sessions and step them.
+	 *
+	 * The new observations, rewards, done flags and action masks are written into obs, rewards, dones and masks.
+	 * A session is done if the action is invalid, the Scenario failed or no valid Action%s remain. In the last case,
+	 * if all the Incoming trains arrived, the reward is the fraction of the Train%s that left the shunting yard.
+	 * Done sessions stay in their last State until they are Reset. Other errors are passed on to the caller
+	 * when all the threads are finished.
+	 */
+	void Step(const int64_t* actions, float* obs, float* rewards, bool* dones, bool* masks);
+	/** Get the State of the session at the given index, or nullptr if it is not started */
+	inline State* GetState(size_t index) const { return states.at(index); }
+	/** Get the number of sessions */
+	inline size_t GetSize() const { return states.size(); }
+	/** Get the number of values in an observation */
+	inline size_t GetObservationSize() const { return featurizer->GetObservationSize() + featurizer->GetNumberOfActions(); }
+	/** Get the Featurizer of this SessionBatch */
+	inline const Featurizer& GetFeaturizer() const { return *featurizer; }
+	/** Get the number of threads used by Step */
+	inline int GetNumberOfThreads() const { return nThreads; }
+};
+
+#endif
@@ -25,8 +25,8 @@ public:
 	ShuntingUnit() = delete;
 	/** Construct a ShuntingUnit with the given id and the given Train%s */
 	ShuntingUnit(int id, const vector<Train>& trains) : id(id), trains(trains) { UpdateValues(); }
-	/** Construct a ShuntingUnit from the given protobuf object */
-	ShuntingUnit(const PBTrainGoal& pb_tg);
+	/** Construct a ShuntingUnit from the given protobuf object, looking up the TrainUnitType%s in types */
+	ShuntingUnit(const PBTrainGoal& pb_tg, const map<string, TrainUnitType*>& types);
 	/** The default copy constructor */
 	ShuntingUnit(const ShuntingUnit& su) = default;
 
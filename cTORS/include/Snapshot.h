@@ -0,0 +1,149 @@
+/** \file Snapshot.h
+ * Describes the SnapshotWriter and SnapshotReader, which encode the binary snapshots of LocationEngine::SaveState
+ */
+#pragma once
+#ifndef SNAPSHOT_H
+#define SNAPSHOT_H
+#include "Utils.h"
+
+using namespace std;
+
+/** The first bytes of every snapshot */
+constexpr char snapshotMagic[] = "TORS";
+/** The version of the snapshot format that is written by LocationEngine::SaveState */
+constexpr uint32_t snapshotVersion = 1;
+
+/**
+ * A SnapshotWriter appends values to a binary snapshot. Integers are written as variable length integers (zigzag
+ * encoded if signed), so that small values take one byte and the snapshot does not depend on the byte order of the
+ * machine. Strings are written as their length followed by their bytes.
+ */
+class SnapshotWriter {
+private:
+	string data;
+public:
+	/** Construct a SnapshotWriter and write the header of the snapshot */
+	SnapshotWriter() : data(snapshotMagic) { PutUnsigned(snapshotVersion); }
+	/** Write an unsigned integer */
+	void PutUnsigned(uint64_t value) {
+		while(value >= 0x80) {
+			data.push_back(static_cast<char>(value | 0x80));
+			value >>= 7;
+		}
+		data.push_back(static_cast<char>(value));
+	}
+	/** Write a signed integer */
+	inline void PutInt(int64_t value) { PutUnsigned((static_cast<uint64_t>(value) << 1) ^ static_cast<uint64_t>(value >> 63)); }
+	/** Write a boolean */
+	inline void PutBool(bool value) { data.push_back(value ? 1 : 0); }
+	/** Write a string */
+	inline void PutString(const string& value) {
+		PutUnsigned(value.size());
+		data.append(value);
+	}
+	/** Write a vector of integers, preceded by its size */
+	inline void PutInts(const vector<int>& values) {
+		PutUnsigned(values.size());
+		for(auto v: values) PutInt(v);
+	}
+	/** Get the snapshot */
+	inline const string& GetData() const { return data; }
+};
+
+/**
+ * A SnapshotReader reads the values of a snapshot that was written by a SnapshotWriter. An invalid_argument
+ * exception is thrown if the snapshot is truncated, or if it was not written by a SnapshotWriter of the current
+ * snapshotVersion.
+ */
+class SnapshotReader {
+private:
+	const string& data;
+	size_t position = 0;
+	inline void Require(size_t n) const {
+		if(data.size() - position < n) throw invalid_argument("The snapshot is truncated.");
+	}
+public:
+	SnapshotReader() = delete;
+	/** Construct a SnapshotReader for the given snapshot and read its header */
+	SnapshotReader(const string& data) : data(data) {
+		size_t n = sizeof(snapshotMagic) - 1;
+		if(data.compare(0, n, snapshotMagic) != 0) throw invalid_argument("The data is not a state snapshot.");
+		position = n;
+		auto version = GetUnsigned();
+		if(version != snapshotVersion)
+			throw invalid_argument("Unsupported snapshot version " + to_string(version) + ", expected version " + to_string(snapshotVersion) + ".");
+	}
+	/** Read an unsigned integer */
+	uint64_t GetUnsigned() {
+		uint64_t value = 0;
+		for(int shift = 0; shift < 64; shift += 7) {
+			Require(1);
+			auto byte = static_cast<uint8_t>(data[position++]);
+			value |= static_cast<uint64_t>(byte & 0x7f) << shift;
+			if(byte < 0x80) return value;
+		}
+		throw invalid_argument("The snapshot contains an invalid integer.");
+	}
+	/** Read a signed integer */
+	inline int GetInt() {
+		auto value = GetUnsigned();
+		return static_cast<int>(static_cast<int64_t>(value >> 1) ^ -static_cast<int64_t>(value & 1));
+	}
+	/** Read a boolean */
+	inline bool GetBool() {
+		Require(1);
+		return data[position++] != 0;
+	}
+	/** Read a size, and check that the snapshot has at least that many bytes left */
+	inline size_t GetSize() {
+		auto size = GetUnsigned();
+		Require(size);
+		return static_cast<size_t>(size);
+	}
+	/** Read a string */
+	inline string GetString() {
+		auto size = GetSize();
+		position += size;
+		return data.substr(position - size, size);
+	}
+	/** Read a vector of integers */
+	inline vector<int> GetInts() {
+		vector<int> values(GetSize());
+		for(auto& v: values) v = GetInt();
+		return values;
+	}
+	/** Returns true iff all the data of the snapshot is read */
+	inline bool AtEnd() const { return position == data.size(); }
+};
+
+/** Get the canonical form of a location string, as it is stored in a snapshot */
+inline string GetCanonicalLocation(const string& location) {
+	error_code error;
+	auto canonical = fs::canonical(location, error);
+	return error ? location : canonical.string();
+}
+
+/**
+ * Get the identity of a Location as it is stored in a snapshot: the name of its folder and the hash of its
+ * protobuf file. Unlike the path, the identity is the same for a copy of the Location in another folder or on another host.
+ */
+inline string GetLocationID(const Location& location) {
+	auto folder = fs::weakly_canonical(fs::path(location.GetLocationFilePath()));
+	if(folder.filename().empty()) folder = folder.parent_path();
+	return folder.filename().string() + "#" + to_string(location.GetFileHash());
+}
+
+/** Get the (canonical) location string of a snapshot, see LocationEngine::SaveState. It is used to find the Location */
+inline string GetSnapshotLocation(const string& data) {
+	SnapshotReader reader(data);
+	return reader.GetString();
+}
+
+/** Get the identity of the Location of a snapshot, see GetLocationID */
+inline string GetSnapshotLocationID(const string& data) {
+	SnapshotReader reader(data);
+	reader.GetString();
+	return reader.GetString();
+}
+
+#endif
@@ -67,6 +67,7 @@ struct TrainState {
 class State
 {
 private:
+	Scenario scenario;
 	EventQueue events;
 	int time, startTime, endTime;
 	vector<const Incoming*> incomingTrains;
@@ -82,14 +83,25 @@ private:
 	bool changed;
 public:
 	State() = delete;
-	/** Construct an initial State object from a Scenario object and a vector of Track%s in a Location */
+	/** 
+	 * Construct an initial State object from a Scenario object and a vector of Track%s in a Location.
+	 * 
+	 * The State shares the Incoming trains, Outgoing trains and Employee%s of the Scenario, see Scenario::Scenario(const Scenario&).
+	 */
 	State(const Scenario& scenario, const vector<Track*>& tracks);
 	/** Default copy constructor */
 	State(const State& state) = default;
 	/** Destroy the State */
 	~State();
+	/**
+	 * Reset this State to a State of the given Scenario without ShuntingUnit%s, at the given time and with copies
+	 * of the given Event%s. The allocations of this State are reused where possible.
+	 */
+	void Reset(const Scenario& scenario, int time, const EventQueue& events);
 
 	//Events
+	/** Get the EventQueue */
+	inline const EventQueue& GetEvents() const { return events; }
 	/** Get the number of Event%s in the EventQueue */
 	inline size_t GetNumberOfEvents() const { return events.size(); }
 	/** Get the first Event in the EventQueue */
@@ -102,22 +114,36 @@ public:
 	void AddEvent(const Outgoing* out);
 	/** Add an Action finish Event to the EventQueue */
 	void AddEvent(const Action* action);
+	/** Add a copy of the given Event to the EventQueue */
+	void AddEvent(const Event& event);
 
 	//Time
 	/** Set the State's time */
 	void SetTime(int time);
 	/** Get the State's time */
 	inline int GetTime() const { return time; };
+	/** Get the Scenario that this State was started from */
+	inline const Scenario& GetScenario() const { return scenario; }
 	/** Get the end time of this Scenario */
 	inline int GetEndTime() const { return endTime; }
 	/** Get the start time of this Scenario */
 	inline int GetStartTime() const { return startTime; }
 	
+	/**
+	 * Get a fingerprint of this State. States that only differ in the order in which the same Action%s were
+	 * applied at the same time get the same fingerprint. The fingerprint includes the time, the remaining
+	 * Incoming and Outgoing trains, the Event%s, the reserved Track%s and for every ShuntingUnit its Train%s, remaining
+	 * Task%s, position, direction and active Action%s.
+	 */
+	size_t GetFingerprint() const;
+
 	//Changed
 	/** Returns true if this state has changed since the last time it was set to unchanged */
 	inline bool IsChanged() const { return changed; }
 	/** Set this state to unchanged */
 	inline void SetUnchanged() { changed = false; }
+	/** Set this state to changed, so that its valid Action%s are generated again */
+	inline void SetChanged() { changed = true; }
 	
 	//Apply action
 	/** Execute the start of the given Action */
@@ -192,6 +218,11 @@ public:
 	inline const Train* GetTrainByTrainID(int id) const { return_ce(trainIDToTrain.at(id)); }
 	/** Get the ShuntingUnit that currently contains the Train%s with the given ids, or null if not found*/
 	const ShuntingUnit* GetShuntingUnitByTrainIDs(const vector<int>& ids) const;
+	/** 
+	 * Get the ShuntingUnit that currently contains the Train%s with the given ids, or null if not found.
+	 * The handle su is returned directly if it is part of this State and contains exactly those Train%s.
+	 */
+	const ShuntingUnit* ResolveShuntingUnit(const ShuntingUnit* su, const vector<int>& ids) const;
 	/** Get the Incoming event by the given id */
 	const Incoming* GetIncomingByID(int id) const;
 	/** Get the Outgoing event by the given id */
@@ -227,6 +258,11 @@ public:
 	inline void AddShuntingUnit(const ShuntingUnit* su, const Track* track, const Track* previous) { AddShuntingUnit(su, track, previous, &su->GetTrains().front()); }
 	/** Add a ShuntingUnit to the State on the given position */
 	void AddShuntingUnitOnPosition(const ShuntingUnit* su, const Track* track, const Track* previous, const Train* frontTrain, int positionOnTrack);
+	/**
+	 * Rebuild the ShuntingUnitState%s with the given number of buckets, such that they are iterated in the given order
+	 * of the ShuntingUnit%s (see GetShuntingUnitStates). The Action%s are generated in this order.
+	 */
+	void SetShuntingUnitOrder(const vector<const ShuntingUnit*>& order, size_t bucketCount);
 	/** Set the front Train of the ShuntingUnit */
 	inline void SetFrontTrain(const ShuntingUnit* su, const Train* frontTrain) { ce(shuntingUnitStates.at(su).frontTrain = frontTrain); }
 	/** Switch the front Train of the ShuntingUnit */
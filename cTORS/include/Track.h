@@ -47,9 +47,12 @@ class Track {
 private:
 	vector<const Track*> aSides; /**< the A-side tracks of this track */
 	vector<const Track*> bSides; /**< the B-side tracks of this track */
+	vector<const Track*> neighbors; /**< the A-side and B-side tracks of this track */
 	/** a map connecting neighboring tracks to reachable tracks if the key track is the previous track */
 	unordered_map<const Track*, vector<const Track*>> next;
 	vector<const Facility*> facilities; /**< the facilities located at this track */
+	int index;							/**< the dense index of this track in its Location, or -1 */
+	friend class Location;
 public:
 	const string id; 				/**< The id of this track */
 	const TrackPartType type; 		/**< The type of this track */
@@ -144,12 +147,7 @@ public:
 	/**
 	 * Get all the neighbors of this track, both A-side and B-side.
 	 */
-	inline const vector<const Track*> GetNeighbors() const {
-		vector<const Track*> res = aSides;
-		if(bSides.size() > 0)
-			res.insert(res.end(), bSides.begin(), bSides.end());
-		return res;
-	}
+	inline const vector<const Track*>& GetNeighbors() const { return neighbors; }
 
 	/**
 	 * Get a neighbor of this track at the opposite side to previous
@@ -180,6 +178,11 @@ public:
 	 * Get the id of this track
 	 */
 	inline const string& GetID() const { return id; }
+
+	/**
+	 * Get the index of this track in the Location's track list, or -1 if it is not part of a Location
+	 */
+	inline int GetIndex() const { return index; }
 	
 	/**
 	 * @return true iff the id of this track equals the id of the other track
@@ -11,7 +11,6 @@ using namespace std;
  * The TrainUnitType describes the type of the Train
  */
 struct TrainUnitType {
-	static map<string,TrainUnitType*> types; /**< a static map containing all the initialized types */
 	const string displayName;		/**< The name of the train unit type */
 	const int carriages;			/**< The number of carriages */
 	const double length;			/**< The length of this train unit, in meters */
@@ -104,8 +103,8 @@ public:
 	Train() = delete;
 	/** Construct a Train from the given parameters */
 	Train(int id, TrainUnitType *type) : id(id), type(type) {}
-	/** Construct a Train from a protobuf object */
-	Train(const PBTrainUnit& pb_train);
+	/** Construct a Train from a protobuf object, looking up its TrainUnitType by name in types */
+	Train(const PBTrainUnit& pb_train, const map<string, TrainUnitType*>& types);
 	/** The default copy constructor */
 	Train(const Train &train) = default;
 	/** The default desctructor */
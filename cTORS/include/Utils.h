@@ -15,6 +15,12 @@
 #include <unordered_map>
 #include <map>
 #include <queue>
+#include <set>
+#include <memory>
+#include <mutex>
+#include <shared_mutex>
+#include <atomic>
+#include <tuple>
 //!\endcond
 #include "Proto.h"
 namespace fs = std::filesystem;
@@ -100,6 +106,88 @@ inline void parse_json_to_pb(const string& filename, google::protobuf::Message*
     parse_json_to_pb(fs::path(filename), message);
 }
 
+/**
+ * Get the path of a protobuf data file, trying the other supported formats if file_path does not exist.
+ * 
+ * For example, if data/location.json does not exist, data/location.json.gz, data/location.pb or 
+ * data/location.pb.gz is returned if one of those exists.
+ */
+inline fs::path resolve_pb_file(const fs::path& file_path) {
+    if (fs::exists(file_path)) return file_path;
+    fs::path stem = file_path;
+    if (stem.extension() == ".gz") stem.replace_extension();
+    if (stem.extension() == ".json" || stem.extension() == ".pb") stem.replace_extension();
+    for (auto ext : {".json", ".json.gz", ".pb", ".pb.gz"}) {
+        fs::path candidate = stem;
+        candidate += ext;
+        if (fs::exists(candidate)) return candidate;
+    }
+    return file_path;
+}
+
+/**
+ * Read a protobuf data file into message. Both the JSON format and the binary wire format are supported,
+ * optionally gzip compressed. 
+ * 
+ * Compression is detected by the gzip header. The format is derived from the extension (.json or .pb), 
+ * ignoring a trailing .gz. For other extensions the file is read as JSON if it starts with '{' and as binary otherwise.
+ * 
+ * @return false if the JSON data could not be parsed into message. Invalid binary data throws a runtime_error.
+ */
+inline bool parse_file_to_pb(const fs::path& file_path, google::protobuf::Message* message) {
+    auto path = resolve_pb_file(file_path);
+    ifstream fileInput(path, ios::in | ios::binary);
+    if (!fileInput.good())
+        throw runtime_error("The file " + file_path.string() + " does not exist.");
+    string data((istreambuf_iterator<char>(fileInput)), istreambuf_iterator<char>());
+    fileInput.close();
+    if (data.size() >= 2 && static_cast<unsigned char>(data[0]) == 0x1f && static_cast<unsigned char>(data[1]) == 0x8b) {
+        google::protobuf::io::ArrayInputStream compressed(data.data(), data.size());
+        google::protobuf::io::GzipInputStream input(&compressed);
+        string uncompressed;
+        const void* buffer;
+        int size;
+        while (input.Next(&buffer, &size))
+            uncompressed.append(static_cast<const char*>(buffer), size);
+        if (input.ZlibErrorMessage() != nullptr)
+            throw runtime_error("The file " + path.string() + " could not be decompressed: " + input.ZlibErrorMessage());
+        data.swap(uncompressed);
+    }
+    auto ext = path.extension() == ".gz" ? path.stem().extension() : path.extension();
+    bool json = ext == ".json" || (ext != ".pb" && data.size() > 0 && data.find_first_not_of(" \t\r\n") != string::npos 
+        && data[data.find_first_not_of(" \t\r\n")] == '{');
+    if (json) {
+        auto status = google::protobuf::util::JsonStringToMessage(data, message);
+        debug_out("Parse JSON " << path.string() << " / Status: " << status.ToString());
+        return status.ok();
+    } else if (!message->ParseFromString(data)) {
+        throw runtime_error("The file " + path.string() + " is not a valid binary " + message->GetTypeName() + " file.");
+    }
+    return true;
+}
+
+/**
+ * Write the message to a file in the binary protobuf format, optionally gzip compressed
+ */
+inline void parse_pb_to_binary(const fs::path& file_path, const google::protobuf::Message& message, bool compress) {
+    ofstream out (file_path, ios::out | ios::binary);
+    if(!out.is_open())
+        throw runtime_error("The file " + file_path.string() + " could not be opened.");
+    string output;
+    if (compress) {
+        google::protobuf::io::StringOutputStream stream(&output);
+        google::protobuf::io::GzipOutputStream::Options options;
+        options.format = google::protobuf::io::GzipOutputStream::GZIP;
+        google::protobuf::io::GzipOutputStream gzip(&stream, options);
+        if (!message.SerializeToZeroCopyStream(&gzip) || !gzip.Close())
+            throw runtime_error("The file " + file_path.string() + " could not be compressed.");
+    } else {
+        message.SerializeToString(&output);
+    }
+    out << output;
+    out.close();
+}
+
 inline void parse_pb_to_json(const fs::path& file_path, const google::protobuf::Message& message) {
     ofstream out (file_path);
     if(!out.is_open())
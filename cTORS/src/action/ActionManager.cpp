@@ -1,5 +1,6 @@
 #include "Action.h"
 #include "BusinessRules.h"
+#include "PruningRules.h"
 
 void ActionManager::AddGenerator(const string& name, const ActionGenerator* generator) {
 	if (config->IsGeneratorActive(name)) {
@@ -23,6 +24,8 @@ void ActionManager::Generate(const State* state, list<const Action*>& out) const
 			return false;
 		}), out.end());
 	}
+	for (auto pruner: pruners)
+		pruner->Prune(state, out);
 }
 
 pair<bool, string> ActionManager::IsValid(const State* state, const Action* action) const {
@@ -34,6 +37,14 @@ pair<bool, string> ActionManager::IsValid(const State* state, const Action* acti
 	return make_pair(true,"");
 }
 
+int ActionManager::GetViolatedBusinessRule(const State* state, const Action* action) const {
+	for (int i=0; i<validators.size(); i++) {
+		if (!validators[i]->IsValid(state, action).first)
+			return i;
+	}
+	return -1;
+}
+
 #ifndef ADD_GENERATOR
 #define ADD_GENERATOR(name, generator)\
 AddGenerator(name, new generator(config->GetActionParameters(name), location));
@@ -43,12 +54,22 @@ AddGenerator(name, new generator(config->GetActionParameters(name), location));
 #define ADD_VALIDATOR(validator) \
 if (config->IsBusinessRuleActive(#validator)) { \
 	validators.push_back(new validator(config)); \
+	validatorNames.push_back(#validator); \
 } 
 #endif
 
+#ifndef ADD_PRUNER
+#define ADD_PRUNER(pruner) \
+if (config->IsPruningRuleActive(#pruner)) { \
+	pruners.push_back(new pruner(config->GetPruningParameters(#pruner), location)); \
+	prunerNames.push_back(#pruner); \
+}
+#endif
+
 ActionManager::~ActionManager() {
 	DELETE_VECTOR(validators);
 	DELETE_VECTOR(generators);
+	DELETE_VECTOR(pruners);
 }
 
 void ActionManager::AddGenerators() {
@@ -105,3 +126,9 @@ void ActionManager::AddValidators() {
 
 	//Matching
 }
+
+void ActionManager::AddPruners() {
+	ADD_PRUNER(wait_at_departure_rule)
+	ADD_PRUNER(exit_order_move_rule)
+	ADD_PRUNER(fastest_route_rule)
+}
@@ -13,17 +13,24 @@ vector<string> TransformTrackVector(const list<const Track*>& tracks) {
 	return trackIDs;
 }
 
+template<class T>
+vector<int> TransformTrackIndices(const T& tracks) {
+	vector<int> trackIndices(tracks.size());
+	transform(tracks.begin(), tracks.end(), trackIndices.begin(), [](const Track* t) -> int {return t->GetIndex(); });
+	return trackIndices;
+}
+
 MultiMove::MultiMove(const vector<int>& trainIDs, const vector<const Track*>& tracks)
-	: MultiMove(trainIDs, TransformTrackVector(tracks)) {}
+	: SimpleAction(trainIDs), trackIDs(TransformTrackVector(tracks)), trackIndices(TransformTrackIndices(tracks)) {}
 
 MultiMove::MultiMove(const ShuntingUnit* su, const vector<const Track*>& tracks)
-	: MultiMove(su->GetTrainIDs(), TransformTrackVector(tracks)) {}
+	: SimpleAction(su), trackIDs(TransformTrackVector(tracks)), trackIndices(TransformTrackIndices(tracks)) {}
 
 MultiMove::MultiMove(const vector<int>& trainIDs, const list<const Track*>& tracks)
-	: MultiMove(trainIDs, TransformTrackVector(tracks)) {}
+	: SimpleAction(trainIDs), trackIDs(TransformTrackVector(tracks)), trackIndices(TransformTrackIndices(tracks)) {}
 
 MultiMove::MultiMove(const ShuntingUnit* su, const list<const Track*>& tracks)
-	: MultiMove(su->GetTrainIDs(), TransformTrackVector(tracks)) {}
+	: SimpleAction(su), trackIDs(TransformTrackVector(tracks)), trackIndices(TransformTrackIndices(tracks)) {}
 
 void MoveAction::Start(State* state) const {
 	state->AddActiveAction(su, this);
@@ -60,7 +67,7 @@ const Path& MoveActionGenerator::GeneratePath(const State* state, const Move& mo
 	auto& suState  = state->GetShuntingUnitState(su);
 	if(!suState.moving) throw InvalidActionException("The shunting unit is not yet moving.");
 	auto previous = suState.inNeutral ? nullptr : suState.previous;
-	auto destination = location->GetTrackByID(move.GetDestinationID());
+	auto destination = location->ResolveTrack(move.GetDestinationIndex(), move.GetDestinationID());
 	return location->GetNeighborPath({previous, suState.position}, destination); 
 }
 
@@ -73,9 +80,11 @@ const Action* MoveActionGenerator::Generate(const State* state, const SimpleActi
 	} else {
 		auto move = static_cast<const MultiMove*>(&action);
 		auto& trackIDs = move->GetTrackIDs();
+		auto& trackIndices = move->GetTrackIndices();
+		bool indexed = trackIndices.size() == trackIDs.size();
 		vector<const Track*> tracks(trackIDs.size());
-		transform(trackIDs.begin(), trackIDs.end(), tracks.begin(), [this](const string& id) 
-			-> const Track* { return  location->GetTrackByID(id); });
+		for(size_t i = 0; i < trackIDs.size(); i++)
+			tracks[i] = location->ResolveTrack(indexed ? trackIndices[i] : -1, trackIDs[i]);
 		auto length = location->GetDistance(tracks);
 		return new MoveAction(su, tracks, length, false);
 	}
@@ -93,7 +102,9 @@ void MoveActionGenerator::Generate(const State* state, list<const Action*>& out)
 		for(auto& previous: previous_list) {
 			auto& paths = location->GetPossiblePaths({previous, track});
 			for(auto& path: paths) {
-				out.push_back(Generate(state, MultiMove(su, path.route)));
+				vector<const Track*> tracks(path.route.begin(), path.route.end());
+				auto length = location->GetDistance(tracks);
+				out.push_back(new MoveAction(su, tracks, length, false));
 			}
 		}
 	}
@@ -11,7 +11,7 @@ const Action* MoveHelperGenerator::Generate(const State* state, const SimpleActi
 	} else if(instanceof<Move>(&action)) {
 		auto move = static_cast<const Move*>(&action);
 		auto previous = suState.inNeutral ? nullptr : suState.previous;
-		auto destination = location->GetTrackByID(move->GetDestinationID());
+		auto destination = location->ResolveTrack(move->GetDestinationIndex(), move->GetDestinationID());
 		auto path = location->GetNeighborPath({previous, suState.position}, destination); 
 		return new MoveAction(su, vector<const Track*>(path.route.begin(), path.route.end()), path.length, true);
 	}
@@ -26,7 +26,7 @@ const string ServiceAction::toString() const {
 
 const Action* ServiceActionGenerator::Generate(const State* state, const SimpleAction& action) const {
 	auto service = static_cast<const Service*>(&action);
-	auto su = state->GetShuntingUnitByTrainIDs(action.GetTrainIDs());
+	auto su = state->ResolveShuntingUnit(action.GetShuntingUnitHandle(), action.GetTrainIDs());
 	if(su == nullptr) throw InvalidActionException("Shunting unit with trains " + Join(action.GetTrainIDs(), "-") + " not found");
 	auto train = su->GetTrainByID(service->GetTrain().GetID());
 	auto tasks = state->GetTasksForTrain(train);
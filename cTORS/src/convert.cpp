@@ -0,0 +1,73 @@
+#include <iostream>
+#include <filesystem>
+#include "Proto.h"
+#include "Utils.h"
+
+namespace fs = std::filesystem;
+using namespace std;
+
+/**
+ * Convert the JSON protobuf files in a data folder to the binary protobuf format.
+ *
+ * Usage: TORSConvert <folder> [--gzip]
+ *
+ * The folder is searched recursively. Location files (location*.json) are converted as PBLocation,
+ * other JSON files are converted as PBScenario or PBRun, depending on which message they match.
+ * The configuration files (config.json and vis_config.json) are not protobuf messages and are skipped.
+ * Every converted file is written next to its source, with the extension .pb (or .pb.gz with --gzip).
+ */
+
+bool parse_strict(const string& data, google::protobuf::Message* message) {
+	google::protobuf::util::JsonParseOptions options;
+	options.ignore_unknown_fields = false;
+	message->Clear();
+	return google::protobuf::util::JsonStringToMessage(data, message, options).ok();
+}
+
+bool convert_file(const fs::path& file, bool compress) {
+	ifstream fileInput(file);
+	stringstream buffer;
+	buffer << fileInput.rdbuf();
+	fileInput.close();
+	auto data = buffer.str();
+
+	PBLocation pb_location;
+	PBScenario pb_scenario;
+	PBRun pb_run;
+	google::protobuf::Message* message = nullptr;
+	auto name = file.stem().string();
+	if (name.rfind("location", 0) == 0 && parse_strict(data, &pb_location)) message = &pb_location;
+	else if (parse_strict(data, &pb_scenario)) message = &pb_scenario;
+	else if (parse_strict(data, &pb_run)) message = &pb_run;
+	if (message == nullptr) {
+		cout << "Skipped " << file.string() << ": not a location, scenario or run file.\n";
+		return false;
+	}
+	auto out = file;
+	out.replace_extension(compress ? ".pb.gz" : ".pb");
+	parse_pb_to_binary(out, *message, compress);
+	cout << "Converted " << file.string() << " to " << out.string() << " (" << message->GetTypeName() << ").\n";
+	return true;
+}
+
+int main(int argc, char* argv[]) {
+	if (argc < 2) {
+		cout << "Usage: " << argv[0] << " <folder> [--gzip]\n";
+		return 1;
+	}
+	fs::path folder(argv[1]);
+	bool compress = argc > 2 && string(argv[2]) == "--gzip";
+	if (!fs::is_directory(folder)) {
+		cout << "The folder " << folder.string() << " does not exist.\n";
+		return 1;
+	}
+	int converted = 0;
+	for (auto& entry : fs::recursive_directory_iterator(folder)) {
+		if (!entry.is_regular_file() || entry.path().extension() != ".json") continue;
+		auto name = entry.path().filename().string();
+		if (name == "config.json" || name == "vis_config.json") continue;
+		if (convert_file(entry.path(), compress)) converted++;
+	}
+	cout << "Converted " << converted << " files.\n";
+	return 0;
+}
@@ -12,6 +12,8 @@ Config::Config(const string& folderName) {
 		fileInput >> j;
 		ImportBusinessRules(j["business_rules"]);
 		ImportActionRules(j["actions"]);
+		if(j.contains("pruning_rules"))
+			ImportPruningRules(j["pruning_rules"]);
 	}
 	catch (exception& e) {
 		cout << "Error in loading config: " << e.what() << "\n";
@@ -36,6 +38,15 @@ void Config::ImportActionRules(const json& j) {
 	}
 }
 
+void Config::ImportPruningRules(const json& j) {
+	for (auto& jit : j["rules"].items()) {
+		auto& name = jit.key();
+		auto& value = jit.value();
+		pruningRules[name] = value.at("on").get<bool>();
+		pruningParams[name] = value.value("parameters", json::object());
+	}
+}
+
 bool Config::IsBusinessRuleActive(const string& name) const { 
 	auto it = businessRules.find(name);
 	if(it == businessRules.end()) return true;
@@ -53,3 +64,15 @@ const json Config::GetActionParameters(const string& name) const {
 	if(it == actionParams.end()) return json();
 	return it->second;
 }
+
+bool Config::IsPruningRuleActive(const string& name) const {
+	auto it = pruningRules.find(name);
+	if(it == pruningRules.end()) return false;
+	return it->second;
+}
+
+const json Config::GetPruningParameters(const string& name) const {
+	auto it = pruningParams.find(name);
+	if(it == pruningParams.end()) return json();
+	return it->second;
+}
@@ -1,16 +1,17 @@
 #include "Engine.h"
+#include "Snapshot.h"
 using namespace std;
 
-LocationEngine::LocationEngine(const string &path) : path(path), location(Location(path, true)), 
-	config(Config(path)), actionManager(ActionManager(&config, &location)) {}
+atomic<size_t> LocationEngine::sessionCounter {0};
+
+LocationEngine::LocationEngine(const string &path) : LocationEngine(path, path) {}
+
+LocationEngine::LocationEngine(const string &path, const string &configPath) : path(path), 
+	location(Location::GetShared(path, true)), config(Config(configPath)), actionManager(ActionManager(&config, location.get())) {}
 
 
 LocationEngine::~LocationEngine() {
 	debug_out("Deleting LocationEngine");
-	for(auto& [name, type]: TrainUnitType::types) {
-		delete type;	
-	}
-	TrainUnitType::types.clear();
 	vector<State*> states;
 	for(auto& [state, action_list]: stateActionMap) {
 		states.push_back(state);
@@ -29,7 +30,7 @@ LocationEngine::~LocationEngine() {
 const Scenario& LocationEngine::GetScenario(const string& scenarioFileString) {
 	auto it = scenarios.find(scenarioFileString);
 	if(it == scenarios.end()) {
-		auto scenario = new Scenario(scenarioFileString, location);
+		auto scenario = new Scenario(scenarioFileString, *location);
 		scenarios[scenarioFileString] = scenario;
 		return *scenario;
 	}
@@ -60,6 +61,7 @@ void LocationEngine::Step(State * state) {
 		ExecuteImmediateEvents(state);
 		CheckScenarioEnded(state);
 	} 
+	if(monitorFeasibility) feasibilityMonitor->Check(state);
 	debug_out("Step done.");
 }
 
@@ -68,6 +70,16 @@ bool LocationEngine::IsStateActive(const State* state) const {
 	return state->IsActionRequired();
 }
 
+void LocationEngine::SetFeasibilityMonitor(bool active) {
+	if(active) GetFeasibilityMonitor();
+	monitorFeasibility = active;
+}
+
+const FeasibilityMonitor& LocationEngine::GetFeasibilityMonitor() {
+	if(feasibilityMonitor == nullptr) feasibilityMonitor = make_unique<FeasibilityMonitor>(*location, GetBusinessRuleNames());
+	return *feasibilityMonitor;
+}
+
 void LocationEngine::ApplyAction(State* state, const Action* action) {
 	debug_out("\tApplying action " + action->toString());
 	int startTime = state->GetTime();
@@ -75,7 +87,7 @@ void LocationEngine::ApplyAction(State* state, const Action* action) {
 	state->StartAction(action);
 	int duration = action->GetDuration();
 	POSAction posaction(startTime, startTime + duration, duration, sa);
-	results[state]->AddAction(posaction);
+	results.at(state)->AddAction(posaction);
 }
 
 void LocationEngine::ApplyAction(State* state, const SimpleAction& action) {
@@ -120,6 +132,29 @@ pair<bool, string> LocationEngine::IsValidAction(const State* state, const Actio
 	return actionManager.IsValid(state, action);
 }
 
+vector<int> LocationEngine::ValidateMany(const State* state, const vector<const SimpleAction*>& actions) const {
+	vector<int> codes;
+	codes.reserve(actions.size());
+	for(auto simple: actions) {
+		auto& name = simple->GetGeneratorName();
+		if(!config.IsGeneratorActive(name)) {
+			codes.push_back(static_cast<int>(ValidationCode::GeneratorDisabled));
+			continue;
+		}
+		const Action* action = nullptr;
+		try {
+			action = actionManager.GetGenerator(name)->Generate(state, *simple);
+		} catch(exception& e) {}
+		if(action == nullptr) {
+			codes.push_back(static_cast<int>(ValidationCode::GenerationFailed));
+			continue;
+		}
+		codes.push_back(actionManager.GetViolatedBusinessRule(state, action) + 1);
+		delete action;
+	}
+	return codes;
+}
+
 const Action* LocationEngine::GenerateAction(const State* state, const SimpleAction& action) const {
 	if(!config.IsGeneratorActive(action.GetGeneratorName()))
 		throw InvalidActionException("Error in generating action (" + action.toString() +"): Action generator " + action.GetGeneratorName() + " is disabled.");
@@ -133,10 +168,14 @@ const Action* LocationEngine::GenerateAction(const State* state, const SimpleAct
 list<const Action*> &LocationEngine::GetValidActions(State* state) {
 	debug_out("Starting GetValidActions");
 	if (state->IsChanged()) {
+		ClearValidActions(state);
 		auto& actions = stateActionMap.at(state);
-		DELETE_LIST(actions)
 		actionManager.Generate(state, actions);
 		debug_out("Generated "+ to_string(actions.size())+" actions");
+		if(reduceSymmetry) {
+			ReduceSymmetry(state, actions, symmetryClasses.at(state));
+			debug_out("Reduced to "+ to_string(actions.size())+" actions");
+		}
 		state->SetUnchanged();
 	}
 	debug_out("Return valid actions: ");
@@ -148,6 +187,213 @@ list<const Action*> &LocationEngine::GetValidActions(State* state) {
 	return actions;
 }
 
+void LocationEngine::ClearValidActions(State* state) {
+	auto& actions = stateActionMap.at(state);
+	DELETE_LIST(actions)
+	auto& classes = symmetryClasses.at(state);
+	for(auto& actionClass: classes)
+		for(size_t i=1; i<actionClass.size(); i++)
+			delete actionClass[i];
+	classes.clear();
+}
+
+inline size_t GetNameIndex(const string& name, unordered_map<string, size_t>& names) {
+	return names.emplace(name, names.size()).first->second;
+}
+
+inline void AppendTrainsKey(const State* state, const vector<Train>& trains, unordered_map<string, size_t>& names,
+		vector<size_t>& key) {
+	key.push_back(trains.size());
+	for(auto& train: trains) {
+		key.push_back(GetNameIndex(train.GetType()->displayName, names));
+		int goal = -1;
+		if(train.GetID() != -1) {
+			for(auto out: state->GetOutgoingTrains()) {
+				auto& outTrains = out->GetShuntingUnit()->GetTrains();
+				if(any_of(outTrains.begin(), outTrains.end(), [&train](const Train& t) { return t.GetID() == train.GetID(); })) {
+					goal = out->GetID();
+					break;
+				}
+			}
+		}
+		key.push_back(static_cast<size_t>(goal));
+	}
+}
+
+inline void AppendShuntingUnitKey(const State* state, const ShuntingUnit* su, unordered_map<string, size_t>& names,
+		vector<size_t>& key) {
+	auto& trains = su->GetTrains();
+	bool interchangeable = state->HasShuntingUnit(su) && !state->HasActiveAction(su) &&
+		all_of(trains.begin(), trains.end(), [state](const Train& train) {
+			return state->GetTasksForTrain(&train).empty() && state->GetActiveTasksForTrain(&train).empty(); });
+	if(!interchangeable) {
+		key.push_back(0);
+		key.push_back(static_cast<size_t>(su->GetID()));
+		return;
+	}
+	AppendTrainsKey(state, state->GetTrainUnitsInOrder(su), names, key);
+	auto position = state->GetPosition(su);
+	auto previous = state->GetPrevious(su);
+	key.push_back(position == nullptr ? -1 : position->GetIndex());
+	key.push_back(previous == nullptr ? -1 : previous->GetIndex());
+	key.push_back(state->IsMoving(su) | state->IsWaiting(su) << 1 | state->IsInNeutral(su) << 2 | state->IsBeginMoving(su) << 3);
+	if(position != nullptr) {
+		auto& occupations = state->GetOccupations(position);
+		key.push_back(*occupations.front() == *su);
+		key.push_back(*occupations.back() == *su);
+	}
+}
+
+inline void AppendIncomingKey(const State* state, const Incoming* incoming, unordered_map<string, size_t>& names,
+		vector<size_t>& key) {
+	key.push_back(incoming->GetTime());
+	key.push_back(incoming->GetParkingTrack()->GetIndex());
+	key.push_back(incoming->GetSideTrack()->GetIndex());
+	key.push_back(incoming->IsInstanding());
+	auto& trains = incoming->GetShuntingUnit()->GetTrains();
+	auto& tasks = incoming->GetTasks();
+	bool interchangeable = all_of(trains.begin(), trains.end(), [&tasks](const Train& train) {
+		auto it = tasks.find(&train);
+		return it == tasks.end() || it->second.empty(); });
+	if(!interchangeable) {
+		key.push_back(0);
+		key.push_back(static_cast<size_t>(incoming->GetID()));
+		return;
+	}
+	AppendTrainsKey(state, trains, names, key);
+}
+
+void LocationEngine::ReduceSymmetry(const State* state, list<const Action*>& actions,
+		vector<vector<const Action*>>& classes) const {
+	map<vector<size_t>, size_t> classIndex;
+	unordered_map<string, size_t> names;
+	vector<size_t> key;
+	for(auto it = actions.begin(); it != actions.end();) {
+		auto action = *it;
+		key.clear();
+		key.push_back(static_cast<size_t>(action->GetKind()));
+		key.push_back(static_cast<size_t>(action->GetDuration()));
+		for(auto employee: action->GetEmployees()) key.push_back(reinterpret_cast<size_t>(employee));
+		key.push_back(-1);
+		for(auto track: action->GetReservedTracks()) key.push_back(track->GetIndex());
+		key.push_back(-1);
+		switch(action->GetKind()) {
+			case ActionKind::ArriveAction:
+				AppendIncomingKey(state, static_cast<const ArriveAction*>(action)->GetIncoming(), names, key);
+				break;
+			case ActionKind::ExitAction:
+				key.push_back(static_cast<size_t>(static_cast<const ExitAction*>(action)->GetOutgoing()->GetID()));
+				AppendShuntingUnitKey(state, action->GetShuntingUnit(), names, key);
+				break;
+			case ActionKind::MoveAction:
+				for(auto track: static_cast<const MoveAction*>(action)->GetTracks()) key.push_back(track->GetIndex());
+				AppendShuntingUnitKey(state, action->GetShuntingUnit(), names, key);
+				break;
+			case ActionKind::CombineAction:
+				AppendShuntingUnitKey(state, action->GetShuntingUnit(), names, key);
+				AppendShuntingUnitKey(state, static_cast<const CombineAction*>(action)->GetRearShuntingUnit(), names, key);
+				break;
+			case ActionKind::SplitAction:
+				key.push_back(static_cast<const SplitAction*>(action)->GetSplitIndex());
+				AppendShuntingUnitKey(state, action->GetShuntingUnit(), names, key);
+				break;
+			case ActionKind::ServiceAction: {
+				auto service = static_cast<const ServiceAction*>(action);
+				key.push_back(static_cast<size_t>(service->GetTrain()->GetID()));
+				key.push_back(static_cast<size_t>(service->GetFacility()->GetID()));
+				key.push_back(GetNameIndex(service->GetTask()->taskType, names));
+				AppendShuntingUnitKey(state, action->GetShuntingUnit(), names, key);
+				break;
+			}
+			default:
+				AppendShuntingUnitKey(state, action->GetShuntingUnit(), names, key);
+				break;
+		}
+		auto [classIt, inserted] = classIndex.emplace(key, classes.size());
+		if(inserted) {
+			classes.push_back({action});
+			++it;
+		} else {
+			classes[classIt->second].push_back(action);
+			it = actions.erase(it);
+		}
+	}
+}
+
+void LocationEngine::SetSymmetryReduction(bool active) {
+	if(active == reduceSymmetry) return;
+	reduceSymmetry = active;
+	for(auto& [state, actions]: stateActionMap)
+		state->SetChanged();
+}
+
+const vector<vector<const Action*>>& LocationEngine::GetSymmetryClasses(State* state) {
+	auto& actions = GetValidActions(state);
+	auto& classes = symmetryClasses.at(state);
+	if(classes.size() != actions.size()) {
+		classes.clear();
+		for(auto action: actions) classes.push_back({action});
+	}
+	return classes;
+}
+
+void LocationEngine::GetValidActionTable(State* state, vector<ActionRow>& rows, vector<int>& trainIDs) {
+	auto& actions = GetValidActions(state);
+	rows.clear();
+	trainIDs.clear();
+	rows.reserve(actions.size());
+	unordered_map<const ShuntingUnit*, int, ShuntingUnitHash, ShuntingUnitEquals> suIndex;
+	const auto& sus = state->GetShuntingUnits();
+	for(int i=0; i<sus.size(); i++) suIndex[sus[i]] = i;
+	auto getSUIndex = [&suIndex](const ShuntingUnit* su) { auto it = suIndex.find(su); return it == suIndex.end() ? -1 : it->second; };
+	for(auto action: actions) {
+		auto su = action->GetShuntingUnit();
+		ActionRow row {static_cast<int32_t>(action->GetKind()), getSUIndex(su), static_cast<int32_t>(trainIDs.size()),
+			static_cast<int32_t>(su->GetTrains().size()), -1, -1, action->GetDuration(), -1, -1, -1, -1, -1};
+		for(auto& train: su->GetTrains()) trainIDs.push_back(train.GetID());
+		switch(action->GetKind()) {
+			case ActionKind::ArriveAction:
+				row.shuntingUnit = -1;
+				row.destinationTrack = static_cast<const ArriveAction*>(action)->GetDestinationTrack()->GetIndex();
+				break;
+			case ActionKind::ExitAction:
+				row.destinationTrack = static_cast<const ExitAction*>(action)->GetDestinationTrack()->GetIndex();
+				break;
+			case ActionKind::MoveAction: {
+				auto move = static_cast<const MoveAction*>(action);
+				row.destinationTrack = move->GetDestinationTrack()->GetIndex();
+				row.previousTrack = move->GetPreviousTrack()->GetIndex();
+				break;
+			}
+			case ActionKind::CombineAction:
+				row.secondShuntingUnit = getSUIndex(static_cast<const CombineAction*>(action)->GetRearShuntingUnit());
+				break;
+			case ActionKind::SplitAction:
+				row.splitIndex = static_cast<const SplitAction*>(action)->GetSplitIndex();
+				break;
+			case ActionKind::ServiceAction: {
+				auto service = static_cast<const ServiceAction*>(action);
+				row.facility = service->GetFacility()->GetID();
+				row.train = service->GetTrain()->GetID();
+				auto& tasks = state->GetTasksForTrain(service->GetTrain());
+				auto it = find(tasks.begin(), tasks.end(), *service->GetTask());
+				row.task = it == tasks.end() ? -1 : distance(tasks.begin(), it);
+				break;
+			}
+			default:
+				break;
+		}
+		rows.push_back(row);
+	}
+}
+
+const Action* LocationEngine::GetValidAction(State* state, size_t index) {
+	auto& actions = GetValidActions(state);
+	if(index >= actions.size())
+		throw out_of_range("Action index " + to_string(index) + " out of range for " + to_string(actions.size()) + " valid actions.");
+	return *next(actions.begin(), index);
+}
+
 void LocationEngine::ExecuteImmediateEvents(State* state) {
 	if (state == nullptr) {
 		throw runtime_error("state == null, something went wrong");
@@ -215,31 +461,94 @@ bool LocationEngine::EvaluatePlan(const Scenario& scenario, const POSPlan& plan)
 
 State* LocationEngine::StartSession(const Scenario& scenario) {
 	debug_out("Start Session. (Currently " << stateActionMap.size() << " sessions)");
-	State* state = new State(scenario, location.GetTracks());
+	State* state = new State(scenario, location->GetTracks());
+	// The entries of a session are only created here, so that other threads can use the maps during the session
 	stateActionMap[state];
+	symmetryClasses[state];
 	results[state] = new RunResult(path, scenario);
+	sessionIDs[state] = ++sessionCounter;
 	return state;
 }
 
 void LocationEngine::EndSession(State* state) {
 	debug_out("End session. (Currently " << stateActionMap.size() << " sessions)");
-	auto& actions = stateActionMap[state];
 	auto& schedule = results[state];
-	DELETE_LIST(actions);
+	ClearValidActions(state);
+	ClearLowerBoundTable(state);
 	delete schedule;
 	stateActionMap.erase(state);
+	symmetryClasses.erase(state);
 	results.erase(state);
+	sessionIDs.erase(state);
 	delete state;
 }
 
+void LocationEngine::ResetSession(State* state, const Scenario& scenario) {
+	debug_out("Reset session. (Currently " << stateActionMap.size() << " sessions)");
+	ClearValidActions(state);
+	ClearLowerBoundTable(state);
+	*results.at(state) = RunResult(path, scenario);
+	vector<int> key {scenario.GetStartTime(), scenario.GetEndTime()};
+	for(auto inc: scenario.GetIncomingTrains())
+		key.push_back(inc->GetTime());
+	key.push_back(-1);
+	for(auto out: scenario.GetOutgoingTrains())
+		key.push_back(out->GetTime());
+	auto it = initialStates.find(key);
+	if(it != initialStates.end()) {
+		state->Reset(scenario, it->second.first, it->second.second);
+		return;
+	}
+	State initial(scenario, location->GetTracks());
+	try {
+		Step(&initial);
+	} catch(ScenarioFailedException& e) {
+		state->Reset(scenario, initial.GetTime(), initial.GetEvents());
+		throw;
+	}
+	state->Reset(scenario, initial.GetTime(), initial.GetEvents());
+	if(initialStates.size() < maxInitialStates)
+		initialStates.emplace(key, make_pair(initial.GetTime(), initial.GetEvents()));
+}
+
+State* LocationEngine::CopySession(const State* source, State* target) {
+	return RestoreSession(*results.at(const_cast<State*>(source)), target);
+}
+
+State* LocationEngine::RestoreSession(const RunResult& result, State* target) {
+	auto plan = result.GetActions();
+	Scenario scenario = result.GetScenario();
+	bool started = target == nullptr;
+	if(started) target = StartSession(scenario);
+	try {
+		ResetSession(target, scenario);
+		auto it = plan.begin();
+		while(it != plan.end()) {
+			if(target->GetTime() >= it->GetSuggestedStart()) {
+				ApplyActionAndStep(target, *(it->GetAction()));
+				it++;
+			} else {
+				auto time = target->GetTime();
+				ApplyWaitAllUntil(target, it->GetSuggestedStart());
+				if(target->GetTime() == time)
+					throw runtime_error("The session cannot be copied: no progress at T" + to_string(time) + ".");
+			}
+		}
+	} catch(...) {
+		if(started) EndSession(target);
+		throw;
+	}
+	return target;
+}
+
 void LocationEngine::CalcShortestPaths() { 
-	for(const auto& [trainTypeName, trainType]: TrainUnitType::types) {
-		location.CalcShortestPaths(trainType);
+	for(const auto& [trainTypeName, trainType]: location->GetTrainUnitTypes()) {
+		location->CalcShortestPaths(trainType);
 	}
 } 
 
 void LocationEngine::CalcAllPossiblePaths() { 
-	location.CalcAllPossiblePaths();
+	location->CalcAllPossiblePaths();
 } 
 
 const Path LocationEngine::GetPath(const State* state, const Move& move) const {
@@ -249,19 +558,103 @@ const Path LocationEngine::GetPath(const State* state, const Move& move) const {
 
 RunResult* LocationEngine::ImportResult(const string& path) {
 	PBRun run;
-	parse_json_to_pb(path, &run);
-	return RunResult::CreateRunResult(&location, run);
+	parse_file_to_pb(path, &run);
+	return RunResult::CreateRunResult(location.get(), run);
+}
+
+Engine::Engine(const string& path) {
+	GetOrLoadLocationEngine(path);
 }
 
 LocationEngine* Engine::GetOrLoadLocationEngine(const string& location) {
 	auto it = engines.find(location);
-	if(it== engines.end()) {
-		engines.emplace(location, location);
-		return &engines.at(location);
+	if(it == engines.end()) {
+		it = engines.emplace(location, location).first;
+		it->second.SetFeasibilityMonitor(feasibilityMonitor);
+		it->second.SetSymmetryReduction(symmetryReduction);
+		lastUse[&it->second] = ++useCounter;
+		UnloadIdleLocationEngines(&it->second);
+	} else {
+		lastUse[&it->second] = ++useCounter;
 	}
 	return &it->second;
 }
 
+LocationEngine* Engine::ResolveLocationEngine(const string& location, const string& relativeTo) {
+	if(engines.find(location) != engines.end())
+		return GetOrLoadLocationEngine(location);
+	auto canonical = GetCanonicalLocation(location);
+	for(auto& [loc, engine]: engines) {
+		if(GetCanonicalLocation(loc) == canonical)
+			return GetOrLoadLocationEngine(loc);
+	}
+	if(fs::is_directory(location))
+		return GetOrLoadLocationEngine(location);
+	auto relative = fs::path(relativeTo) / fs::path(location);
+	if(!relativeTo.empty() && fs::is_directory(relative))
+		return GetOrLoadLocationEngine(relative.string());
+	auto name = fs::path(location).filename();
+	for(auto& [loc, engine]: engines) {
+		if(fs::path(loc).filename() == name)
+			return GetOrLoadLocationEngine(loc);
+	}
+	throw runtime_error("The location " + location + " could not be found.");
+}
+
+vector<string> Engine::GetLoadedLocations() const {
+	vector<string> locations;
+	for(auto& [loc, engine]: engines)
+		locations.push_back(loc);
+	return locations;
+}
+
+void Engine::SetMemoryBudget(size_t budget) {
+	memoryBudget = budget;
+	UnloadIdleLocationEngines(nullptr);
+}
+
+void Engine::SetFeasibilityMonitor(bool active) {
+	feasibilityMonitor = active;
+	for(auto& [loc, engine]: engines)
+		engine.SetFeasibilityMonitor(active);
+}
+
+void Engine::SetSymmetryReduction(bool active) {
+	symmetryReduction = active;
+	for(auto& [loc, engine]: engines)
+		engine.SetSymmetryReduction(active);
+}
+
+size_t Engine::GetMemoryUsage() const {
+	set<const Location*> locations;
+	size_t usage = 0;
+	for(auto& [loc, engine]: engines) {
+		if(locations.insert(&engine.GetLocation()).second)
+			usage += engine.GetLocation().GetMemoryUsage();
+	}
+	return usage;
+}
+
+void Engine::UnloadIdleLocationEngines(const LocationEngine* keep) {
+	if(memoryBudget == 0) return;
+	while(GetMemoryUsage() > memoryBudget) {
+		// A Location that is also referenced outside this Engine (e.g. from Python) is not released by unloading
+		map<const Location*, long> references;
+		for(auto& [loc, engine]: engines)
+			references[&engine.GetLocation()]++;
+		auto lru = engines.end();
+		for(auto it = engines.begin(); it != engines.end(); it++) {
+			if(&it->second == keep || !it->second.IsIdle()) continue;
+			if(it->second.GetSharedLocation().use_count() > references.at(&it->second.GetLocation())) continue;
+			if(lru == engines.end() || lastUse.at(&it->second) < lastUse.at(&lru->second)) lru = it;
+		}
+		if(lru == engines.end()) return;
+		debug_out("Unloading location " << lru->first);
+		lastUse.erase(&lru->second);
+		engines.erase(lru);
+	}
+}
+
 State* Engine::StartSession(const string& location, const Scenario& scenario) {
 	auto e = GetOrLoadLocationEngine(location);
 	auto state = e->StartSession(scenario);
@@ -275,6 +668,29 @@ void Engine::EndSession(State* state) {
 	e->EndSession(state);
 }
 
+State* Engine::CopySession(const State* source, State* target) {
+	auto e = engineMap.at(source);
+	if(target != nullptr && engineMap.at(target) != e)
+		throw invalid_argument("The sessions of the source and target State belong to different locations.");
+	target = e->CopySession(source, target);
+	engineMap[target] = e;
+	return target;
+}
+
+State* Engine::RestoreSession(const RunResult& result, State* target) {
+	auto e = target == nullptr ? ResolveLocationEngine(result.GetLocation()) : engineMap.at(target);
+	target = e->RestoreSession(result, target);
+	engineMap[target] = e;
+	return target;
+}
+
+State* Engine::LoadState(const string& data, State* target) {
+	auto e = target == nullptr ? ResolveLocationEngine(GetSnapshotLocation(data)) : engineMap.at(target);
+	target = e->LoadState(data, target);
+	engineMap[target] = e;
+	return target;
+}
+
 void Engine::CalcShortestPaths() {
 	for(auto& [loc, engine]: engines) {
 		engine.CalcShortestPaths();
@@ -289,6 +705,7 @@ void Engine::CalcAllPossiblePaths() {
 
 RunResult* Engine::ImportResult(const string& path) {
 	PBRun run;
-	parse_json_to_pb(path, &run);
-	return RunResult::CreateRunResult(*this, run);
+	parse_file_to_pb(path, &run);
+	auto engine = ResolveLocationEngine(run.location(), fs::path(path).parent_path().string());
+	return RunResult::CreateRunResult(&engine->GetLocation(), run);
 }
\ No newline at end of file
@@ -0,0 +1,276 @@
+#include "Feasibility.h"
+#include "Action.h"
+#include <numeric>
+#include <queue>
+#include <unordered_set>
+
+inline bool MatchesTrain(const Train& expected, const Train& train) {
+	if(expected.GetID() != -1 && train.GetID() != -1) return expected.GetID() == train.GetID();
+	return expected.GetType()->displayName == train.GetType()->displayName;
+}
+
+inline bool IsRuleActive(const vector<string>& businessRules, const string& name) {
+	return find(businessRules.begin(), businessRules.end(), name) != businessRules.end();
+}
+
+vector<int> CalcTravelTimes(const Location& location) {
+	auto& tracks = location.GetTracks();
+	auto numberOfTracks = tracks.size();
+	vector<vector<pair<int, int>>> edges(numberOfTracks);
+	location.CalcNeighboringPaths();
+	for(auto track: tracks) {
+		if(track->type != TrackPartType::Railroad) continue;
+		for(auto neighbor: track->GetNeighbors()) {
+			for(auto& [destination, path]: location.GetNeighboringPaths({neighbor, track})) {
+				edges[track->GetIndex()].emplace_back(destination.second->GetIndex(), path.length);
+				edges[destination.second->GetIndex()].emplace_back(track->GetIndex(), path.length);
+			}
+		}
+	}
+	vector<int> distances(numberOfTracks * numberOfTracks, MAX_PATH_LENGTH);
+	for(size_t source=0; source<numberOfTracks; source++) {
+		auto distance = distances.begin() + source * numberOfTracks;
+		priority_queue<pair<int, int>, vector<pair<int, int>>, greater<pair<int, int>>> open;
+		distance[source] = 0;
+		open.emplace(0, static_cast<int>(source));
+		while(!open.empty()) {
+			auto [d, track] = open.top();
+			open.pop();
+			if(d > distance[track]) continue;
+			for(auto [next, length]: edges[track]) {
+				if(d + length < distance[next]) {
+					distance[next] = d + length;
+					open.emplace(d + length, next);
+				}
+			}
+		}
+	}
+	return distances;
+}
+
+FeasibilityMonitor::FeasibilityMonitor(const Location& location, const vector<string>& businessRules) :
+		numberOfTracks(location.GetTracks().size()), distances(CalcTravelTimes(location)) {
+	matchTrains = IsRuleActive(businessRules, "out_correct_order_rule");
+	fixedDepartureTimes = IsRuleActive(businessRules, "out_correct_time_rule");
+	mandatoryServices = IsRuleActive(businessRules, "mandatory_service_task_rule");
+	correctFacilities = IsRuleActive(businessRules, "correct_facility_rule");
+	limitedCapacity = IsRuleActive(businessRules, "capacity_facility_rule");
+	fixedArrivalTimes = IsRuleActive(businessRules, "in_correct_time_rule");
+	limitedLength = IsRuleActive(businessRules, "length_track_rule");
+	electricTracks = IsRuleActive(businessRules, "electric_track_rule");
+	for(auto track: location.GetTracks())
+		if(track->type == TrackPartType::Railroad) totalLength += track->length;
+	for(auto facility: location.GetFacilities()) {
+		facilityCapacity += facility->GetCapacity();
+		for(auto track: facility->GetTracks())
+			facilityTracks.push_back(track->GetIndex());
+		for(auto& task: facility->GetTasks()) {
+			serviceCapacity[task] += facility->GetCapacity();
+			for(auto track: facility->GetTracks())
+				serviceTracks[task].push_back(track->GetIndex());
+		}
+	}
+}
+
+int FeasibilityMonitor::GetRequiredTime(const vector<Task>& tasks, int from, int to) const {
+	auto distance = [this](int a, int b) { return distances[a * numberOfTracks + b]; };
+	int travel = distance(from, to), service = 0;
+	if(!mandatoryServices) return travel;
+	static const vector<int> noTracks;
+	for(auto& task: tasks) {
+		if(task.priority != 0) continue;
+		auto it = serviceTracks.find(task.taskType);
+		auto& tracks = !correctFacilities ? facilityTracks : (it == serviceTracks.end() ? noTracks : it->second);
+		int best = MAX_PATH_LENGTH;
+		for(auto track: tracks) {
+			auto there = distance(from, track), back = distance(track, to);
+			if(there < MAX_PATH_LENGTH && back < MAX_PATH_LENGTH) best = min(best, there + back);
+		}
+		if(best == MAX_PATH_LENGTH) return best;
+		travel = max(travel, best);
+		service += task.duration;
+	}
+	if(travel == MAX_PATH_LENGTH) return travel;
+	return travel + service;
+}
+
+void FeasibilityMonitor::Check(const State* state) const {
+	static const vector<Task> noTasks;
+	auto time = state->GetTime();
+	vector<Candidate> candidates;
+	for(auto su: state->GetShuntingUnits()) {
+		auto& suState = state->GetShuntingUnitState(su);
+		auto position = suState.position;
+		// A moving ShuntingUnit arrives at the destination of its MoveAction at or after the current time
+		for(auto action: suState.activeActions)
+			if(action->GetKind() == ActionKind::MoveAction)
+				position = static_cast<const MoveAction*>(action)->GetDestinationTrack();
+		if(position == nullptr) continue;
+		for(auto& train: su->GetTrains())
+			candidates.push_back({&train, position->GetIndex(), time, &state->GetTasksForTrain(&train)});
+	}
+	for(auto in: state->GetIncomingTrains()) {
+		auto& tasks = in->GetTasks();
+		for(auto& train: in->GetShuntingUnit()->GetTrains()) {
+			auto it = tasks.find(&train);
+			candidates.push_back({&train, in->GetParkingTrack()->GetIndex(), max(time, in->GetTime()),
+				it == tasks.end() ? &noTasks : &it->second});
+		}
+	}
+	CheckCandidates(candidates, state->GetOutgoingTrains(), time, state->GetEndTime(), nullptr);
+}
+
+void FeasibilityMonitor::CheckCandidates(const vector<Candidate>& candidates, const vector<const Outgoing*>& outgoing,
+		int time, int endTime, ScreeningResult* result) const {
+	auto report = [result](DeadEndReason reason, const string& message) {
+		if(result == nullptr) throw DeadEndException(reason, message);
+		result->reasons.push_back(reason);
+		result->messages.push_back(message);
+	};
+
+	// Every Train of every Outgoing train needs a matching Train that can reach the parking Track in time
+	size_t numberOfSlots = 0;
+	for(auto out: outgoing) {
+		auto deadline = fixedDepartureTimes && !out->IsInstanding() ? out->GetTime() : endTime;
+		auto parking = out->GetParkingTrack()->GetIndex();
+		for(auto& expected: out->GetShuntingUnit()->GetTrains()) {
+			numberOfSlots++;
+			bool matched = false, reachable = false;
+			for(auto& candidate: candidates) {
+				if(matchTrains && !MatchesTrain(expected, *candidate.train)) continue;
+				matched = true;
+				auto required = GetRequiredTime(*candidate.tasks, candidate.position, parking);
+				if(required < MAX_PATH_LENGTH && candidate.earliest + required <= deadline) {
+					reachable = true;
+					break;
+				}
+			}
+			if(!matched)
+				report(DeadEndReason::MissingTrain, "No remaining train matches train " + expected.toString()
+					+ " of " + out->toString() + ".");
+			else if(!reachable)
+				report(DeadEndReason::LateDeparture, "No matching train can reach track "
+					+ out->GetParkingTrack()->toString() + " before T" + to_string(deadline) + " for train "
+					+ expected.toString() + " of " + out->toString() + ".");
+		}
+	}
+
+	// If all Train%s must leave, all their mandatory service Task%s must fit in the remaining Facility capacity
+	if(!mandatoryServices || !limitedCapacity || candidates.size() != numberOfSlots) return;
+	unordered_map<string, long long> durations;
+	long long total = 0;
+	for(auto& candidate: candidates) {
+		for(auto& task: *candidate.tasks) {
+			if(task.priority != 0) continue;
+			durations[task.taskType] += task.duration;
+			total += task.duration;
+		}
+	}
+	long long remaining = endTime - time;
+	if(!correctFacilities) {
+		if(total > facilityCapacity * remaining)
+			report(DeadEndReason::ServiceCapacity, "The remaining mandatory service tasks take " + to_string(total)
+				+ " seconds, but the facilities only have " + to_string(facilityCapacity * remaining) + " left.");
+		return;
+	}
+	for(auto& [task, duration]: durations) {
+		auto it = serviceCapacity.find(task);
+		long long capacity = it == serviceCapacity.end() ? 0 : it->second * remaining;
+		if(duration > capacity)
+			report(DeadEndReason::ServiceCapacity, "The remaining mandatory " + task + " tasks take "
+				+ to_string(duration) + " seconds, but the facilities only have " + to_string(capacity) + " left.");
+	}
+}
+
+ScreeningResult FeasibilityMonitor::Screen(const Scenario& scenario) const {
+	ScreeningResult result;
+	auto report = [&result](DeadEndReason reason, const string& message) {
+		result.reasons.push_back(reason);
+		result.messages.push_back(message);
+	};
+	static const vector<Task> noTasks;
+	auto& incoming = scenario.GetIncomingTrains();
+	auto& outgoing = scenario.GetOutgoingTrains();
+	vector<Candidate> candidates;
+	for(auto in: incoming) {
+		auto& tasks = in->GetTasks();
+		for(auto& train: in->GetShuntingUnit()->GetTrains()) {
+			auto it = tasks.find(&train);
+			candidates.push_back({&train, in->GetParkingTrack()->GetIndex(), max(scenario.GetStartTime(), in->GetTime()),
+				it == tasks.end() ? &noTasks : &it->second});
+		}
+	}
+	CheckCandidates(candidates, outgoing, scenario.GetStartTime(), scenario.GetEndTime(), &result);
+
+	// A Train must leave if there are as many Outgoing as Incoming Train%s, or if an Outgoing train asks for it
+	size_t numberOfSlots = 0;
+	unordered_set<int> leaving;
+	for(auto out: outgoing) {
+		numberOfSlots += out->GetShuntingUnit()->GetNumberOfTrains();
+		if(matchTrains)
+			for(auto id: out->GetShuntingUnit()->GetTrainIDs())
+				if(id != -1) leaving.insert(id);
+	}
+	if(mandatoryServices && correctFacilities) {
+		for(auto& candidate: candidates) {
+			if(candidates.size() != numberOfSlots && leaving.find(candidate.train->GetID()) == leaving.end()) continue;
+			for(auto& task: *candidate.tasks) {
+				if(task.priority == 0 && serviceTracks.find(task.taskType) == serviceTracks.end())
+					report(DeadEndReason::MissingFacility, "No facility executes task " + task.toString()
+						+ " of train " + candidate.train->toString() + ".");
+			}
+		}
+	}
+
+	if(limitedLength) {
+		for(auto in: incoming) {
+			if(in->GetShuntingUnit()->GetLength() > in->GetParkingTrack()->GetLength())
+				report(DeadEndReason::ParkingLength, in->toString() + " is longer than its parking track.");
+		}
+		if(matchTrains) {
+			for(auto out: outgoing) {
+				if(out->GetShuntingUnit()->GetLength() > out->GetParkingTrack()->GetLength())
+					report(DeadEndReason::ParkingLength, out->toString() + " is longer than its parking track.");
+			}
+		}
+		// After every arrival, at most one Train per Outgoing Train that departed before has left the shunting yard
+		if(fixedArrivalTimes) {
+			vector<int> departures;
+			for(auto out: outgoing)
+				if(!out->IsInstanding())
+					departures.insert(departures.end(), out->GetShuntingUnit()->GetNumberOfTrains(), out->GetTime());
+			sort(departures.begin(), departures.end());
+			vector<double> lengths;
+			for(auto in: incoming) {
+				lengths.clear();
+				for(auto other: incoming)
+					if(other->GetTime() <= in->GetTime())
+						for(auto& train: other->GetShuntingUnit()->GetTrains())
+							lengths.push_back(train.GetType()->length);
+				auto departed = static_cast<size_t>(upper_bound(departures.begin(), departures.end(), in->GetTime()) - departures.begin());
+				sort(lengths.begin(), lengths.end());
+				auto present = accumulate(lengths.begin(), lengths.end() - min(departed, lengths.size()), 0.0);
+				if(present > totalLength) {
+					report(DeadEndReason::ParkingLength, "At T" + to_string(in->GetTime()) + " at least "
+						+ to_string(present) + "m of trains is on the shunting yard, but its tracks are only "
+						+ to_string(totalLength) + "m long.");
+					break;
+				}
+			}
+		}
+	}
+
+	if(electricTracks) {
+		for(auto in: incoming) {
+			if(in->GetShuntingUnit()->NeedsElectricity() && !in->GetParkingTrack()->isElectrified)
+				report(DeadEndReason::Electrification, in->toString() + " needs electricity, but its parking track is not electrified.");
+		}
+		if(matchTrains) {
+			for(auto out: outgoing) {
+				if(out->GetShuntingUnit()->NeedsElectricity() && !out->GetParkingTrack()->isElectrified)
+					report(DeadEndReason::Electrification, out->toString() + " needs electricity, but its parking track is not electrified.");
+			}
+		}
+	}
+	return result;
+}
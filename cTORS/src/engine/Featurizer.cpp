@@ -0,0 +1,213 @@
+#include "Featurizer.h"
+
+Featurizer::Featurizer(const Location& location, int nIncoming, int nOutgoing, int nShuntingUnits, int nTrains, const vector<string>& trainTypes) :
+	location(&location), nIncoming(nIncoming), nOutgoing(nOutgoing), nShuntingUnits(nShuntingUnits), nTrains(nTrains), trainTypes(trainTypes) {
+	if(this->trainTypes.empty()) {
+		for(auto& [name, type]: location.GetTrainUnitTypes())
+			this->trainTypes.push_back(name);
+	}
+	for(int i=0; i<this->trainTypes.size(); i++)
+		trainTypeIndex[this->trainTypes[i]] = i;
+	trackSlots.assign(location.GetTracks().size(), -1);
+	for(auto track: location.GetTracks()) {
+		if(track->GetType() != TrackPartType::Railroad) continue;
+		trackSlots[track->GetIndex()] = tracks.size();
+		tracks.push_back(track);
+	}
+	trainSize = nTrains * this->trainTypes.size();
+	goalSize = 1 + tracks.size() + trainSize;
+	trackSize = nShuntingUnits * nShuntingUnits + 2;
+	shuntingUnitSize = 4 + tracks.size() + 1 + trainSize + 1;
+	observationSize = nIncoming * goalSize + nOutgoing * goalSize + tracks.size() * trackSize + nShuntingUnits * shuntingUnitSize + 1;
+	nShuntingUnitActions = 5 + (nTrains - 1) + (nShuntingUnits - 1) + tracks.size();
+	nActions = nIncoming + nOutgoing + nShuntingUnits * nShuntingUnitActions;
+}
+
+template<class G>
+vector<const G*> Featurizer::SortByTime(const vector<const G*>& goals, int n) {
+	vector<const G*> next(min(goals.size(), static_cast<size_t>(n)));
+	partial_sort_copy(goals.begin(), goals.end(), next.begin(), next.end(),
+		[](const G* a, const G* b) { return a->GetTime() < b->GetTime(); });
+	return next;
+}
+
+float* Featurizer::WriteTrack(const Track* track, float* out) const {
+	auto slot = GetTrackSlot(track);
+	if(slot >= 0) out[slot] = 1;
+	return out + tracks.size();
+}
+
+float* Featurizer::WriteTrains(const vector<Train>& trains, float* out) const {
+	auto nTypes = trainTypes.size();
+	for(int i=0; i<trains.size() && i<nTrains; i++) {
+		auto it = trainTypeIndex.find(trains[i].GetType()->displayName);
+		if(it != trainTypeIndex.end()) out[i * nTypes + it->second] = 1;
+	}
+	return out + trainSize;
+}
+
+float* Featurizer::WriteTime(const State* state, int time, float* out) const {
+	auto interval = state->GetEndTime() - state->GetStartTime();
+	*out = interval > 0 ? static_cast<float>(time - state->GetStartTime()) / interval : 0;
+	return out + 1;
+}
+
+template<class G>
+float* Featurizer::WriteGoals(const State* state, const vector<const G*>& goals, int n, float* out) const {
+	auto end = out + n * goalSize;
+	for(auto goal: SortByTime(goals, n)) {
+		out = WriteTime(state, goal->GetTime(), out);
+		out = WriteTrack(goal->GetParkingTrack(), out);
+		out = WriteTrains(goal->GetShuntingUnit()->GetTrains(), out);
+	}
+	return end;
+}
+
+void Featurizer::Featurize(const State* state, float* out) const {
+	fill(out, out + observationSize, 0.0f);
+	out = WriteGoals(state, state->GetIncomingTrains(), nIncoming, out);
+	out = WriteGoals(state, state->GetOutgoingTrains(), nOutgoing, out);
+
+	const auto& sus = state->GetShuntingUnits();
+	unordered_map<const ShuntingUnit*, int, ShuntingUnitHash, ShuntingUnitEquals> suIndex;
+	for(int i=0; i<sus.size() && i<nShuntingUnits; i++) suIndex[sus[i]] = i;
+	for(auto track: tracks) {
+		int i = 0;
+		double length = 0;
+		for(auto su: state->GetOccupations(track)) {
+			length += su->GetLength();
+			auto it = suIndex.find(su);
+			if(i < nShuntingUnits && it != suIndex.end()) out[i * nShuntingUnits + it->second] = 1;
+			i++;
+		}
+		out[nShuntingUnits * nShuntingUnits] = state->IsReserved(track) ? 1 : 0;
+		out[nShuntingUnits * nShuntingUnits + 1] = track->GetLength() > 0 ? static_cast<float>(length / track->GetLength()) : 0;
+		out += trackSize;
+	}
+
+	auto suEnd = out + nShuntingUnits * shuntingUnitSize;
+	for(int i=0; i<sus.size() && i<nShuntingUnits; i++) {
+		auto su = sus[i];
+		out[0] = state->IsMoving(su) ? 1 : 0;
+		out[1] = state->IsWaiting(su) ? 1 : 0;
+		out[2] = state->IsInNeutral(su) ? 1 : 0;
+		out[3] = state->HasActiveAction(su) ? 1 : 0;
+		out = WriteTrack(state->GetPosition(su), out + 4);
+		auto previous = state->GetPrevious(su);
+		*out = previous != nullptr && state->GetPosition(su)->IsASide(previous) ? 1 : 0;
+		auto trains = state->GetTrainUnitsInOrder(su);
+		out = WriteTrains(trains, out + 1);
+		size_t tasks = 0;
+		for(auto& train: trains) tasks += state->GetTasksForTrain(&train).size();
+		*(out++) = tasks;
+	}
+	out = WriteTime(state, state->GetTime(), suEnd);
+}
+
+int Featurizer::GetActionIndex(const State* state, const Action* action) const {
+	auto kind = action->GetKind();
+	if(kind == ActionKind::ArriveAction) {
+		auto incoming = SortByTime(state->GetIncomingTrains(), nIncoming);
+		auto it = find(incoming.begin(), incoming.end(), static_cast<const ArriveAction*>(action)->GetIncoming());
+		return it == incoming.end() ? -1 : distance(incoming.begin(), it);
+	}
+	int base = nIncoming;
+	if(kind == ActionKind::ExitAction) {
+		auto outgoing = SortByTime(state->GetOutgoingTrains(), nOutgoing);
+		auto it = find(outgoing.begin(), outgoing.end(), static_cast<const ExitAction*>(action)->GetOutgoing());
+		return it == outgoing.end() ? -1 : base + distance(outgoing.begin(), it);
+	}
+	base += nOutgoing;
+	const auto& sus = state->GetShuntingUnits();
+	auto suIndex = [&sus](const ShuntingUnit* su) -> int {
+		for(int i=0; i<sus.size(); i++)
+			if(sus[i]->GetID() == su->GetID()) return i;
+		return -1;
+	};
+	auto suIx = suIndex(action->GetShuntingUnit());
+	if(suIx < 0 || suIx >= nShuntingUnits) return -1;
+	base += suIx * nShuntingUnitActions;
+	switch(kind) {
+		case ActionKind::BeginMoveAction: return base;
+		case ActionKind::EndMoveAction: return base + 1;
+		case ActionKind::WaitAction: return base + 2;
+		case ActionKind::SetbackAction: return base + 3;
+		case ActionKind::ServiceAction: return base + 4;
+		case ActionKind::SplitAction: {
+			auto splitIx = static_cast<const SplitAction*>(action)->GetSplitIndex() - 1;
+			return splitIx < nTrains - 1 ? base + 5 + splitIx : -1;
+		}
+		case ActionKind::CombineAction: {
+			auto rearIx = suIndex(static_cast<const CombineAction*>(action)->GetRearShuntingUnit());
+			if(rearIx < 0 || rearIx >= nShuntingUnits) return -1;
+			if(rearIx > suIx) rearIx--;
+			return base + 5 + (nTrains - 1) + rearIx;
+		}
+		case ActionKind::MoveAction: {
+			auto slot = GetTrackSlot(static_cast<const MoveAction*>(action)->GetDestinationTrack());
+			return slot < 0 ? -1 : base + 5 + (nTrains - 1) + (nShuntingUnits - 1) + slot;
+		}
+		default:
+			return -1;
+	}
+}
+
+void Featurizer::GetActionMask(const State* state, const list<const Action*>& actions, bool* out) const {
+	fill(out, out + nActions, false);
+	for(auto action: actions) {
+		auto index = GetActionIndex(state, action);
+		if(index >= 0) out[index] = true;
+	}
+}
+
+const SimpleAction* Featurizer::GetSimpleAction(const State* state, int index) const {
+	if(index < 0 || index >= nActions)
+		throw InvalidActionException("Action index " + to_string(index) + " is out of range.");
+	if(index < nIncoming) {
+		auto incoming = SortByTime(state->GetIncomingTrains(), nIncoming);
+		if(index >= incoming.size()) throw InvalidActionException("Incoming train does not exist.");
+		return new Arrive(incoming[index]);
+	}
+	index -= nIncoming;
+	if(index < nOutgoing) {
+		auto outgoing = SortByTime(state->GetOutgoingTrains(), nOutgoing);
+		if(index >= outgoing.size()) throw InvalidActionException("Outgoing train does not exist.");
+		auto out = outgoing[index];
+		for(auto su: state->GetShuntingUnits()) {
+			if(out->GetShuntingUnit()->MatchesShuntingUnit(su) && state->GetPosition(su) == out->GetParkingTrack())
+				return new Exit(su, out);
+		}
+		throw InvalidActionException("No shunting unit matches the outgoing train.");
+	}
+	index -= nOutgoing;
+	const auto& sus = state->GetShuntingUnits();
+	auto suIx = index / nShuntingUnitActions;
+	if(suIx >= sus.size()) throw InvalidActionException("Shunting unit does not exist.");
+	auto su = sus[suIx];
+	index %= nShuntingUnitActions;
+	switch(index) {
+		case 0: return new BeginMove(su);
+		case 1: return new EndMove(su);
+		case 2: return new Wait(su);
+		case 3: return new Setback(su);
+		case 4: {
+			auto& facilities = state->GetPosition(su)->GetFacilities();
+			if(facilities.empty()) throw InvalidActionException("Executing service task, but there is no facility.");
+			for(auto& train: su->GetTrains()) {
+				auto& tasks = state->GetTasksForTrain(&train);
+				if(!tasks.empty()) return new Service(su, tasks.front(), train, facilities.front());
+			}
+			throw InvalidActionException("Executing service task, but no task to be executed.");
+		}
+	}
+	index -= 5;
+	if(index < nTrains - 1) return new Split(su, index + 1);
+	index -= nTrains - 1;
+	if(index < nShuntingUnits - 1) {
+		if(index >= suIx) index++; // Skip its own index
+		if(index >= sus.size()) throw InvalidActionException("Shunting unit does not exist.");
+		return new Combine(su, sus[index]);
+	}
+	index -= nShuntingUnits - 1;
+	return new Move(su, tracks[index]);
+}
@@ -1,6 +1,6 @@
 #include "Plan.h"
 
-int POSAction::newUID{ 0 };
+atomic<int> POSAction::newUID{ 0 };
 
 const vector<int> GetTrainIDs(const PBList<string>& pb_train_ids) {
     vector<string> trainIDs(pb_train_ids.begin(), pb_train_ids.end());
@@ -9,18 +9,6 @@ const vector<int> GetTrainIDs(const PBList<string>& pb_train_ids) {
     return trains;
 }
 
-POSAction& POSAction::operator=(const POSAction& pa) {
-    if(this != &pa) {
-        id = pa.id;
-        suggestedStart = pa.suggestedStart;
-        suggestedEnd = pa.suggestedEnd;
-        minDuration = pa.minDuration;
-        delete action;
-        action = pa.action->Clone();
-    }
-    return *this;
-}
-
 POSAction POSAction::CreatePOSAction(const Location* location, const Scenario* scenario, const PBAction& pb_action) {
     int suggestedStartingTime = pb_action.suggestedstartingtime();
     int suggestedEndingTime = pb_action.suggestedfinishingtime();
@@ -109,6 +97,7 @@ POSAction POSAction::CreatePOSAction(const Location* location, const Scenario* s
 }
 
 void POSAction::Serialize(const LocationEngine& engine, const State* state, PBAction* pb_action) const {
+    auto action = this->action.get();
     pb_action->set_suggestedstartingtime(suggestedStart);
     pb_action->set_suggestedfinishingtime(suggestedEnd);
     pb_action->set_minimumduration(minDuration);
@@ -121,13 +110,13 @@ void POSAction::Serialize(const LocationEngine& engine, const State* state, PBAc
         auto move = dynamic_cast<const Move*>(action);
         auto pb_move = pb_action->mutable_movement();
         auto path = engine.GetPath(state, *move);
-        auto su = state->GetShuntingUnitByTrainIDs(move->GetTrainIDs());
+        auto su = state->ResolveShuntingUnit(move->GetShuntingUnitHandle(), move->GetTrainIDs());
         for(auto t: path.route) {
             pb_move->add_path(stoi(t->GetID()));
         }
         auto current = state->GetPosition(su);
         auto previous = state->GetPrevious(su);
-        auto destination = engine.GetLocation().GetTrackByID(move->GetDestinationID());
+        auto destination = engine.GetLocation().ResolveTrack(move->GetDestinationIndex(), move->GetDestinationID());
         auto prev_destination = prev(path.route.back());
         pb_move->set_fromside(current->IsASide(previous) ? PBSide::B : PBSide::A );
         pb_move->set_toside(destination->IsASide(prev_destination) ? PBSide::A : PBSide::B );
@@ -238,9 +227,8 @@ void RunResult::SerializeToFile(LocationEngine& engine, const string& outfile) c
     parse_pb_to_json(outfile, pb_run);
 }
 
-RunResult* RunResult::CreateRunResult(const Engine& engine, const PBRun& pb_run) {
-    string locationString = pb_run.location();
-    auto& location = engine.GetLocation(locationString);
+RunResult* RunResult::CreateRunResult(Engine& engine, const PBRun& pb_run) {
+    auto& location = engine.ResolveLocationEngine(pb_run.location())->GetLocation();
     return CreateRunResult(&location, pb_run);
 }
 
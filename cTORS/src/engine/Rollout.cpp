@@ -0,0 +1,138 @@
+#include "Rollout.h"
+#include <random>
+#include <thread>
+
+int GetRolloutPriority(ActionKind kind) {
+	switch(kind) {
+		case ActionKind::ArriveAction:
+		case ActionKind::ExitAction:
+			return 100;
+		case ActionKind::MoveAction:
+		case ActionKind::ServiceAction:
+		case ActionKind::SetbackAction:
+			return 20;
+		case ActionKind::CombineAction:
+		case ActionKind::SplitAction:
+			return 10;
+		case ActionKind::BeginMoveAction:
+		case ActionKind::EndMoveAction:
+			return 5;
+		default:
+			return 1;
+	}
+}
+
+inline const Action* ChooseAction(const list<const Action*>& actions, RolloutPolicy policy, mt19937& rng) {
+	if(policy == RolloutPolicy::Random) {
+		uniform_int_distribution<size_t> index(0, actions.size() - 1);
+		return *next(actions.begin(), index(rng));
+	}
+	vector<int> priorities;
+	priorities.reserve(actions.size());
+	for(auto action: actions) priorities.push_back(GetRolloutPriority(action->GetKind()));
+	if(policy == RolloutPolicy::Mix) {
+		discrete_distribution<size_t> index(priorities.begin(), priorities.end());
+		return *next(actions.begin(), index(rng));
+	}
+	auto best = *max_element(priorities.begin(), priorities.end());
+	auto ties = count(priorities.begin(), priorities.end(), best);
+	auto choice = uniform_int_distribution<long>(0, ties - 1)(rng);
+	auto it = actions.begin();
+	for(auto priority: priorities) {
+		if(priority == best && choice-- == 0) break;
+		it++;
+	}
+	return *it;
+}
+
+RolloutResult PlayRollouts(LocationEngine& engine, State* state, RolloutPolicy policy, size_t n, unsigned int seed,
+		int maxSteps, int nThreads, bool keepBestPlan) {
+	RolloutResult result;
+	if(n == 0) return result;
+	auto& scenario = state->GetScenario();
+	auto numberOfTrains = max<size_t>(1, scenario.GetNumberOfTrains());
+	if(nThreads <= 0) nThreads = max(1u, thread::hardware_concurrency());
+	auto nWorkers = min(n, static_cast<size_t>(nThreads));
+
+	// Start and reset all the sessions in this thread, so that the workers only read the maps of the engine
+	vector<State*> sessions;
+	try {
+		for(size_t w=0; w<nWorkers; w++) {
+			sessions.push_back(engine.StartSession(scenario));
+			engine.ResetSession(sessions.back(), scenario);
+		}
+	} catch(...) {
+		for(auto session: sessions) engine.EndSession(session);
+		throw;
+	}
+
+	vector<double> scores(n), trainsLeft(n), endTimes(n);
+	vector<bool> successes(n);
+	vector<size_t> bestIndex(nWorkers, n);
+	vector<vector<POSAction>> bestPlans(nWorkers);
+	vector<exception_ptr> errors(nWorkers);
+	auto work = [&](size_t w) {
+		try {
+			auto session = sessions[w];
+			for(size_t i=w; i<n; i+=nWorkers) {
+				mt19937 rng(seed + i);
+				engine.CopySession(state, session);
+				auto start = engine.GetResult(session)->GetActions().size();
+				bool failed = false;
+				try {
+					for(int step=0; step<maxSteps; step++) {
+						auto& actions = engine.GetValidActions(session);
+						if(actions.empty()) break;
+						engine.ApplyActionAndStep(session, ChooseAction(actions, policy, rng));
+					}
+				} catch(exception& e) {
+					failed = true;
+				}
+				size_t left = 0;
+				for(auto out: session->GetOutgoingTrains())
+					left += out->GetShuntingUnit()->GetNumberOfTrains();
+				auto arrived = session->GetIncomingTrains().empty();
+				successes[i] = !failed && arrived && session->GetOutgoingTrains().empty();
+				scores[i] = failed || !arrived ? 0 : 1.0 - static_cast<double>(left) / numberOfTrains;
+				trainsLeft[i] = left;
+				endTimes[i] = session->GetTime();
+				if(keepBestPlan && (bestIndex[w] == n || scores[i] > scores[bestIndex[w]])) {
+					bestIndex[w] = i;
+					auto& actions = engine.GetResult(session)->GetActions();
+					bestPlans[w].assign(actions.begin() + start, actions.end());
+				}
+			}
+		} catch(...) {
+			errors[w] = current_exception();
+		}
+	};
+	if(nWorkers == 1) {
+		work(0);
+	} else {
+		vector<thread> threads;
+		for(size_t w=0; w<nWorkers; w++) threads.emplace_back(work, w);
+		for(auto& t: threads) t.join();
+	}
+	for(auto session: sessions) engine.EndSession(session);
+	for(auto& error: errors)
+		if(error) rethrow_exception(error);
+
+	result.numberOfRollouts = n;
+	result.bestScore = scores[0];
+	for(size_t i=0; i<n; i++) {
+		result.numberOfSuccesses += successes[i];
+		result.meanScore += scores[i] / n;
+		result.meanTrainsLeft += trainsLeft[i] / n;
+		result.meanEndTime += endTimes[i] / n;
+		result.bestScore = max(result.bestScore, scores[i]);
+	}
+	if(keepBestPlan) {
+		size_t best = 0;
+		for(size_t w=1; w<nWorkers; w++) {
+			auto i = bestIndex[w], j = bestIndex[best];
+			if(scores[i] > scores[j] || (scores[i] == scores[j] && i < j)) best = w;
+		}
+		result.bestPlan = POSPlan(bestPlans[best]);
+	}
+	return result;
+}
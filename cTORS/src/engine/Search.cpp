@@ -0,0 +1,416 @@
+#include "Search.h"
+#include <chrono>
+#include <limits>
+#include <thread>
+#include <unordered_set>
+
+struct BeamNode {
+	vector<size_t> actions;
+	double score;
+	size_t fingerprint;
+	bool complete;
+};
+
+struct AStarNode {
+	size_t parent;
+	size_t action;
+	double cost;
+	double bound;
+	size_t fingerprint;
+	bool complete;
+};
+
+inline void ApplyPath(LocationEngine& engine, State* state, const vector<size_t>& actions) {
+	for(auto index: actions) {
+		engine.ApplyActionByIndex(state, index);
+		engine.Step(state);
+	}
+}
+
+inline const Outgoing* GetTargetOutgoing(const State* state, const ShuntingUnit* su) {
+	auto& front = su->GetTrains().front();
+	const Outgoing* match = nullptr;
+	for(auto out: state->GetOutgoingTrains()) {
+		for(auto& train: out->GetShuntingUnit()->GetTrains()) {
+			if(train.GetID() == front.GetID()) return out;
+			if(train.GetType() == front.GetType() && (match == nullptr || out->GetTime() < match->GetTime()))
+				match = out;
+		}
+	}
+	return match;
+}
+
+inline double GetTargetDistance(const Location& location, const State* state) {
+	double total = 0;
+	vector<Position> targets;
+	for(auto su: state->GetShuntingUnits()) {
+		auto& suState = state->GetShuntingUnitState(su);
+		if(suState.position == nullptr || suState.previous == nullptr) continue;
+		targets.clear();
+		const Task* task = nullptr;
+		for(auto& train: su->GetTrains()) {
+			auto& tasks = state->GetTasksForTrain(&train);
+			if(!tasks.empty()) {
+				task = &tasks.front();
+				break;
+			}
+		}
+		if(task != nullptr) {
+			for(auto facility: location.GetFacilities())
+				if(facility->ExecutesTask(task))
+					for(auto track: facility->GetTracks())
+						for(auto side: track->GetNeighbors())
+							targets.emplace_back(side, track);
+		} else if(auto out = GetTargetOutgoing(state, su); out != nullptr && out->GetParkingTrack() != nullptr) {
+			auto park = out->GetParkingTrack();
+			auto side = out->GetSideTrack();
+			for(auto previous: side == nullptr ? park->GetNeighbors() : park->GetNextTrackParts(side))
+				targets.emplace_back(previous, park);
+		}
+		int best = MAX_PATH_LENGTH;
+		auto type = su->GetTrains().front().GetType();
+		for(auto& target: targets) {
+			try {
+				best = min(best, location.GetShortestPath(type, {suState.previous, suState.position}, target).length);
+			} catch(out_of_range& e) {}
+		}
+		if(best < MAX_PATH_LENGTH) total += best;
+	}
+	return total;
+}
+
+double GetHeuristicScore(const LocationEngine& engine, const State* state, const SearchHeuristic& heuristic) {
+	double score = 0;
+	if(heuristic.trainsServed != 0) {
+		size_t served = 0;
+		for(auto out: state->GetScenario().GetOutgoingTrains())
+			served += out->GetShuntingUnit()->GetNumberOfTrains();
+		for(auto out: state->GetOutgoingTrains())
+			served -= out->GetShuntingUnit()->GetNumberOfTrains();
+		score += heuristic.trainsServed * served;
+	}
+	if(heuristic.slack != 0) {
+		for(auto out: state->GetOutgoingTrains())
+			score += heuristic.slack * (out->GetTime() - state->GetTime()) / 3600.0;
+	}
+	if(heuristic.tasks != 0) {
+		size_t tasks = 0;
+		for(auto su: state->GetShuntingUnits())
+			for(auto& train: su->GetTrains())
+				tasks += state->GetTasksForTrain(&train).size();
+		for(auto in: state->GetIncomingTrains())
+			for(auto& [train, trainTasks]: in->GetTasks())
+				tasks += trainTasks.size();
+		score -= heuristic.tasks * tasks;
+	}
+	if(heuristic.distance != 0)
+		score -= heuristic.distance * GetTargetDistance(engine.GetLocation(), state);
+	return score;
+}
+
+BeamSearchResult BeamSearch(LocationEngine& engine, State* state, size_t width, const SearchHeuristic& heuristic,
+		int maxDepth, double timeLimit, int nThreads) {
+	auto start = chrono::steady_clock::now();
+	auto timeUp = [&start, timeLimit]() {
+		return timeLimit > 0 && chrono::duration<double>(chrono::steady_clock::now() - start).count() >= timeLimit; };
+	BeamSearchResult result;
+	if(heuristic.distance != 0) engine.CalcShortestPaths();
+	if(nThreads <= 0) nThreads = max(1u, thread::hardware_concurrency());
+	auto nWorkers = max<size_t>(1, min(width, static_cast<size_t>(nThreads)));
+
+	// Start all the sessions in this thread, so that the workers only read the maps of the engine
+	vector<State*> sessions;
+	try {
+		for(size_t w=0; w<2*nWorkers; w++)
+			sessions.push_back(engine.CopySession(state));
+
+		vector<BeamNode> beam {{{}, GetHeuristicScore(engine, state, heuristic), state->GetFingerprint(), false}};
+		unordered_set<size_t> seen {beam.front().fingerprint};
+		for(int depth=0; depth<maxDepth; depth++) {
+			if(timeUp()) break;
+			vector<vector<BeamNode>> expansions(beam.size());
+			vector<exception_ptr> errors(nWorkers);
+			// The time limit is also checked during the epoch, in which case the unfinished epoch is discarded
+			atomic<bool> stopped {false};
+			auto work = [&](size_t w) {
+				try {
+					auto base = sessions[2 * w], child = sessions[2 * w + 1];
+					for(size_t i=w; i<beam.size(); i+=nWorkers) {
+						auto& node = beam[i];
+						engine.CopySession(state, base);
+						ApplyPath(engine, base, node.actions);
+						auto n = engine.GetValidActions(base).size();
+						for(size_t a=0; a<n; a++) {
+							if(stopped || timeUp()) {
+								stopped = true;
+								return;
+							}
+							engine.CopySession(base, child);
+							try {
+								engine.ApplyActionByIndex(child, a);
+								engine.Step(child);
+							} catch(ScenarioFailedException& e) {
+								continue;
+							} catch(InvalidActionException& e) {
+								continue;
+							}
+							auto complete = child->GetIncomingTrains().empty() && child->GetOutgoingTrains().empty();
+							expansions[i].push_back({node.actions, GetHeuristicScore(engine, child, heuristic), child->GetFingerprint(), complete});
+							expansions[i].back().actions.push_back(a);
+						}
+					}
+				} catch(...) {
+					errors[w] = current_exception();
+				}
+			};
+			if(nWorkers == 1 || beam.size() == 1) {
+				work(0);
+			} else {
+				vector<thread> threads;
+				for(size_t w=0; w<nWorkers; w++) threads.emplace_back(work, w);
+				for(auto& t: threads) t.join();
+			}
+			for(auto& error: errors)
+				if(error) rethrow_exception(error);
+			if(stopped) break;
+
+			vector<BeamNode> next;
+			for(auto& nodes: expansions) {
+				for(auto& node: nodes) {
+					result.numberOfExpansions++;
+					if(!seen.insert(node.fingerprint).second) {
+						result.numberOfDuplicates++;
+						continue;
+					}
+					next.push_back(move(node));
+				}
+			}
+			if(next.empty()) break;
+			stable_sort(next.begin(), next.end(), [](const BeamNode& a, const BeamNode& b) {
+				return a.complete > b.complete || (a.complete == b.complete && a.score > b.score); });
+			if(next.size() > width) next.resize(width);
+			beam = move(next);
+			if(beam.front().complete) break;
+		}
+		result.actions = beam.front().actions;
+		result.score = beam.front().score;
+		result.complete = beam.front().complete;
+	} catch(...) {
+		for(auto session: sessions) engine.EndSession(session);
+		throw;
+	}
+	for(auto session: sessions) engine.EndSession(session);
+	return result;
+}
+
+LowerBoundTable::LowerBoundTable(const LocationEngine& engine, const Scenario& scenario) {
+	auto& location = engine.GetLocation();
+	auto& rules = engine.GetBusinessRuleNames();
+	mandatoryServices = find(rules.begin(), rules.end(), "mandatory_service_task_rule") != rules.end();
+	fixedExitTracks = find(rules.begin(), rules.end(), "out_correct_track_rule") != rules.end();
+
+	numberOfTracks = location.GetTracks().size();
+	distances = CalcTravelTimes(location);
+
+	for(auto facility: location.GetFacilities()) {
+		for(auto& task: facility->GetTasks()) {
+			serviceCapacity[task] += facility->GetCapacity();
+			for(auto track: facility->GetTracks())
+				serviceTracks[task].push_back(track->GetIndex());
+		}
+	}
+
+	// The exit Track of a Train is the parking Track of the Outgoing train with the same id, or otherwise of any
+	// Outgoing train with a Train of the same type
+	for(auto in: scenario.GetIncomingTrains()) {
+		for(auto& train: in->GetShuntingUnit()->GetTrains()) {
+			auto& exits = exitTracks[train.GetID()];
+			if(auto out = scenario.GetOutgoingByTrain(&train); out != nullptr && out->GetParkingTrack() != nullptr) {
+				exits.push_back(out->GetParkingTrack()->GetIndex());
+				continue;
+			}
+			for(auto out: scenario.GetOutgoingTrains()) {
+				if(out->GetParkingTrack() == nullptr) continue;
+				for(auto& match: out->GetShuntingUnit()->GetTrains()) {
+					if(match.GetType() == train.GetType()) {
+						exits.push_back(out->GetParkingTrack()->GetIndex());
+						break;
+					}
+				}
+			}
+		}
+	}
+}
+
+int LowerBoundTable::GetTrainBound(const Train& train, const Track* position, const vector<Task>& tasks) const {
+	if(position == nullptr || position->GetIndex() < 0) return 0;
+	auto from = static_cast<size_t>(position->GetIndex());
+	const vector<int>* exits = nullptr;
+	if(fixedExitTracks) {
+		auto it = exitTracks.find(train.GetID());
+		if(it != exitTracks.end() && !it->second.empty()) exits = &it->second;
+	}
+	auto toExit = [&](size_t track) {
+		if(exits == nullptr) return 0;
+		int best = MAX_PATH_LENGTH;
+		for(auto exit: *exits) best = min(best, distances[track * numberOfTracks + exit]);
+		return best;
+	};
+	int bound = toExit(from);
+	if(bound == MAX_PATH_LENGTH) return bound;
+	if(!mandatoryServices) return bound;
+	for(auto& task: tasks) {
+		if(task.priority != 0) continue;
+		auto it = serviceTracks.find(task.toString());
+		if(it == serviceTracks.end()) return MAX_PATH_LENGTH;
+		int best = MAX_PATH_LENGTH;
+		for(auto service: it->second) {
+			auto there = distances[from * numberOfTracks + service];
+			auto back = toExit(service);
+			if(there < MAX_PATH_LENGTH && back < MAX_PATH_LENGTH) best = min(best, there + back);
+		}
+		if(best == MAX_PATH_LENGTH) return best;
+		bound = max(bound, best);
+	}
+	return bound;
+}
+
+double LowerBoundTable::GetLowerBound(const State* state) const {
+	int travel = 0;
+	double service = 0;
+	unordered_map<string, double> durations;
+	auto addTrain = [&](const Train& train, const Track* position, const vector<Task>& tasks) {
+		auto bound = GetTrainBound(train, position, tasks);
+		if(bound == MAX_PATH_LENGTH) return false;
+		travel = max(travel, bound);
+		if(mandatoryServices) {
+			for(auto& task: tasks) {
+				if(task.priority != 0) continue;
+				service += task.duration;
+				durations[task.toString()] += task.duration;
+			}
+		}
+		return true;
+	};
+	for(auto su: state->GetShuntingUnits())
+		for(auto& train: su->GetTrains())
+			if(!addTrain(train, state->GetPosition(su), state->GetTasksForTrain(&train)))
+				return numeric_limits<double>::infinity();
+	const vector<Task> noTasks;
+	for(auto in: state->GetIncomingTrains()) {
+		auto& tasks = in->GetTasks();
+		for(auto& train: in->GetShuntingUnit()->GetTrains()) {
+			auto it = tasks.find(&train);
+			if(!addTrain(train, in->GetParkingTrack(), it == tasks.end() ? noTasks : it->second))
+				return numeric_limits<double>::infinity();
+		}
+	}
+	auto remaining = static_cast<double>(state->GetEndTime() - state->GetTime());
+	for(auto& [task, duration]: durations) {
+		auto it = serviceCapacity.find(task);
+		if(it == serviceCapacity.end() || duration > it->second * remaining)
+			return numeric_limits<double>::infinity();
+	}
+	return travel + service;
+}
+
+shared_ptr<const LowerBoundTable> LocationEngine::GetLowerBoundTable(const State* state) const {
+	lock_guard<mutex> lock(lowerBoundMutex);
+	auto& table = lowerBoundTables[state];
+	if(!table) table = make_shared<const LowerBoundTable>(*this, state->GetScenario());
+	return table;
+}
+
+void LocationEngine::ClearLowerBoundTable(const State* state) {
+	lock_guard<mutex> lock(lowerBoundMutex);
+	lowerBoundTables.erase(state);
+}
+
+AStarResult AStarSearch(LocationEngine& engine, State* state, double weight, size_t maxExpansions, double timeLimit) {
+	auto start = chrono::steady_clock::now();
+	auto elapsed = [&start]() { return chrono::duration<double>(chrono::steady_clock::now() - start).count(); };
+	AStarResult result;
+	auto table = engine.GetLowerBoundTable(state);
+	auto infinity = numeric_limits<double>::infinity();
+
+	vector<AStarNode> nodes {{SIZE_MAX, 0, 0, table->GetLowerBound(state), state->GetFingerprint(),
+		state->GetIncomingTrains().empty() && state->GetOutgoingTrains().empty()}};
+	// The open list is a heap of (cost + weight * bound, -cost, node), so that ties are broken by the highest cost
+	vector<tuple<double, double, size_t>> open;
+	if(nodes.front().bound < infinity) open.emplace_back(weight * nodes.front().bound, 0, 0);
+	unordered_map<size_t, double> costs {{nodes.front().fingerprint, 0}};
+	size_t best = 0, goal = SIZE_MAX;
+	auto getPath = [&nodes](size_t node) {
+		vector<size_t> path;
+		for(; nodes[node].parent != SIZE_MAX; node = nodes[node].parent) path.push_back(nodes[node].action);
+		reverse(path.begin(), path.end());
+		return path;
+	};
+
+	vector<State*> sessions;
+	try {
+		sessions.push_back(engine.CopySession(state));
+		sessions.push_back(engine.CopySession(state));
+		auto base = sessions[0], child = sessions[1];
+		while(!open.empty()) {
+			if(result.numberOfExpansions >= maxExpansions || (timeLimit > 0 && elapsed() >= timeLimit)) break;
+			pop_heap(open.begin(), open.end(), greater<>());
+			auto current = get<2>(open.back());
+			open.pop_back();
+			auto node = nodes[current];
+			// Skip States that were reached again with a lower cost after they were generated
+			if(node.cost > costs.at(node.fingerprint)) continue;
+			if(node.complete) {
+				goal = current;
+				break;
+			}
+			result.numberOfExpansions++;
+			if(node.bound < nodes[best].bound || (node.bound == nodes[best].bound && node.cost < nodes[best].cost)) best = current;
+			auto path = getPath(current);
+			engine.CopySession(state, base);
+			ApplyPath(engine, base, path);
+			size_t index = 0;
+			for(auto action: engine.GetValidActions(base)) {
+				auto a = index++;
+				engine.CopySession(base, child);
+				try {
+					engine.ApplyActionByIndex(child, a);
+					engine.Step(child);
+				} catch(ScenarioFailedException& e) {
+					continue;
+				} catch(InvalidActionException& e) {
+					continue;
+				}
+				result.numberOfGenerated++;
+				auto nextCost = node.cost + (action->GetKind() == ActionKind::WaitAction ? 0 : action->GetDuration());
+				auto fingerprint = child->GetFingerprint();
+				auto [it, inserted] = costs.emplace(fingerprint, nextCost);
+				if(!inserted) {
+					if(it->second <= nextCost) continue;
+					it->second = nextCost;
+				}
+				auto bound = table->GetLowerBound(child);
+				if(bound == infinity) continue;
+				nodes.push_back({current, a, nextCost, bound, fingerprint, child->GetIncomingTrains().empty() && child->GetOutgoingTrains().empty()});
+				open.emplace_back(nextCost + weight * bound, -nextCost, nodes.size() - 1);
+				push_heap(open.begin(), open.end(), greater<>());
+			}
+		}
+	} catch(...) {
+		for(auto session: sessions) engine.EndSession(session);
+		throw;
+	}
+	for(auto session: sessions) engine.EndSession(session);
+
+	result.lowerBound = infinity;
+	for(auto& [f, cost, node]: open) result.lowerBound = min(result.lowerBound, nodes[node].cost + nodes[node].bound);
+	if(goal != SIZE_MAX) {
+		result.lowerBound = min(result.lowerBound, nodes[goal].cost);
+		best = goal;
+	}
+	result.actions = getPath(best);
+	result.complete = nodes[best].complete;
+	result.cost = nodes[best].cost;
+	result.elapsed = elapsed();
+	return result;
+}
@@ -0,0 +1,102 @@
+#include "SessionBatch.h"
+#include <thread>
+#include <exception>
+
+SessionBatch::SessionBatch(LocationEngine& engine, const Featurizer& featurizer, size_t size, float stepPenalty, int nThreads) :
+	engine(&engine), featurizer(&featurizer), states(size, nullptr), numberOfTrains(size, 0), stepPenalty(stepPenalty), nThreads(nThreads) {
+	if(this->nThreads <= 0) this->nThreads = max(1u, thread::hardware_concurrency());
+}
+
+SessionBatch::~SessionBatch() {
+	for(auto state: states)
+		if(state != nullptr) engine->EndSession(state);
+}
+
+void SessionBatch::WriteObservation(size_t index, float* obs, bool* masks) {
+	auto state = states[index];
+	auto nActions = featurizer->GetNumberOfActions();
+	obs += index * GetObservationSize();
+	masks += index * nActions;
+	featurizer->Featurize(state, obs);
+	try {
+		featurizer->GetActionMask(state, engine->GetValidActions(state), masks);
+	} catch(exception& e) {
+		fill(masks, masks + nActions, false);
+	}
+	obs += featurizer->GetObservationSize();
+	for(int i=0; i<nActions; i++) obs[i] = masks[i] ? 1 : 0;
+}
+
+void SessionBatch::Reset(size_t index, const Scenario& scenario, float* obs, bool* masks) {
+	auto& state = states.at(index);
+	numberOfTrains[index] = scenario.GetNumberOfTrains();
+	try {
+		if(state != nullptr) {
+			engine->ResetSession(state, scenario);
+		} else {
+			state = engine->StartSession(scenario);
+			engine->Step(state);
+		}
+	} catch(ScenarioFailedException& e) {} // The mask is then empty, and the session is done after the first Step
+	WriteObservation(index, obs, masks);
+}
+
+void SessionBatch::StepSession(size_t index, int action, float* obs, float* rewards, bool* dones, bool* masks) {
+	auto state = states[index];
+	float reward = 0;
+	bool done = false;
+	try {
+		unique_ptr<const SimpleAction> simple(featurizer->GetSimpleAction(state, action));
+		engine->ApplyActionAndStep(state, *simple);
+		reward -= stepPenalty;
+		if(engine->GetValidActions(state).empty()) {
+			done = true;
+			reward = 0;
+			if(state->GetIncomingTrains().empty() && numberOfTrains[index] > 0) {
+				size_t trainsLeft = 0;
+				for(auto out: state->GetOutgoingTrains())
+					trainsLeft += out->GetShuntingUnit()->GetNumberOfTrains();
+				reward = 1.0f - static_cast<float>(trainsLeft) / numberOfTrains[index];
+			}
+		}
+	} catch(InvalidActionException& e) {
+		// Invalid actions and failed Scenarios end the session without reward
+		done = true;
+		reward = 0;
+	} catch(ScenarioFailedException& e) {
+		done = true;
+		reward = 0;
+	}
+	rewards[index] = reward;
+	dones[index] = done;
+	WriteObservation(index, obs, masks);
+}
+
+void SessionBatch::Step(const int64_t* actions, float* obs, float* rewards, bool* dones, bool* masks) {
+	for(size_t i=0; i<states.size(); i++)
+		if(states[i] == nullptr) throw invalid_argument("Session " + to_string(i) + " is not started.");
+	auto n = states.size();
+	auto stepRange = [=](size_t begin, size_t end) {
+		for(size_t i=begin; i<end; i++)
+			StepSession(i, static_cast<int>(actions[i]), obs, rewards, dones, masks);
+	};
+	size_t nWorkers = min(n, static_cast<size_t>(nThreads));
+	if(nWorkers <= 1) {
+		stepRange(0, n);
+		return;
+	}
+	// Other errors than invalid actions and failed Scenarios are passed on to the caller
+	vector<exception_ptr> errors(nWorkers);
+	vector<thread> workers;
+	for(size_t w=0; w<nWorkers; w++)
+		workers.emplace_back([&, w]() {
+			try {
+				stepRange(w * n / nWorkers, (w + 1) * n / nWorkers);
+			} catch(...) {
+				errors[w] = current_exception();
+			}
+		});
+	for(auto& worker: workers) worker.join();
+	for(auto& error: errors)
+		if(error) rethrow_exception(error);
+}
@@ -0,0 +1,500 @@
+#include "Engine.h"
+#include "Snapshot.h"
+using namespace std;
+
+/** The tags of the SimpleAction%s of the plan in a snapshot */
+enum class SimpleActionTag : int {
+	Arrive, Exit, BeginMove, EndMove, Move, MultiMove, Combine, Split, Service, Setback, Wait
+};
+
+/**
+ * The placeholder for a ShuntingUnit that an Action refers to, but that is no longer on the shunting yard (such as
+ * the rear ShuntingUnit of a started CombineAction)
+ */
+static const ShuntingUnit unknownShuntingUnit(-1, {});
+
+inline void PutTrack(SnapshotWriter& writer, const Track* track) {
+	writer.PutInt(track == nullptr ? -1 : track->GetIndex());
+}
+
+inline const Track* GetTrack(SnapshotReader& reader, const Location& location) {
+	auto index = reader.GetInt();
+	if(index == -1) return nullptr;
+	if(index < 0 || static_cast<size_t>(index) >= location.GetTracks().size())
+		throw invalid_argument("The snapshot refers to an unknown Track with index " + to_string(index) + ".");
+	return location.GetTrackByIndex(index);
+}
+
+inline void PutTasks(SnapshotWriter& writer, const vector<Task>& tasks) {
+	writer.PutUnsigned(tasks.size());
+	for(auto& task: tasks) {
+		writer.PutString(task.taskType);
+		writer.PutInt(task.priority);
+		writer.PutInt(task.duration);
+		writer.PutUnsigned(task.skills.size());
+		for(auto& skill: task.skills) writer.PutString(skill);
+	}
+}
+
+inline vector<Task> GetTasks(SnapshotReader& reader) {
+	vector<Task> tasks;
+	for(size_t i = reader.GetSize(); i > 0; i--) {
+		auto taskType = reader.GetString();
+		auto priority = reader.GetInt();
+		auto duration = reader.GetInt();
+		list<string> skills;
+		for(size_t j = reader.GetSize(); j > 0; j--) skills.push_back(reader.GetString());
+		tasks.emplace_back(taskType, priority, duration, skills);
+	}
+	return tasks;
+}
+
+inline void PutShuntingUnit(SnapshotWriter& writer, const ShuntingUnit& su) {
+	writer.PutInt(su.GetID());
+	writer.PutInts(su.GetTrainIDs());
+}
+
+inline ShuntingUnit GetShuntingUnit(SnapshotReader& reader, const Scenario& scenario) {
+	auto id = reader.GetInt();
+	vector<Train> trains;
+	for(auto trainID: reader.GetInts()) {
+		auto train = scenario.GetTrainByID(trainID);
+		if(train == nullptr) throw invalid_argument("The snapshot refers to an unknown Train " + to_string(trainID) + ".");
+		trains.push_back(*train);
+	}
+	return ShuntingUnit(id, trains);
+}
+
+/**
+ * Get the ID of the ShuntingUnit of an Action, or -1 if it is no longer on the shunting yard. The pointer is
+ * only dereferenced if the ShuntingUnit is on the shunting yard.
+ */
+inline int GetActionShuntingUnitID(const vector<const ShuntingUnit*>& shuntingUnits, const ShuntingUnit* su) {
+	return find(shuntingUnits.begin(), shuntingUnits.end(), su) == shuntingUnits.end() ? -1 : su->GetID();
+}
+
+inline const ShuntingUnit* GetActionShuntingUnit(const State* state, int id) {
+	if(id == -1) return &unknownShuntingUnit;
+	auto su = state->GetShuntingUnitByID(id);
+	if(su == nullptr) throw invalid_argument("The snapshot refers to an unknown ShuntingUnit " + to_string(id) + ".");
+	return su;
+}
+
+template<class T>
+inline const T* GetTrainGoal(const vector<const T*>& goals, int id) {
+	auto it = find_if(goals.begin(), goals.end(), [id](const T* goal) { return goal->GetID() == id; });
+	if(it == goals.end()) throw invalid_argument("The snapshot refers to an unknown train goal " + to_string(id) + ".");
+	return *it;
+}
+
+/**
+ * Write an Action of the EventQueue or the active Action%s. The ShuntingUnit%s that a started CombineAction or
+ * SplitAction acts on are removed from the State, so those are identified by the resulting ShuntingUnit%s, which
+ * have the same ID.
+ */
+void PutAction(SnapshotWriter& writer, const vector<const ShuntingUnit*>& shuntingUnits, const Action* action) {
+	auto kind = action->GetKind();
+	writer.PutInt(static_cast<int>(kind));
+	writer.PutInt(action->GetDuration());
+	switch(kind) {
+		case ActionKind::ArriveAction:
+			writer.PutInt(static_cast<const ArriveAction*>(action)->GetIncoming()->GetID());
+			break;
+		case ActionKind::ExitAction:
+			writer.PutInt(GetActionShuntingUnitID(shuntingUnits, action->GetShuntingUnit()));
+			writer.PutInt(static_cast<const ExitAction*>(action)->GetOutgoing()->GetID());
+			break;
+		case ActionKind::MoveAction: {
+			auto move = static_cast<const MoveAction*>(action);
+			writer.PutInt(GetActionShuntingUnitID(shuntingUnits, action->GetShuntingUnit()));
+			writer.PutBool(move->IsStepMove());
+			writer.PutUnsigned(move->GetTracks().size());
+			for(auto track: move->GetTracks()) PutTrack(writer, track);
+			break;
+		}
+		case ActionKind::CombineAction: {
+			auto combine = static_cast<const CombineAction*>(action);
+			PutShuntingUnit(writer, *combine->GetCombinedShuntingUnit());
+			PutTrack(writer, action->GetReservedTracks().front());
+			writer.PutBool(combine->IsInNeutral());
+			writer.PutInt(combine->GetPosition());
+			writer.PutString(combine->GetShuntingUnitsString());
+			break;
+		}
+		case ActionKind::SplitAction: {
+			auto split = static_cast<const SplitAction*>(action);
+			PutTrack(writer, action->GetReservedTracks().front());
+			PutShuntingUnit(writer, *split->GetASideShuntingUnit());
+			PutShuntingUnit(writer, *split->GetBSideShuntingUnit());
+			break;
+		}
+		case ActionKind::ServiceAction: {
+			auto service = static_cast<const ServiceAction*>(action);
+			writer.PutInt(GetActionShuntingUnitID(shuntingUnits, action->GetShuntingUnit()));
+			writer.PutInt(service->GetTrain()->GetID());
+			PutTasks(writer, {*service->GetTask()});
+			writer.PutInt(service->GetFacility()->GetID());
+			break;
+		}
+		default:
+			writer.PutInt(GetActionShuntingUnitID(shuntingUnits, action->GetShuntingUnit()));
+	}
+}
+
+/** Read an Action that was written by PutAction. The ShuntingUnit%s of the State must be restored */
+Action* GetAction(SnapshotReader& reader, const State* state, const Location& location) {
+	auto& scenario = state->GetScenario();
+	auto kind = static_cast<ActionKind>(reader.GetInt());
+	auto duration = reader.GetInt();
+	switch(kind) {
+		case ActionKind::ArriveAction: {
+			auto incoming = GetTrainGoal(scenario.GetIncomingTrains(), reader.GetInt());
+			return new ArriveAction(incoming->GetShuntingUnit(), duration, incoming);
+		}
+		case ActionKind::ExitAction: {
+			auto su = GetActionShuntingUnit(state, reader.GetInt());
+			return new ExitAction(su, duration, GetTrainGoal(scenario.GetOutgoingTrains(), reader.GetInt()));
+		}
+		case ActionKind::BeginMoveAction:
+			return new BeginMoveAction(GetActionShuntingUnit(state, reader.GetInt()), duration);
+		case ActionKind::EndMoveAction:
+			return new EndMoveAction(GetActionShuntingUnit(state, reader.GetInt()), duration);
+		case ActionKind::MoveAction: {
+			auto su = GetActionShuntingUnit(state, reader.GetInt());
+			auto stepMove = reader.GetBool();
+			vector<const Track*> tracks(reader.GetSize());
+			for(auto& track: tracks) track = GetTrack(reader, location);
+			if(tracks.size() < 2) throw invalid_argument("The snapshot contains a MoveAction without a route.");
+			return new MoveAction(su, tracks, duration, stepMove);
+		}
+		case ActionKind::CombineAction: {
+			auto combinedSU = GetShuntingUnit(reader, scenario);
+			auto track = GetTrack(reader, location);
+			auto inNeutral = reader.GetBool();
+			auto position = reader.GetInt();
+			auto suString = reader.GetString();
+			return new CombineAction(GetActionShuntingUnit(state, combinedSU.GetID()), &unknownShuntingUnit, combinedSU,
+				track, duration, inNeutral, position, suString);
+		}
+		case ActionKind::SplitAction: {
+			auto track = GetTrack(reader, location);
+			auto suA = GetShuntingUnit(reader, scenario);
+			auto suB = GetShuntingUnit(reader, scenario);
+			return new SplitAction(GetActionShuntingUnit(state, suA.GetID()), track, duration, suA, suB);
+		}
+		case ActionKind::ServiceAction: {
+			auto su = GetActionShuntingUnit(state, reader.GetInt());
+			auto trainID = reader.GetInt();
+			auto train = su->GetTrainByID(trainID);
+			if(train == nullptr) throw invalid_argument("The snapshot refers to an unknown Train " + to_string(trainID) + ".");
+			auto tasks = GetTasks(reader);
+			if(tasks.size() != 1) throw invalid_argument("The snapshot contains a ServiceAction without a Task.");
+			auto facility = location.GetFacilityByID(reader.GetInt());
+			if(facility == nullptr) throw invalid_argument("The snapshot refers to an unknown Facility.");
+			return new ServiceAction(su, train, tasks.front(), facility, {});
+		}
+		case ActionKind::SetbackAction:
+			return new SetbackAction(GetActionShuntingUnit(state, reader.GetInt()), {}, duration);
+		case ActionKind::WaitAction:
+			return new WaitAction(GetActionShuntingUnit(state, reader.GetInt()), duration);
+	}
+	throw invalid_argument("The snapshot contains an unknown Action kind " + to_string(static_cast<int>(kind)) + ".");
+}
+
+void PutSimpleAction(SnapshotWriter& writer, const SimpleAction* action) {
+	SimpleActionTag tag;
+	if(instanceof<Arrive>(action)) tag = SimpleActionTag::Arrive;
+	else if(instanceof<Exit>(action)) tag = SimpleActionTag::Exit;
+	else if(instanceof<BeginMove>(action)) tag = SimpleActionTag::BeginMove;
+	else if(instanceof<EndMove>(action)) tag = SimpleActionTag::EndMove;
+	else if(instanceof<Move>(action)) tag = SimpleActionTag::Move;
+	else if(instanceof<MultiMove>(action)) tag = SimpleActionTag::MultiMove;
+	else if(instanceof<Combine>(action)) tag = SimpleActionTag::Combine;
+	else if(instanceof<Split>(action)) tag = SimpleActionTag::Split;
+	else if(instanceof<Service>(action)) tag = SimpleActionTag::Service;
+	else if(instanceof<Setback>(action)) tag = SimpleActionTag::Setback;
+	else if(instanceof<Wait>(action)) tag = SimpleActionTag::Wait;
+	else throw invalid_argument("The plan contains an unknown action " + action->toString() + ".");
+	writer.PutInt(static_cast<int>(tag));
+	writer.PutInts(action->GetTrainIDs());
+	switch(tag) {
+		case SimpleActionTag::Arrive:
+			writer.PutInt(static_cast<const Arrive*>(action)->GetIncomingID());
+			break;
+		case SimpleActionTag::Exit:
+			writer.PutInt(static_cast<const Exit*>(action)->GetOutgoingID());
+			break;
+		case SimpleActionTag::Move: {
+			auto move = static_cast<const Move*>(action);
+			writer.PutString(move->GetDestinationID());
+			writer.PutInt(move->GetDestinationIndex());
+			break;
+		}
+		case SimpleActionTag::MultiMove: {
+			auto move = static_cast<const MultiMove*>(action);
+			writer.PutUnsigned(move->GetTrackIDs().size());
+			for(auto& id: move->GetTrackIDs()) writer.PutString(id);
+			writer.PutInts(move->GetTrackIndices());
+			break;
+		}
+		case SimpleActionTag::Combine:
+			writer.PutInts(static_cast<const Combine*>(action)->GetSecondTrainIDs());
+			break;
+		case SimpleActionTag::Split:
+			writer.PutInt(static_cast<const Split*>(action)->GetSplitIndex());
+			break;
+		case SimpleActionTag::Service: {
+			auto service = static_cast<const Service*>(action);
+			PutTasks(writer, {service->GetTask()});
+			writer.PutInt(service->GetTrain().GetID());
+			writer.PutInt(service->GetFacilityID());
+			break;
+		}
+		default:
+			break;
+	}
+}
+
+/** Read a SimpleAction that was written by PutSimpleAction. The caller owns the result */
+const SimpleAction* GetSimpleAction(SnapshotReader& reader, const Scenario& scenario, const Location& location) {
+	auto tag = static_cast<SimpleActionTag>(reader.GetInt());
+	auto trainIDs = reader.GetInts();
+	switch(tag) {
+		case SimpleActionTag::Arrive:
+			return new Arrive(GetTrainGoal(scenario.GetIncomingTrains(), reader.GetInt()));
+		case SimpleActionTag::Exit:
+			return new Exit(trainIDs, reader.GetInt());
+		case SimpleActionTag::BeginMove:
+			return new BeginMove(trainIDs);
+		case SimpleActionTag::EndMove:
+			return new EndMove(trainIDs);
+		case SimpleActionTag::Move: {
+			auto destinationID = reader.GetString();
+			auto index = reader.GetInt();
+			if(index == -1) return new Move(trainIDs, destinationID);
+			return new Move(trainIDs, location.GetTrackByIndex(index));
+		}
+		case SimpleActionTag::MultiMove: {
+			vector<string> trackIDs(reader.GetSize());
+			for(auto& id: trackIDs) id = reader.GetString();
+			auto indices = reader.GetInts();
+			if(indices.size() != trackIDs.size()) return new MultiMove(trainIDs, trackIDs);
+			vector<const Track*> tracks;
+			for(auto index: indices) tracks.push_back(location.GetTrackByIndex(index));
+			return new MultiMove(trainIDs, tracks);
+		}
+		case SimpleActionTag::Combine:
+			return new Combine(trainIDs, reader.GetInts());
+		case SimpleActionTag::Split:
+			return new Split(trainIDs, reader.GetInt());
+		case SimpleActionTag::Service: {
+			auto tasks = GetTasks(reader);
+			auto trainID = reader.GetInt();
+			auto train = scenario.GetTrainByID(trainID);
+			if(tasks.size() != 1 || train == nullptr) throw invalid_argument("The snapshot contains an invalid Service action.");
+			return new Service(trainIDs, tasks.front(), *train, reader.GetInt());
+		}
+		case SimpleActionTag::Setback:
+			return new Setback(trainIDs);
+		case SimpleActionTag::Wait:
+			return new Wait(trainIDs);
+	}
+	throw invalid_argument("The snapshot contains an unknown action tag " + to_string(static_cast<int>(tag)) + ".");
+}
+
+string LocationEngine::SaveState(const State* state) const {
+	auto& result = *results.at(const_cast<State*>(state));
+	auto& scenario = state->GetScenario();
+	SnapshotWriter writer;
+	writer.PutString(GetCanonicalLocation(path));
+	writer.PutString(GetLocationID(*location));
+	PBScenario pb_scenario;
+	scenario.Serialize(&pb_scenario);
+	writer.PutString(pb_scenario.SerializeAsString());
+	writer.PutInt(state->GetTime());
+	vector<int> incomingIDs, outgoingIDs;
+	for(auto in: state->GetIncomingTrains()) incomingIDs.push_back(in->GetID());
+	for(auto out: state->GetOutgoingTrains()) outgoingIDs.push_back(out->GetID());
+	writer.PutInts(incomingIDs);
+	writer.PutInts(outgoingIDs);
+
+	// The ShuntingUnit%s with their state and the Task%s of their Train%s
+	auto shuntingUnits = state->GetShuntingUnits();
+	writer.PutUnsigned(shuntingUnits.size());
+	for(auto su: shuntingUnits) {
+		auto& suState = state->GetShuntingUnitState(su);
+		PutShuntingUnit(writer, *su);
+		PutTrack(writer, suState.position);
+		PutTrack(writer, suState.previous);
+		writer.PutInt(suState.frontTrain->GetID());
+		writer.PutBool(suState.moving);
+		writer.PutBool(suState.waiting);
+		writer.PutBool(suState.inNeutral);
+		writer.PutBool(suState.beginMoving);
+		for(auto& train: su->GetTrains()) {
+			PutTasks(writer, state->GetTasksForTrain(&train));
+			PutTasks(writer, state->GetActiveTasksForTrain(&train));
+		}
+	}
+	// The iteration order of the ShuntingUnitState%s, which determines the order of the valid Action%s
+	auto& suStates = state->GetShuntingUnitStates();
+	writer.PutUnsigned(suStates.bucket_count());
+	for(auto& [su, suState]: suStates) writer.PutInt(su->GetID());
+
+	// The Track%s that are occupied or reserved
+	vector<const Track*> tracks;
+	for(auto track: location->GetTracks())
+		if(state->IsReserved(track) || state->GetAmountOnTrack(track) > 0) tracks.push_back(track);
+	writer.PutUnsigned(tracks.size());
+	for(auto track: tracks) {
+		PutTrack(writer, track);
+		writer.PutBool(state->IsReserved(track));
+		vector<int> ids;
+		for(auto su: state->GetOccupations(track)) ids.push_back(su->GetID());
+		writer.PutInts(ids);
+	}
+
+	// The active Action%s and the Action%s of the Event%s, which share their Action if it has the same uid
+	vector<const Action*> actions;
+	auto getIndex = [&actions](const Action* action) -> int {
+		auto it = find_if(actions.begin(), actions.end(), [action](const Action* a) { return a->IsEqual(*action); });
+		if(it != actions.end()) return it - actions.begin();
+		actions.push_back(action);
+		return actions.size() - 1;
+	};
+	vector<vector<int>> activeActions;
+	for(auto su: shuntingUnits) {
+		activeActions.emplace_back();
+		for(auto action: state->GetActiveActions(su)) activeActions.back().push_back(getIndex(action));
+	}
+	auto& events = state->GetEvents().GetEvents();
+	vector<int> eventActions;
+	for(auto event: events) eventActions.push_back(event->GetAction() == nullptr ? -1 : getIndex(event->GetAction()));
+	writer.PutUnsigned(actions.size());
+	for(auto action: actions) PutAction(writer, shuntingUnits, action);
+	for(auto& indices: activeActions) writer.PutInts(indices);
+	// The Event%s in the order of the underlying heap, so that the EventQueue is restored exactly
+	writer.PutUnsigned(events.size());
+	for(size_t i = 0; i < events.size(); i++) {
+		writer.PutInt(events[i]->GetTime());
+		writer.PutInt(static_cast<int>(events[i]->GetType()));
+		writer.PutInt(eventActions[i]);
+	}
+
+	// The plan so far
+	auto& plan = result.GetActions();
+	writer.PutUnsigned(plan.size());
+	for(auto& action: plan) {
+		writer.PutInt(action.GetSuggestedStart());
+		writer.PutInt(action.GetSuggestedEnd());
+		writer.PutInt(action.GetMinimumDuration());
+		PutSimpleAction(writer, action.GetAction());
+	}
+	return writer.GetData();
+}
+
+State* LocationEngine::LoadState(const string& data, State* target) {
+	SnapshotReader reader(data);
+	auto snapshotLocation = reader.GetString();
+	// The location is identified by its contents, so snapshots can be loaded from a copy of the location in another folder
+	if(reader.GetString() != GetLocationID(*location))
+		throw invalid_argument("The snapshot belongs to the location " + snapshotLocation + ", not to " + path + ".");
+	PBScenario pb_scenario;
+	if(!pb_scenario.ParseFromString(reader.GetString()))
+		throw invalid_argument("The snapshot contains an invalid Scenario.");
+	Scenario scenario(pb_scenario, *location);
+	bool started = target == nullptr;
+	if(started) target = StartSession(scenario);
+	else {
+		ClearValidActions(target);
+		ClearLowerBoundTable(target);
+		*results.at(target) = RunResult(path, scenario);
+	}
+	try {
+		target->Reset(scenario, reader.GetInt(), EventQueue());
+		auto incomingIDs = reader.GetInts();
+		auto outgoingIDs = reader.GetInts();
+		for(auto in: vector<const Incoming*>(target->GetIncomingTrains()))
+			if(find(incomingIDs.begin(), incomingIDs.end(), in->GetID()) == incomingIDs.end()) target->RemoveIncoming(in);
+		for(auto out: vector<const Outgoing*>(target->GetOutgoingTrains()))
+			if(find(outgoingIDs.begin(), outgoingIDs.end(), out->GetID()) == outgoingIDs.end()) target->RemoveOutgoing(out);
+		if(target->GetIncomingTrains().size() != incomingIDs.size() || target->GetOutgoingTrains().size() != outgoingIDs.size())
+			throw invalid_argument("The snapshot refers to an unknown train goal.");
+
+		// The ShuntingUnit%s
+		auto& state = *target;
+		vector<const ShuntingUnit*> shuntingUnits(reader.GetSize());
+		vector<pair<const Track*, const Track*>> positions;
+		for(auto& su: shuntingUnits) {
+			auto shuntingUnit = GetShuntingUnit(reader, state.GetScenario());
+			auto position = GetTrack(reader, *location);
+			auto previous = GetTrack(reader, *location);
+			auto frontTrain = shuntingUnit.GetTrainByID(reader.GetInt());
+			if(frontTrain == nullptr) throw invalid_argument("The snapshot contains an invalid front Train.");
+			su = state.AddShuntingUnitToState(&shuntingUnit, position, previous, frontTrain);
+			positions.emplace_back(position, previous);
+			state.SetMoving(su, reader.GetBool());
+			state.SetWaiting(su, reader.GetBool());
+			state.SetInNeutral(su, reader.GetBool());
+			state.SetBeginMoving(su, reader.GetBool());
+			for(auto& train: su->GetTrains()) {
+				for(auto& task: GetTasks(reader)) state.AddTaskToTrain(&train, task);
+				for(auto& task: GetTasks(reader)) state.AddActiveTaskToTrain(&train, task);
+			}
+		}
+		auto bucketCount = reader.GetUnsigned();
+		vector<const ShuntingUnit*> order(shuntingUnits.size());
+		for(auto& su: order) su = GetActionShuntingUnit(target, reader.GetInt());
+
+		// The Track%s, after which the position of the ShuntingUnit%s is set again, because occupying a Track sets it
+		for(size_t i = reader.GetSize(); i > 0; i--) {
+			auto track = GetTrack(reader, *location);
+			if(track == nullptr) throw invalid_argument("The snapshot contains an invalid Track.");
+			if(reader.GetBool()) state.ReserveTrack(track);
+			auto ids = reader.GetInts();
+			for(size_t j = 0; j < ids.size(); j++) {
+				auto su = GetActionShuntingUnit(target, ids[j]);
+				state.InsertOnTrack(su, track, state.GetPrevious(su), j);
+			}
+		}
+		for(size_t i = 0; i < shuntingUnits.size(); i++) {
+			state.SetPosition(shuntingUnits[i], positions[i].first);
+			state.SetPrevious(shuntingUnits[i], positions[i].second);
+		}
+		state.SetShuntingUnitOrder(order, bucketCount);
+
+		// The active Action%s and the EventQueue
+		vector<unique_ptr<const Action>> actions(reader.GetSize());
+		for(auto& action: actions) action.reset(GetAction(reader, target, *location));
+		for(auto su: shuntingUnits)
+			for(auto index: reader.GetInts()) state.AddActiveAction(su, actions.at(index).get());
+		for(size_t i = reader.GetSize(); i > 0; i--) {
+			auto time = reader.GetInt();
+			auto type = static_cast<EventType>(reader.GetInt());
+			auto index = reader.GetInt();
+			if(index == -1) state.AddEvent(Event(time, type));
+			else state.AddEvent(Event(time, actions.at(index).get()));
+		}
+
+		// The plan so far
+		vector<POSAction> plan;
+		for(size_t i = reader.GetSize(); i > 0; i--) {
+			auto start = reader.GetInt();
+			auto end = reader.GetInt();
+			auto minDuration = reader.GetInt();
+			plan.emplace_back(start, end, minDuration, GetSimpleAction(reader, state.GetScenario(), *location));
+		}
+		if(!reader.AtEnd()) throw invalid_argument("The snapshot contains trailing data.");
+		*results.at(target) = RunResult(path, scenario, POSPlan(plan), false);
+		state.SetChanged();
+	} catch(const out_of_range& e) {
+		if(started) EndSession(target);
+		else ResetSession(target, scenario);
+		throw invalid_argument("The snapshot is inconsistent: " + string(e.what()));
+	} catch(...) {
+		if(started) EndSession(target);
+		else ResetSession(target, scenario);
+		throw;
+	}
+	return target;
+}
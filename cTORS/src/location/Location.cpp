@@ -1,4 +1,5 @@
 #include "Location.h"
+#include "LocationGraph.h"
 #if DEBUG
 #include <chrono>
 #endif
@@ -7,12 +8,22 @@ namespace fs = std::filesystem;
 using namespace std;
 
 const string Location::locationFileString = "location.json";
+map<tuple<string, size_t, bool>, weak_ptr<const Location>> Location::sharedLocations;
+mutex Location::sharedLocationsMutex;
+
+/** Read the raw contents of the protobuf file of the Location in the given folder */
+static string ReadLocationFile(const string& path, const string& locationFileString) {
+	auto file = resolve_pb_file(fs::path(path) / fs::path(locationFileString));
+	ifstream fileInput(file, ios::in | ios::binary);
+	return string((istreambuf_iterator<char>(fileInput)), istreambuf_iterator<char>());
+}
 
 Location::Location(const string &folderName, bool byType) : byType(byType) {
 	path = folderName;
+	fileHash = hash<string>{}(ReadLocationFile(folderName, locationFileString));
 	try {
 		PBLocation pb_location;
-		parse_json_to_pb(fs::path(folderName) / fs::path(locationFileString), &pb_location);
+		parse_file_to_pb(fs::path(folderName) / fs::path(locationFileString), &pb_location);
 		ImportTracks(pb_location);
 		ImportFacilities(pb_location);
 		ImportDistanceMatrix(pb_location);
@@ -39,6 +50,73 @@ Location::~Location()
 	DELETE_VECTOR(tracks)
 	DELETE_VECTOR(facilities)
 	trackIndex.clear();
+	for(auto& [name, type]: trainUnitTypes)
+		delete type;
+	trainUnitTypes.clear();
+}
+
+shared_ptr<const Location> Location::GetShared(const string &path, bool byType) {
+	auto key = make_tuple(fs::weakly_canonical(fs::path(path)).string(), hash<string>{}(ReadLocationFile(path, locationFileString)), byType);
+	lock_guard<mutex> lock(sharedLocationsMutex);
+	for(auto it = sharedLocations.begin(); it != sharedLocations.end();) {
+		if(it->second.expired()) it = sharedLocations.erase(it);
+		else it++;
+	}
+	auto it = sharedLocations.find(key);
+	if(it != sharedLocations.end()) {
+		auto location = it->second.lock();
+		if(location) return location;
+	}
+	auto location = make_shared<const Location>(path, byType);
+	sharedLocations[key] = location;
+	return location;
+}
+
+map<string, TrainUnitType*> Location::AddTrainUnitTypes(const PBList<PBTrainUnitType>& pb_types) const {
+	lock_guard<mutex> lock(typeMutex);
+	for (auto& pb_train_type: pb_types) {
+		if (trainUnitTypes.find(pb_train_type.displayname()) == trainUnitTypes.end()) {
+			TrainUnitType* tt = new TrainUnitType(pb_train_type);
+			trainUnitTypes[tt->displayName] = tt;
+		}
+	}
+	return trainUnitTypes;
+}
+
+map<string, TrainUnitType*> Location::GetTrainUnitTypes() const {
+	lock_guard<mutex> lock(typeMutex);
+	return trainUnitTypes;
+}
+
+size_t Location::GetMemoryUsage() const {
+	lock_guard<recursive_mutex> lock(pathMutex);
+	auto pathSize = [](const Path& path) { return sizeof(Path) + path.route.size() * 3 * sizeof(void*); };
+	size_t usage = sizeof(Location) + tracks.size() * sizeof(Track) + facilities.size() * sizeof(Facility)
+		+ distanceMatrix.size() * (sizeof(Position) + sizeof(double));
+	for(auto& [setbackTime, paths]: shortestPath)
+		for(auto& [fromTo, path]: paths) usage += sizeof(fromTo) + pathSize(path);
+	for(auto& [from, paths]: neighborPaths)
+		for(auto& [to, path]: paths) usage += sizeof(to) + pathSize(path);
+	for(auto& [fromTo, paths]: possiblePaths) {
+		usage += sizeof(fromTo);
+		for(auto& path: paths) usage += pathSize(path);
+	}
+	for(auto& [from, paths]: possibleMovements)
+		for(auto& path: paths) usage += sizeof(from) + pathSize(path);
+	return usage;
+}
+
+Track* Location::GetTrackByID(const string& id) const {
+	size_t end = 0;
+	UInt numericID;
+	try {
+		numericID = stoull(id, &end);
+	} catch (exception& e) {
+		end = 0;
+	}
+	if(end == 0 || end != id.size() || trackIndex.find(numericID) == trackIndex.end())
+		throw out_of_range("Track with id " + id + " does not exist");
+	return trackIndex.at(numericID);
 }
 
 const Facility* Location::GetFacilityByID(int id) const {
@@ -49,6 +127,17 @@ const Facility* Location::GetFacilityByID(int id) const {
 }
 
 
+int Location::GetEdgeDuration(const Track* from, const Track* to) const {
+	if(byType) return GetDurationByType(to);
+	auto it = distanceMatrix.find({from, to});
+	return it == distanceMatrix.end() ? 0 : it->second;
+}
+
+const LocationGraph& Location::GetGraph() const {
+	call_once(graphOnce, [this]() { graph = make_unique<const LocationGraph>(*this); });
+	return *graph;
+}
+
 int Location::GetDistance(const list<const Track*>& tracks) const {
 	return GetDistance(vector<const Track*>(tracks.begin(), tracks.end()));
 }
@@ -75,7 +164,8 @@ list<Position> GetAllPositions(const vector<Track*>& tracks) {
 	return positions;
 }
 
-void Location::CalcNeighboringPaths() {
+void Location::CalcNeighboringPaths() const {
+	lock_guard<recursive_mutex> lock(pathMutex);
 	if(neighborPaths.size() > 0) return;
 	auto positions = GetAllPositions(tracks);
 	for(auto& pos: positions) {
@@ -110,10 +200,12 @@ void Location::CalcNeighboringPaths() {
  * Calculate the shortest paths.
  * Param type: The train type for which the shortest paths are calculated. 
  */
-void Location::CalcShortestPaths(const TrainUnitType* type) {
+void Location::CalcShortestPaths(const TrainUnitType* type) const {
+	lock_guard<recursive_mutex> lock(pathMutex);
 	auto setbackTime = type->setbackTime;
-	auto& shortestPath = this->shortestPath[setbackTime];
-	if(shortestPath.size() > 0) return;
+	if(this->shortestPath.find(setbackTime) != this->shortestPath.end()) return;
+	// The table is calculated aside and added afterwards, so that the tables of other setbackTime%s can be read meanwhile
+	unordered_map<pair<Position, Position>, Path> shortestPath;
 	#if DEBUG
 	auto begin = chrono::steady_clock::now();
 	#endif
@@ -166,6 +258,13 @@ void Location::CalcShortestPaths(const TrainUnitType* type) {
 		<< chrono::duration_cast<chrono::milliseconds>(end - begin).count() << "ms" << " // "
 		<< chrono::duration_cast<chrono::seconds>(end - begin).count() << "s");
 	#endif
+	unique_lock<shared_mutex> write(shortestPathMutex);
+	this->shortestPath.emplace(setbackTime, move(shortestPath));
+}
+
+Path Location::GetShortestPath(const TrainUnitType* type, const Position& from, const Position& to) const {
+	shared_lock<shared_mutex> read(shortestPathMutex);
+	return shortestPath.at(type->setbackTime).at({from, to});
 }
 
 void CalcPossiblePaths(const Location& location, unordered_map<pair<Position,Position>, vector<Path>>& possiblePaths,
@@ -205,7 +304,8 @@ void CalcPossiblePaths(const Location& location, unordered_map<pair<Position,Pos
 	visited[from] = false;
 }
 
-void Location::CalcAllPossiblePaths() {
+void Location::CalcAllPossiblePaths() const {
+	lock_guard<recursive_mutex> lock(pathMutex);
 	if(possiblePaths.size() > 0) return;
 	#if DEBUG
 	auto begin = chrono::steady_clock::now();
@@ -255,8 +355,9 @@ void Location::ImportTracks(const PBLocation& pb_location) {
 		Track* t = new Track(track);
 		aSides[t] = vector<UInt>(track.aside().begin(), track.aside().end());
 		bSides[t] = vector<UInt>(track.bside().begin(), track.bside().end());
+		t->index = tracks.size();
 		tracks.push_back(t);
-		trackIndex[t->id] = t;
+		trackIndex[track.id()] = t;
 		debug_out("Imported track " << t->toString());
 	}
 	for (Track* t : tracks) {
@@ -265,9 +366,9 @@ void Location::ImportTracks(const PBLocation& pb_location) {
 		auto aside = vector<const Track*>(saside.size());
 		auto bside = vector<const Track*>(sbside.size());
 		for (int j = 0; j != saside.size(); j++)
-			aside[j] = trackIndex[to_string(saside[j])];
+			aside[j] = trackIndex[saside[j]];
 		for (int j = 0; j != sbside.size(); j++)
-			bside[j] = trackIndex[to_string(sbside[j])];
+			bside[j] = trackIndex[sbside[j]];
 		t->AssignNeighbors(aside, bside);
 	}
 	debug_out("finished loading tracks from JSON");
@@ -276,14 +377,14 @@ void Location::ImportTracks(const PBLocation& pb_location) {
 void Location::ImportFacilities(const PBLocation& pb_location) {
 	for (auto& pb_f : pb_location.facilities()) {
 		Facility* f = new Facility(pb_f);
-		auto sTracks = vector<UInt>(pb_f.relatedtrackparts().begin(), pb_f.relatedtrackparts().end());
 		vector<Track*> tracks;
-		for (auto s : sTracks) {
-			Track* t = trackIndex[to_string(s)];
+		for (auto s : pb_f.relatedtrackparts()) {
+			Track* t = trackIndex[s];
 			tracks.push_back(t);
 			t->AddFacility(f);
 		}
 		f->AssignTracks(tracks);
+		f->index = facilities.size();
 		facilities.push_back(f);
 		debug_out("Imported facility " << f->toString());
 	}
@@ -292,8 +393,8 @@ void Location::ImportFacilities(const PBLocation& pb_location) {
 
 void Location::ImportDistanceMatrix(const PBLocation& pb_location) {
 	for (auto& wde : pb_location.distanceentries()) {
-		string from = to_string(wde.fromtrackpartid());
-		string to = to_string(wde.totrackpartid());
+		UInt from = wde.fromtrackpartid();
+		UInt to = wde.totrackpartid();
 		int distance = wde.distanceinseconds();
 		pair<Track*, Track*> key(trackIndex[from], trackIndex[to]);
 		distanceMatrix[key] = distance;
@@ -0,0 +1,64 @@
+#include "LocationGraph.h"
+
+LocationGraph::LocationGraph(const Location& location) {
+	tracks.assign(location.GetTracks().begin(), location.GetTracks().end());
+	indptr.push_back(0);
+	facilityIndptr.push_back(0);
+	for(auto track: tracks) {
+		for(auto neighbor: track->GetASideTracks()) {
+			indices.push_back(neighbor->GetIndex());
+			edgeSides.push_back(0);
+			edgeDurations.push_back(location.GetEdgeDuration(track, neighbor));
+		}
+		for(auto neighbor: track->GetBSideTracks()) {
+			indices.push_back(neighbor->GetIndex());
+			edgeSides.push_back(1);
+			edgeDurations.push_back(location.GetEdgeDuration(track, neighbor));
+		}
+		indptr.push_back(indices.size());
+		types.push_back(static_cast<int32_t>(track->GetType()));
+		lengths.push_back(track->GetLength());
+		electrified.push_back(track->isElectrified);
+		parkingAllowed.push_back(track->parkingAllowed);
+		sawMovementAllowed.push_back(track->sawMovementAllowed);
+		for(auto facility: track->GetFacilities())
+			facilityIDs.push_back(facility->GetID());
+		facilityIndptr.push_back(facilityIDs.size());
+	}
+	transitionIndptr.push_back(0);
+	for(int u=0; u<tracks.size(); u++) {
+		for(int e=indptr[u]; e<indptr[u+1]; e++) {
+			auto v = indices[e];
+			if(tracks[v]->IsNeighbor(tracks[u])) {
+				for(auto w: tracks[v]->GetNextTrackParts(tracks[u])) {
+					auto edge = FindEdge(v, w->GetIndex());
+					if(edge >= 0) transitionIndices.push_back(edge);
+				}
+			}
+			transitionIndptr.push_back(transitionIndices.size());
+		}
+	}
+}
+
+int LocationGraph::FindEdge(int from, int to) const {
+	for(int e=indptr[from]; e<indptr[from+1]; e++)
+		if(indices[e] == to) return e;
+	return -1;
+}
+
+void LocationGraph::FeaturizeNodes(const State* state, float* out) const {
+	fill(out, out + tracks.size() * numberOfNodeFeatures, 0.0f);
+	for(auto track: tracks) {
+		double length = 0;
+		for(auto su: state->GetOccupations(track)) {
+			out[0]++;
+			length += su->GetLength();
+			if(state->IsMoving(su)) out[3]++;
+			for(auto& train: su->GetTrains())
+				out[4] += state->GetTasksForTrain(&train).size();
+		}
+		out[1] = track->GetLength() > 0 ? static_cast<float>(length / track->GetLength()) : 0;
+		out[2] = state->IsReserved(track) ? 1 : 0;
+		out += numberOfNodeFeatures;
+	}
+}
@@ -3,13 +3,13 @@
 Track::Track(const string& id, TrackPartType type, double length, const string& name,
 	bool sawMovementAllowed, bool parkingAllowed, bool isElectrified) :
 	id(id), type(type), length(length),	name(name), sawMovementAllowed(sawMovementAllowed),
-	parkingAllowed(parkingAllowed), isElectrified(isElectrified) { }
+	parkingAllowed(parkingAllowed), isElectrified(isElectrified), index(-1) { }
 
 Track::Track(const Track& track) :
 	id(track.id), type(track.type), length(track.length),
 	name(track.name), sawMovementAllowed(track.sawMovementAllowed),
 	parkingAllowed(track.parkingAllowed), isElectrified(track.isElectrified),
-	aSides(track.aSides), bSides(track.bSides), next(track.next) { }
+	aSides(track.aSides), bSides(track.bSides), neighbors(track.neighbors), next(track.next), index(track.index) { }
 
 void Track::AssignNeighbors(vector<const Track*> aside, vector<const Track*> bside)
 {
@@ -20,6 +20,8 @@ void Track::AssignNeighbors(vector<const Track*> aside, vector<const Track*> bsi
 	//write error functions for Switch, EnglishSwitch, HalfEnglishSwitch, InterSection, Building
 	aSides = aside;
 	bSides = bside;
+	neighbors = aside;
+	neighbors.insert(neighbors.end(), bside.begin(), bside.end());
 	if (type == TrackPartType::HalfEnglishSwitch) {
 		next[aside[0]] = bside;
 		next[aside[1]] = vector<const Track*> { bside[1] };
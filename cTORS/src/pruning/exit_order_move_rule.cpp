@@ -0,0 +1,45 @@
+#include "PruningRules.h"
+
+inline bool IsDeadEnd(const Track* track, const Track* previous) {
+	auto& otherSide = track->IsASide(previous) ? track->GetBSideTracks() : track->GetASideTracks();
+	return all_of(otherSide.begin(), otherSide.end(), [](const Track* t) { return t->GetType() == TrackPartType::Bumper; });
+}
+
+inline int GetDepartureTime(const State* state, const ShuntingUnit* su) {
+	int departure = numeric_limits<int>::max();
+	auto& trains = su->GetTrains();
+	for(auto out: state->GetOutgoingTrains()) {
+		if(out->GetTime() >= departure) continue;
+		auto& outTrains = out->GetShuntingUnit()->GetTrains();
+		bool matches = any_of(outTrains.begin(), outTrains.end(), [&trains](const Train& outTrain) {
+			return any_of(trains.begin(), trains.end(), [&outTrain](const Train& train) {
+				return outTrain.GetID() == -1 ? *outTrain.GetType() == *train.GetType() : outTrain.GetID() == train.GetID();
+			});
+		});
+		if(matches) departure = out->GetTime();
+	}
+	return departure;
+}
+
+/**
+ * Prunes the valid Action%s for the given state.
+ * A MoveAction is removed if
+ * 1. Its destination Track can only be left via the side the ShuntingUnit enters, and
+ * 2. A ShuntingUnit on the destination Track must leave before the moving ShuntingUnit.
+ */
+void exit_order_move_rule::Prune(const State* state, list<const Action*>& actions) const {
+	actions.remove_if([state](const Action* action) {
+		if(action->GetKind() != ActionKind::MoveAction) return false;
+		auto move = static_cast<const MoveAction*>(action);
+		auto destination = move->GetDestinationTrack();
+		auto& occupations = state->GetOccupations(destination);
+		if(occupations.empty() || !IsDeadEnd(destination, move->GetPreviousTrack())) return false;
+		auto su = move->GetShuntingUnit();
+		int departure = GetDepartureTime(state, su);
+		bool blocks = any_of(occupations.begin(), occupations.end(), [state, su, departure](const ShuntingUnit* other) {
+			return !(*other == *su) && GetDepartureTime(state, other) < departure;
+		});
+		if(blocks) delete action;
+		return blocks;
+	});
+}
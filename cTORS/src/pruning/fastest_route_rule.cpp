@@ -0,0 +1,26 @@
+#include "PruningRules.h"
+
+/**
+ * Prunes the valid Action%s for the given state.
+ * A MoveAction is removed if
+ * 1. Another MoveAction of the same ShuntingUnit to the same destination Track arrives from the same previous Track, and
+ * 2. That MoveAction is faster, or equally fast and generated earlier.
+ */
+void fastest_route_rule::Prune(const State* state, list<const Action*>& actions) const {
+	map<tuple<int, int, int>, const Action*> fastest;
+	auto getKey = [](const MoveAction* move) {
+		return make_tuple(move->GetShuntingUnit()->GetID(), move->GetDestinationTrack()->GetIndex(), move->GetPreviousTrack()->GetIndex());
+	};
+	for(auto action: actions) {
+		if(action->GetKind() != ActionKind::MoveAction) continue;
+		auto [it, inserted] = fastest.emplace(getKey(static_cast<const MoveAction*>(action)), action);
+		if(!inserted && action->GetDuration() < it->second->GetDuration())
+			it->second = action;
+	}
+	actions.remove_if([&fastest, &getKey](const Action* action) {
+		if(action->GetKind() != ActionKind::MoveAction) return false;
+		if(fastest.at(getKey(static_cast<const MoveAction*>(action))) == action) return false;
+		delete action;
+		return true;
+	});
+}
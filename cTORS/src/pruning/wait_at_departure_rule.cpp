@@ -0,0 +1,20 @@
+#include "PruningRules.h"
+
+/**
+ * Prunes the valid Action%s for the given state.
+ * All WaitAction%s are removed if
+ * 1. One of the valid Action%s is an ExitAction for an Outgoing train with a departure time that is not later than
+ *    the current time.
+ */
+void wait_at_departure_rule::Prune(const State* state, list<const Action*>& actions) const {
+	bool exitDue = any_of(actions.begin(), actions.end(), [state](const Action* action) {
+		return action->GetKind() == ActionKind::ExitAction &&
+			static_cast<const ExitAction*>(action)->GetOutgoing()->GetTime() <= state->GetTime();
+	});
+	if(!exitDue) return;
+	actions.remove_if([](const Action* action) {
+		if(action->GetKind() != ActionKind::WaitAction) return false;
+		delete action;
+		return true;
+	});
+}
@@ -4,7 +4,7 @@ Scenario::Scenario() : startTime(0), endTime(0) {}
 
 Scenario::Scenario(string scenarioFileString, const Location& location) {
 	PBScenario pb_scenario;
-	parse_json_to_pb(fs::path(scenarioFileString), &pb_scenario);
+	parse_file_to_pb(fs::path(scenarioFileString), &pb_scenario);
 	Init(pb_scenario, location);
 }
 
@@ -26,27 +26,110 @@ void Scenario::Init(const PBScenario& pb_scenario, const Location& location) {
 }
 
 Scenario::Scenario(const Scenario& scenario) : 
-	startTime(scenario.startTime), endTime(scenario.endTime)
+	startTime(scenario.startTime), endTime(scenario.endTime), employees(scenario.employees), 
+	incomingTrains(scenario.incomingTrains), outgoingTrains(scenario.outgoingTrains), owned(scenario.owned)
 {
 	disturbances = scenario.disturbances;
-	for (auto inc : scenario.incomingTrains)
-		incomingTrains.push_back(new Incoming(*inc));
-	for (auto out : scenario.outgoingTrains)
-		outgoingTrains.push_back(new Outgoing(*out));
-	for (auto e : scenario.employees)
-		employees.push_back(new Employee(*e));
+	Adopt(incomingTrains);
+	Adopt(outgoingTrains);
+	Adopt(employees);
 	//TODO disturbances
 	//TODO tasks
 }
 
+Scenario& Scenario::operator=(const Scenario& scenario) {
+	if(this == &scenario) return *this;
+	startTime = scenario.startTime;
+	endTime = scenario.endTime;
+	disturbances = scenario.disturbances;
+	employees = scenario.employees;
+	incomingTrains = scenario.incomingTrains;
+	outgoingTrains = scenario.outgoingTrains;
+	owned = scenario.owned;
+	Adopt(incomingTrains);
+	Adopt(outgoingTrains);
+	Adopt(employees);
+	return *this;
+}
 
-Scenario::~Scenario()
-{
-	DELETE_VECTOR(incomingTrains)
-	DELETE_VECTOR(outgoingTrains)
-	DELETE_VECTOR(employees)
-	//TODO  disturbances
-	//TODO tasks
+void Scenario::Unshare() {
+	if(!owned)
+		owned = make_shared<unordered_map<const void*, shared_ptr<const void>>>();
+	else if(owned.use_count() > 1)
+		owned = make_shared<unordered_map<const void*, shared_ptr<const void>>>(*owned);
+}
+
+template<class T>
+const T* Scenario::Own(const T* object) {
+	Unshare();
+	if(owned->find(object) == owned->end())
+		owned->emplace(object, shared_ptr<const T>(object));
+	return object;
+}
+
+template<class T>
+void Scenario::Adopt(vector<const T*>& objects) {
+	for(auto& object: objects)
+		if(!owned || owned->find(object) == owned->end())
+			object = Own(new T(*object));
+}
+
+template<class T>
+void Scenario::Detach(vector<const T*>& objects) {
+	for(auto& object: objects) {
+		if(!owned) return;
+		auto it = owned->find(object);
+		if(it == owned->end() || (owned.use_count() == 1 && it->second.use_count() == 1)) continue;
+		Unshare();
+		owned->erase(object);
+		object = Own(new T(*object));
+	}
+}
+
+template<class T>
+void Scenario::Replace(vector<const T*>& objects, const vector<const T*>& replacement) {
+	for(auto object: replacement)
+		Own(object);
+	objects = replacement;
+}
+
+void Scenario::SetOutgoingTrains(const vector<const Outgoing*>& outgoingTrains) {
+	Replace(this->outgoingTrains, outgoingTrains);
+}
+
+void Scenario::SetIncomingTrains(const vector<const Incoming*>& incomingTrains) {
+	Replace(this->incomingTrains, incomingTrains);
+}
+
+void Scenario::SetEmployees(const vector<const Employee*>& employees) {
+	Replace(this->employees, employees);
+}
+
+void Scenario::AddOutgoingTrain(const Outgoing* outgoingTrain) {
+	outgoingTrains.push_back(Own(outgoingTrain));
+}
+
+void Scenario::AddIncomingTrain(const Incoming* incomingTrain) {
+	incomingTrains.push_back(Own(incomingTrain));
+}
+
+void Scenario::AddEmployee(const Employee* employee) {
+	employees.push_back(Own(employee));
+}
+
+const vector<const Outgoing*>& Scenario::DetachOutgoingTrains() {
+	Detach(outgoingTrains);
+	return outgoingTrains;
+}
+
+const vector<const Incoming*>& Scenario::DetachIncomingTrains() {
+	Detach(incomingTrains);
+	return incomingTrains;
+}
+
+const vector<const Employee*>& Scenario::DetachEmployees() {
+	Detach(employees);
+	return employees;
 }
 
 const size_t Scenario::GetNumberOfTrains() const {
@@ -99,15 +182,15 @@ void Scenario::ImportEmployees(const PBScenario& pb_scenario, const Location& lo
 		string start = to_string(pb_e.startlocationid());
 		string end = to_string(pb_e.endlocationid());
 		e->AssignTracks(location.GetTrackByID(start), location.GetTrackByID(end));
-		employees.push_back(e);
+		employees.push_back(Own(e));
 		debug_out("Imported Employee " << e->toString());
 	}
 	debug_out("finished loading employees from JSON");
 }
 
 template<class PBTrainGoal>
-TrainGoal* ImportTrainGoal(const Location& location, const PBTrainGoal& m, bool in, bool standing) {
-	TrainGoal* g = in ? static_cast<TrainGoal*>(new Incoming(m, standing)) : new Outgoing(m, standing);
+TrainGoal* ImportTrainGoal(const Location& location, const map<string, TrainUnitType*>& types, const PBTrainGoal& m, bool in, bool standing) {
+	TrainGoal* g = in ? static_cast<TrainGoal*>(new Incoming(m, standing, types)) : new Outgoing(m, standing, types);
 	string park = to_string(m.parkingtrackpart());
 	string side = to_string(m.sidetrackpart());
 	g->assignTracks(location.GetTrackByID(park), location.GetTrackByID(side));
@@ -115,20 +198,15 @@ TrainGoal* ImportTrainGoal(const Location& location, const PBTrainGoal& m, bool
 }
 
 void Scenario::ImportShuntingUnits(const PBScenario& pb_scenario, const Location& location) {
-	for (auto& pb_train_type: pb_scenario.trainunittypes()) {
-		if (TrainUnitType::types.find(pb_train_type.displayname()) == TrainUnitType::types.end()) {
-			TrainUnitType* tt = new TrainUnitType(pb_train_type);
-			TrainUnitType::types[tt->displayName] = tt;
-		}
-	}
+	auto types = location.AddTrainUnitTypes(pb_scenario.trainunittypes());
 	for(auto& pb_in : pb_scenario.in())
-		incomingTrains.push_back(dynamic_cast<Incoming*>(ImportTrainGoal(location, pb_in, true, false)));
+		incomingTrains.push_back(Own(dynamic_cast<Incoming*>(ImportTrainGoal(location, types, pb_in, true, false))));
 	for(auto& pb_in : pb_scenario.instanding())
-		incomingTrains.push_back(dynamic_cast<Incoming*>(ImportTrainGoal(location, pb_in, true, true)));
+		incomingTrains.push_back(Own(dynamic_cast<Incoming*>(ImportTrainGoal(location, types, pb_in, true, true))));
 	for(auto& pb_out : pb_scenario.out())
-		outgoingTrains.push_back(dynamic_cast<Outgoing*>(ImportTrainGoal(location, pb_out, false, false)));
+		outgoingTrains.push_back(Own(dynamic_cast<Outgoing*>(ImportTrainGoal(location, types, pb_out, false, false))));
 	for(auto& pb_out : pb_scenario.outstanding())
-		outgoingTrains.push_back(dynamic_cast<Outgoing*>(ImportTrainGoal(location, pb_out, false, true)));
+		outgoingTrains.push_back(Own(dynamic_cast<Outgoing*>(ImportTrainGoal(location, types, pb_out, false, true))));
 }
 
 void Scenario::Serialize(PBScenario* pb_scenario) const {
@@ -148,7 +226,15 @@ void Scenario::Serialize(PBScenario* pb_scenario) const {
 	}
 	pb_scenario->set_starttime(GetStartTime());
 	pb_scenario->set_endtime(GetEndTime());
-	for(auto& [name, type]: TrainUnitType::types) {
+	map<string, const TrainUnitType*> types;
+	for(auto goals : {
+			vector<const TrainGoal*>(incomingTrains.begin(), incomingTrains.end()), 
+			vector<const TrainGoal*>(outgoingTrains.begin(), outgoingTrains.end())}) {
+		for(auto goal: goals)
+			for(auto& train: goal->GetShuntingUnit()->GetTrains())
+				if(train.GetType() != nullptr) types[train.GetType()->displayName] = train.GetType();
+	}
+	for(auto& [name, type]: types) {
 		type->Serialize(pb_scenario->add_trainunittypes());
 	}
 }
@@ -185,4 +271,27 @@ void Scenario::PrintScenarioInfo() const {
 		}
 		cout << endl;
 	}
-}
\ No newline at end of file
+}
+
+ScenarioInfo Scenario::ReadInfo(const string& path) {
+	PBScenario pb_scenario;
+	if (!parse_file_to_pb(fs::path(path), &pb_scenario))
+		throw runtime_error("The file " + path + " is not a valid Scenario file.");
+	ScenarioInfo info;
+	info.numberOfTrains = 0;
+	info.numberOfIncoming = pb_scenario.in_size() + pb_scenario.instanding_size();
+	info.numberOfOutgoing = pb_scenario.out_size() + pb_scenario.outstanding_size();
+	info.startTime = pb_scenario.starttime();
+	info.endTime = pb_scenario.endtime();
+	for (auto pb_incoming : {&pb_scenario.in(), &pb_scenario.instanding()}) {
+		for (auto& pb_in : *pb_incoming) {
+			info.numberOfTrains += pb_in.members_size();
+			for (auto& pb_unit : pb_in.members()) {
+				auto& type = pb_unit.typedisplayname();
+				if (find(info.trainTypes.begin(), info.trainTypes.end(), type) == info.trainTypes.end())
+					info.trainTypes.push_back(type);
+			}
+		}
+	}
+	return info;
+}
@@ -1,15 +1,11 @@
 #include "State.h"
 
-State::State(const Scenario& scenario, const vector<Track*>& tracks) {
+State::State(const Scenario& scenario, const vector<Track*>& tracks) : scenario(scenario), 
+		incomingTrains(this->scenario.GetIncomingTrains()), outgoingTrains(this->scenario.GetOutgoingTrains()),
+		employees(this->scenario.GetEmployees()) {
 	time = scenario.GetStartTime();
 	startTime = scenario.GetStartTime();
 	endTime = scenario.GetEndTime();
-	for(auto inc: scenario.GetIncomingTrains())
-		incomingTrains.push_back(new Incoming(*inc));
-	for(auto out: scenario.GetOutgoingTrains())
-		outgoingTrains.push_back(new Outgoing(*out));
-	for(auto e: scenario.GetEmployees())
-		employees.push_back(new Employee(*e));
 	for (auto in : incomingTrains)
 		AddEvent(in);
 	for (auto out : outgoingTrains)
@@ -21,9 +17,27 @@ State::State(const Scenario& scenario, const vector<Track*>& tracks) {
 State::~State() {
 	debug_out("Deleting state");
 	DELETE_VECTOR(shuntingUnits);
-	DELETE_VECTOR(incomingTrains);
-	DELETE_VECTOR(outgoingTrains);
-	DELETE_VECTOR(employees);
+}
+
+void State::Reset(const Scenario& scenario, int time, const EventQueue& events) {
+	DELETE_VECTOR(shuntingUnits);
+	shuntingUnitStates.clear();
+	trainStates.clear();
+	trainIDToShuntingUnit.clear();
+	trainIDToTrain.clear();
+	for(auto& [track, trackState]: trackStates) {
+		trackState.occupations.clear();
+		trackState.reserved = false;
+	}
+	this->scenario = scenario;
+	incomingTrains = this->scenario.GetIncomingTrains();
+	outgoingTrains = this->scenario.GetOutgoingTrains();
+	employees = this->scenario.GetEmployees();
+	this->events = events;
+	this->time = time;
+	startTime = scenario.GetStartTime();
+	endTime = scenario.GetEndTime();
+	changed = true;
 }
 
 void State::SetTime(int time) {
@@ -65,6 +79,10 @@ void State::AddEvent(const Action* action) {
 	debug_out("Push event " << event->toString() << " at T=" << to_string(event->GetTime()));
 }
 
+void State::AddEvent(const Event& event) {
+	events.push(new Event(event));
+}
+
 void State::StartAction(const Action* action) {
 	if (action == nullptr) return;
 	changed = true;
@@ -99,6 +117,16 @@ const ShuntingUnit* State::AddShuntingUnitToState(const ShuntingUnit* su, const
 	return shuntingUnit;
 }
 
+void State::SetShuntingUnitOrder(const vector<const ShuntingUnit*>& order, size_t bucketCount) {
+	// A new element is placed in front of the elements in its bucket, or in front of all elements if its bucket is empty.
+	// An empty map has a single bucket, which a bucket count hint would round up.
+	decltype(shuntingUnitStates) reordered;
+	if(bucketCount > 1) reordered.rehash(bucketCount);
+	for(auto it = order.rbegin(); it != order.rend(); it++)
+		reordered.emplace(*it, shuntingUnitStates.at(*it));
+	shuntingUnitStates.swap(reordered);
+}
+
 void State::AddShuntingUnit(const ShuntingUnit* su, const Track* track, const Track* previous, const Train* frontTrain) {
 	su = AddShuntingUnitToState(su, track, previous, frontTrain);
 	OccupyTrack(su, track, previous);
@@ -279,6 +307,48 @@ const vector<const Track*> State::GetReservedTracks() const {
 	return reserved;
 }
 
+size_t State::GetFingerprint() const {
+	size_t seed = 0;
+	hash_combine(seed, time);
+	for(auto in: incomingTrains) hash_combine(seed, in->GetID());
+	hash_combine(seed, -1);
+	for(auto out: outgoingTrains) hash_combine(seed, out->GetID());
+	vector<size_t> hashes;
+	for(auto& [su, suState]: shuntingUnitStates) {
+		size_t h = 0;
+		for(auto& train: su->GetTrains()) {
+			hash_combine(h, train.GetID());
+			auto& trainState = trainStates.at(&train);
+			for(auto& task: trainState.tasks) hash_combine(h, task.taskType);
+			hash_combine(h, trainState.activeTasks.size());
+		}
+		hash_combine(h, suState.position == nullptr ? -1 : suState.position->GetIndex());
+		hash_combine(h, suState.previous == nullptr ? -1 : suState.previous->GetIndex());
+		hash_combine(h, suState.position == nullptr ? -1 : GetPositionOnTrack(su));
+		hash_combine(h, suState.frontTrain == nullptr ? -1 : suState.frontTrain->GetID());
+		hash_combine(h, suState.moving | suState.waiting << 1 | suState.inNeutral << 2 | suState.beginMoving << 3);
+		for(auto action: suState.activeActions) hash_combine(h, static_cast<int>(action->GetKind()));
+		hashes.push_back(h);
+	}
+	sort(hashes.begin(), hashes.end());
+	for(auto h: hashes) hash_combine(seed, h);
+	hashes.clear();
+	for(auto e: events.GetEvents()) {
+		size_t h = 0;
+		hash_combine(h, e->GetTime());
+		hash_combine(h, static_cast<int>(e->GetType()));
+		hashes.push_back(h);
+	}
+	sort(hashes.begin(), hashes.end());
+	for(auto h: hashes) hash_combine(seed, h);
+	hashes.clear();
+	for(auto& [track, trackState]: trackStates)
+		if(trackState.reserved) hashes.push_back(static_cast<size_t>(track->GetIndex()));
+	sort(hashes.begin(), hashes.end());
+	for(auto h: hashes) hash_combine(seed, h);
+	return seed;
+}
+
 int State::GetPositionOnTrack(const ShuntingUnit* su) const {
 	auto& sus = GetOccupations(GetPosition(su));
 	auto it = find_if(sus.begin(), sus.end(), [su](const ShuntingUnit* s) -> bool { return *su == *s; });
@@ -311,6 +381,13 @@ void State::SwitchFrontTrain(const ShuntingUnit* su) {
 	SetFrontTrain(su, GetFrontTrain(su) == front ? back : front);
 }
 
+const ShuntingUnit* State::ResolveShuntingUnit(const ShuntingUnit* su, const vector<int>& ids) const {
+	if(su != nullptr && find(shuntingUnits.begin(), shuntingUnits.end(), su) != shuntingUnits.end()
+		&& su->GetTrainIDs() == ids)
+		return su;
+	return GetShuntingUnitByTrainIDs(ids);
+}
+
 const ShuntingUnit* State::GetShuntingUnitByTrainIDs(const vector<int>& ids) const {
 	#if(DEBUG)
 	//Check that all train ids refer to the same shunting unit
@@ -1,15 +1,15 @@
 #include "ShuntingUnit.h"
 
-const vector<Train> ConvertPBTrains(const PBList<PBTrainUnit>& trains) {
+const vector<Train> ConvertPBTrains(const PBList<PBTrainUnit>& trains, const map<string, TrainUnitType*>& types) {
 	vector<Train> out;
 	for(auto& train: trains) {
-		out.push_back(Train(train));
+		out.push_back(Train(train, types));
 	}
 	return out;
 }
 
-ShuntingUnit::ShuntingUnit(const PBTrainGoal& pb_tg) 
-	: ShuntingUnit(stoi(pb_tg.id()), ConvertPBTrains(pb_tg.members())) {}
+ShuntingUnit::ShuntingUnit(const PBTrainGoal& pb_tg, const map<string, TrainUnitType*>& types) 
+	: ShuntingUnit(stoi(pb_tg.id()), ConvertPBTrains(pb_tg.members(), types)) {}
 
 void ShuntingUnit::UpdateValues() {
 	length = 0;
@@ -1,6 +1,5 @@
 #include "Train.h"
 
-map<string, TrainUnitType *> TrainUnitType::types;
 
 void TrainUnitType::Serialize(PBTrainUnitType* pb_tt) const {
 	pb_tt->set_displayname(displayName);
@@ -28,8 +27,8 @@ void Task::Serialize(PBTask* pb_task) const {
 	}
 }
 
-Train::Train(const PBTrainUnit& pb_train) 
-	: Train(pb_train.id()=="****" ? -1 : stoi(pb_train.id()), TrainUnitType::types.at(pb_train.typedisplayname())) {}
+Train::Train(const PBTrainUnit& pb_train, const map<string, TrainUnitType*>& types) 
+	: Train(pb_train.id()=="****" ? -1 : stoi(pb_train.id()), types.at(pb_train.typedisplayname())) {}
 
 bool Train::operator==(const Train& train) const {
 	return (id != -1 && id == train.id) || this == &train;
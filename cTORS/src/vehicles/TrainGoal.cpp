@@ -19,12 +19,12 @@ unordered_map<const Train*, vector<Task>, TrainHash, TrainEquals> ConvertPBTrain
 	return map;
 }
 
-Incoming::Incoming(const PBTrainGoal& pb_inc, bool isInstanding) : Incoming(stoi(pb_inc.id()), new ShuntingUnit(pb_inc),
+Incoming::Incoming(const PBTrainGoal& pb_inc, bool isInstanding, const map<string, TrainUnitType*>& types) : Incoming(stoi(pb_inc.id()), new ShuntingUnit(pb_inc, types),
  	pb_inc.time(), isInstanding, pb_inc.standingindex()) {
 		 tasks = ConvertPBTrainTasks(shuntingUnit, pb_inc);
 	 }
 
-Outgoing::Outgoing(const PBTrainGoal& pb_out, bool isInstanding) : Outgoing(stoi(pb_out.id()), new ShuntingUnit(pb_out),
+Outgoing::Outgoing(const PBTrainGoal& pb_out, bool isInstanding, const map<string, TrainUnitType*>& types) : Outgoing(stoi(pb_out.id()), new ShuntingUnit(pb_out, types),
  	pb_out.time(), isInstanding, pb_out.standingindex()) {}
 
 TrainGoal::TrainGoal(const TrainGoal& traingoal) :
@@ -1,5 +1,9 @@
 #include "doctest/doctest.h"
 #include "Engine.h"
+#include "SessionBatch.h"
+#include "LocationGraph.h"
+#include "Rollout.h"
+#include "Search.h"
 
 namespace cTORSTest
 {
@@ -18,7 +22,7 @@ namespace cTORSTest
 		SUBCASE("Test create state") {
 			auto state = engine.StartSession(scenario);
 			SUBCASE("Test active actions") {
-				ShuntingUnit* su = new ShuntingUnit(0, {Train(0, TrainUnitType::types.begin()->second)});
+				ShuntingUnit* su = new ShuntingUnit(0, {Train(0, engine.GetLocation().GetTrainUnitTypes().begin()->second)});
 				state->AddShuntingUnit(su, railTrack, previous);
 				BeginMoveAction* beginMoveAction = new BeginMoveAction(su, 25);
 				state->AddActiveAction(su, beginMoveAction);
@@ -251,4 +255,592 @@ namespace cTORSTest
 		CHECK(engine.EvaluatePlan(runResult->GetScenario(), runResult->GetPlan()));
 		delete runResult;
 	}
+
+	TEST_CASE("Track index test") {
+		LocationEngine engine("data/Demo");
+		auto& location = engine.GetLocation();
+		auto& tracks = location.GetTracks();
+		for(int i=0; i<tracks.size(); i++) {
+			auto track = tracks.at(i);
+			CHECK(track->GetIndex() == i);
+			CHECK(location.GetTrackByIndex(i) == track);
+			CHECK(location.GetTrackByID(track->GetID()) == track);
+			CHECK(location.ResolveTrack(i, track->GetID()) == track);
+			CHECK(location.ResolveTrack(-1, track->GetID()) == track);
+		}
+		auto last = tracks.back();
+		CHECK(location.ResolveTrack(0, last->GetID()) == last);
+	}
+
+	TEST_CASE("Binary protobuf test") {
+		auto folder = fs::temp_directory_path() / "cTORSBinaryTest";
+		fs::remove_all(folder);
+		fs::create_directories(folder);
+		fs::copy_file("data/Demo/config.json", folder / "config.json");
+		PBLocation pb_location;
+		parse_json_to_pb(fs::path("data/Demo/location.json"), &pb_location);
+		parse_pb_to_binary(folder / "location.pb.gz", pb_location, true);
+		PBScenario pb_scenario;
+		parse_json_to_pb(fs::path("data/Demo/scenario.json"), &pb_scenario);
+		parse_pb_to_binary(folder / "scenario.pb", pb_scenario, false);
+		CHECK(resolve_pb_file(folder / "location.json") == folder / "location.pb.gz");
+		CHECK(resolve_pb_file(folder / "scenario.json") == folder / "scenario.pb");
+		{
+			LocationEngine jsonEngine("data/Demo");
+			LocationEngine binaryEngine(folder.string());
+			CHECK(binaryEngine.GetLocation().GetTracks().size() == jsonEngine.GetLocation().GetTracks().size());
+			auto& sc1 = jsonEngine.GetScenario("data/Demo/scenario.json");
+			auto& sc2 = binaryEngine.GetScenario((folder / "scenario.pb").string());
+			CHECK(sc2.GetIncomingTrains().size() == sc1.GetIncomingTrains().size());
+			CHECK(sc2.GetOutgoingTrains().size() == sc1.GetOutgoingTrains().size());
+			CHECK(sc2.GetEndTime() == sc1.GetEndTime());
+		}
+		fs::remove_all(folder);
+	}
+
+	TEST_CASE("Shared location test") {
+		LocationEngine engine("data/Demo");
+		auto& scenario = engine.GetScenario("data/Demo/scenario.json");
+		{
+			LocationEngine other("data/Demo", "data/TwoTrack");
+			CHECK(&other.GetLocation() == &engine.GetLocation());
+			auto& sc = other.GetScenario("data/Demo/scenario.json");
+			CHECK(sc.GetIncomingTrains().front()->GetShuntingUnit()->GetTrains().front().GetType() 
+				== scenario.GetIncomingTrains().front()->GetShuntingUnit()->GetTrains().front().GetType());
+		}
+		CHECK(engine.GetLocation().GetTrainUnitTypes().size() > 0);
+		CHECK(scenario.GetIncomingTrains().front()->GetShuntingUnit()->GetTrains().front().GetType()->displayName.size() > 0);
+		auto state = engine.StartSession(scenario);
+		engine.Step(state);
+		CHECK(engine.GetValidActions(state).size() > 0);
+		engine.EndSession(state);
+		LocationEngine twoTrack("data/TwoTrack");
+		CHECK(&twoTrack.GetLocation() != &engine.GetLocation());
+	}
+
+	TEST_CASE("Multi location engine test") {
+		Engine engine;
+		auto& scenario = engine.GetScenario("data/Demo", "data/Demo/scenario.json");
+		auto state = engine.StartSession("data/Demo", scenario);
+		engine.Step(state);
+		CHECK(engine.IsStateActive(state));
+		auto twoTrack = engine.GetOrLoadLocationEngine("data/TwoTrack")->GetSharedLocation();
+		CHECK(engine.GetLoadedLocations().size() == 2);
+		CHECK(engine.GetMemoryUsage() > 0);
+		engine.SetMemoryBudget(1);
+		CHECK(engine.GetLoadedLocations().size() == 2);
+		twoTrack.reset();
+		engine.SetMemoryBudget(1);
+		auto loaded = engine.GetLoadedLocations();
+		CHECK(loaded.size() == 1);
+		CHECK(loaded.front() == "data/Demo");
+
+		auto file = (fs::temp_directory_path() / "cTORSMultiEngineTest.json").string();
+		engine.GetResult(state)->SerializeToFile(*engine.GetOrLoadLocationEngine("data/Demo"), file);
+		engine.EndSession(state);
+		auto result = engine.ImportResult(file);
+		CHECK(result->GetScenario().GetIncomingTrains().size() == scenario.GetIncomingTrains().size());
+		delete result;
+		fs::remove(file);
+	}
+
+	TEST_CASE("Valid action table test") {
+		LocationEngine engine("data/Demo");
+		auto& scenario = engine.GetScenario("data/Demo/scenario.json");
+		auto state = engine.StartSession(scenario);
+		vector<ActionRow> rows;
+		vector<int> trainIDs;
+		for(int i=0; i<10; i++) {
+			engine.Step(state);
+			engine.GetValidActionTable(state, rows, trainIDs);
+			auto& actions = engine.GetValidActions(state);
+			REQUIRE(rows.size() == actions.size());
+			REQUIRE(rows.size() > 0);
+			auto it = actions.begin();
+			for(auto& row: rows) {
+				auto action = *(it++);
+				CHECK(row.kind == static_cast<int32_t>(action->GetKind()));
+				CHECK(row.duration == action->GetDuration());
+				auto& trains = action->GetShuntingUnit()->GetTrains();
+				CHECK(row.trainCount == trains.size());
+				CHECK(trainIDs[row.trainOffset] == trains.front().GetID());
+				if(row.shuntingUnit >= 0)
+					CHECK(state->GetShuntingUnits()[row.shuntingUnit]->GetID() == action->GetShuntingUnit()->GetID());
+				if(auto move = dynamic_cast<const MoveAction*>(action))
+					CHECK(row.destinationTrack == move->GetDestinationTrack()->GetIndex());
+			}
+			auto index = rows.size() - 1;
+			auto action = engine.GetValidAction(state, index);
+			CHECK(action == actions.back());
+			engine.ApplyActionByIndex(state, index);
+		}
+		CHECK_THROWS_AS(engine.GetValidAction(state, 1000), out_of_range);
+		engine.EndSession(state);
+	}
+
+	TEST_CASE("Validate many test") {
+		LocationEngine engine("data/Demo");
+		auto& scenario = engine.GetScenario("data/Demo/scenario.json");
+		auto state = engine.StartSession(scenario);
+		for(int i=0; i<10; i++) {
+			engine.Step(state);
+			auto& actions = engine.GetValidActions(state);
+			vector<const SimpleAction*> simples;
+			for(auto action: actions) simples.push_back(action->CreateSimple());
+			for(auto su: state->GetShuntingUnits()) {
+				for(auto track: engine.GetLocation().GetTracks())
+					simples.push_back(new Move(su, track));
+			}
+			auto codes = engine.ValidateMany(state, simples);
+			REQUIRE(codes.size() == simples.size());
+			for(int j=0; j<simples.size(); j++) {
+				if(j < actions.size()) CHECK(codes[j] == static_cast<int>(ValidationCode::Valid));
+				CHECK((codes[j] == static_cast<int>(ValidationCode::Valid)) == engine.IsValidAction(state, *simples[j]).first);
+				CHECK(codes[j] <= static_cast<int>(engine.GetBusinessRuleNames().size()));
+			}
+			DELETE_VECTOR(simples)
+			engine.ApplyAction(state, actions.front());
+		}
+		engine.EndSession(state);
+	}
+
+	TEST_CASE("Featurizer test") {
+		LocationEngine engine("data/Demo");
+		auto& scenario = engine.GetScenario("data/Demo/scenario.json");
+		auto state = engine.StartSession(scenario);
+		Featurizer featurizer(engine.GetLocation(), 3, 3, 3, 3, {"SLT4", "SLT6", "SNG3"});
+		auto nTracks = featurizer.GetTracks().size();
+		auto goalSize = 1 + nTracks + 3 * 3;
+		auto suSize = 4 + nTracks + 1 + 3 * 3 + 1;
+		auto suOffset = 6 * goalSize + nTracks * (3 * 3 + 2);
+		CHECK(featurizer.GetObservationSize() == suOffset + 3 * suSize + 1);
+		vector<float> observation(featurizer.GetObservationSize(), -1);
+		engine.Step(state);
+		for(int i=0; i<6; i++) {
+			featurizer.Featurize(state, observation.data());
+			for(auto value: observation) CHECK(value >= 0);
+			auto time = static_cast<float>(state->GetTime() - state->GetStartTime()) / (state->GetEndTime() - state->GetStartTime());
+			CHECK(abs(observation.back() - time) < 1e-6);
+			auto sus = state->GetShuntingUnits();
+			for(int j=0; j<sus.size() && j<3; j++) {
+				auto slot = featurizer.GetTrackSlot(state->GetPosition(sus[j]));
+				if(slot >= 0) CHECK(observation[suOffset + j * suSize + 4 + slot] == 1);
+			}
+			engine.ApplyActionAndStep(state, engine.GetValidActions(state).front());
+		}
+		engine.EndSession(state);
+	}
+
+	TEST_CASE("Featurizer action mask test") {
+		LocationEngine engine("data/Demo");
+		auto& scenario = engine.GetScenario("data/Demo/scenario.json");
+		auto state = engine.StartSession(scenario);
+		Featurizer featurizer(engine.GetLocation(), 3, 3, 3, 3);
+		CHECK(featurizer.GetNumberOfActions() == 6 + 3 * (5 + 2 + 2 + featurizer.GetTracks().size()));
+		auto mask = make_unique<bool[]>(featurizer.GetNumberOfActions());
+		engine.Step(state);
+		for(int i=0; i<10; i++) {
+			auto& actions = engine.GetValidActions(state);
+			featurizer.GetActionMask(state, actions, mask.get());
+			for(auto action: actions) {
+				auto index = featurizer.GetActionIndex(state, action);
+				REQUIRE(index >= 0);
+				CHECK(mask[index]);
+				auto simple = featurizer.GetSimpleAction(state, index);
+				CHECK(engine.IsValidAction(state, *simple).first);
+				auto generated = engine.GenerateAction(state, *simple);
+				CHECK(featurizer.GetActionIndex(state, generated) == index);
+				delete generated;
+				delete simple;
+			}
+			CHECK_THROWS_AS(featurizer.GetSimpleAction(state, featurizer.GetNumberOfActions()), InvalidActionException);
+			engine.ApplyActionAndStep(state, actions.front());
+		}
+		engine.EndSession(state);
+	}
+
+	TEST_CASE("Session batch test") {
+		LocationEngine engine("data/Demo");
+		auto& scenario = engine.GetScenario("data/Demo/scenario.json");
+		Featurizer featurizer(engine.GetLocation(), 3, 3, 3, 3);
+		const size_t n = 4;
+		SessionBatch batch(engine, featurizer, n, 0.005, 2);
+		auto obsSize = batch.GetObservationSize();
+		auto nActions = featurizer.GetNumberOfActions();
+		CHECK(obsSize == featurizer.GetObservationSize() + nActions);
+		vector<float> obs(n * obsSize), rewards(n);
+		auto dones = make_unique<bool[]>(n);
+		auto masks = make_unique<bool[]>(n * nActions);
+		for(size_t i=0; i<n; i++) batch.Reset(i, scenario, obs.data(), masks.get());
+		vector<int64_t> actions(n);
+		for(int step=0; step<5; step++) {
+			for(size_t i=0; i<n; i++) {
+				auto mask = masks.get() + i * nActions;
+				auto valid = find(mask, mask + nActions, true);
+				REQUIRE(valid != mask + nActions);
+				actions[i] = distance(mask, valid);
+				CHECK(obs[i * obsSize + featurizer.GetObservationSize() + actions[i]] == 1);
+			}
+			batch.Step(actions.data(), obs.data(), rewards.data(), dones.get(), masks.get());
+			for(size_t i=0; i<n; i++) {
+				CHECK_FALSE(dones[i]);
+				CHECK(abs(rewards[i] + 0.005) < 1e-6);
+				// All sessions take the same actions, so they should be in the same state
+				CHECK(equal(obs.begin() + i * obsSize, obs.begin() + (i + 1) * obsSize, obs.begin()));
+			}
+		}
+		actions[0] = distance(masks.get(), find(masks.get(), masks.get() + nActions, false));
+		batch.Step(actions.data(), obs.data(), rewards.data(), dones.get(), masks.get());
+		CHECK(dones[0]);
+		CHECK(rewards[0] == 0);
+		batch.Reset(0, scenario, obs.data(), masks.get());
+		CHECK(batch.GetState(0)->GetTime() < batch.GetState(1)->GetTime());
+	}
+
+	TEST_CASE("Location graph test") {
+		LocationEngine engine("data/Demo");
+		auto& location = engine.GetLocation();
+		auto& graph = location.GetGraph();
+		CHECK(&graph == &location.GetGraph());
+		auto& tracks = location.GetTracks();
+		REQUIRE(graph.GetNumberOfNodes() == tracks.size());
+		auto& indptr = graph.GetIndptr();
+		auto& indices = graph.GetIndices();
+		for(int u=0; u<tracks.size(); u++) {
+			auto neighbors = tracks[u]->GetNeighbors();
+			REQUIRE(indptr[u+1] - indptr[u] == neighbors.size());
+			for(int e=indptr[u]; e<indptr[u+1]; e++) {
+				CHECK(indices[e] == neighbors[e - indptr[u]]->GetIndex());
+				CHECK(graph.GetEdgeDurations()[e] == location.GetEdgeDuration(tracks[u], tracks[indices[e]]));
+				// Every transition continues from the target of the edge, in the direction of movement
+				for(int t=graph.GetTransitionIndptr()[e]; t<graph.GetTransitionIndptr()[e+1]; t++) {
+					auto next = graph.GetTransitionIndices()[t];
+					CHECK(next >= indptr[indices[e]]);
+					CHECK(next < indptr[indices[e]+1]);
+					CHECK(tracks[indices[next]] != tracks[u]);
+				}
+			}
+		}
+		auto state = engine.StartSession(engine.GetScenario("data/Demo/scenario.json"));
+		engine.Step(state);
+		engine.ApplyActionAndStep(state, engine.GetValidActions(state).front());
+		vector<float> features(graph.GetNumberOfNodes() * LocationGraph::numberOfNodeFeatures);
+		graph.FeaturizeNodes(state, features.data());
+		for(auto su: state->GetShuntingUnits()) {
+			auto node = state->GetPosition(su)->GetIndex();
+			CHECK(features[node * LocationGraph::numberOfNodeFeatures] >= 1);
+		}
+		engine.EndSession(state);
+	}
+
+	TEST_CASE("Shared scenario test") {
+		LocationEngine engine("data/Demo");
+		auto& scenario = engine.GetScenario("data/Demo/scenario.json");
+		Scenario copy(scenario);
+		REQUIRE(copy.GetIncomingTrains() == scenario.GetIncomingTrains());
+		REQUIRE(copy.GetOutgoingTrains() == scenario.GetOutgoingTrains());
+		auto state = engine.StartSession(copy);
+		CHECK(state->GetIncomingTrains() == scenario.GetIncomingTrains());
+		CHECK(engine.GetResult(state)->GetScenario().GetIncomingTrains() == scenario.GetIncomingTrains());
+		// Detaching copies the shared trains, and leaves the other Scenario and the State untouched
+		auto& incoming = copy.DetachIncomingTrains();
+		REQUIRE(incoming.size() == scenario.GetIncomingTrains().size());
+		for(int i=0; i<incoming.size(); i++) {
+			CHECK(incoming[i] != scenario.GetIncomingTrains()[i]);
+			CHECK(*incoming[i] == *scenario.GetIncomingTrains()[i]);
+		}
+		CHECK(state->GetIncomingTrains() == scenario.GetIncomingTrains());
+		// Added trains are owned by the Scenario, so its copies share them
+		auto added = new Outgoing(*scenario.GetOutgoingTrains().front());
+		copy.AddOutgoingTrain(added);
+		CHECK(copy.GetOutgoingTrains().back() == added);
+		CHECK(Scenario(copy).GetOutgoingTrains().back() == added);
+		engine.Step(state);
+		engine.ApplyActionAndStep(state, engine.GetValidActions(state).front());
+		engine.EndSession(state);
+	}
+
+	TEST_CASE("Reset session test") {
+		LocationEngine engine("data/Demo");
+		auto& scenario = engine.GetScenario("data/Demo/scenario.json");
+		auto fresh = engine.StartSession(scenario);
+		engine.Step(fresh);
+		auto state = engine.StartSession(scenario);
+		engine.Step(state);
+		for(int i=0; i<3; i++) {
+			engine.ApplyActionAndStep(state, engine.GetValidActions(state).front());
+			REQUIRE(engine.GetResult(state)->GetActions().size() == 1);
+			engine.ResetSession(state, scenario);
+			CHECK(state->GetShuntingUnits().empty());
+			CHECK(state->GetTime() == fresh->GetTime());
+			CHECK(state->GetNumberOfEvents() == fresh->GetNumberOfEvents());
+			CHECK(state->GetIncomingTrains() == fresh->GetIncomingTrains());
+			CHECK(state->GetOutgoingTrains() == fresh->GetOutgoingTrains());
+			CHECK(engine.GetResult(state)->GetActions().empty());
+			CHECK(engine.GetValidActions(state).size() == engine.GetValidActions(fresh).size());
+		}
+		engine.EndSession(fresh);
+		engine.EndSession(state);
+	}
+
+	TEST_CASE("Rollout test") {
+		LocationEngine engine("data/Demo");
+		auto& scenario = engine.GetScenario("data/Demo/scenario.json");
+		auto state = engine.StartSession(scenario);
+		engine.Step(state);
+		engine.ApplyActionAndStep(state, engine.GetValidActions(state).front());
+		auto time = state->GetTime();
+		auto numberOfActions = engine.GetResult(state)->GetActions().size();
+		for(auto policy: {RolloutPolicy::Random, RolloutPolicy::Greedy, RolloutPolicy::Mix}) {
+			auto result = PlayRollouts(engine, state, policy, 16, 42, 200, 4, true);
+			CHECK(result.numberOfRollouts == 16);
+			CHECK(result.numberOfSuccesses <= 16);
+			CHECK(result.meanScore <= result.bestScore);
+			CHECK(result.meanEndTime >= time);
+			// The result does not depend on the number of threads
+			auto single = PlayRollouts(engine, state, policy, 16, 42, 200, 1, true);
+			CHECK(single.numberOfSuccesses == result.numberOfSuccesses);
+			CHECK(abs(single.meanScore - result.meanScore) < 1e-9);
+			CHECK(single.bestPlan.GetActions().size() == result.bestPlan.GetActions().size());
+		}
+		CHECK(state->GetTime() == time);
+		CHECK(engine.GetResult(state)->GetActions().size() == numberOfActions);
+		CHECK(engine.IsIdle() == false);
+		engine.EndSession(state);
+		CHECK(engine.IsIdle());
+	}
+
+	TEST_CASE("Beam search test") {
+		LocationEngine engine("data/TwoTrack");
+		auto& scenario = engine.GetScenario("data/TwoTrack/scenario.json");
+		auto state = engine.StartSession(scenario);
+		engine.Step(state);
+		auto fingerprint = state->GetFingerprint();
+		auto copy = engine.CopySession(state);
+		CHECK(copy->GetFingerprint() == fingerprint);
+		engine.EndSession(copy);
+		SearchHeuristic heuristic;
+		auto result = BeamSearch(engine, state, 8, heuristic, 100, -1, 4);
+		CHECK(result.complete);
+		CHECK(result.numberOfExpansions > result.numberOfDuplicates);
+		// The result does not depend on the number of threads
+		auto single = BeamSearch(engine, state, 8, heuristic, 100, -1, 1);
+		CHECK(single.actions == result.actions);
+		// A search that runs out of time returns the best State of the last completed epoch
+		auto limited = BeamSearch(engine, state, 8, heuristic, 100, 1e-6, 4);
+		CHECK(limited.actions.size() <= result.actions.size());
+		CHECK(state->GetFingerprint() == fingerprint);
+		for(auto index: result.actions) {
+			engine.ApplyActionByIndex(state, index);
+			engine.Step(state);
+		}
+		CHECK(state->GetIncomingTrains().empty());
+		CHECK(state->GetOutgoingTrains().empty());
+		CHECK(abs(GetHeuristicScore(engine, state, heuristic) - result.score) < 1e-9);
+		engine.EndSession(state);
+	}
+
+	TEST_CASE("A* search test") {
+		LocationEngine engine("data/TwoTrack");
+		auto& scenario = engine.GetScenario("data/TwoTrack/scenario.json");
+		auto state = engine.StartSession(scenario);
+		engine.Step(state);
+		auto fingerprint = state->GetFingerprint();
+		LowerBoundTable table(engine, scenario);
+		auto bound = table.GetLowerBound(state);
+		auto result = AStarSearch(engine, state);
+		CHECK(result.complete);
+		CHECK(bound <= result.cost);
+		// With weight 1 the plan is optimal, so its cost equals the proven lower bound
+		CHECK(result.lowerBound == result.cost);
+		CHECK(state->GetFingerprint() == fingerprint);
+		auto weighted = AStarSearch(engine, state, 3.0);
+		CHECK(weighted.complete);
+		CHECK(weighted.cost <= 3.0 * result.cost);
+		for(auto index: result.actions) {
+			engine.ApplyActionByIndex(state, index);
+			engine.Step(state);
+		}
+		CHECK(state->GetIncomingTrains().empty());
+		CHECK(state->GetOutgoingTrains().empty());
+		// The LowerBoundTable of the session is kept until its Scenario changes
+		auto cached = engine.GetLowerBoundTable(state);
+		CHECK(engine.GetLowerBoundTable(state) == cached);
+		engine.ResetSession(state, scenario);
+		CHECK(engine.GetLowerBoundTable(state) != cached);
+		engine.EndSession(state);
+	}
+
+	TEST_CASE("Feasibility monitor test") {
+		SUBCASE("Dead ends are detected before the end of the Scenario") {
+			LocationEngine engine("data/Demo");
+			engine.SetFeasibilityMonitor(true);
+			CHECK(engine.IsFeasibilityMonitorActive());
+			auto state = engine.StartSession(engine.GetScenario("data/Demo/scenario.json"));
+			bool deadEnd = false;
+			try {
+				engine.Step(state);
+				while(engine.IsStateActive(state))
+					engine.ApplyActionAndStep(state, engine.GetValidActions(state).front());
+			} catch(DeadEndException& e) {
+				deadEnd = true;
+				CHECK(e.GetReason() == DeadEndReason::LateDeparture);
+				CHECK(state->GetTime() < state->GetEndTime());
+			}
+			CHECK(deadEnd);
+			engine.EndSession(state);
+		}
+		SUBCASE("The monitor does not change the successful sessions") {
+			LocationEngine engine("data/TwoTrack");
+			auto state = engine.StartSession(engine.GetScenario("data/TwoTrack/scenario.json"));
+			engine.Step(state);
+			auto result = PlayRollouts(engine, state, RolloutPolicy::Random, 200, 42, 200, 1);
+			engine.SetFeasibilityMonitor(true);
+			auto monitored = PlayRollouts(engine, state, RolloutPolicy::Random, 200, 42, 200, 1);
+			CHECK(monitored.numberOfSuccesses == result.numberOfSuccesses);
+			CHECK(monitored.meanEndTime <= result.meanEndTime);
+			engine.SetFeasibilityMonitor(false);
+			CHECK_FALSE(engine.IsFeasibilityMonitorActive());
+			engine.EndSession(state);
+		}
+	}
+	TEST_CASE("Scenario screening test") {
+		LocationEngine engine("data/Demo");
+		auto& scenario = engine.GetScenario("data/Demo/scenario.json");
+		CHECK(engine.ScreenScenario(scenario).IsFeasible());
+		SUBCASE("An Outgoing train that leaves before any Train can reach it is reported") {
+			Scenario copy(scenario);
+			auto outgoing = copy.GetOutgoingTrains();
+			auto first = outgoing.front();
+			outgoing.front() = new Outgoing(first->GetID(), new ShuntingUnit(*first->GetShuntingUnit()), first->GetParkingTrack(), 
+				first->GetSideTrack(), 0, first->IsInstanding(), first->GetStandingIndex());
+			copy.SetOutgoingTrains(outgoing);
+			auto result = engine.ScreenScenario(copy);
+			CHECK_FALSE(result.IsFeasible());
+			CHECK(result.reasons.size() == result.messages.size());
+			CHECK(find(result.reasons.begin(), result.reasons.end(), DeadEndReason::LateDeparture) != result.reasons.end());
+		}
+	}
+	TEST_CASE("Symmetry reduction test") {
+		LocationEngine engine("data/TwoTrack");
+		auto state = engine.StartSession(engine.GetScenario("data/TwoTrack/scenario.json"));
+		engine.Step(state);
+		engine.ApplyActionAndStep(state, engine.GetValidActions(state).front());
+		vector<string> actions;
+		for(auto action: engine.GetValidActions(state)) actions.push_back(action->toString());
+		CHECK(engine.GetSymmetryClasses(state).size() == actions.size());
+		engine.SetSymmetryReduction(true);
+		CHECK(engine.IsSymmetryReductionActive());
+		// Units with different types or positions are never symmetric
+		auto& reduced = engine.GetValidActions(state);
+		CHECK(reduced.size() == actions.size());
+		auto& classes = engine.GetSymmetryClasses(state);
+		REQUIRE(classes.size() == reduced.size());
+		auto it = reduced.begin();
+		for(auto& actionClass: classes) {
+			CHECK(actionClass.size() == 1);
+			CHECK(actionClass.front() == *(it++));
+		}
+		engine.SetSymmetryReduction(false);
+		CHECK(engine.GetValidActions(state).size() == actions.size());
+		engine.EndSession(state);
+	}
+
+	TEST_CASE("Symmetry reduction threads test") {
+		LocationEngine engine("data/TwoTrack");
+		engine.SetSymmetryReduction(true);
+		auto state = engine.StartSession(engine.GetScenario("data/TwoTrack/scenario.json"));
+		engine.Step(state);
+		// The worker threads generate the reduced valid actions of their own sessions
+		auto result = PlayRollouts(engine, state, RolloutPolicy::Mix, 32, 42, 200, 8);
+		auto single = PlayRollouts(engine, state, RolloutPolicy::Mix, 32, 42, 200, 1);
+		CHECK(result.numberOfSuccesses == single.numberOfSuccesses);
+		CHECK(abs(result.meanScore - single.meanScore) < 1e-9);
+		SearchHeuristic heuristic;
+		auto beam = BeamSearch(engine, state, 8, heuristic, 100, -1, 8);
+		auto singleBeam = BeamSearch(engine, state, 8, heuristic, 100, -1, 1);
+		CHECK(beam.complete);
+		CHECK(beam.actions == singleBeam.actions);
+		engine.EndSession(state);
+		CHECK(engine.IsIdle());
+	}
+	TEST_CASE("Pruning rules test") {
+		auto folder = fs::temp_directory_path() / "cTORSPruningTest";
+		fs::remove_all(folder);
+		fs::create_directories(folder);
+		json j;
+		ifstream("data/TwoTrack/config.json") >> j;
+		for(auto& [name, rule]: j["pruning_rules"]["rules"].items())
+			rule["on"] = true;
+		ofstream(folder / "config.json") << j;
+		{
+			LocationEngine engine("data/TwoTrack");
+			LocationEngine prunedEngine("data/TwoTrack", folder.string());
+			CHECK(engine.GetPruningRuleNames().empty());
+			CHECK(prunedEngine.GetPruningRuleNames().size() == 3);
+			auto& scenario = engine.GetScenario("data/TwoTrack/scenario.json");
+			auto state = engine.StartSession(scenario);
+			auto prunedState = prunedEngine.StartSession(scenario);
+			engine.Step(state);
+			prunedEngine.Step(prunedState);
+			auto result = PlayRollouts(engine, state, RolloutPolicy::Greedy, 20, 42, 200, 1);
+			auto prunedResult = PlayRollouts(prunedEngine, prunedState, RolloutPolicy::Greedy, 20, 42, 200, 1);
+			CHECK(prunedResult.numberOfSuccesses == result.numberOfSuccesses);
+			CHECK(prunedEngine.GetValidActions(prunedState).size() <= engine.GetValidActions(state).size());
+			engine.EndSession(state);
+			prunedEngine.EndSession(prunedState);
+		}
+		fs::remove_all(folder);
+	}
+
+	TEST_CASE("State snapshot test") {
+		LocationEngine engine("data/Demo");
+		auto& scenario = engine.GetScenario("data/Demo/scenario.json");
+		auto state = engine.StartSession(scenario);
+		engine.Step(state);
+		State* target = nullptr;
+		auto toStrings = [](const list<const Action*>& actions) {
+			vector<string> strings;
+			for(auto action: actions) strings.push_back(action->toString());
+			return strings;
+		};
+		for(size_t i=0; i<20; i++) {
+			auto data = engine.SaveState(state);
+			target = engine.LoadState(data, target);
+			CHECK(target->GetTime() == state->GetTime());
+			CHECK(target->GetFingerprint() == state->GetFingerprint());
+			CHECK(engine.GetResult(target)->GetActions().size() == engine.GetResult(state)->GetActions().size());
+			CHECK(engine.SaveState(target) == data);
+			auto& actions = engine.GetValidActions(state);
+			REQUIRE(toStrings(engine.GetValidActions(target)) == toStrings(actions));
+			if(actions.empty()) break;
+			// The restored session continues like the saved session
+			auto index = (i * 7) % actions.size();
+			auto action = *next(actions.begin(), index);
+			auto restoredAction = *next(engine.GetValidActions(target).begin(), index);
+			try {
+				engine.ApplyActionAndStep(state, action);
+			} catch(ScenarioFailedException&) {
+				CHECK_THROWS_AS(engine.ApplyActionAndStep(target, restoredAction), ScenarioFailedException);
+				break;
+			}
+			engine.ApplyActionAndStep(target, restoredAction);
+			CHECK(target->GetFingerprint() == state->GetFingerprint());
+		}
+		auto data = engine.SaveState(state);
+		CHECK_THROWS_AS(engine.LoadState("not a snapshot"), invalid_argument);
+		CHECK_THROWS_AS(engine.LoadState(data.substr(0, data.size() - 3)), invalid_argument);
+		// A failed load resets the target session to the start of the Scenario of the snapshot
+		CHECK_THROWS_AS(engine.LoadState(data.substr(0, data.size() - 3), target), invalid_argument);
+		CHECK(engine.GetResult(target)->GetActions().empty());
+		// The location of the snapshot is compared by its canonical path
+		LocationEngine sameLocation("./data/../data/Demo");
+		sameLocation.EndSession(sameLocation.LoadState(data));
+		LocationEngine twoTrack("data/TwoTrack");
+		CHECK_THROWS_AS(twoTrack.LoadState(data), invalid_argument);
+		CHECK(twoTrack.IsIdle());
+		engine.EndSession(target);
+		engine.EndSession(state);
+		CHECK(engine.IsIdle());
+	}
 }
@@ -12,9 +12,6 @@ namespace cTORSTest {
         CHECK(elecTrain == Train(elecTrain));
         CHECK(Train(-1, &nonElecTrainType) != Train(-1, &nonElecTrainType));
 
-        TrainUnitType::types[elecTrainType.displayName] = &elecTrainType;
-        TrainUnitType::types[nonElecTrainType.displayName] = &nonElecTrainType;
-
         //TODO test shunting units, length, needsElectric?
     }
 
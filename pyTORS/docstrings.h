@@ -23,6 +23,51 @@
 #endif
 
 
+static const char *__doc_AStarResult = R"doc(The outcome of an AStarSearch */)doc";
+
+static const char *__doc_AStarResult_actions =
+R"doc(< The indices of the valid Action%s (see
+LocationEngine::GetValidActions) of the plan, starting from the given
+State */)doc";
+
+static const char *__doc_AStarResult_complete =
+R"doc(< True iff the plan handles all the Incoming and Outgoing trains */)doc";
+
+static const char *__doc_AStarResult_cost =
+R"doc(< The cost of the plan: the summed duration of its Action%s, except
+WaitAction%s */)doc";
+
+static const char *__doc_AStarResult_elapsed =
+R"doc(< The duration of the search in seconds */)doc";
+
+static const char *__doc_AStarResult_lowerBound =
+R"doc(< A proven lower bound on the cost of any complete plan from the given
+State, infinite if there is none */)doc";
+
+static const char *__doc_AStarResult_numberOfExpansions =
+R"doc(< The number of States that were expanded */)doc";
+
+static const char *__doc_AStarResult_numberOfGenerated =
+R"doc(< The number of States that were generated */)doc";
+
+static const char *__doc_AStarSearch =
+R"doc(Search for a plan with minimum cost (see AStarResult::cost) from the
+given State with a weighted A* search, using the admissible lower
+bound of the LowerBoundTable of the session (see
+LocationEngine::GetLowerBoundTable) as heuristic.
+
+States are expanded in the order of cost + weight * lower bound. With
+weight 1 a complete plan is optimal, and with weight w > 1 its cost is
+at most w times the optimal cost. Generated States with the same
+fingerprint (see State::GetFingerprint) as an earlier generated State
+with lower or equal cost are discarded. Only the fingerprints are
+compared, so a collision of the fingerprints of different States may
+discard a State. The search stops when a complete plan is found, no
+State is left, or after maxExpansions expansions or timeLimit seconds
+(if positive). If no complete plan is found, the result describes the
+plan to the expanded State with the lowest lower bound. The given
+State is not changed.)doc";
+
 static const char *__doc_Action =
 R"doc(The abstract base class for action descriptions. Action describes an
 action more extensively than SimpleAction. It it therefore used to
@@ -33,6 +78,8 @@ Engine::GenerateAction or LocationEngine::GenerateAction)doc";
 
 static const char *__doc_Action_2 = R"doc()doc";
 
+static const char *__doc_Action_GetKind = R"doc(Get the ActionKind of this action.)doc";
+
 static const char *__doc_ActionGenerator =
 R"doc(An abstract base class for the ActionGenerators.
 
@@ -58,10 +105,34 @@ from the State */)doc";
 
 static const char *__doc_ActionGenerator_InitialCheck_2 =
 R"doc(Run an initial error check on ShuntingUnit described the train IDs and
-return the ShuntingUnit from the State */)doc";
+return the ShuntingUnit from the State. If given, the ShuntingUnit
+handle su is used as a lookup shortcut.)doc";
 
 static const char *__doc_ActionGenerator_location = R"doc(< a reference to the Location object */)doc";
 
+static const char *__doc_ActionKind =
+R"doc(The kind of an Action, one value per Action subclass)doc";
+
+static const char *__doc_ActionKind_ArriveAction = R"doc(< An ArriveAction */)doc";
+
+static const char *__doc_ActionKind_BeginMoveAction = R"doc(< A BeginMoveAction */)doc";
+
+static const char *__doc_ActionKind_CombineAction = R"doc(< A CombineAction */)doc";
+
+static const char *__doc_ActionKind_EndMoveAction = R"doc(< An EndMoveAction */)doc";
+
+static const char *__doc_ActionKind_ExitAction = R"doc(< An ExitAction */)doc";
+
+static const char *__doc_ActionKind_MoveAction = R"doc(< A MoveAction */)doc";
+
+static const char *__doc_ActionKind_ServiceAction = R"doc(< A ServiceAction */)doc";
+
+static const char *__doc_ActionKind_SetbackAction = R"doc(< A SetbackAction */)doc";
+
+static const char *__doc_ActionKind_SplitAction = R"doc(< A SplitAction */)doc";
+
+static const char *__doc_ActionKind_WaitAction = R"doc(< A WaitAction */)doc";
+
 static const char *__doc_ActionManager =
 R"doc(An ActionManager contains all the ActionGenerators and
 ActionValidators
@@ -79,14 +150,29 @@ static const char *__doc_ActionManager_AddGenerator = R"doc()doc";
 
 static const char *__doc_ActionManager_AddGenerators = R"doc()doc";
 
+static const char *__doc_ActionManager_AddPruners = R"doc()doc";
+
 static const char *__doc_ActionManager_AddValidators = R"doc()doc";
 
 static const char *__doc_ActionManager_Generate =
 R"doc(Generate valid Action%s given the State and store the result in the
-out list */)doc";
+out list. The active PruningRule%s are applied to the valid Action%s
+*/)doc";
+
+static const char *__doc_ActionManager_GetBusinessRuleNames =
+R"doc(Get the names of the active business rules, in the order used by
+GetViolatedBusinessRule */)doc";
 
 static const char *__doc_ActionManager_GetGenerator = R"doc(Get the ActionGenerator based on its name */)doc";
 
+static const char *__doc_ActionManager_GetPruningRuleNames =
+R"doc(Get the names of the active pruning rules, in the order in which they
+are applied */)doc";
+
+static const char *__doc_ActionManager_GetViolatedBusinessRule =
+R"doc(Get the index of the first business rule that the Action violates in
+the given State, or -1 if the Action is valid */)doc";
+
 static const char *__doc_ActionManager_IsValid =
 R"doc(Check the validity of an Action in a certain State
 
@@ -102,6 +188,12 @@ static const char *__doc_ActionManager_generators = R"doc()doc";
 
 static const char *__doc_ActionManager_location = R"doc()doc";
 
+static const char *__doc_ActionManager_prunerNames = R"doc()doc";
+
+static const char *__doc_ActionManager_pruners = R"doc()doc";
+
+static const char *__doc_ActionManager_validatorNames = R"doc()doc";
+
 static const char *__doc_ActionManager_validators = R"doc()doc";
 
 static const char *__doc_Action_Action = R"doc()doc";
@@ -152,6 +244,48 @@ static const char *__doc_Action_toString = R"doc(Generate a string representatio
 
 static const char *__doc_Action_uid = R"doc(< The unique id of this Action */)doc";
 
+static const char *__doc_ActionRow =
+R"doc(A flat description of an Action, as one row of the valid action table
+(see LocationEngine::GetValidActionTable).
+
+Fields that do not apply to the kind of Action are -1.)doc";
+
+static const char *__doc_ActionRow_destinationTrack =
+R"doc(< The index of the destination Track */)doc";
+
+static const char *__doc_ActionRow_duration = R"doc(< The duration of the Action in seconds */)doc";
+
+static const char *__doc_ActionRow_facility =
+R"doc(< The ID of the Facility of a ServiceAction */)doc";
+
+static const char *__doc_ActionRow_kind = R"doc(< The ActionKind of the Action */)doc";
+
+static const char *__doc_ActionRow_previousTrack =
+R"doc(< The index of the previous Track when the ShuntingUnit arrives at its
+destination */)doc";
+
+static const char *__doc_ActionRow_secondShuntingUnit =
+R"doc(< The index of the rear ShuntingUnit of a CombineAction */)doc";
+
+static const char *__doc_ActionRow_shuntingUnit =
+R"doc(< The index of the ShuntingUnit in State::GetShuntingUnits (-1 for an
+ArriveAction) */)doc";
+
+static const char *__doc_ActionRow_splitIndex = R"doc(< The split index of a SplitAction */)doc";
+
+static const char *__doc_ActionRow_task =
+R"doc(< The index of the Task in State::GetTasksForTrain of a ServiceAction
+*/)doc";
+
+static const char *__doc_ActionRow_train = R"doc(< The ID of the Train of a ServiceAction */)doc";
+
+static const char *__doc_ActionRow_trainCount =
+R"doc(< The number of train IDs of the ShuntingUnit */)doc";
+
+static const char *__doc_ActionRow_trainOffset =
+R"doc(< The offset of the ShuntingUnit's train IDs in the train ID array of
+the table */)doc";
+
 static const char *__doc_Arrive =
 R"doc(The Arrive action lets a scheduled ShuntingUnit arrive on the shunting
 yard.)doc";
@@ -160,6 +294,8 @@ static const char *__doc_ArriveAction =
 R"doc(The ArriveAction lets a scheduled ShuntingUnit arrive on the shunting
 yard.)doc";
 
+static const char *__doc_ArriveAction_GetKind = R"doc()doc";
+
 static const char *__doc_ArriveActionGenerator = R"doc(The ArriveActionGenerator generates ArriveAction%s */)doc";
 
 static const char *__doc_ArriveActionGenerator_ArriveActionGenerator = R"doc()doc";
@@ -210,6 +346,50 @@ static const char *__doc_Arrive_incomingID = R"doc()doc";
 
 static const char *__doc_Arrive_toString = R"doc()doc";
 
+static const char *__doc_BeamSearch =
+R"doc(Search for a plan from the given State with a beam search of the given
+width.
+
+Every epoch, every State in the beam is expanded by applying each of
+its valid Action%s. Generated States that have the same fingerprint as
+an earlier generated State (see State::GetFingerprint) are discarded,
+as are States in which the session failed. Only the fingerprints are
+compared, so the search is lossy: a State of which the fingerprint
+collides with that of another State is discarded as well. The width
+best States by their heuristic score (see GetHeuristicScore) form the
+next beam. The search stops when a State is generated in which all
+Incoming and Outgoing trains are handled, when the beam is empty, or
+after maxDepth epochs or timeLimit seconds (if positive). The time
+limit is also checked during an epoch. The result describes the best
+State found in the last completed epoch.
+
+The expansions are divided over nThreads threads, or one per hardware
+thread if nThreads <= 0. Unless the time limit is reached, the result
+does not depend on the number of threads. The given State is not
+changed and the LocationEngine should not be used by other threads
+meanwhile.)doc";
+
+static const char *__doc_BeamSearchResult = R"doc(The outcome of a BeamSearch */)doc";
+
+static const char *__doc_BeamSearchResult_actions =
+R"doc(< The indices of the valid Action%s (see
+LocationEngine::GetValidActions) that the best plan applies, starting
+from the given State */)doc";
+
+static const char *__doc_BeamSearchResult_complete =
+R"doc(< True iff the best plan handles all the Incoming and Outgoing trains
+*/)doc";
+
+static const char *__doc_BeamSearchResult_numberOfDuplicates =
+R"doc(< The number of generated States that were discarded because a State
+with the same fingerprint was generated before */)doc";
+
+static const char *__doc_BeamSearchResult_numberOfExpansions =
+R"doc(< The number of States that were generated */)doc";
+
+static const char *__doc_BeamSearchResult_score =
+R"doc(< The heuristic score of the State at the end of the best plan */)doc";
+
 static const char *__doc_BeginMove =
 R"doc(The BeginMove action changes the state of a ShuntingUnit to moving.
 After this action the ShuntingUnit can be moved.)doc";
@@ -228,6 +408,8 @@ static const char *__doc_BeginMoveAction_CreateSimple = R"doc()doc";
 
 static const char *__doc_BeginMoveAction_Finish = R"doc()doc";
 
+static const char *__doc_BeginMoveAction_GetKind = R"doc()doc";
+
 static const char *__doc_BeginMoveAction_Start = R"doc()doc";
 
 static const char *__doc_BeginMoveAction_toString = R"doc()doc";
@@ -265,10 +447,38 @@ Returns:
 
 static const char *__doc_BusinessRule_config = R"doc()doc";
 
+static const char *__doc_CalcTravelTimes =
+R"doc(Calculate the minimum travel time between every pair of Railroad
+Track%s of the Location, where setbacks are free and the direction is
+ignored (Dijkstra over the neighboring paths, see
+Location::GetNeighboringPaths).
+
+Returns:
+    the travel times, flattened as [from * #tracks + to] by Track
+    index, or MAX_PATH_LENGTH if there is no path)doc";
+
 static const char *__doc_Combine = R"doc(The Combine action combines two ShuntingUnits into one ShuntingUnit.)doc";
 
 static const char *__doc_CombineAction = R"doc(The CombineAction combines two ShuntingUnits into one ShuntingUnit.)doc";
 
+static const char *__doc_CombineAction_CombineAction_3 =
+R"doc(Generate a CombineAction from the given parameters, with the given
+description of the Train%s of the two ShuntingUnit%s (see
+GetShuntingUnitsString))doc";
+
+static const char *__doc_CombineAction_GetKind = R"doc()doc";
+
+static const char *__doc_CombineAction_GetPosition =
+R"doc(Get the index of the combined ShuntingUnit on the Track */)doc";
+
+static const char *__doc_CombineAction_GetShuntingUnitsString =
+R"doc(Get a description of the Train%s of the two ShuntingUnit%s that are
+combined */)doc";
+
+static const char *__doc_CombineAction_IsInNeutral =
+R"doc(Returns true iff the combined ShuntingUnit will be in neutral
+direction */)doc";
+
 static const char *__doc_CombineActionGenerator = R"doc(The CombineActionGenerator generates CombineAction%s */)doc";
 
 static const char *__doc_CombineActionGenerator_CombineActionGenerator = R"doc()doc";
@@ -348,26 +558,76 @@ static const char *__doc_Config_Config_2 = R"doc(Construct a Config object based
 
 static const char *__doc_Config_GetActionParameters = R"doc(Get the parameters for the ActionGenerator defined by the name */)doc";
 
+static const char *__doc_Config_GetPruningParameters =
+R"doc(Get the parameters for the PruningRule defined by the name */)doc";
+
 static const char *__doc_Config_ImportActionRules = R"doc()doc";
 
 static const char *__doc_Config_ImportBusinessRules = R"doc()doc";
 
+static const char *__doc_Config_ImportPruningRules = R"doc()doc";
+
 static const char *__doc_Config_IsBusinessRuleActive = R"doc(Returns true iff the BusinessRule defined by the name is active */)doc";
 
 static const char *__doc_Config_IsGeneratorActive = R"doc(Returns true iff the ActionGenerator defined by the name is active */)doc";
 
+static const char *__doc_Config_IsPruningRuleActive =
+R"doc(Returns true iff the PruningRule defined by the name is active.
+Pruning rules are inactive unless configured */)doc";
+
 static const char *__doc_Config_actionParams = R"doc()doc";
 
 static const char *__doc_Config_actionRules = R"doc()doc";
 
 static const char *__doc_Config_businessRules = R"doc()doc";
 
+static const char *__doc_Config_pruningParams = R"doc()doc";
+
+static const char *__doc_Config_pruningRules = R"doc()doc";
+
 static const char *__doc_ConvertPBTaskType = R"doc(//!\cond NO_DOC)doc";
 
 static const char *__doc_ConvertPBTaskTypes = R"doc()doc";
 
 static const char *__doc_ConvertPBTrackPartType = R"doc(Convert a protobuf track_part_type to a TrackPartType)doc";
 
+static const char *__doc_DeadEndException =
+R"doc(A DeadEndException is a ScenarioFailedException that is raised by the
+FeasibilityMonitor as soon as the session can no longer succeed)doc";
+
+static const char *__doc_DeadEndException_DeadEndException =
+R"doc(Construct a DeadEndException with the given reason and extra info */)doc";
+
+static const char *__doc_DeadEndException_GetReason =
+R"doc(Get the reason code of this DeadEndException */)doc";
+
+static const char *__doc_DeadEndException_reason = R"doc()doc";
+
+static const char *__doc_DeadEndReason = R"doc(The reason codes of a DeadEndException)doc";
+
+static const char *__doc_DeadEndReason_Electrification =
+R"doc(< A ShuntingUnit that needs electricity arrives or leaves on a Track
+that is not electrified (only by FeasibilityMonitor::Screen) */)doc";
+
+static const char *__doc_DeadEndReason_LateDeparture =
+R"doc(< No matching Train can reach the parking Track of a remaining
+Outgoing train before its deadline */)doc";
+
+static const char *__doc_DeadEndReason_MissingFacility =
+R"doc(< No Facility executes a mandatory service Task of a Train that must
+leave (only by FeasibilityMonitor::Screen) */)doc";
+
+static const char *__doc_DeadEndReason_MissingTrain =
+R"doc(< No remaining Train matches a Train of a remaining Outgoing train */)doc";
+
+static const char *__doc_DeadEndReason_ParkingLength =
+R"doc(< The Train%s on the shunting yard do not fit on its Track%s (only by
+FeasibilityMonitor::Screen) */)doc";
+
+static const char *__doc_DeadEndReason_ServiceCapacity =
+R"doc(< The remaining mandatory service Task%s of a type need more time than
+the Facility%s have left */)doc";
+
 static const char *__doc_Disturbance =
 R"doc(The Disturbance class describes an (unexpected) distrubance that can
 happen during a Scenario
@@ -432,6 +692,8 @@ static const char *__doc_EndMoveAction_EndMoveAction_2 = R"doc(Construct a EndMo
 
 static const char *__doc_EndMoveAction_Finish = R"doc()doc";
 
+static const char *__doc_EndMoveAction_GetKind = R"doc()doc";
+
 static const char *__doc_EndMoveAction_Start = R"doc()doc";
 
 static const char *__doc_EndMoveAction_toString = R"doc()doc";
@@ -450,9 +712,27 @@ static const char *__doc_EndMove_GetGeneratorName = R"doc()doc";
 
 static const char *__doc_EndMove_toString = R"doc()doc";
 
-static const char *__doc_Engine = R"doc(The TORS Engine for several Location%s)doc";
+static const char *__doc_Engine =
+R"doc(The TORS Engine for several Location%s
+
+Location%s are loaded when they are first used. If a memory budget is
+set, the least recently used Location%s without active sessions are
+unloaded when the estimated memory usage exceeds the budget. A
+Location is not unloaded while its shared pointer (see
+LocationEngine::GetSharedLocation) is held outside the Engine. Note
+that Scenario%s obtained through GetScenario are invalid after their
+Location is unloaded.)doc";
+
+static const char *__doc_Engine_2 =
+R"doc(The TORS Engine for several Location%s
 
-static const char *__doc_Engine_2 = R"doc(The TORS Engine for several Location%s)doc";
+Location%s are loaded when they are first used. If a memory budget is
+set, the least recently used Location%s without active sessions are
+unloaded when the estimated memory usage exceeds the budget. A
+Location is not unloaded while its shared pointer (see
+LocationEngine::GetSharedLocation) is held outside the Engine. Note
+that Scenario%s obtained through GetScenario are invalid after their
+Location is unloaded.)doc";
 
 static const char *__doc_Engine_ApplyAction = R"doc(Apply the given Action to the State */)doc";
 
@@ -466,6 +746,10 @@ static const char *__doc_Engine_ApplyActionAndStep_2 =
 R"doc(Apply the SimpleAction to the State and go to the next step in the
 simulation */)doc";
 
+static const char *__doc_Engine_ApplyActionByIndex =
+R"doc(Apply the valid Action at the given index of GetValidActions (or
+GetValidActionTable) to the State */)doc";
+
 static const char *__doc_Engine_CalcAllPossiblePaths =
 R"doc(Calculate all the possible paths (run this once before requesting
 possible paths) */)doc";
@@ -474,6 +758,10 @@ static const char *__doc_Engine_CalcShortestPaths =
 R"doc(Calculate all the shortest paths (run this once before requesting
 shortest paths) */)doc";
 
+static const char *__doc_Engine_CopySession =
+R"doc(Copy the session that belongs to the source State to the session of
+the target State, see LocationEngine::CopySession */)doc";
+
 static const char *__doc_Engine_EndSession = R"doc(End the session that belongs to the given State */)doc";
 
 static const char *__doc_Engine_Engine = R"doc(The default constructor */)doc";
@@ -486,8 +774,22 @@ Location */)doc";
 
 static const char *__doc_Engine_GenerateAction = R"doc(Generate an Action from the given SimpleAction */)doc";
 
+static const char *__doc_Engine_GetLoadedLocations =
+R"doc(Get the location strings of all loaded Location%s */)doc";
+
 static const char *__doc_Engine_GetLocation = R"doc(Get a reference to the Location of the given location string */)doc";
 
+static const char *__doc_Engine_GetLocationEngine =
+R"doc(Get the LocationEngine that runs the session of the given State */)doc";
+
+static const char *__doc_Engine_GetMemoryBudget =
+R"doc(Get the memory budget in bytes for the loaded Location%s (0 means
+unlimited) */)doc";
+
+static const char *__doc_Engine_GetMemoryUsage =
+R"doc(Get an estimate of the memory used by the loaded Location%s, in bytes
+*/)doc";
+
 static const char *__doc_Engine_GetOrLoadLocationEngine = R"doc(Get or load the LocationEngine based on its file location */)doc";
 
 static const char *__doc_Engine_GetPath = R"doc(Get a path for the Move */)doc";
@@ -498,10 +800,34 @@ static const char *__doc_Engine_GetScenario =
 R"doc(Get a reference to the Scenario given by the path and the given
 location string */)doc";
 
+static const char *__doc_Engine_GetSessionID =
+R"doc(Get the id of the session that belongs to the given State, see
+LocationEngine::GetSessionID */)doc";
+
+static const char *__doc_Engine_GetSymmetryClasses =
+R"doc(Get the symmetry classes of the valid Action%s of the given State, see
+LocationEngine::GetSymmetryClasses */)doc";
+
+static const char *__doc_Engine_GetValidActionTable =
+R"doc(Get the valid Action%s for the given State as a table, see
+LocationEngine::GetValidActionTable */)doc";
+
 static const char *__doc_Engine_GetValidActions = R"doc(Get the valid actions for the session with the given State */)doc";
 
 static const char *__doc_Engine_ImportResult = R"doc(Import a RunResult from a protobuf file */)doc";
 
+static const char *__doc_Engine_IsFeasibilityMonitorActive =
+R"doc(Returns true iff the FeasibilityMonitor is active, see
+SetFeasibilityMonitor */)doc";
+
+static const char *__doc_Engine_IsStateActive =
+R"doc(Returns true iff the given state is still active (ie the scenario is
+not ended or failed yet) */)doc";
+
+static const char *__doc_Engine_IsSymmetryReductionActive =
+R"doc(Returns true iff symmetry reduction is active, see
+SetSymmetryReduction */)doc";
+
 static const char *__doc_Engine_IsValidAction =
 R"doc(Checks if the given SimpleAction is valid in the given State or not.
 If not provides a reason why.)doc";
@@ -510,16 +836,74 @@ static const char *__doc_Engine_IsValidAction_2 =
 R"doc(Checks if the given Action is valid in the given State or not. If not
 provides a reason why.)doc";
 
+static const char *__doc_Engine_LoadState =
+R"doc(Restore the session of a snapshot into the session of the target
+State, see LocationEngine::LoadState. If no target State is given, the
+location string of the snapshot is resolved as by
+ResolveLocationEngine.)doc";
+
+static const char *__doc_Engine_ResetSession =
+R"doc(Reset the session that belongs to the given State to a new session for
+the given Scenario, see LocationEngine::ResetSession */)doc";
+
+static const char *__doc_Engine_ResolveLocationEngine =
+R"doc(Get the LocationEngine for the location string of a RunResult.
+
+The location is looked up as a loaded location, as a loaded location
+with the same canonical path, as a folder, as a folder relative to
+relativeTo, and finally as a loaded location with the same folder
+name.)doc";
+
+static const char *__doc_Engine_RestoreSession =
+R"doc(Restore the session of the given RunResult to the session of the
+target State, see LocationEngine::RestoreSession */)doc";
+
+static const char *__doc_Engine_SaveState =
+R"doc(Save the session that belongs to the given State to a binary snapshot,
+see LocationEngine::SaveState */)doc";
+
+static const char *__doc_Engine_ScreenScenario =
+R"doc(Screen the Scenario for the given location string, see
+LocationEngine::ScreenScenario */)doc";
+
+static const char *__doc_Engine_SetFeasibilityMonitor =
+R"doc(Activate or deactivate the FeasibilityMonitor of all loaded and future
+LocationEngine%s, see LocationEngine::SetFeasibilityMonitor */)doc";
+
+static const char *__doc_Engine_SetMemoryBudget =
+R"doc(Set the memory budget in bytes for the loaded Location%s (0 means
+unlimited) */)doc";
+
+static const char *__doc_Engine_SetSymmetryReduction =
+R"doc(Activate or deactivate symmetry reduction of all loaded and future
+LocationEngine%s, see LocationEngine::SetSymmetryReduction */)doc";
+
 static const char *__doc_Engine_StartSession =
 R"doc(Start a session for the given Scenario and location and generate an
 initial State */)doc";
 
 static const char *__doc_Engine_Step = R"doc(Go to the next Step in the simulation and update the State */)doc";
 
+static const char *__doc_Engine_UnloadIdleLocationEngines = R"doc()doc";
+
+static const char *__doc_Engine_ValidateMany =
+R"doc(Check the validity of all the given SimpleAction%s in the given State
+at once, see LocationEngine::ValidateMany */)doc";
+
 static const char *__doc_Engine_engineMap = R"doc()doc";
 
 static const char *__doc_Engine_engines = R"doc()doc";
 
+static const char *__doc_Engine_feasibilityMonitor = R"doc()doc";
+
+static const char *__doc_Engine_lastUse = R"doc()doc";
+
+static const char *__doc_Engine_memoryBudget = R"doc()doc";
+
+static const char *__doc_Engine_symmetryReduction = R"doc()doc";
+
+static const char *__doc_Engine_useCounter = R"doc()doc";
+
 static const char *__doc_Event = R"doc(A triggered Event)doc";
 
 static const char *__doc_EventCompare = R"doc(//!\cond NO_DOC)doc";
@@ -528,6 +912,20 @@ static const char *__doc_EventCompare_operator_call = R"doc()doc";
 
 static const char *__doc_EventQueue = R"doc(A priority queue of all the Event%s based on the time of the Event)doc";
 
+static const char *__doc_EventQueue_Clear = R"doc(Remove and delete all the Event%s */)doc";
+
+static const char *__doc_EventQueue_EventQueue = R"doc(Construct an empty EventQueue */)doc";
+
+static const char *__doc_EventQueue_EventQueue_2 =
+R"doc(Copy the EventQueue and its Event%s */)doc";
+
+static const char *__doc_EventQueue_GetEvents =
+R"doc(Get the Event%s in this EventQueue, in no particular order */)doc";
+
+static const char *__doc_EventQueue_operator_assign =
+R"doc(Replace the Event%s of this EventQueue by copies of the Event%s in the
+given EventQueue */)doc";
+
 static const char *__doc_EventType = R"doc(The EventType of an Event */)doc";
 
 static const char *__doc_EventType_ActionFinish = R"doc(< When an Action is finished */)doc";
@@ -554,7 +952,9 @@ static const char *__doc_Event_Event_3 =
 R"doc(Construct an Event with type OutgoingTrain from the given Outgoing
 object */)doc";
 
-static const char *__doc_Event_Event_4 = R"doc(Copy the Event */)doc";
+static const char *__doc_Event_Event_4 = R"doc(Construct an Event of the given type without an Action */)doc";
+
+static const char *__doc_Event_Event_5 = R"doc(Copy the Event */)doc";
 
 static const char *__doc_Event_GetAction = R"doc(Get the Action that belongs to this Event */)doc";
 
@@ -578,6 +978,8 @@ static const char *__doc_ExitAction =
 R"doc(The ExitAction lets a scheduled ShuntingUnit depart from the shunting
 yard.)doc";
 
+static const char *__doc_ExitAction_GetKind = R"doc()doc";
+
 static const char *__doc_ExitActionGenerator = R"doc(The ExitActionGenerator generates ExitAction%s */)doc";
 
 static const char *__doc_ExitActionGenerator_ExitActionGenerator = R"doc()doc";
@@ -675,6 +1077,10 @@ simultaneously) */)doc";
 
 static const char *__doc_Facility_GetID = R"doc(Get the id of this Facility */)doc";
 
+static const char *__doc_Facility_GetIndex =
+R"doc(Get the index of this Facility in the Location's facility list, or -1
+if it is not part of a Location */)doc";
+
 static const char *__doc_Facility_GetTasks = R"doc(Get a list of Task types that this Facility can service */)doc";
 
 static const char *__doc_Facility_GetTracks = R"doc(Get the list of Track%s of this Facility */)doc";
@@ -687,6 +1093,9 @@ R"doc(Returns true iff this Facility is active during the given time window
 
 static const char *__doc_Facility_id = R"doc()doc";
 
+static const char *__doc_Facility_index =
+R"doc(< the dense index of this Facility in its Location, or -1 */)doc";
+
 static const char *__doc_Facility_operator_eq = R"doc(Returns true iff the two Facilities have the same id */)doc";
 
 static const char *__doc_Facility_operator_ne = R"doc(Returns true iff the two Facilities do not have the same id */)doc";
@@ -705,6 +1114,257 @@ static const char *__doc_Facility_tracks = R"doc()doc";
 
 static const char *__doc_Facility_type = R"doc()doc";
 
+static const char *__doc_FeasibilityMonitor =
+R"doc(The FeasibilityMonitor detects States from which a session can no
+longer succeed, using precomputed travel times (see CalcTravelTimes)
+and the durations of the remaining Task%s. All checks are relaxations,
+so a State is only reported if failure is certain:
+
+1. Every Train of every remaining Outgoing train must be matched by a
+   Train on the shunting yard or of a remaining Incoming train (only
+   if the out_correct_order_rule is active).
+2. One of these Train%s must be able to reach the parking Track of the
+   Outgoing train, via the Facility%s for its remaining mandatory
+   service Task%s and after executing them, before the departure time
+   (if the out_correct_time_rule is active) or the end of the Scenario.
+3. If all Train%s must leave, the remaining mandatory service Task%s of
+   every type must fit in the capacity of the Facility%s until the end
+   of the Scenario (only if the capacity_facility_rule is active).
+
+Service Task%s are only taken into account if the
+mandatory_service_task_rule is active.)doc";
+
+static const char *__doc_FeasibilityMonitor_Candidate = R"doc()doc";
+
+static const char *__doc_FeasibilityMonitor_Candidate_earliest = R"doc()doc";
+
+static const char *__doc_FeasibilityMonitor_Candidate_position = R"doc()doc";
+
+static const char *__doc_FeasibilityMonitor_Candidate_tasks = R"doc()doc";
+
+static const char *__doc_FeasibilityMonitor_Candidate_train = R"doc()doc";
+
+static const char *__doc_FeasibilityMonitor_Check =
+R"doc(Throws a DeadEndException if the session of the given State can no
+longer succeed */)doc";
+
+static const char *__doc_FeasibilityMonitor_CheckCandidates = R"doc()doc";
+
+static const char *__doc_FeasibilityMonitor_FeasibilityMonitor =
+R"doc(Construct a FeasibilityMonitor for the Location with the given active
+business rules */)doc";
+
+static const char *__doc_FeasibilityMonitor_GetRequiredTime = R"doc()doc";
+
+static const char *__doc_FeasibilityMonitor_Screen =
+R"doc(Screen the Scenario for reasons why it is infeasible from the start,
+without starting a session. Next to the checks of Check for the start
+of the Scenario, this checks that:
+
+1. Every mandatory service Task of a Train that must leave can be
+   executed by a Facility (only if the correct_facility_rule is
+   active).
+2. Every Incoming and Outgoing train fits on its parking Track, and
+   the Train%s that are certainly on the shunting yard after every
+   arrival fit on all Railroad Track%s together (only if the
+   length_track_rule is active, and the in_correct_time_rule for the
+   latter).
+3. Every Incoming and Outgoing train that needs electricity has an
+   electrified parking Track (only if the electric_track_rule is
+   active).
+
+The checks of Outgoing trains that depend on their Train types require
+the out_correct_order_rule.)doc";
+
+static const char *__doc_FeasibilityMonitor_correctFacilities = R"doc()doc";
+
+static const char *__doc_FeasibilityMonitor_distances = R"doc()doc";
+
+static const char *__doc_FeasibilityMonitor_electricTracks = R"doc()doc";
+
+static const char *__doc_FeasibilityMonitor_facilityCapacity = R"doc()doc";
+
+static const char *__doc_FeasibilityMonitor_facilityTracks = R"doc()doc";
+
+static const char *__doc_FeasibilityMonitor_fixedArrivalTimes = R"doc()doc";
+
+static const char *__doc_FeasibilityMonitor_fixedDepartureTimes = R"doc()doc";
+
+static const char *__doc_FeasibilityMonitor_limitedCapacity = R"doc()doc";
+
+static const char *__doc_FeasibilityMonitor_limitedLength = R"doc()doc";
+
+static const char *__doc_FeasibilityMonitor_mandatoryServices = R"doc()doc";
+
+static const char *__doc_FeasibilityMonitor_matchTrains = R"doc()doc";
+
+static const char *__doc_FeasibilityMonitor_numberOfTracks = R"doc()doc";
+
+static const char *__doc_FeasibilityMonitor_serviceCapacity = R"doc()doc";
+
+static const char *__doc_FeasibilityMonitor_serviceTracks = R"doc()doc";
+
+static const char *__doc_FeasibilityMonitor_totalLength = R"doc()doc";
+
+static const char *__doc_Featurizer =
+R"doc(The Featurizer writes a fixed-size observation of a State into a float
+buffer.
+
+The observation consists of the following blocks, in this order: 1.
+The next nIncoming Incoming trains, ordered by time. Per train: the
+relative time, the one-hot parking Track and the one-hot TrainUnitType
+of its first nTrains Train%s. 2. The next nOutgoing Outgoing trains,
+in the same format as the Incoming trains. 3. Per railroad Track: for
+its first nShuntingUnits occupations the one-hot index of the
+ShuntingUnit in State::GetShuntingUnits, followed by whether the Track
+is reserved and its occupied length fraction. 4. The first
+nShuntingUnits ShuntingUnit%s. Per ShuntingUnit: the moving, waiting,
+in neutral and active action flags, the one-hot position, the
+direction, the one-hot TrainUnitType of its first nTrains Train%s (in
+order) and its number of remaining Task%s. 5. The relative time of the
+State.
+
+Relative times are scaled to the interval of the State, with 0 the
+start time and 1 the end time.
+
+The Featurizer also maps Action%s to a fixed index space of
+GetNumberOfActions indices: 1. Arrive for the next nIncoming Incoming
+trains, ordered by time. 2. Exit for the next nOutgoing Outgoing
+trains, ordered by time. 3. Per ShuntingUnit (the first nShuntingUnits
+in State::GetShuntingUnits): BeginMove, EndMove, Wait, Setback,
+Service, Split at split index 1 to nTrains-1, Combine with each of the
+other ShuntingUnit%s and Move to each of the railroad Track%s.)doc";
+
+static const char *__doc_Featurizer_Featurize =
+R"doc(Write the observation of the State to out, which should have room for
+GetObservationSize values */)doc";
+
+static const char *__doc_Featurizer_Featurizer = R"doc()doc";
+
+static const char *__doc_Featurizer_Featurizer_2 =
+R"doc(Construct a Featurizer for the given Location.
+
+The observation describes at most nIncoming Incoming trains, nOutgoing
+Outgoing trains, nShuntingUnits ShuntingUnit%s on the shunting yard
+and nTrains Train%s per ShuntingUnit. Train%s are encoded by the given
+TrainUnitType names. If no names are given, all the TrainUnitType%s of
+the Location are used.)doc";
+
+static const char *__doc_Featurizer_GetActionIndex =
+R"doc(Get the index of the Action in the action index space, or -1 if the
+Action has no index */)doc";
+
+static const char *__doc_Featurizer_GetActionMask =
+R"doc(Set out[i] to true for the index i of every given Action, and to false
+for all other indices. out should have room for GetNumberOfActions
+values */)doc";
+
+static const char *__doc_Featurizer_GetNumberOfActions =
+R"doc(Get the size of the action index space */)doc";
+
+static const char *__doc_Featurizer_GetNumberOfIncoming =
+R"doc(Get the maximum number of Incoming trains in the observation */)doc";
+
+static const char *__doc_Featurizer_GetNumberOfOutgoing =
+R"doc(Get the maximum number of Outgoing trains in the observation */)doc";
+
+static const char *__doc_Featurizer_GetNumberOfShuntingUnitActions =
+R"doc(Get the number of actions per ShuntingUnit in the action index space
+*/)doc";
+
+static const char *__doc_Featurizer_GetNumberOfShuntingUnits =
+R"doc(Get the maximum number of ShuntingUnit%s in the observation */)doc";
+
+static const char *__doc_Featurizer_GetNumberOfTrains =
+R"doc(Get the maximum number of Train%s per ShuntingUnit in the observation
+*/)doc";
+
+static const char *__doc_Featurizer_GetObservationSize =
+R"doc(Get the number of values in an observation */)doc";
+
+static const char *__doc_Featurizer_GetSimpleAction =
+R"doc(Get the SimpleAction for the given index of the action index space.
+The caller owns the result */)doc";
+
+static const char *__doc_Featurizer_GetTrackSlot =
+R"doc(Get the slot of the Track in GetTracks, or -1 if the Track is not a
+railroad */)doc";
+
+static const char *__doc_Featurizer_GetTracks =
+R"doc(Get the railroad Track%s, in the order used in the observation */)doc";
+
+static const char *__doc_Featurizer_GetTrainTypes =
+R"doc(Get the TrainUnitType names, in the order used in the observation */)doc";
+
+static const char *__doc_Featurizer_SortByTime = R"doc()doc";
+
+static const char *__doc_Featurizer_WriteGoals = R"doc()doc";
+
+static const char *__doc_Featurizer_WriteTime = R"doc()doc";
+
+static const char *__doc_Featurizer_WriteTrack = R"doc()doc";
+
+static const char *__doc_Featurizer_WriteTrains = R"doc()doc";
+
+static const char *__doc_Featurizer_goalSize = R"doc()doc";
+
+static const char *__doc_Featurizer_location = R"doc()doc";
+
+static const char *__doc_Featurizer_nActions = R"doc()doc";
+
+static const char *__doc_Featurizer_nIncoming = R"doc()doc";
+
+static const char *__doc_Featurizer_nOutgoing = R"doc()doc";
+
+static const char *__doc_Featurizer_nShuntingUnitActions = R"doc()doc";
+
+static const char *__doc_Featurizer_nShuntingUnits = R"doc()doc";
+
+static const char *__doc_Featurizer_nTrains = R"doc()doc";
+
+static const char *__doc_Featurizer_observationSize = R"doc()doc";
+
+static const char *__doc_Featurizer_shuntingUnitSize = R"doc()doc";
+
+static const char *__doc_Featurizer_trackSize = R"doc()doc";
+
+static const char *__doc_Featurizer_trackSlots = R"doc()doc";
+
+static const char *__doc_Featurizer_tracks = R"doc()doc";
+
+static const char *__doc_Featurizer_trainSize = R"doc()doc";
+
+static const char *__doc_Featurizer_trainTypeIndex = R"doc()doc";
+
+static const char *__doc_Featurizer_trainTypes = R"doc()doc";
+
+static const char *__doc_GetHeuristicScore =
+R"doc(Get the heuristic score of the State. The score combines the number of
+Train%s that left, the time until the departure of the remaining
+Outgoing trains, the number of remaining Task%s and the summed
+shortest path lengths from the ShuntingUnit%s to their next target: a
+Track of a Facility for their first remaining Task, or the parking
+Track of a matching Outgoing train.
+
+The distance term requires LocationEngine::CalcShortestPaths.)doc";
+
+static const char *__doc_GetLocationID =
+R"doc(Get the identity of a Location as it is stored in a snapshot: the name
+of its folder and the hash of its protobuf file. Unlike the path, the
+identity is the same for a copy of the Location in another folder or
+on another host.)doc";
+
+static const char *__doc_GetRolloutPriority =
+R"doc(Get the priority of an Action of the given ActionKind for the Greedy
+and Mix RolloutPolicy */)doc";
+
+static const char *__doc_GetSnapshotLocation =
+R"doc(Get the (canonical) location string of a snapshot, see
+LocationEngine::SaveState. It is used to find the Location */)doc";
+
+static const char *__doc_GetSnapshotLocationID =
+R"doc(Get the identity of the Location of a snapshot, see GetLocationID */)doc";
+
 static const char *__doc_Incoming = R"doc(Describes a future Incoming ShuntingUnit)doc";
 
 static const char *__doc_Incoming_Incoming = R"doc()doc";
@@ -713,7 +1373,9 @@ static const char *__doc_Incoming_Incoming_2 = R"doc(Construct an Incoming objec
 
 static const char *__doc_Incoming_Incoming_3 = R"doc(Construct an Incoming object from the given parameters */)doc";
 
-static const char *__doc_Incoming_Incoming_4 = R"doc(Construct an Incoming object from the given protobuf object */)doc";
+static const char *__doc_Incoming_Incoming_4 =
+R"doc(Construct an Incoming object from the given protobuf object, looking
+up the TrainUnitType%s in types */)doc";
 
 static const char *__doc_Incoming_Incoming_5 = R"doc(Copy constructor */)doc";
 
@@ -791,7 +1453,70 @@ static const char *__doc_Location =
 R"doc(A Location describes a shunting yard.
 
 It contains a list of Track%s and Facilities. It also has helper
-functions to find (shortest) Path%s and distances)doc";
+functions to find (shortest) Path%s and distances
+
+A Location is immutable after loading, except for the path tables that
+are calculated on request. Use Location::GetShared to share one
+Location between several engines.)doc";
+
+static const char *__doc_Location_AddTrainUnitTypes =
+R"doc(Add the TrainUnitType%s to this Location, unless a TrainUnitType with
+the same name is already known. Returns all TrainUnitType%s of this
+Location by name)doc";
+
+static const char *__doc_Location_GetEdgeDuration =
+R"doc(Get the duration of moving from a Track onto its neighbor to, as used
+by GetDistance.
+
+This is the duration of to by type, or the distance between the
+Track%s in the distance matrix (0 if unknown))doc";
+
+static const char *__doc_Location_GetFileHash =
+R"doc(Get the hash of the contents of the protobuf file, see GetShared */)doc";
+
+static const char *__doc_Location_GetGraph =
+R"doc(Get the track part graph of this Location. It is built on the first
+call and shared afterwards */)doc";
+
+static const char *__doc_Location_GetMemoryUsage =
+R"doc(Get an estimate of the memory used by this Location and its path
+tables, in bytes */)doc";
+
+static const char *__doc_Location_GetShared =
+R"doc(Get the Location described in the given folder, shared with all other
+users of the same Location.
+
+Locations are identified by their folder, the contents of their
+protobuf file and byType. A shared Location is loaded once and
+destroyed when its last user releases it.)doc";
+
+static const char *__doc_Location_GetTrainUnitTypes =
+R"doc(Get all the TrainUnitType%s of this Location by name */)doc";
+
+static const char *__doc_Location_fileHash = R"doc()doc";
+
+static const char *__doc_Location_graph =
+R"doc(The track part graph, built on first request */)doc";
+
+static const char *__doc_Location_graphOnce = R"doc(Guards the construction of graph */)doc";
+
+static const char *__doc_Location_pathMutex =
+R"doc(Guards the calculation of the path tables. The neighboring and
+possible paths are calculated when the Location is constructed, so
+they are read without locking)doc";
+
+static const char *__doc_Location_sharedLocations = R"doc()doc";
+
+static const char *__doc_Location_sharedLocationsMutex = R"doc()doc";
+
+static const char *__doc_Location_shortestPathMutex =
+R"doc(Guards shortestPath, which is read while the shortest paths for
+another setbackTime are calculated */)doc";
+
+static const char *__doc_Location_trainUnitTypes =
+R"doc(The TrainUnitType%s used in the scenarios of this Location, by name */)doc";
+
+static const char *__doc_Location_typeMutex = R"doc(Guards trainUnitTypes */)doc";
 
 static const char *__doc_LocationEngine = R"doc(A TORS engine for a specific Location)doc";
 
@@ -809,6 +1534,10 @@ static const char *__doc_LocationEngine_ApplyActionAndStep_2 =
 R"doc(Apply the SimpleAction to the State and go to the next step in the
 simulation */)doc";
 
+static const char *__doc_LocationEngine_ApplyActionByIndex =
+R"doc(Apply the valid Action at the given index of GetValidActions (or
+GetValidActionTable) to the State */)doc";
+
 static const char *__doc_LocationEngine_ApplyWaitAllUntil = R"doc(Apply Wait actions for all non-waiting trains until the given time */)doc";
 
 static const char *__doc_LocationEngine_CalcAllPossiblePaths =
@@ -819,6 +1548,20 @@ static const char *__doc_LocationEngine_CalcShortestPaths =
 R"doc(Calculate all the shortest paths (run this once before requesting
 shortest paths) */)doc";
 
+static const char *__doc_LocationEngine_ClearLowerBoundTable = R"doc()doc";
+
+static const char *__doc_LocationEngine_ClearValidActions = R"doc()doc";
+
+static const char *__doc_LocationEngine_CopySession =
+R"doc(Copy the session that belongs to the source State to the session of
+the target State, by resetting the target session to the Scenario of
+the source (see ResetSession) and replaying the RunResult of the
+source session. A new session is started for the copy if no target
+State is given.
+
+Returns:
+    the target State)doc";
+
 static const char *__doc_LocationEngine_EndSession = R"doc(End the session that belongs to the given State */)doc";
 
 static const char *__doc_LocationEngine_EvaluatePlan = R"doc(Evaluate the given POSPlan for the given Scenario */)doc";
@@ -829,22 +1572,91 @@ static const char *__doc_LocationEngine_ExecuteImmediateEvents = R"doc()doc";
 
 static const char *__doc_LocationEngine_GenerateAction = R"doc(Generate an Action from the given SimpleAction */)doc";
 
+static const char *__doc_LocationEngine_GetBusinessRuleNames =
+R"doc(Get the names of the active business rules, in the order used by the
+reason codes of ValidateMany */)doc";
+
+static const char *__doc_LocationEngine_GetFeasibilityMonitor =
+R"doc(Get the FeasibilityMonitor of this LocationEngine, and construct it on
+first use */)doc";
+
 static const char *__doc_LocationEngine_GetLocation = R"doc(Get a reference to the Location of this Engine */)doc";
 
+static const char *__doc_LocationEngine_GetLocationString =
+R"doc(Get the location string of this Engine, which is the folder of its
+Location */)doc";
+
+static const char *__doc_LocationEngine_GetLowerBoundTable =
+R"doc(Get the LowerBoundTable for the Scenario of the session that belongs
+to the given State. The table is built when it is first used, and is
+kept until the session ends or its Scenario changes (see ResetSession
+and LoadState).)doc";
+
 static const char *__doc_LocationEngine_GetPath = R"doc(Get a path for the Move */)doc";
 
+static const char *__doc_LocationEngine_GetPruningRuleNames =
+R"doc(Get the names of the active pruning rules, see
+ActionManager::GetPruningRuleNames */)doc";
+
 static const char *__doc_LocationEngine_GetResult = R"doc(Get the RunResult for the given State/session */)doc";
 
 static const char *__doc_LocationEngine_GetScenario = R"doc(Get the Scenario given in the file path */)doc";
 
-static const char *__doc_LocationEngine_GetValidActions = R"doc(Get a list of valid Action%s for the given State */)doc";
+static const char *__doc_LocationEngine_GetSessionID =
+R"doc(Get the id of the session that belongs to the given State, which is
+unique among all the sessions in this process */)doc";
+
+static const char *__doc_LocationEngine_GetSharedLocation =
+R"doc(Get the shared pointer to the Location of this Engine, see
+Location::GetShared */)doc";
+
+static const char *__doc_LocationEngine_GetSymmetryClasses =
+R"doc(Get the symmetry classes of the valid Action%s of the given State, see
+SetSymmetryReduction.
+
+Returns:
+    one class per Action of GetValidActions, in the same order. Every
+    class starts with that Action, followed by the Action%s that are
+    symmetric to it. Without symmetry reduction every class contains one
+    Action)doc";
+
+static const char *__doc_LocationEngine_GetValidAction =
+R"doc(Get the valid Action at the given index of GetValidActions */)doc";
+
+static const char *__doc_LocationEngine_GetValidActionTable =
+R"doc(Get the valid Action%s for the given State as a table, with one
+ActionRow per Action in the order of GetValidActions.
+
+The train IDs of every row are stored in trainIDs, starting at the
+row's trainOffset.)doc";
+
+static const char *__doc_LocationEngine_GetValidActions =
+R"doc(Get a list of valid Action%s for the given State. If symmetry
+reduction is active, only one Action per symmetry class is listed, see
+SetSymmetryReduction */)doc";
+
+static const char *__doc_LocationEngine_HasSession =
+R"doc(Returns true iff the given State belongs to a session of this
+LocationEngine */)doc";
 
 static const char *__doc_LocationEngine_ImportResult = R"doc(Import a RunResult from a protobuf file */)doc";
 
+static const char *__doc_LocationEngine_IsFeasibilityMonitorActive =
+R"doc(Returns true iff the FeasibilityMonitor is active, see
+SetFeasibilityMonitor */)doc";
+
+static const char *__doc_LocationEngine_IsIdle =
+R"doc(Returns true iff there are no active sessions in this LocationEngine
+*/)doc";
+
 static const char *__doc_LocationEngine_IsStateActive =
 R"doc(Returns true iff the given state is still active (ie the scenario is
 not ended or failed yet) */)doc";
 
+static const char *__doc_LocationEngine_IsSymmetryReductionActive =
+R"doc(Returns true iff symmetry reduction is active, see
+SetSymmetryReduction */)doc";
+
 static const char *__doc_LocationEngine_IsValidAction =
 R"doc(Checks if the given SimpleAction is valid in the given State or not.
 If not provides a reason why.)doc";
@@ -853,30 +1665,156 @@ static const char *__doc_LocationEngine_IsValidAction_2 =
 R"doc(Checks if the given Action is valid in the given State or not. If not
 provides a reason why.)doc";
 
+static const char *__doc_LocationEngine_LoadScenario =
+R"doc(Load the Scenario given in the file path without storing it in this
+Engine. The caller owns the result */)doc";
+
+static const char *__doc_LocationEngine_LoadState =
+R"doc(Restore the session of a snapshot that was saved by SaveState into the
+session of the target State, or into a new session if no target State
+is given. Unlike RestoreSession, no Action%s are replayed, and the
+restored session generates the same valid Action%s in the same order
+as the saved session. The Location is identified by GetLocationID, so
+a snapshot can be loaded by an engine for a copy of the Location in
+another folder. An invalid_argument exception is thrown if the
+snapshot is invalid or belongs to another location. In that case, the
+target session is unchanged if the location or the Scenario of the
+snapshot is invalid, and otherwise it is reset to the start of the
+Scenario of the snapshot (see ResetSession).
+
+Returns:
+    the target State)doc";
+
 static const char *__doc_LocationEngine_LocationEngine = R"doc()doc";
 
 static const char *__doc_LocationEngine_LocationEngine_2 =
 R"doc(Construct a LocationEngine based on the configuration files found in
 the given folder */)doc";
 
+static const char *__doc_LocationEngine_LocationEngine_3 =
+R"doc(Construct a LocationEngine for the Location in the folder path, with
+the config.json found in the folder configPath.
+
+The Location is shared with all other engines for the same Location,
+see Location::GetShared)doc";
+
+static const char *__doc_LocationEngine_ReduceSymmetry = R"doc()doc";
+
+static const char *__doc_LocationEngine_ResetSession =
+R"doc(Reset the session that belongs to the given State to a new session for
+the given Scenario, and Step it to the first decision. The State is
+reused and restored in place.
+
+The first Step of a Scenario only depends on the times of its Incoming
+and Outgoing trains. The time and the remaining Event%s after the
+first Step are therefore cached per combination of these times, so
+that the first Step is only executed once for Scenario%s that are
+reset often. At most maxInitialStates combinations are cached.)doc";
+
+static const char *__doc_LocationEngine_RestoreSession =
+R"doc(Restore the session of the given RunResult to the session of the
+target State, by resetting the target session to the Scenario of the
+RunResult (see ResetSession) and replaying its plan. A new session is
+started if no target State is given.
+
+Returns:
+    the target State)doc";
+
+static const char *__doc_LocationEngine_SaveState =
+R"doc(Save the session that belongs to the given State to a compact binary
+snapshot, that can be restored with LoadState. The snapshot contains
+the canonical location string, the identity of the Location (see
+GetLocationID) and the Scenario of the session, and the mutable part
+of the session relative to the Scenario: the time, the remaining
+Incoming and Outgoing trains, the ShuntingUnit%s with their position,
+status and Task%s, the Track reservations, the active Action%s, the
+EventQueue and the plan so far. The format is versioned, see
+snapshotVersion.)doc";
+
+static const char *__doc_LocationEngine_ScreenScenario =
+R"doc(Screen the Scenario for reasons why it is infeasible from the start,
+see FeasibilityMonitor::Screen */)doc";
+
+static const char *__doc_LocationEngine_SetFeasibilityMonitor =
+R"doc(Activate or deactivate the FeasibilityMonitor, that is evaluated after
+every Step. The travel times of the monitor are calculated when it is
+activated, so this should not be called while other threads use this
+LocationEngine.)doc";
+
+static const char *__doc_LocationEngine_SetSymmetryReduction =
+R"doc(Activate or deactivate symmetry reduction of the valid Action%s. If
+active, GetValidActions lists only the first generated Action of every
+symmetry class. Two Action%s are symmetric if they are of the same
+kind, have the same duration, employees, reserved Track%s and
+parameters (such as the route, the Outgoing train or the split index),
+and their ShuntingUnit%s are interchangeable. ShuntingUnit%s are
+interchangeable if:
+
+1. Their Train%s have the same TrainUnitType%s, in the order of their
+   direction.
+2. None of their Train%s has a remaining or active Task.
+3. Their Train%s have the same goal: the same matching Outgoing train,
+   or none if their IDs are not matched.
+4. They are in an equivalent position: on the same Track, coming from
+   the same previous Track, with the same status (moving, waiting, in
+   neutral) and with the same free sides of the Track.
+
+The classes are available through GetSymmetryClasses. Changing the
+mode regenerates the valid Action%s of all active sessions.)doc";
+
 static const char *__doc_LocationEngine_StartSession =
 R"doc(Start a session for the given Scenario and generate an initial State
 */)doc";
 
-static const char *__doc_LocationEngine_Step = R"doc(Go to the next Step in the simulation and update the State */)doc";
+static const char *__doc_LocationEngine_Step =
+R"doc(Go to the next Step in the simulation and update the State.
+
+If the feasibility monitor is active, a DeadEndException is thrown as
+soon as the session can no longer succeed, see SetFeasibilityMonitor.)doc";
+
+static const char *__doc_LocationEngine_ValidateMany =
+R"doc(Check the validity of all the given SimpleAction%s in the given State
+at once.
+
+Returns:
+    a reason code for every SimpleAction, see ValidationCode)doc";
 
 static const char *__doc_LocationEngine_actionManager = R"doc()doc";
 
 static const char *__doc_LocationEngine_config = R"doc()doc";
 
+static const char *__doc_LocationEngine_feasibilityMonitor = R"doc()doc";
+
+static const char *__doc_LocationEngine_initialStates = R"doc()doc";
+
 static const char *__doc_LocationEngine_location = R"doc()doc";
 
+static const char *__doc_LocationEngine_lowerBoundMutex =
+R"doc(Guards lowerBoundTables, which is used by searches in several threads
+*/)doc";
+
+static const char *__doc_LocationEngine_lowerBoundTables =
+R"doc(The LowerBoundTable%s of the sessions, which are built when they are
+first used, see GetLowerBoundTable */)doc";
+
+static const char *__doc_LocationEngine_maxInitialStates =
+R"doc(The maximum number of initial States that are cached by ResetSession
+*/)doc";
+
+static const char *__doc_LocationEngine_monitorFeasibility = R"doc()doc";
+
 static const char *__doc_LocationEngine_path = R"doc()doc";
 
+static const char *__doc_LocationEngine_reduceSymmetry = R"doc()doc";
+
 static const char *__doc_LocationEngine_results = R"doc()doc";
 
 static const char *__doc_LocationEngine_scenarios = R"doc()doc";
 
+static const char *__doc_LocationEngine_sessionCounter = R"doc()doc";
+
+static const char *__doc_LocationEngine_sessionIDs = R"doc()doc";
+
 static const char *__doc_LocationEngine_stateActionMap = R"doc()doc";
 
 static const char *__doc_Location_CalcAllPossiblePaths =
@@ -964,6 +1902,9 @@ calculate all the shortest paths)doc";
 
 static const char *__doc_Location_GetTrackByID = R"doc(Get a reference to the Track by its id */)doc";
 
+static const char *__doc_Location_GetTrackByIndex =
+R"doc(Get a reference to the Track by its index in the list of Track%s */)doc";
+
 static const char *__doc_Location_GetTracks = R"doc(Get all the Track%s */)doc";
 
 static const char *__doc_Location_ImportDistanceMatrix = R"doc()doc";
@@ -980,7 +1921,13 @@ R"doc(Construct a Location from a protobuf file
 The parameter byType determines if distances are calculated by
 TrackPartType or by using the distance matrix)doc";
 
-static const char *__doc_Location_Location_3 = R"doc(Default copy constructor */)doc";
+static const char *__doc_Location_Location_3 =
+R"doc(Locations own their Track%s, Facilities and TrainUnitType%s, and are
+shared instead of copied */)doc";
+
+static const char *__doc_Location_ResolveTrack =
+R"doc(Get a reference to the Track by its index, if the Track at that index
+has the given id. Otherwise the Track is looked up by its id.)doc";
 
 static const char *__doc_Location_byType = R"doc()doc";
 
@@ -1012,6 +1959,169 @@ static const char *__doc_Location_trackIndex = R"doc(All the tracks indexed by t
 
 static const char *__doc_Location_tracks = R"doc()doc";
 
+static const char *__doc_LocationEngine_symmetryClasses = R"doc()doc";
+
+static const char *__doc_LocationGraph =
+R"doc(The track part graph of a Location in compressed sparse row (CSR)
+form.
+
+The nodes are all the Track%s of the Location, in the order of
+Location::GetTracks (so node i is the Track with index i). Node u has
+an edge to every neighbor v, first to its A-side Track%s and then to
+its B-side Track%s. The edges of node u are the entries GetIndptr()[u]
+up to GetIndptr()[u+1] of the edge arrays. The duration of an edge is
+the duration of moving onto Track v, see Location::GetEdgeDuration.
+
+The direction of movement is described by the transitions between
+edges: a ShuntingUnit that moved over edge (u, v) can continue over
+edge (v, w) for every Track w in Track::GetNextTrackParts of v with u
+as previous Track. The transitions are also stored in CSR form, with
+one row per edge.
+
+Use Location::GetGraph to get the shared LocationGraph of a Location.)doc";
+
+static const char *__doc_LocationGraph_FeaturizeNodes =
+R"doc(Write the dynamic features of every node in the given State into out,
+which should have room for GetNumberOfNodes() * numberOfNodeFeatures
+values.
+
+Per node, the features are the number of ShuntingUnit%s on the Track,
+the occupied fraction of its length, whether the Track is reserved,
+the number of moving ShuntingUnit%s on the Track and the number of
+remaining Task%s of the Train%s on the Track.)doc";
+
+static const char *__doc_LocationGraph_FindEdge = R"doc()doc";
+
+static const char *__doc_LocationGraph_GetEdgeDurations =
+R"doc(Get the duration of every edge */)doc";
+
+static const char *__doc_LocationGraph_GetEdgeSides =
+R"doc(Get for every edge whether its target is an A-side (0) or a B-side (1)
+neighbor of its source */)doc";
+
+static const char *__doc_LocationGraph_GetElectrified =
+R"doc(Get for every node whether it is electrified */)doc";
+
+static const char *__doc_LocationGraph_GetFacilityIDs =
+R"doc(Get the Facility ids of every node */)doc";
+
+static const char *__doc_LocationGraph_GetFacilityIndptr =
+R"doc(Get the row pointers of the facilities, with GetNumberOfNodes()+1
+values */)doc";
+
+static const char *__doc_LocationGraph_GetIndices = R"doc(Get the target node of every edge */)doc";
+
+static const char *__doc_LocationGraph_GetIndptr =
+R"doc(Get the row pointers of the edges, with GetNumberOfNodes()+1 values */)doc";
+
+static const char *__doc_LocationGraph_GetLengths = R"doc(Get the length of every node */)doc";
+
+static const char *__doc_LocationGraph_GetNumberOfEdges =
+R"doc(Get the number of directed edges */)doc";
+
+static const char *__doc_LocationGraph_GetNumberOfNodes =
+R"doc(Get the number of nodes (Track%s) */)doc";
+
+static const char *__doc_LocationGraph_GetParkingAllowed =
+R"doc(Get for every node whether parking is allowed */)doc";
+
+static const char *__doc_LocationGraph_GetSawMovementAllowed =
+R"doc(Get for every node whether saw movements are allowed */)doc";
+
+static const char *__doc_LocationGraph_GetTransitionIndices =
+R"doc(Get the edge index that every transition continues with */)doc";
+
+static const char *__doc_LocationGraph_GetTransitionIndptr =
+R"doc(Get the row pointers of the transitions, with GetNumberOfEdges()+1
+values */)doc";
+
+static const char *__doc_LocationGraph_GetTypes = R"doc(Get the TrackPartType of every node */)doc";
+
+static const char *__doc_LocationGraph_LocationGraph = R"doc()doc";
+
+static const char *__doc_LocationGraph_LocationGraph_2 =
+R"doc(Construct the LocationGraph of the given Location */)doc";
+
+static const char *__doc_LocationGraph_edgeDurations = R"doc()doc";
+
+static const char *__doc_LocationGraph_edgeSides = R"doc()doc";
+
+static const char *__doc_LocationGraph_electrified = R"doc()doc";
+
+static const char *__doc_LocationGraph_facilityIDs = R"doc()doc";
+
+static const char *__doc_LocationGraph_facilityIndptr = R"doc()doc";
+
+static const char *__doc_LocationGraph_indices = R"doc()doc";
+
+static const char *__doc_LocationGraph_indptr = R"doc()doc";
+
+static const char *__doc_LocationGraph_lengths = R"doc()doc";
+
+static const char *__doc_LocationGraph_numberOfNodeFeatures =
+R"doc(The number of dynamic features per node, see FeaturizeNodes */)doc";
+
+static const char *__doc_LocationGraph_parkingAllowed = R"doc()doc";
+
+static const char *__doc_LocationGraph_sawMovementAllowed = R"doc()doc";
+
+static const char *__doc_LocationGraph_tracks = R"doc()doc";
+
+static const char *__doc_LocationGraph_transitionIndices = R"doc()doc";
+
+static const char *__doc_LocationGraph_transitionIndptr = R"doc()doc";
+
+static const char *__doc_LocationGraph_types = R"doc()doc";
+
+static const char *__doc_LowerBoundTable =
+R"doc(The LowerBoundTable stores precomputed data of a Scenario to compute
+an admissible lower bound on the cost (see AStarResult::cost) to
+handle all Incoming and Outgoing trains from a State in O(#units).
+
+The table contains the minimum travel time between every pair of
+Railroad Track%s, where setbacks are free and the direction is
+ignored, the Track%s of the Facility%s for every Task type and the
+candidate exit Track%s of every Train. Service Task%s are only taken
+into account if the mandatory_service_task_rule is active, and exit
+Track%s only if the out_correct_track_rule is active.)doc";
+
+static const char *__doc_LowerBoundTable_GetDistance =
+R"doc(Get the minimum travel time from one Railroad Track to another, or
+MAX_PATH_LENGTH if there is no path */)doc";
+
+static const char *__doc_LowerBoundTable_GetLowerBound =
+R"doc(Get a lower bound on the cost to handle all Incoming and Outgoing
+trains from the given State. The bound is the summed duration of the
+remaining mandatory service Task%s plus the maximum over all Train%s
+of the travel time to their exit Track via the Facility%s for each of
+their remaining mandatory service Task%s.
+
+Returns:
+    the lower bound, or infinity if the remaining mandatory service
+    Task%s of a type cannot be executed before the end of the Scenario
+    by the Facility%s that execute that type, or if a Train cannot
+    reach its targets)doc";
+
+static const char *__doc_LowerBoundTable_GetTrainBound = R"doc()doc";
+
+static const char *__doc_LowerBoundTable_LowerBoundTable =
+R"doc(Construct the LowerBoundTable for the given Scenario in the Location
+of the given LocationEngine */)doc";
+
+static const char *__doc_LowerBoundTable_distances = R"doc()doc";
+
+static const char *__doc_LowerBoundTable_exitTracks = R"doc()doc";
+
+static const char *__doc_LowerBoundTable_fixedExitTracks = R"doc()doc";
+
+static const char *__doc_LowerBoundTable_mandatoryServices = R"doc()doc";
+
+static const char *__doc_LowerBoundTable_numberOfTracks = R"doc()doc";
+
+static const char *__doc_LowerBoundTable_serviceCapacity = R"doc()doc";
+
+static const char *__doc_LowerBoundTable_serviceTracks = R"doc()doc";
+
 static const char *__doc_Move =
 R"doc(The Move action moves a ShuntingUnit from one Track to a neighboring
 Railroad Track.)doc";
@@ -1020,6 +2130,8 @@ static const char *__doc_MoveAction =
 R"doc(The MoveAction moves a ShuntingUnit from one Track to a neighboring
 Railroad Track.)doc";
 
+static const char *__doc_MoveAction_GetKind = R"doc()doc";
+
 static const char *__doc_MoveActionGenerator = R"doc(The MoveActionGenerator generates MoveAction%s */)doc";
 
 static const char *__doc_MoveActionGenerator_Generate = R"doc()doc";
@@ -1099,6 +2211,9 @@ static const char *__doc_Move_Clone = R"doc()doc";
 
 static const char *__doc_Move_GetDestinationID = R"doc(Get the id of the destination track */)doc";
 
+static const char *__doc_Move_GetDestinationIndex =
+R"doc(Get the index of the destination track, or -1 if unknown */)doc";
+
 static const char *__doc_Move_GetGeneratorName = R"doc()doc";
 
 static const char *__doc_Move_Move = R"doc()doc";
@@ -1119,6 +2234,8 @@ static const char *__doc_Move_Move_5 = R"doc(Default copy constructor */)doc";
 
 static const char *__doc_Move_destinationID = R"doc()doc";
 
+static const char *__doc_Move_destinationIndex = R"doc()doc";
+
 static const char *__doc_Move_toString = R"doc()doc";
 
 static const char *__doc_MultiMove =
@@ -1133,6 +2250,9 @@ static const char *__doc_MultiMove_GetGeneratorName = R"doc()doc";
 
 static const char *__doc_MultiMove_GetTrackIDs = R"doc(Get the Track IDs of the route */)doc";
 
+static const char *__doc_MultiMove_GetTrackIndices =
+R"doc(Get the Track indices of the route, or an empty vector if unknown */)doc";
+
 static const char *__doc_MultiMove_MultiMove = R"doc()doc";
 
 static const char *__doc_MultiMove_MultiMove_2 =
@@ -1161,6 +2281,8 @@ static const char *__doc_MultiMove_toString = R"doc()doc";
 
 static const char *__doc_MultiMove_trackIDs = R"doc()doc";
 
+static const char *__doc_MultiMove_trackIndices = R"doc()doc";
+
 static const char *__doc_NonExistingPathException =
 R"doc(Raise this exception when trying to find a non-existing Path in the
 shunting yard */)doc";
@@ -1187,7 +2309,9 @@ static const char *__doc_Outgoing_Outgoing_2 = R"doc(Construct an Outgoing objec
 
 static const char *__doc_Outgoing_Outgoing_3 = R"doc(Construct an Outgoing object from the given parameters */)doc";
 
-static const char *__doc_Outgoing_Outgoing_4 = R"doc(Construct an Outgoing object from the given protobuf object */)doc";
+static const char *__doc_Outgoing_Outgoing_4 =
+R"doc(Construct an Outgoing object from the given protobuf object, looking
+up the TrainUnitType%s in types */)doc";
 
 static const char *__doc_Outgoing_Outgoing_5 = R"doc(Copy constructor */)doc";
 
@@ -1216,9 +2340,12 @@ static const char *__doc_POSAction_GetSuggestedStart = R"doc(Get the suggested s
 
 static const char *__doc_POSAction_POSAction = R"doc()doc";
 
-static const char *__doc_POSAction_POSAction_2 = R"doc(Construct a POSAction from the given parameters */)doc";
+static const char *__doc_POSAction_POSAction_2 =
+R"doc(Construct a POSAction from the given parameters. The POSAction takes
+ownership of the action */)doc";
 
-static const char *__doc_POSAction_POSAction_3 = R"doc(Copy constructor */)doc";
+static const char *__doc_POSAction_POSAction_3 =
+R"doc(Copy constructor. The copy shares the (immutable) SimpleAction */)doc";
 
 static const char *__doc_POSAction_Serialize = R"doc(Serialize this POSAction to a protobuf object */)doc";
 
@@ -1228,7 +2355,8 @@ static const char *__doc_POSAction_id = R"doc()doc";
 
 static const char *__doc_POSAction_minDuration = R"doc()doc";
 
-static const char *__doc_POSAction_operator_assign = R"doc(Assignment operator */)doc";
+static const char *__doc_POSAction_operator_assign =
+R"doc(Assignment operator. The SimpleAction is shared */)doc";
 
 static const char *__doc_POSAction_suggestedEnd = R"doc()doc";
 
@@ -1315,6 +2443,79 @@ position to end position */)doc";
 
 static const char *__doc_Path_toString = R"doc(Get a string representation of this path */)doc";
 
+static const char *__doc_PlayRollouts =
+R"doc(Play n rollouts from the given State until no valid Action remains,
+the session fails, or maxSteps Action%s are applied.
+
+The given State is not changed. Every rollout starts from a copy of
+its session, see LocationEngine::CopySession. The rollouts are divided
+over nThreads threads, or one per hardware thread if nThreads <= 0.
+Rollout i uses random seed seed + i, so the result does not depend on
+the number of threads. The LocationEngine should not be used by other
+threads meanwhile.
+
+The score of a rollout is 0 if it failed or not all Incoming trains
+arrived, and otherwise the fraction of the Train%s of the Scenario
+that left the shunting yard. The best rollout is the first rollout
+with the highest score.)doc";
+
+static const char *__doc_PruningRule =
+R"doc(Abstract base class for all the pruning rules. The ActionManager
+applies the active pruning rules (see Config::IsPruningRuleActive) to
+the valid Action%s, in order to remove Action%s that are dominated by
+other valid Action%s.)doc";
+
+static const char *__doc_PruningRule_Prune =
+R"doc(Remove and delete the dominated Action%s from the valid Action%s of
+the given State */)doc";
+
+static const char *__doc_PruningRule_PruningRule = R"doc()doc";
+
+static const char *__doc_PruningRule_PruningRule_2 =
+R"doc(Construct this PruningRule based on the parameters defined in the json
+object */)doc";
+
+static const char *__doc_PruningRule_location = R"doc(< a reference to the Location object */)doc";
+
+static const char *__doc_RolloutPolicy =
+R"doc(The policies for choosing an Action in a rollout, see PlayRollouts */)doc";
+
+static const char *__doc_RolloutPolicy_Greedy =
+R"doc(< Choose the valid Action with the highest priority (see
+GetRolloutPriority), breaking ties at random */)doc";
+
+static const char *__doc_RolloutPolicy_Mix =
+R"doc(< Choose a valid Action at random, with a probability proportional to
+its priority */)doc";
+
+static const char *__doc_RolloutPolicy_Random =
+R"doc(< Choose a valid Action uniformly at random */)doc";
+
+static const char *__doc_RolloutResult =
+R"doc(The aggregated outcome of a number of rollouts, see PlayRollouts */)doc";
+
+static const char *__doc_RolloutResult_bestPlan =
+R"doc(< The POSAction%s that the best rollout applied after the given State,
+if requested */)doc";
+
+static const char *__doc_RolloutResult_bestScore = R"doc(< The highest score of a rollout */)doc";
+
+static const char *__doc_RolloutResult_meanEndTime =
+R"doc(< The mean time at the end of a rollout */)doc";
+
+static const char *__doc_RolloutResult_meanScore = R"doc(< The mean score of the rollouts */)doc";
+
+static const char *__doc_RolloutResult_meanTrainsLeft =
+R"doc(< The mean number of Train%s in the remaining Outgoing trains at the
+end of a rollout */)doc";
+
+static const char *__doc_RolloutResult_numberOfRollouts =
+R"doc(< The number of rollouts that were played */)doc";
+
+static const char *__doc_RolloutResult_numberOfSuccesses =
+R"doc(< The number of rollouts that handled all the Incoming and Outgoing
+trains */)doc";
+
 static const char *__doc_RunResult =
 R"doc(A RunResult describes a TORS session
 
@@ -1388,11 +2589,33 @@ static const char *__doc_ScenarioFailedException_what = R"doc()doc";
 
 static const char *__doc_Scenario_AddDisturbance = R"doc(Add a Disturbance to this Scenario (not yet implemented) */)doc";
 
-static const char *__doc_Scenario_AddEmployee = R"doc(Add an Employee to this Scenario (not yet implemented) */)doc";
+static const char *__doc_Scenario_AddEmployee =
+R"doc(Add an Employee to this Scenario (not yet implemented). The Scenario
+takes ownership of the Employee */)doc";
+
+static const char *__doc_Scenario_AddIncomingTrain =
+R"doc(Add an Incoming train to this Scenario. The Scenario takes ownership
+of the Incoming train */)doc";
+
+static const char *__doc_Scenario_AddOutgoingTrain =
+R"doc(Add an Outgoing train to this Scenario. The Scenario takes ownership
+of the Outgoing train */)doc";
+
+static const char *__doc_Scenario_Adopt = R"doc()doc";
 
-static const char *__doc_Scenario_AddIncomingTrain = R"doc(Add an Incoming train to this Scenario */)doc";
+static const char *__doc_Scenario_Detach = R"doc()doc";
 
-static const char *__doc_Scenario_AddOutgoingTrain = R"doc(Add an Outgoing train to this Scenario */)doc";
+static const char *__doc_Scenario_DetachEmployees =
+R"doc(Copy the Employee%s that are shared with other Scenario%s and get all
+the Employee%s, so they can be modified */)doc";
+
+static const char *__doc_Scenario_DetachIncomingTrains =
+R"doc(Copy the Incoming trains that are shared with other Scenario%s and get
+all the Incoming trains, so they can be modified */)doc";
+
+static const char *__doc_Scenario_DetachOutgoingTrains =
+R"doc(Copy the Outgoing trains that are shared with other Scenario%s and get
+all the Outgoing trains, so they can be modified */)doc";
 
 static const char *__doc_Scenario_GetDisturbanceVector = R"doc(Get the disturbances in this Scenario as a vector*/)doc";
 
@@ -1436,8 +2659,17 @@ static const char *__doc_Scenario_ImportShuntingUnits = R"doc()doc";
 
 static const char *__doc_Scenario_Init = R"doc()doc";
 
+static const char *__doc_Scenario_Own = R"doc()doc";
+
 static const char *__doc_Scenario_PrintScenarioInfo = R"doc(Print the Scenario Info */)doc";
 
+static const char *__doc_Scenario_ReadInfo =
+R"doc(Read the ScenarioInfo from the protobuf file on the given path,
+without constructing a Scenario. Throws a runtime_error if the file is
+not a valid Scenario file.)doc";
+
+static const char *__doc_Scenario_Replace = R"doc()doc";
+
 static const char *__doc_Scenario_Scenario = R"doc(Generate an empty scenario */)doc";
 
 static const char *__doc_Scenario_Scenario_2 =
@@ -1448,7 +2680,13 @@ static const char *__doc_Scenario_Scenario_3 =
 R"doc(Generate a Scenario according to the protobuf object for the provided
 Location */)doc";
 
-static const char *__doc_Scenario_Scenario_4 = R"doc(Copy constructor */)doc";
+static const char *__doc_Scenario_Scenario_4 =
+R"doc(Copy constructor.
+
+The Incoming trains, Outgoing trains and Employee%s that are owned by
+the given Scenario are shared with the copy, the others are copied.
+Shared objects are copied when they are detached, see
+DetachIncomingTrains.)doc";
 
 static const char *__doc_Scenario_Serialize = R"doc(Serialize this object to a protobuf object */)doc";
 
@@ -1456,16 +2694,28 @@ static const char *__doc_Scenario_SetDisturbances =
 R"doc(Set the queue of Disturbance%s in this Scenario (not yet implemented)
 */)doc";
 
-static const char *__doc_Scenario_SetEmployees = R"doc(Set the list of Employee%s in this Scenario (not yet implemented) */)doc";
+static const char *__doc_Scenario_SetEmployees =
+R"doc(Set the list of Employee%s in this Scenario (not yet implemented). The
+Scenario takes ownership of the Employee%s it did not own yet. The
+ones that are no longer in the list are kept until the Scenario is
+deleted)doc";
 
 static const char *__doc_Scenario_SetEndTime = R"doc(Set the end time of this scenario */)doc";
 
-static const char *__doc_Scenario_SetIncomingTrains = R"doc(Set the list of Incoming trains in this Scenario */)doc";
+static const char *__doc_Scenario_SetIncomingTrains =
+R"doc(Set the list of Incoming trains in this Scenario. The Scenario takes
+ownership of the Incoming trains it did not own yet. The ones that are
+no longer in the list are kept until the Scenario is deleted)doc";
 
-static const char *__doc_Scenario_SetOutgoingTrains = R"doc(Set the list of Outgoing trains in this Scenario */)doc";
+static const char *__doc_Scenario_SetOutgoingTrains =
+R"doc(Set the list of Outgoing trains in this Scenario. The Scenario takes
+ownership of the Outgoing trains it did not own yet. The ones that are
+no longer in the list are kept until the Scenario is deleted)doc";
 
 static const char *__doc_Scenario_SetStartTime = R"doc(Set the start time of this scenario */)doc";
 
+static const char *__doc_Scenario_Unshare = R"doc()doc";
+
 static const char *__doc_Scenario_disturbanceList = R"doc()doc";
 
 static const char *__doc_Scenario_disturbances = R"doc()doc";
@@ -1476,10 +2726,66 @@ static const char *__doc_Scenario_endTime = R"doc()doc";
 
 static const char *__doc_Scenario_incomingTrains = R"doc()doc";
 
+static const char *__doc_Scenario_operator_assign =
+R"doc(Assign the given Scenario to this Scenario, sharing its objects like
+the copy constructor */)doc";
+
 static const char *__doc_Scenario_outgoingTrains = R"doc()doc";
 
+static const char *__doc_Scenario_owned = R"doc()doc";
+
 static const char *__doc_Scenario_startTime = R"doc()doc";
 
+static const char *__doc_ScenarioInfo =
+R"doc(Summary of a scenario file: the metadata that can be read without
+constructing the Scenario)doc";
+
+static const char *__doc_ScenarioInfo_endTime = R"doc(The end time of the scenario */)doc";
+
+static const char *__doc_ScenarioInfo_numberOfIncoming =
+R"doc(The number of Incoming trains */)doc";
+
+static const char *__doc_ScenarioInfo_numberOfOutgoing =
+R"doc(The number of Outgoing trains */)doc";
+
+static const char *__doc_ScenarioInfo_numberOfTrains =
+R"doc(The number of Train%s in the incoming trains */)doc";
+
+static const char *__doc_ScenarioInfo_startTime = R"doc(The start time of the scenario */)doc";
+
+static const char *__doc_ScenarioInfo_trainTypes =
+R"doc(The (unique) names of the TrainUnitType%s of the incoming trains */)doc";
+
+static const char *__doc_ScreeningResult = R"doc(The outcome of FeasibilityMonitor::Screen */)doc";
+
+static const char *__doc_ScreeningResult_IsFeasible =
+R"doc(Returns true iff no reason for infeasibility was found */)doc";
+
+static const char *__doc_ScreeningResult_messages = R"doc(< A description for every reason */)doc";
+
+static const char *__doc_ScreeningResult_reasons =
+R"doc(< The reasons why the Scenario is infeasible, empty if no reason was
+found */)doc";
+
+static const char *__doc_SearchHeuristic =
+R"doc(The weights of the terms of the heuristic score of a State, see
+GetHeuristicScore. A higher score is better.)doc";
+
+static const char *__doc_SearchHeuristic_distance =
+R"doc(< The penalty per second of the summed shortest paths of the
+ShuntingUnit%s to their next target */)doc";
+
+static const char *__doc_SearchHeuristic_slack =
+R"doc(< The reward per hour until the departure of the remaining Outgoing
+trains */)doc";
+
+static const char *__doc_SearchHeuristic_tasks =
+R"doc(< The penalty per remaining Task of the Train%s on the shunting yard
+and the remaining Incoming trains */)doc";
+
+static const char *__doc_SearchHeuristic_trainsServed =
+R"doc(< The reward per Train that left the shunting yard */)doc";
+
 static const char *__doc_Service =
 R"doc(The Service action executes a task on the specified train.
 
@@ -1489,6 +2795,8 @@ can change.)doc";
 
 static const char *__doc_ServiceAction = R"doc(The ServiceAction executes a task on the specified train.)doc";
 
+static const char *__doc_ServiceAction_GetKind = R"doc()doc";
+
 static const char *__doc_ServiceActionGenerator = R"doc(The ServiceActionGenerator generates ServiceAction%s */)doc";
 
 static const char *__doc_ServiceActionGenerator_Generate = R"doc()doc";
@@ -1560,10 +2868,86 @@ static const char *__doc_Service_toString = R"doc()doc";
 
 static const char *__doc_Service_train = R"doc()doc";
 
+static const char *__doc_SessionBatch =
+R"doc(A batch of sessions on one LocationEngine that are stepped together,
+for vectorized reinforcement learning.
+
+Every call writes into buffers with one row per session. The
+observation of a session is the observation of the Featurizer followed
+by its action mask as zeros and ones, and has GetObservationSize
+values.
+
+Step may step the sessions on several threads. Reset starts and ends
+sessions on the LocationEngine, and should therefore not be called
+while another thread uses the LocationEngine.)doc";
+
+static const char *__doc_SessionBatch_GetFeaturizer =
+R"doc(Get the Featurizer of this SessionBatch */)doc";
+
+static const char *__doc_SessionBatch_GetNumberOfThreads =
+R"doc(Get the number of threads used by Step */)doc";
+
+static const char *__doc_SessionBatch_GetObservationSize =
+R"doc(Get the number of values in an observation */)doc";
+
+static const char *__doc_SessionBatch_GetSize = R"doc(Get the number of sessions */)doc";
+
+static const char *__doc_SessionBatch_GetState =
+R"doc(Get the State of the session at the given index, or nullptr if it is
+not started */)doc";
+
+static const char *__doc_SessionBatch_Reset =
+R"doc(Start a new session for the given Scenario at the given index. The
+previous session at that index is reset in place, see
+LocationEngine::ResetSession.
+
+The first observation and action mask are written into row index of
+obs and masks.)doc";
+
+static const char *__doc_SessionBatch_SessionBatch = R"doc()doc";
+
+static const char *__doc_SessionBatch_SessionBatch_2 = R"doc()doc";
+
+static const char *__doc_SessionBatch_SessionBatch_3 =
+R"doc(Construct a SessionBatch of size sessions on the given LocationEngine.
+
+Every Step costs stepPenalty reward. Step uses nThreads threads, or
+one per hardware thread if nThreads <= 0.)doc";
+
+static const char *__doc_SessionBatch_Step =
+R"doc(Apply the given action indices (see Featurizer::GetSimpleAction) to
+all the sessions and step them.
+
+The new observations, rewards, done flags and action masks are written
+into obs, rewards, dones and masks. A session is done if the action is
+invalid, the Scenario failed or no valid Action%s remain. In the last
+case, if all the Incoming trains arrived, the reward is the fraction
+of the Train%s that left the shunting yard. Done sessions stay in
+their last State until they are Reset. Other errors are passed on to
+the caller when all the threads are finished.)doc";
+
+static const char *__doc_SessionBatch_StepSession = R"doc()doc";
+
+static const char *__doc_SessionBatch_WriteObservation = R"doc()doc";
+
+static const char *__doc_SessionBatch_engine = R"doc()doc";
+
+static const char *__doc_SessionBatch_featurizer = R"doc()doc";
+
+static const char *__doc_SessionBatch_nThreads = R"doc()doc";
+
+static const char *__doc_SessionBatch_numberOfTrains = R"doc()doc";
+
+static const char *__doc_SessionBatch_states = R"doc()doc";
+
+static const char *__doc_SessionBatch_stepPenalty = R"doc()doc";
+
 static const char *__doc_Setback = R"doc(The Setback action changes the direction of the ShuntingUnit)doc";
 
 static const char *__doc_SetbackAction = R"doc(The SetbackAction changes the direction of the ShuntingUnit)doc";
 
+static const char *__doc_SetbackAction_GetKind = R"doc()doc";
+
 static const char *__doc_SetbackActionGenerator = R"doc(The SetbackActionGenerator generates SetbackAction%s */)doc";
 
 static const char *__doc_SetbackActionGenerator_Generate = R"doc()doc";
@@ -1730,7 +3114,9 @@ static const char *__doc_ShuntingUnit_ShuntingUnit = R"doc()doc";
 
 static const char *__doc_ShuntingUnit_ShuntingUnit_2 = R"doc(Construct a ShuntingUnit with the given id and the given Train%s */)doc";
 
-static const char *__doc_ShuntingUnit_ShuntingUnit_3 = R"doc(Construct a ShuntingUnit from the given protobuf object */)doc";
+static const char *__doc_ShuntingUnit_ShuntingUnit_3 =
+R"doc(Construct a ShuntingUnit from the given protobuf object, looking up
+the TrainUnitType%s in types */)doc";
 
 static const char *__doc_ShuntingUnit_ShuntingUnit_4 = R"doc(The default copy constructor */)doc";
 
@@ -1772,6 +3158,12 @@ static const char *__doc_SimpleAction_GetGeneratorName =
 R"doc(Get the name of the generator that can turn this SimpleAction into an
 Action)doc";
 
+static const char *__doc_SimpleAction_GetShuntingUnitHandle =
+R"doc(Get the ShuntingUnit this action was constructed with, or nullptr.
+
+The handle is only used as a shortcut when resolving the ShuntingUnit
+in a State, see State::ResolveShuntingUnit.)doc";
+
 static const char *__doc_SimpleAction_GetTrainIDs = R"doc(Get the train ids of the ShuntingUnit)doc";
 
 static const char *__doc_SimpleAction_GetTrainsToString =
@@ -1788,16 +3180,80 @@ static const char *__doc_SimpleAction_SimpleAction_3 = R"doc(Construct a SimpleA
 
 static const char *__doc_SimpleAction_SimpleAction_4 = R"doc(Default copy constructor)doc";
 
+static const char *__doc_SimpleAction_su = R"doc()doc";
+
 static const char *__doc_SimpleAction_toString = R"doc(Get a string representation of this action)doc";
 
 static const char *__doc_SimpleAction_trainIDs = R"doc()doc";
 
+static const char *__doc_SnapshotReader =
+R"doc(A SnapshotReader reads the values of a snapshot that was written by a
+SnapshotWriter. An invalid_argument exception is thrown if the
+snapshot is truncated, or if it was not written by a SnapshotWriter of
+the current snapshotVersion.)doc";
+
+static const char *__doc_SnapshotReader_AtEnd =
+R"doc(Returns true iff all the data of the snapshot is read */)doc";
+
+static const char *__doc_SnapshotReader_GetBool = R"doc(Read a boolean */)doc";
+
+static const char *__doc_SnapshotReader_GetInt = R"doc(Read a signed integer */)doc";
+
+static const char *__doc_SnapshotReader_GetInts = R"doc(Read a vector of integers */)doc";
+
+static const char *__doc_SnapshotReader_GetSize =
+R"doc(Read a size, and check that the snapshot has at least that many bytes
+left */)doc";
+
+static const char *__doc_SnapshotReader_GetString = R"doc(Read a string */)doc";
+
+static const char *__doc_SnapshotReader_GetUnsigned = R"doc(Read an unsigned integer */)doc";
+
+static const char *__doc_SnapshotReader_Require = R"doc()doc";
+
+static const char *__doc_SnapshotReader_SnapshotReader = R"doc()doc";
+
+static const char *__doc_SnapshotReader_SnapshotReader_2 =
+R"doc(Construct a SnapshotReader for the given snapshot and read its header
+*/)doc";
+
+static const char *__doc_SnapshotReader_data = R"doc()doc";
+
+static const char *__doc_SnapshotReader_position = R"doc()doc";
+
+static const char *__doc_SnapshotWriter =
+R"doc(A SnapshotWriter appends values to a binary snapshot. Integers are
+written as variable length integers (zigzag encoded if signed), so
+that small values take one byte and the snapshot does not depend on
+the byte order of the machine. Strings are written as their length
+followed by their bytes.)doc";
+
+static const char *__doc_SnapshotWriter_GetData = R"doc(Get the snapshot */)doc";
+
+static const char *__doc_SnapshotWriter_PutBool = R"doc(Write a boolean */)doc";
+
+static const char *__doc_SnapshotWriter_PutInt = R"doc(Write a signed integer */)doc";
+
+static const char *__doc_SnapshotWriter_PutInts =
+R"doc(Write a vector of integers, preceded by its size */)doc";
+
+static const char *__doc_SnapshotWriter_PutString = R"doc(Write a string */)doc";
+
+static const char *__doc_SnapshotWriter_PutUnsigned = R"doc(Write an unsigned integer */)doc";
+
+static const char *__doc_SnapshotWriter_SnapshotWriter =
+R"doc(Construct a SnapshotWriter and write the header of the snapshot */)doc";
+
+static const char *__doc_SnapshotWriter_data = R"doc()doc";
+
 static const char *__doc_Split =
 R"doc(The Split action splits a ShuntingUnit into two separate ShuntingUnits
 based on the splitIndex.)doc";
 
 static const char *__doc_SplitAction = R"doc(The SplitAction splits a ShuntingUnit into two separate ShuntingUnits.)doc";
 
+static const char *__doc_SplitAction_GetKind = R"doc()doc";
+
 static const char *__doc_SplitActionGenerator = R"doc(The SplitActionGenerator generates SplitAction%s */)doc";
 
 static const char *__doc_SplitActionGenerator_Generate = R"doc()doc";
@@ -1889,6 +3345,9 @@ static const char *__doc_State_AddEvent_2 = R"doc(Add an Outgoing Event to the E
 
 static const char *__doc_State_AddEvent_3 = R"doc(Add an Action finish Event to the EventQueue */)doc";
 
+static const char *__doc_State_AddEvent_4 =
+R"doc(Add a copy of the given Event to the EventQueue */)doc";
+
 static const char *__doc_State_AddShuntingUnit = R"doc(Add a ShuntingUnit to the State */)doc";
 
 static const char *__doc_State_AddShuntingUnit_2 = R"doc(Add a ShuntingUnit to the State */)doc";
@@ -1921,6 +3380,16 @@ static const char *__doc_State_GetAmountOnTrack = R"doc(Get the number of Shunti
 
 static const char *__doc_State_GetEndTime = R"doc(Get the end time of this Scenario */)doc";
 
+static const char *__doc_State_GetEvents = R"doc(Get the EventQueue */)doc";
+
+static const char *__doc_State_GetFingerprint =
+R"doc(Get a fingerprint of this State. States that only differ in the order
+in which the same Action%s were applied at the same time get the same
+fingerprint. The fingerprint includes the time, the remaining Incoming
+and Outgoing trains, the Event%s, the reserved Track%s and for every
+ShuntingUnit its Train%s, remaining Task%s, position, direction and
+active Action%s.)doc";
+
 static const char *__doc_State_GetFrontTrain = R"doc(Get the front Train for the given ShuntingUnit */)doc";
 
 static const char *__doc_State_GetIncomingByID = R"doc(Get the Incoming event by the given id */)doc";
@@ -1949,6 +3418,9 @@ static const char *__doc_State_GetPrevious = R"doc(Get the previous position of
 
 static const char *__doc_State_GetReservedTracks = R"doc(Get all the reserved Track%s */)doc";
 
+static const char *__doc_State_GetScenario =
+R"doc(Get the Scenario that this State was started from */)doc";
+
 static const char *__doc_State_GetShuntingUnitByID = R"doc(Get the ShuntingUnit by ShuntingUnit id */)doc";
 
 static const char *__doc_State_GetShuntingUnitByTrainID =
@@ -2057,8 +3529,22 @@ static const char *__doc_State_ReserveTracks = R"doc(Reserve the Track%s */)doc"
 
 static const char *__doc_State_ReserveTracks_2 = R"doc(Reserve the Track%s */)doc";
 
+static const char *__doc_State_Reset =
+R"doc(Reset this State to a State of the given Scenario without
+ShuntingUnit%s, at the given time and with copies of the given
+Event%s. The allocations of this State are reused where possible.)doc";
+
+static const char *__doc_State_ResolveShuntingUnit =
+R"doc(Get the ShuntingUnit that currently contains the Train%s with the
+given ids, or null if not found. The handle su is returned directly if
+it is part of this State and contains exactly those Train%s.)doc";
+
 static const char *__doc_State_SetBeginMoving = R"doc(Set the ShuntingUnit's begin moving state */)doc";
 
+static const char *__doc_State_SetChanged =
+R"doc(Set this state to changed, so that its valid Action%s are generated
+again */)doc";
+
 static const char *__doc_State_SetFrontTrain = R"doc(Set the front Train of the ShuntingUnit */)doc";
 
 static const char *__doc_State_SetInNeutral = R"doc(Set the ShuntingUnit's neutral state (to be updated) */)doc";
@@ -2069,6 +3555,11 @@ static const char *__doc_State_SetPosition = R"doc(Set the ShuntingUnit's curren
 
 static const char *__doc_State_SetPrevious = R"doc(Set the ShuntingUnit's previous position */)doc";
 
+static const char *__doc_State_SetShuntingUnitOrder =
+R"doc(Rebuild the ShuntingUnitState%s with the given number of buckets, such
+that they are iterated in the given order of the ShuntingUnit%s (see
+GetShuntingUnitStates). The Action%s are generated in this order.)doc";
+
 static const char *__doc_State_SetTime = R"doc(Set the State's time */)doc";
 
 static const char *__doc_State_SetUnchanged = R"doc(Set this state to unchanged */)doc";
@@ -2081,7 +3572,10 @@ static const char *__doc_State_State = R"doc()doc";
 
 static const char *__doc_State_State_2 =
 R"doc(Construct an initial State object from a Scenario object and a vector
-of Track%s in a Location */)doc";
+of Track%s in a Location.
+
+The State shares the Incoming trains, Outgoing trains and Employee%s
+of the Scenario, see Scenario::Scenario(const Scenario&).)doc";
 
 static const char *__doc_State_State_3 = R"doc(Default copy constructor */)doc";
 
@@ -2099,6 +3593,8 @@ static const char *__doc_State_incomingTrains = R"doc()doc";
 
 static const char *__doc_State_outgoingTrains = R"doc()doc";
 
+static const char *__doc_State_scenario = R"doc()doc";
+
 static const char *__doc_State_shuntingUnitStates = R"doc()doc";
 
 static const char *__doc_State_shuntingUnits = R"doc()doc";
@@ -2151,6 +3647,8 @@ static const char *__doc_TimeShift_end = R"doc(< This TimeShift's end time in se
 
 static const char *__doc_TimeShift_start = R"doc(< This TimeShift's start time in seconds */)doc";
 
+static const char *__doc_ToString = R"doc(Get a string representation of the DeadEndReason */)doc";
+
 static const char *__doc_Track = R"doc(A Track describes a track part and its connections.)doc";
 
 static const char *__doc_Track_2 = R"doc(A Track describes a track part and its connections.)doc";
@@ -2211,6 +3709,10 @@ static const char *__doc_Track_GetFacilities = R"doc(Get all the facilities that
 
 static const char *__doc_Track_GetID = R"doc(Get the id of this track)doc";
 
+static const char *__doc_Track_GetIndex =
+R"doc(Get the index of this track in the Location's track list, or -1 if it
+is not part of a Location)doc";
+
 static const char *__doc_Track_GetLength = R"doc(Get the length of this track)doc";
 
 static const char *__doc_Track_GetNeighbors = R"doc(Get all the neighbors of this track, both A-side and B-side.)doc";
@@ -2263,12 +3765,17 @@ static const char *__doc_Track_facilities = R"doc(< the facilities located at th
 
 static const char *__doc_Track_id = R"doc(< The id of this track */)doc";
 
+static const char *__doc_Track_index =
+R"doc(< the dense index of this track in its Location, or -1 */)doc";
+
 static const char *__doc_Track_isElectrified = R"doc(< Whether this track is electrified or not */)doc";
 
 static const char *__doc_Track_length = R"doc(< The length of thist track */)doc";
 
 static const char *__doc_Track_name = R"doc(< The name of this track */)doc";
 
+static const char *__doc_Track_neighbors = R"doc(< the A-side and B-side tracks of this track */)doc";
+
 static const char *__doc_Track_next =
 R"doc(a map connecting neighboring tracks to reachable tracks if the key
 track is the previous track */)doc";
@@ -2455,7 +3962,9 @@ static const char *__doc_Train_Train = R"doc()doc";
 
 static const char *__doc_Train_Train_2 = R"doc(Construct a Train from the given parameters */)doc";
 
-static const char *__doc_Train_Train_3 = R"doc(Construct a Train from a protobuf object */)doc";
+static const char *__doc_Train_Train_3 =
+R"doc(Construct a Train from a protobuf object, looking up its TrainUnitType
+by name in types */)doc";
 
 static const char *__doc_Train_Train_4 = R"doc(The default copy constructor */)doc";
 
@@ -2473,6 +3982,20 @@ static const char *__doc_Train_toString = R"doc(Get a string representation of t
 
 static const char *__doc_Train_type = R"doc()doc";
 
+static const char *__doc_ValidationCode =
+R"doc(The reason codes of LocationEngine::ValidateMany.
+
+A positive code k means that the Action violates the business rule at
+index k-1 of LocationEngine::GetBusinessRuleNames)doc";
+
+static const char *__doc_ValidationCode_GenerationFailed =
+R"doc(< No Action could be generated from the SimpleAction in the State */)doc";
+
+static const char *__doc_ValidationCode_GeneratorDisabled =
+R"doc(< The ActionGenerator for the SimpleAction is disabled */)doc";
+
+static const char *__doc_ValidationCode_Valid = R"doc(< The Action is valid */)doc";
+
 static const char *__doc_Wait =
 R"doc(The Wait action instructs this ShuntingUnit to wait until the next
 Event.)doc";
@@ -2481,6 +4004,8 @@ static const char *__doc_WaitAction =
 R"doc(The WaitAction instructs this ShuntingUnit to wait until the next
 Event.)doc";
 
+static const char *__doc_WaitAction_GetKind = R"doc()doc";
+
 static const char *__doc_WaitActionGenerator = R"doc(The WaitActionGenerator generates WaitAction%s */)doc";
 
 static const char *__doc_WaitActionGenerator_Generate = R"doc()doc";
@@ -2614,6 +4139,33 @@ static const char *__doc_end_correct_order_on_track_rule_end_correct_order_on_tr
 
 static const char *__doc_end_correct_order_on_track_rule_end_correct_order_on_track_rule_2 = R"doc()doc";
 
+static const char *__doc_exit_order_move_rule =
+R"doc(Rule that removes MoveAction%s onto a dead-end Track (a Track that can
+only be left via the side it is entered) if a ShuntingUnit on that
+Track must leave before the moving ShuntingUnit. The departure of a
+ShuntingUnit is the earliest time of the remaining Outgoing trains
+that contain one of its Train%s by ID, or by TrainUnitType if the
+Outgoing train is not matched. This rule is a heuristic: a plan may
+still move the blocking ShuntingUnit away before the departure.)doc";
+
+static const char *__doc_exit_order_move_rule_Prune = R"doc()doc";
+
+static const char *__doc_exit_order_move_rule_exit_order_move_rule = R"doc()doc";
+
+static const char *__doc_exit_order_move_rule_exit_order_move_rule_2 = R"doc()doc";
+
+static const char *__doc_fastest_route_rule =
+R"doc(Rule that keeps only the fastest MoveAction for every ShuntingUnit,
+destination Track and arrival side, and removes the slower routes to
+the same destination. This rule ignores the difference in the Track%s
+that are reserved by the routes.)doc";
+
+static const char *__doc_fastest_route_rule_Prune = R"doc()doc";
+
+static const char *__doc_fastest_route_rule_fastest_route_rule = R"doc()doc";
+
+static const char *__doc_fastest_route_rule_fastest_route_rule_2 = R"doc()doc";
+
 static const char *__doc_hash_combine = R"doc()doc";
 
 static const char *__doc_in_correct_time_rule =
@@ -2765,14 +4317,38 @@ static const char *__doc_park_combine_split_rule_park_combine_split_rule = R"doc
 
 static const char *__doc_park_combine_split_rule_park_combine_split_rule_2 = R"doc()doc";
 
+static const char *__doc_parse_file_to_pb =
+R"doc(Read a protobuf data file into message. Both the JSON format and the
+binary wire format are supported, optionally gzip compressed.
+
+Compression is detected by the gzip header. The format is derived from
+the extension (.json or .pb), ignoring a trailing .gz. For other
+extensions the file is read as JSON if it starts with '{' and as
+binary otherwise.
+
+Returns:     false if the JSON data could not be parsed into message.
+Invalid     binary data throws a runtime_error.)doc";
+
 static const char *__doc_parse_json_to_pb = R"doc()doc";
 
 static const char *__doc_parse_json_to_pb_2 = R"doc()doc";
 
+static const char *__doc_parse_pb_to_binary =
+R"doc(Write the message to a file in the binary protobuf format, optionally
+gzip compressed)doc";
+
 static const char *__doc_parse_pb_to_json = R"doc()doc";
 
 static const char *__doc_parse_pb_to_json_2 = R"doc()doc";
 
+static const char *__doc_resolve_pb_file =
+R"doc(Get the path of a protobuf data file, trying the other supported
+formats if file_path does not exist.
+
+For example, if data/location.json does not exist,
+data/location.json.gz, data/location.pb or data/location.pb.gz is
+returned if one of those exists.)doc";
+
 static const char *__doc_setback_combine_split_rule =
 R"doc(Rule that verifies that combine and split actions on shunting units
 are only performed on tracks where setback is allowed.)doc";
@@ -2814,6 +4390,12 @@ static const char *__doc_single_move_track_rule_single_move_track_rule = R"doc()
 
 static const char *__doc_single_move_track_rule_single_move_track_rule_2 = R"doc()doc";
 
+static const char *__doc_snapshotMagic = R"doc(The first bytes of every snapshot */)doc";
+
+static const char *__doc_snapshotVersion =
+R"doc(The version of the snapshot format that is written by
+LocationEngine::SaveState */)doc";
+
 static const char *__doc_understaffed_rule =
 R"doc(Rule that verifies that all tasks have enough employees assigned, with
 the right skills, such that the task will have all of its required
@@ -2825,6 +4407,18 @@ static const char *__doc_understaffed_rule_understaffed_rule = R"doc()doc";
 
 static const char *__doc_understaffed_rule_understaffed_rule_2 = R"doc()doc";
 
+static const char *__doc_wait_at_departure_rule =
+R"doc(Rule that removes all WaitAction%s while a valid ExitAction is
+available for an Outgoing train that is due (its departure time is now
+or past). Waiting never enables the ExitAction, so any plan can first
+apply the ExitAction and then wait.)doc";
+
+static const char *__doc_wait_at_departure_rule_Prune = R"doc()doc";
+
+static const char *__doc_wait_at_departure_rule_wait_at_departure_rule = R"doc()doc";
+
+static const char *__doc_wait_at_departure_rule_wait_at_departure_rule_2 = R"doc()doc";
+
 #if defined(__GNUG__)
 #pragma GCC diagnostic pop
 #endif
@@ -4,8 +4,15 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <pybind11/iostream.h>
+#include <pybind11/numpy.h>
+#include <pybind11/eval.h>
 
 #include "Engine.h"
+#include "SessionBatch.h"
+#include "Rollout.h"
+#include "Search.h"
+#include "LocationGraph.h"
+#include "Snapshot.h"
 #include "docstrings.h"
 
 #ifndef BIND_ACTION
@@ -28,10 +35,274 @@
 namespace py = pybind11;
 using namespace std;
 
+/** Move the vector into a NumPy array without copying its data */
+template<class T>
+py::array_t<T> to_array(vector<T>&& data) {
+	auto owner = new vector<T>(move(data));
+	py::capsule capsule(owner, [](void* p) { delete reinterpret_cast<vector<T>*>(p); });
+	return py::array_t<T>(owner->size(), owner->data(), capsule);
+}
+
+/** Get the valid action table of the engine as a tuple of a structured NumPy array and an array of train IDs */
+template<class E>
+py::tuple get_valid_action_table(E& engine, State* state) {
+	vector<ActionRow> rows;
+	vector<int> trainIDs;
+	engine.GetValidActionTable(state, rows, trainIDs);
+	return py::make_tuple(to_array(move(rows)), to_array(move(trainIDs)));
+}
+
+/** Get the given output buffer, or a new array if out is None, and check its type and size */
+template<class T>
+py::array_t<T, py::array::c_style> get_buffer(py::object out, size_t size) {
+	using buffer_t = py::array_t<T, py::array::c_style>;
+	if(out.is_none()) return buffer_t(size);
+	if(!py::isinstance<buffer_t>(out)) 
+		throw py::type_error("The output buffer should be a C-contiguous array of type " + string(py::str(py::dtype::of<T>())) + ".");
+	auto buffer = out.cast<buffer_t>();
+	if(buffer.size() < size)
+		throw py::value_error("The output buffer has size " + to_string(buffer.size()) + ", but should have size " + to_string(size) + ".");
+	return buffer;
+}
+
+/** Write the observation of the state into out, or into a new array if out is None, with the GIL released */
+py::array_t<float> featurize(const Featurizer& featurizer, const State* state, py::object out) {
+	auto buffer = get_buffer<float>(out, featurizer.GetObservationSize());
+	auto data = buffer.mutable_data();
+	{
+		py::gil_scoped_release release;
+		featurizer.Featurize(state, data);
+	}
+	return buffer;
+}
+
+/** Write the mask of the valid actions of the engine into out, or into a new array if out is None, with the GIL released */
+template<class E>
+py::array_t<bool> get_action_mask(const Featurizer& featurizer, E& engine, State* state, py::object out) {
+	auto buffer = get_buffer<bool>(out, featurizer.GetNumberOfActions());
+	auto data = buffer.mutable_data();
+	{
+		py::gil_scoped_release release;
+		featurizer.GetActionMask(state, engine.GetValidActions(state), data);
+	}
+	return buffer;
+}
+
+/** Validate the simple actions with the engine, with the GIL released, and return a boolean mask (and the reason codes) */
+template<class E>
+py::object validate_many(const E& engine, const State* state, const vector<const SimpleAction*>& actions, bool returnReasons) {
+	vector<int> codes;
+	{
+		py::gil_scoped_release release;
+		codes = engine.ValidateMany(state, actions);
+	}
+	py::array_t<bool> mask(codes.size());
+	auto data = mask.mutable_data();
+	for(size_t i=0; i<codes.size(); i++) data[i] = codes[i] == static_cast<int>(ValidationCode::Valid);
+	if(!returnReasons) return mask;
+	return py::make_tuple(mask, to_array(move(codes)));
+}
+
+/** The shared locations of which the Python wrappers are interned, see intern_location */
+map<const Location*, weak_ptr<const Location>>& interned_locations() {
+	static map<const Location*, weak_ptr<const Location>> interned;
+	return interned;
+}
+
+/**
+ * Keep the Python wrappers of the Tracks and Facilities of the shared location alive for as long as the location exists,
+ * so that every access to a Track or Facility returns the same wrapper. The wrappers of expired locations are released.
+ */
+const Location& intern_location(const shared_ptr<const Location>& location) {
+	auto& interned = interned_locations();
+	py::dict wrappers = py::module::import("pyTORS").attr("_interned_wrappers");
+	for(auto it = interned.begin(); it != interned.end();) {
+		if(it->second.expired()) {
+			wrappers.attr("pop")(reinterpret_cast<uintptr_t>(it->first), py::none());
+			it = interned.erase(it);
+		} else it++;
+	}
+	if(interned.find(location.get()) != interned.end()) return *location;
+	interned[location.get()] = location;
+	py::list list;
+	for(auto track: location->GetTracks()) list.append(py::cast(track, py::return_value_policy::reference));
+	for(auto facility: location->GetFacilities()) list.append(py::cast(facility, py::return_value_policy::reference));
+	wrappers[py::int_(reinterpret_cast<uintptr_t>(location.get()))] = list;
+	return *location;
+}
+
+/** Get the shared pointer of a Location that is used from Python, see intern_location */
+shared_ptr<const Location> get_shared_location(const Location& location) {
+	auto it = interned_locations().find(&location);
+	if(it == interned_locations().end() || it->second.expired())
+		throw invalid_argument("The Location is not loaded by an Engine.");
+	return it->second.lock();
+}
+
+/** Get a capsule that keeps the shared location alive for as long as it exists */
+py::capsule location_capsule(const shared_ptr<const Location>& location) {
+	return py::capsule(new shared_ptr<const Location>(location),
+		[](void* ptr) { delete static_cast<shared_ptr<const Location>*>(ptr); });
+}
+
+/**
+ * Keep the shared location alive for as long as the Python object exists, so that the Engine does not unload
+ * a location that is still used from Python (see Engine::UnloadIdleLocationEngines).
+ */
+py::object keep_location_alive(py::object object, const shared_ptr<const Location>& location) {
+	auto& patients = py::detail::get_internals().patients;
+	auto it = patients.find(object.ptr());
+	if(it != patients.end()) {
+		// The only capsules that are kept alive by pyTORS objects are the shared locations
+		for(auto patient: it->second)
+			if(PyCapsule_CheckExact(patient)) return object;
+	}
+	py::detail::keep_alive_impl(object, location_capsule(location));
+	return object;
+}
+
+/** The Engines that are created in Python, in the order of creation, to restore pickled States */
+list<LocationEngine*>& python_engines() {
+	static list<LocationEngine*> engines;
+	return engines;
+}
+
+/** Deletes an Engine that was created in Python and removes it from python_engines */
+struct PythonEngineDeleter {
+	void operator()(LocationEngine* engine) const {
+		python_engines().remove(engine);
+		delete engine;
+	}
+};
+
+/** Pickle a State as a snapshot (see LocationEngine::SaveState) of the Engine that holds its session */
+py::tuple reduce_state(const State* state) {
+	for(auto engine: python_engines()) {
+		if(engine->HasSession(state))
+			return py::make_tuple(py::module::import("pyTORS").attr("_load_pickled_state"),
+				py::make_tuple(py::bytes(engine->SaveState(state))));
+	}
+	throw invalid_argument("Only the States of a session of an Engine can be pickled.");
+}
+
+/** Restore a pickled State in a new session of the most recently created Engine of the same location */
+State* load_pickled_state(const string& data) {
+	auto id = GetSnapshotLocationID(data);
+	auto& engines = python_engines();
+	auto it = find_if(engines.rbegin(), engines.rend(), [&id](const LocationEngine* e) { return GetLocationID(e->GetLocation()) == id; });
+	if(it == engines.rend())
+		throw invalid_argument("Create an Engine for the location " + GetSnapshotLocation(data) + " before unpickling its States.");
+	return (*it)->LoadState(data);
+}
+
+/** Get a read-only NumPy view of the vector, which stays valid as long as owner is alive */
+template<class T>
+py::array view_array(const vector<T>& data, py::handle owner, py::dtype dtype = py::dtype::of<T>()) {
+	py::array array(dtype, {data.size()}, {sizeof(T)}, data.data(), owner);
+	array.attr("setflags")(py::arg("write") = false);
+	return array;
+}
+
+/** Get the arrays of the location graph as a dict of read-only NumPy arrays */
+py::dict graph_to_csr(const LocationGraph& graph, py::handle owner) {
+	py::dict csr;
+	csr["indptr"] = view_array(graph.GetIndptr(), owner);
+	csr["indices"] = view_array(graph.GetIndices(), owner);
+	csr["edge_duration"] = view_array(graph.GetEdgeDurations(), owner);
+	csr["edge_side"] = view_array(graph.GetEdgeSides(), owner);
+	csr["transition_indptr"] = view_array(graph.GetTransitionIndptr(), owner);
+	csr["transition_indices"] = view_array(graph.GetTransitionIndices(), owner);
+	csr["type"] = view_array(graph.GetTypes(), owner);
+	csr["length"] = view_array(graph.GetLengths(), owner);
+	csr["electrified"] = view_array(graph.GetElectrified(), owner, py::dtype::of<bool>());
+	csr["parking_allowed"] = view_array(graph.GetParkingAllowed(), owner, py::dtype::of<bool>());
+	csr["saw_movement_allowed"] = view_array(graph.GetSawMovementAllowed(), owner, py::dtype::of<bool>());
+	csr["facility_indptr"] = view_array(graph.GetFacilityIndptr(), owner);
+	csr["facility_ids"] = view_array(graph.GetFacilityIDs(), owner);
+	return csr;
+}
+
+/** Write the dynamic node features of the state into out, or into a new array if out is None, with the GIL released */
+py::array_t<float, py::array::c_style> featurize_nodes(const LocationGraph& graph, const State* state, py::object out) {
+	auto n = graph.GetNumberOfNodes();
+	auto k = static_cast<size_t>(LocationGraph::numberOfNodeFeatures);
+	auto buffer = out.is_none() ? py::array_t<float, py::array::c_style>({n, k}) : get_buffer<float>(out, n * k);
+	auto data = buffer.mutable_data();
+	{
+		py::gil_scoped_release release;
+		graph.FeaturizeNodes(state, data);
+	}
+	return buffer;
+}
+
+/** Get the objects to hand over to a Scenario that holds current, copying the objects that it does not own */
+template<class T>
+vector<const T*> scenario_objects(const vector<const T*>& current, const vector<const T*>& objects) {
+	unordered_set<const T*> owned(current.begin(), current.end());
+	vector<const T*> result;
+	for(auto object: objects)
+		result.push_back(owned.find(object) != owned.end() ? object : new T(*object));
+	return result;
+}
+
+/** Reset the session at the given index of the batch and write its observation and action mask into obs and masks */
+void reset_session(SessionBatch& batch, size_t index, const Scenario& scenario, py::object obs, py::object masks) {
+	auto obsBuffer = get_buffer<float>(obs, batch.GetSize() * batch.GetObservationSize());
+	auto maskBuffer = get_buffer<bool>(masks, batch.GetSize() * batch.GetFeaturizer().GetNumberOfActions());
+	batch.Reset(index, scenario, obsBuffer.mutable_data(), maskBuffer.mutable_data());
+}
+
+/** Step all the sessions of the batch with the GIL released, and write the results into the given buffers */
+void step_sessions(SessionBatch& batch, py::array_t<int64_t, py::array::c_style | py::array::forcecast> actions,
+		py::object obs, py::object rewards, py::object dones, py::object masks) {
+	auto n = batch.GetSize();
+	if(actions.size() != n)
+		throw py::value_error("Expected " + to_string(n) + " actions, but got " + to_string(actions.size()) + ".");
+	auto obsBuffer = get_buffer<float>(obs, n * batch.GetObservationSize());
+	auto rewardBuffer = get_buffer<float>(rewards, n);
+	auto doneBuffer = get_buffer<bool>(dones, n);
+	auto maskBuffer = get_buffer<bool>(masks, n * batch.GetFeaturizer().GetNumberOfActions());
+	auto actionData = actions.data();
+	auto obsData = obsBuffer.mutable_data();
+	auto rewardData = rewardBuffer.mutable_data();
+	auto doneData = doneBuffer.mutable_data();
+	auto maskData = maskBuffer.mutable_data();
+	py::gil_scoped_release release;
+	batch.Step(actionData, obsData, rewardData, doneData, maskData);
+}
+
+/** A read-only view on the live RunResult of a session, which is looked up again on every access */
+class RunResultView {
+private:
+	function<RunResult*()> resolve;
+public:
+	/** The view checks the session id, because the State of an ended session may be reused for a new session */
+	template<class E>
+	RunResultView(E& engine, State* state) : resolve([&engine, state, id = engine.GetSessionID(state)]() {
+		if(engine.GetSessionID(state) != id) throw out_of_range("The session has ended.");
+		return engine.GetResult(state);
+	}) {}
+	const RunResult& Get() const {
+		try {
+			return *resolve();
+		} catch(out_of_range&) {
+			throw py::value_error("The session of this RunResult has ended. Use snapshot() to keep a copy of a RunResult.");
+		}
+	}
+	static const POSAction& GetAction(const RunResult& result, long index) {
+		auto& actions = result.GetActions();
+		long n = actions.size();
+		if(index < 0) index += n;
+		if(index < 0 || index >= n) throw py::index_error("POSAction index out of range");
+		return actions[index];
+	}
+};
+
 
 
 PYBIND11_MODULE(pyTORS, m) {
     m.doc() = "TORS implemented in C++"; 
+	m.attr("_interned_wrappers") = py::dict();
 
 	////////////////////////////////////
 	//// ShuntingUnit               ////
@@ -48,7 +319,8 @@ PYBIND11_MODULE(pyTORS, m) {
 		.def("__str__", &ShuntingUnit::toString, DOC(ShuntingUnit, toString))
 		.def("__repr__", &ShuntingUnit::toString, DOC(ShuntingUnit, toString))
 		.def("__eq__", &ShuntingUnit::operator==, DOC(ShuntingUnit, operator_eq), py::arg("other"))
-		.def("__ne__", &ShuntingUnit::operator!=, DOC(ShuntingUnit, operator_ne), py::arg("other"));
+		.def("__ne__", &ShuntingUnit::operator!=, DOC(ShuntingUnit, operator_ne), py::arg("other"))
+		.def("__hash__", [](const ShuntingUnit* su) { return ShuntingUnitHash()(su); });
 		
 
 	////////////////////////////////////
@@ -158,14 +430,35 @@ PYBIND11_MODULE(pyTORS, m) {
 		.def("get_train_units_in_order", &State::GetTrainUnitsInOrder, DOC(State, GetTrainUnitsInOrder), py::arg("shunting_unit"), py::return_value_policy::move)
 		.def("get_front_train", &State::GetFrontTrain, DOC(State, GetFrontTrain), py::arg("shunting_unit"), py::return_value_policy::reference)
 		.def("get_active_actions", &State::GetActiveActions, DOC(State, GetActiveActions), py::arg("shunting_unit"), py::return_value_policy::reference)
+		.def_property_readonly("fingerprint", &State::GetFingerprint, DOC(State, GetFingerprint))
 		.def("get_tasks_for_train", &State::GetTasksForTrain, DOC(State, GetTasksForTrain), py::arg("train"), py::return_value_policy::reference)
 		.def("print_state_info", &State::PrintStateInfo, DOC(State, PrintStateInfo),
-			py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>());
+			py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>())
+		.def("__reduce__", &reduce_state);
+	m.def("_load_state", &load_pickled_state, py::arg("data"), py::return_value_policy::reference);
+	// Pickle refers to a function of the module by name, which only works for Python functions
+	py::exec("def _load_pickled_state(data):\n    return _load_state(data)\n", m.attr("__dict__"));
 
 	////////////////////////////////////
 	//// Action                     ////
 	////////////////////////////////////
+	py::enum_<ActionKind>(m, "ActionKind", DOC(ActionKind))
+		.value("ArriveAction", ActionKind::ArriveAction, DOC(ActionKind, ArriveAction))
+		.value("ExitAction", ActionKind::ExitAction, DOC(ActionKind, ExitAction))
+		.value("BeginMoveAction", ActionKind::BeginMoveAction, DOC(ActionKind, BeginMoveAction))
+		.value("EndMoveAction", ActionKind::EndMoveAction, DOC(ActionKind, EndMoveAction))
+		.value("MoveAction", ActionKind::MoveAction, DOC(ActionKind, MoveAction))
+		.value("CombineAction", ActionKind::CombineAction, DOC(ActionKind, CombineAction))
+		.value("SplitAction", ActionKind::SplitAction, DOC(ActionKind, SplitAction))
+		.value("ServiceAction", ActionKind::ServiceAction, DOC(ActionKind, ServiceAction))
+		.value("SetbackAction", ActionKind::SetbackAction, DOC(ActionKind, SetbackAction))
+		.value("WaitAction", ActionKind::WaitAction, DOC(ActionKind, WaitAction));
+	PYBIND11_NUMPY_DTYPE_EX(ActionRow, kind, "kind", shuntingUnit, "shunting_unit", trainOffset, "train_offset", 
+		trainCount, "train_count", destinationTrack, "destination_track", previousTrack, "previous_track", duration, "duration", 
+		facility, "facility", task, "task", train, "train", secondShuntingUnit, "second_shunting_unit", splitIndex, "split_index");
+
 	py::class_<Action>(m, "Action", DOC(Action))
+		.def_property_readonly("kind", &Action::GetKind, DOC(Action, GetKind))
 		.def_property_readonly("shunting_unit", &Action::GetShuntingUnit, DOC(Action, GetShuntingUnit), py::return_value_policy::reference)
 		.def_property_readonly("reserved_tracks", &Action::GetReservedTracks, DOC(Action, GetReservedTracks), py::return_value_policy::reference)
 		.def_property_readonly("duration", &Action::GetDuration, DOC(Action, GetDuration))
@@ -264,13 +557,28 @@ PYBIND11_MODULE(pyTORS, m) {
 		.def_property_readonly("track_parts", &Location::GetTracks, DOC(Location, GetTracks), py::return_value_policy::reference)
 		.def_property_readonly("facilities", &Location::GetFacilities, DOC(Location, GetFacilities), py::return_value_policy::reference)
 		.def("get_track_by_id", &Location::GetTrackByID, py::arg("id"), DOC(Location, GetTrackByID), py::return_value_policy::reference)
+		.def("get_track_by_index", &Location::GetTrackByIndex, py::arg("index"), DOC(Location, GetTrackByIndex), py::return_value_policy::reference)
+		.def_property_readonly("train_unit_types", &Location::GetTrainUnitTypes, DOC(Location, GetTrainUnitTypes), py::return_value_policy::reference)
 		.def("calc_all_possible_paths", &Location::CalcAllPossiblePaths, DOC(Location, CalcAllPossiblePaths))
 		.def("calc_shortest_paths", &Location::CalcShortestPaths, DOC(Location, CalcShortestPaths), py::arg("trainUnitType"))
 		.def("get_distance", py::overload_cast<const vector<const Track*>&>(&Location::GetDistance, py::const_), DOC(Location, GetDistance), py::arg("tracks"))
 		.def("get_shortest_path", 
 			[](const Location& loc, const TrainUnitType* trainType, const Track* f1, const Track* f2, const Track* t1, const Track* t2) {
 				return loc.GetShortestPath(trainType, {f1,f2}, {t1, t2});
-			} , DOC(Location, GetShortestPath), py::arg("trainType"), py::arg("from_previous"), py::arg("from_track"), py::arg("to_previous"), py::arg("to_track"), py::return_value_policy::reference);
+			} , DOC(Location, GetShortestPath), py::arg("trainType"), py::arg("from_previous"), py::arg("from_track"), py::arg("to_previous"), py::arg("to_track"), py::return_value_policy::reference)
+		.def_property_readonly("graph", [](const Location& location) {
+				return keep_location_alive(py::cast(location.GetGraph(), py::return_value_policy::reference), get_shared_location(location));
+			}, DOC(Location, GetGraph))
+		.def("to_csr", [](const Location& location) { return graph_to_csr(location.GetGraph(), location_capsule(get_shared_location(location))); },
+			DOC(LocationGraph))
+		.def("get_edge_duration", &Location::GetEdgeDuration, DOC(Location, GetEdgeDuration), py::arg("from_track"), py::arg("to_track"));
+
+	py::class_<LocationGraph>(m, "LocationGraph", DOC(LocationGraph))
+		.def("to_csr", [](py::object graph) { return graph_to_csr(graph.cast<const LocationGraph&>(), graph); }, DOC(LocationGraph))
+		.def("featurize_nodes", &featurize_nodes, DOC(LocationGraph, FeaturizeNodes), py::arg("state"), py::arg("out") = py::none())
+		.def_property_readonly("number_of_nodes", &LocationGraph::GetNumberOfNodes, DOC(LocationGraph, GetNumberOfNodes))
+		.def_property_readonly("number_of_edges", &LocationGraph::GetNumberOfEdges, DOC(LocationGraph, GetNumberOfEdges))
+		.def_readonly_static("number_of_node_features", &LocationGraph::numberOfNodeFeatures, DOC(LocationGraph, numberOfNodeFeatures));
 		
 
 	py::enum_<TrackPartType>(m, "TrackPartType", DOC(TrackPartType))
@@ -291,6 +599,11 @@ PYBIND11_MODULE(pyTORS, m) {
 		.def_property_readonly("tracks", &Facility::GetTracks, DOC(Facility, GetTracks), py::return_value_policy::reference)
 		.def("is_available", &Facility::IsAvailable, DOC(Facility, IsAvailable), py::arg("start_time"), py::arg("duration"))
 		.def("executes_task", &Facility::ExecutesTask, DOC(Facility, ExecutesTask), py::arg("task"))
+		.def_property_readonly("index", &Facility::GetIndex, DOC(Facility, GetIndex))
+		.def("__eq__", &Facility::operator==, DOC(Facility, operator_eq), py::arg("other"))
+		.def("__ne__", &Facility::operator!=, DOC(Facility, operator_ne), py::arg("other"))
+		// Hash by id, like operator==, so that equal Facilities of different Locations have the same hash
+		.def("__hash__", [](const Facility* facility) { return hash<int>()(facility->GetID()); })
 		.def("__repr__", &Facility::toString, DOC(Facility, toString))
 		.def("__str__", &Facility::toString, DOC(Facility, toString));
 
@@ -299,6 +612,7 @@ PYBIND11_MODULE(pyTORS, m) {
 	////////////////////////////////////
 	py::class_<Track>(m, "Track", DOC(Track))
 		.def_readonly("id", &Track::id, DOC(Track, id))
+		.def_property_readonly("index", &Track::GetIndex, DOC(Track, GetIndex))
 		.def_readonly("type", &Track::type, DOC(Track, type))
 		.def_readonly("length", &Track::length, DOC(Track, length))
 		.def_readonly("name", &Track::name, DOC(Track, name))
@@ -317,6 +631,8 @@ PYBIND11_MODULE(pyTORS, m) {
 		.def("get_next_track_parts", &Track::GetNextTrackParts, DOC(Track, GetNextTrackParts), py::arg("previous_track"), py::return_value_policy::reference)
 		.def("__eq__", &Track::operator==, DOC(Track, operator_eq), py::arg("track"))
 		.def("__ne__", &Track::operator!=, DOC(Track, operator_ne), py::arg("track"))
+		// Hash by id, like operator==, so that equal Tracks of different Locations have the same hash
+		.def("__hash__", [](const Track* track) { return hash<string>()(track->GetID()); })
 		.def("__repr__", &Track::toString, DOC(Track, toString))
 		.def("__str__", &Track::toString, DOC(Track, toString));
 
@@ -332,6 +648,14 @@ PYBIND11_MODULE(pyTORS, m) {
 	////////////////////////////////////
 	//// Scenario                   ////
 	////////////////////////////////////
+	py::class_<ScenarioInfo>(m, "ScenarioInfo", DOC(ScenarioInfo))
+		.def_readonly("number_of_trains", &ScenarioInfo::numberOfTrains, DOC(ScenarioInfo, numberOfTrains))
+		.def_readonly("number_of_incoming", &ScenarioInfo::numberOfIncoming, DOC(ScenarioInfo, numberOfIncoming))
+		.def_readonly("number_of_outgoing", &ScenarioInfo::numberOfOutgoing, DOC(ScenarioInfo, numberOfOutgoing))
+		.def_readonly("start_time", &ScenarioInfo::startTime, DOC(ScenarioInfo, startTime))
+		.def_readonly("end_time", &ScenarioInfo::endTime, DOC(ScenarioInfo, endTime))
+		.def_readonly("train_types", &ScenarioInfo::trainTypes, DOC(ScenarioInfo, trainTypes));
+
 	py::class_<Scenario>(m, "Scenario", DOC(Scenario))
 		.def(py::init<>())
 		.def_property_readonly("start_time", &Scenario::GetStartTime, DOC(Scenario, GetStartTime))
@@ -340,31 +664,144 @@ PYBIND11_MODULE(pyTORS, m) {
 		.def_property_readonly("outgoing_trains", &Scenario::GetOutgoingTrains, DOC(Scenario, GetOutgoingTrains), py::return_value_policy::reference)
 		.def_property_readonly("incoming_trains", &Scenario::GetIncomingTrains, DOC(Scenario, GetIncomingTrains), py::return_value_policy::reference)
 		.def_property_readonly("employees", &Scenario::GetEmployees, DOC(Scenario, GetEmployees), py::return_value_policy::reference)
+		.def("detach_outgoing_trains", &Scenario::DetachOutgoingTrains, DOC(Scenario, DetachOutgoingTrains), py::return_value_policy::reference)
+		.def("detach_incoming_trains", &Scenario::DetachIncomingTrains, DOC(Scenario, DetachIncomingTrains), py::return_value_policy::reference)
+		.def("detach_employees", &Scenario::DetachEmployees, DOC(Scenario, DetachEmployees), py::return_value_policy::reference)
 		.def_property_readonly("disturbances", &Scenario::GetDisturbances, DOC(Scenario, GetDisturbances), py::return_value_policy::reference)
 		.def("set_start_time", &Scenario::SetStartTime, DOC(Scenario, SetStartTime), py::arg("start_time"))
 		.def("set_end_time", &Scenario::SetEndTime, DOC(Scenario, SetEndTime), py::arg("end_time"))
-		.def("set_outgoing_trains", &Scenario::SetOutgoingTrains, DOC(Scenario, SetOutgoingTrains), py::arg("incoming_trains"), py::keep_alive<1, 2>())
-		.def("set_incoming_trains", &Scenario::SetIncomingTrains, DOC(Scenario, SetIncomingTrains), py::arg("outgoing_trains"), py::keep_alive<1, 2>())
-		.def("add_outgoing_train", &Scenario::AddOutgoingTrain, DOC(Scenario, AddOutgoingTrain), py::arg("outgoing_train"), py::keep_alive<1, 2>())
-		.def("add_incoming_train", &Scenario::AddIncomingTrain, DOC(Scenario, AddIncomingTrain), py::arg("incoming_train"), py::keep_alive<1, 2>())
-		.def("set_employees", &Scenario::SetEmployees, DOC(Scenario, SetEmployees), py::arg("employees"), py::keep_alive<1, 2>())
-		.def("add_employee", &Scenario::AddEmployee, DOC(Scenario, AddEmployee), py::arg("employee"), py::keep_alive<1, 2>())
+		.def("set_outgoing_trains", [](Scenario& scenario, const vector<const Outgoing*>& outgoingTrains) {
+				scenario.SetOutgoingTrains(scenario_objects(scenario.GetOutgoingTrains(), outgoingTrains)); 
+			}, DOC(Scenario, SetOutgoingTrains), py::arg("outgoing_trains"))
+		.def("set_incoming_trains", [](Scenario& scenario, const vector<const Incoming*>& incomingTrains) {
+				scenario.SetIncomingTrains(scenario_objects(scenario.GetIncomingTrains(), incomingTrains)); 
+			}, DOC(Scenario, SetIncomingTrains), py::arg("incoming_trains"))
+		.def("add_outgoing_train", [](Scenario& scenario, const Outgoing* outgoingTrain) { scenario.AddOutgoingTrain(new Outgoing(*outgoingTrain)); }, 
+			DOC(Scenario, AddOutgoingTrain), py::arg("outgoing_train"))
+		.def("add_incoming_train", [](Scenario& scenario, const Incoming* incomingTrain) { scenario.AddIncomingTrain(new Incoming(*incomingTrain)); }, 
+			DOC(Scenario, AddIncomingTrain), py::arg("incoming_train"))
+		.def("set_employees", [](Scenario& scenario, const vector<const Employee*>& employees) {
+				scenario.SetEmployees(scenario_objects(scenario.GetEmployees(), employees)); 
+			}, DOC(Scenario, SetEmployees), py::arg("employees"))
+		.def("add_employee", [](Scenario& scenario, const Employee* employee) { scenario.AddEmployee(new Employee(*employee)); }, 
+			DOC(Scenario, AddEmployee), py::arg("employee"))
 		.def("get_disturbance_list", &Scenario::GetDisturbanceVector, DOC(Scenario, GetDisturbanceVector), py::return_value_policy::reference)
 		.def("set_disturbances", &Scenario::SetDisturbances, DOC(Scenario, SetDisturbances), py::arg("disturbances"), py::keep_alive<1, 2>())
 		.def("add_disturbance", &Scenario::AddDisturbance, DOC(Scenario, AddDisturbance), py::arg("disturbance"), py::keep_alive<1, 2>())
 		.def("print_scenario_info", &Scenario::PrintScenarioInfo, DOC(Scenario, PrintScenarioInfo),
 			py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>())
-		.def("get_copy", [](const Scenario& scenario) { return new Scenario(scenario); }, DOC(Scenario, Scenario, 4), py::return_value_policy::take_ownership);
+		.def("get_copy", [](const Scenario& scenario) { 
+				auto copy = new Scenario(scenario);
+				copy->DetachIncomingTrains();
+				copy->DetachOutgoingTrains();
+				copy->DetachEmployees();
+				return copy;
+			}, DOC(Scenario, Scenario, 4), py::return_value_policy::take_ownership)
+		.def_static("read_info", &Scenario::ReadInfo, DOC(Scenario, ReadInfo), py::arg("file_path"), py::call_guard<py::gil_scoped_release>());
 	
 
+	////////////////////////////////////
+	//// Rollout                    ////
+	////////////////////////////////////
+	py::enum_<RolloutPolicy>(m, "RolloutPolicy", DOC(RolloutPolicy))
+		.value("Random", RolloutPolicy::Random, DOC(RolloutPolicy, Random))
+		.value("Greedy", RolloutPolicy::Greedy, DOC(RolloutPolicy, Greedy))
+		.value("Mix", RolloutPolicy::Mix, DOC(RolloutPolicy, Mix));
+
+	py::class_<RolloutResult>(m, "RolloutResult", DOC(RolloutResult))
+		.def_readonly("number_of_rollouts", &RolloutResult::numberOfRollouts, DOC(RolloutResult, numberOfRollouts))
+		.def_readonly("number_of_successes", &RolloutResult::numberOfSuccesses, DOC(RolloutResult, numberOfSuccesses))
+		.def_property_readonly("success_rate", [](const RolloutResult& r) { 
+			return r.numberOfRollouts == 0 ? 0.0 : static_cast<double>(r.numberOfSuccesses) / r.numberOfRollouts; })
+		.def_readonly("mean_score", &RolloutResult::meanScore, DOC(RolloutResult, meanScore))
+		.def_readonly("mean_trains_left", &RolloutResult::meanTrainsLeft, DOC(RolloutResult, meanTrainsLeft))
+		.def_readonly("mean_end_time", &RolloutResult::meanEndTime, DOC(RolloutResult, meanEndTime))
+		.def_readonly("best_score", &RolloutResult::bestScore, DOC(RolloutResult, bestScore))
+		.def_readonly("best_plan", &RolloutResult::bestPlan, DOC(RolloutResult, bestPlan), py::return_value_policy::reference_internal);
+
+	m.def("get_rollout_priority", &GetRolloutPriority, DOC(GetRolloutPriority), py::arg("kind"));
+
+	////////////////////////////////////
+	//// Search                     ////
+	////////////////////////////////////
+	SearchHeuristic defaultHeuristic;
+	py::class_<SearchHeuristic>(m, "SearchHeuristic", DOC(SearchHeuristic))
+		.def(py::init([](double trainsServed, double slack, double tasks, double distance) {
+				return SearchHeuristic {trainsServed, slack, tasks, distance};
+			}), py::arg("trains_served") = defaultHeuristic.trainsServed, py::arg("slack") = defaultHeuristic.slack,
+			py::arg("tasks") = defaultHeuristic.tasks, py::arg("distance") = defaultHeuristic.distance)
+		.def_readwrite("trains_served", &SearchHeuristic::trainsServed, DOC(SearchHeuristic, trainsServed))
+		.def_readwrite("slack", &SearchHeuristic::slack, DOC(SearchHeuristic, slack))
+		.def_readwrite("tasks", &SearchHeuristic::tasks, DOC(SearchHeuristic, tasks))
+		.def_readwrite("distance", &SearchHeuristic::distance, DOC(SearchHeuristic, distance));
+
+	py::class_<BeamSearchResult>(m, "BeamSearchResult", DOC(BeamSearchResult))
+		.def_readonly("actions", &BeamSearchResult::actions, DOC(BeamSearchResult, actions))
+		.def_readonly("complete", &BeamSearchResult::complete, DOC(BeamSearchResult, complete))
+		.def_readonly("score", &BeamSearchResult::score, DOC(BeamSearchResult, score))
+		.def_readonly("number_of_expansions", &BeamSearchResult::numberOfExpansions, DOC(BeamSearchResult, numberOfExpansions))
+		.def_readonly("number_of_duplicates", &BeamSearchResult::numberOfDuplicates, DOC(BeamSearchResult, numberOfDuplicates));
+
+	py::class_<AStarResult>(m, "AStarResult", DOC(AStarResult))
+		.def_readonly("actions", &AStarResult::actions, DOC(AStarResult, actions))
+		.def_readonly("complete", &AStarResult::complete, DOC(AStarResult, complete))
+		.def_readonly("cost", &AStarResult::cost, DOC(AStarResult, cost))
+		.def_readonly("lower_bound", &AStarResult::lowerBound, DOC(AStarResult, lowerBound))
+		.def_readonly("number_of_expansions", &AStarResult::numberOfExpansions, DOC(AStarResult, numberOfExpansions))
+		.def_readonly("number_of_generated", &AStarResult::numberOfGenerated, DOC(AStarResult, numberOfGenerated))
+		.def_readonly("elapsed", &AStarResult::elapsed, DOC(AStarResult, elapsed))
+		.def_property_readonly("expansion_rate", [](const AStarResult& r) {
+			return r.elapsed <= 0 ? 0.0 : r.numberOfExpansions / r.elapsed; });
+
+	py::class_<LowerBoundTable>(m, "LowerBoundTable", DOC(LowerBoundTable))
+		.def(py::init<const LocationEngine&, const Scenario&>(), DOC(LowerBoundTable, LowerBoundTable), py::arg("engine"), py::arg("scenario"),
+			py::keep_alive<1, 2>())
+		.def("get_distance", &LowerBoundTable::GetDistance, DOC(LowerBoundTable, GetDistance), py::arg("from"), py::arg("to"))
+		.def("get_lower_bound", &LowerBoundTable::GetLowerBound, DOC(LowerBoundTable, GetLowerBound), py::arg("state"));
+
 	////////////////////////////////////
 	//// Engine                     ////
 	////////////////////////////////////
-	py::class_<LocationEngine>(m, "Engine", DOC(LocationEngine))
-		.def(py::init<const std::string&>(), DOC(LocationEngine, LocationEngine, 2))
+	py::enum_<ValidationCode>(m, "ValidationCode", DOC(ValidationCode))
+		.value("Valid", ValidationCode::Valid, DOC(ValidationCode, Valid))
+		.value("GeneratorDisabled", ValidationCode::GeneratorDisabled, DOC(ValidationCode, GeneratorDisabled))
+		.value("GenerationFailed", ValidationCode::GenerationFailed, DOC(ValidationCode, GenerationFailed));
+
+	py::enum_<DeadEndReason>(m, "DeadEndReason", DOC(DeadEndReason))
+		.value("MissingTrain", DeadEndReason::MissingTrain, DOC(DeadEndReason, MissingTrain))
+		.value("LateDeparture", DeadEndReason::LateDeparture, DOC(DeadEndReason, LateDeparture))
+		.value("ServiceCapacity", DeadEndReason::ServiceCapacity, DOC(DeadEndReason, ServiceCapacity))
+		.value("MissingFacility", DeadEndReason::MissingFacility, DOC(DeadEndReason, MissingFacility))
+		.value("ParkingLength", DeadEndReason::ParkingLength, DOC(DeadEndReason, ParkingLength))
+		.value("Electrification", DeadEndReason::Electrification, DOC(DeadEndReason, Electrification));
+
+	py::class_<ScreeningResult>(m, "ScreeningResult", DOC(ScreeningResult))
+		.def_readonly("reasons", &ScreeningResult::reasons, DOC(ScreeningResult, reasons))
+		.def_readonly("messages", &ScreeningResult::messages, DOC(ScreeningResult, messages))
+		.def_property_readonly("feasible", &ScreeningResult::IsFeasible, DOC(ScreeningResult, IsFeasible))
+		.def("__bool__", &ScreeningResult::IsFeasible, DOC(ScreeningResult, IsFeasible))
+		.def("__repr__", [](const ScreeningResult& r) {
+			return r.IsFeasible() ? string("ScreeningResult(feasible)") : "ScreeningResult(" + Join(r.messages, " ") + ")"; });
+
+	py::class_<LocationEngine, unique_ptr<LocationEngine, PythonEngineDeleter>>(m, "Engine", DOC(LocationEngine))
+		.def(py::init([](const string& path) {
+				auto engine = new LocationEngine(path);
+				intern_location(engine->GetSharedLocation());
+				python_engines().push_back(engine);
+				return unique_ptr<LocationEngine, PythonEngineDeleter>(engine);
+			}), DOC(LocationEngine, LocationEngine, 2), py::arg("path"))
+		.def(py::init([](const string& path, const string& configPath) {
+				auto engine = new LocationEngine(path, configPath);
+				intern_location(engine->GetSharedLocation());
+				python_engines().push_back(engine);
+				return unique_ptr<LocationEngine, PythonEngineDeleter>(engine);
+			}), DOC(LocationEngine, LocationEngine, 3), py::arg("path"), py::arg("config_path"))
 		.def("step", &LocationEngine::Step, DOC(LocationEngine, Step), py::arg("state"),
 			py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>())
 		.def("get_valid_actions", &LocationEngine::GetValidActions, DOC(LocationEngine, GetValidActions), py::arg("state"), py::return_value_policy::reference)
+		.def("get_valid_action_table", &get_valid_action_table<LocationEngine>, DOC(LocationEngine, GetValidActionTable), py::arg("state"))
+		.def("apply_action_by_index", &LocationEngine::ApplyActionByIndex, DOC(LocationEngine, ApplyActionByIndex), py::arg("state"), py::arg("index"),
+			py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>())
 		.def("apply_action", py::overload_cast<State*, const SimpleAction&>(&LocationEngine::ApplyAction), DOC(LocationEngine, ApplyAction), py::arg("state"), py::arg("action"),
 			py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>())
 		.def("apply_action", py::overload_cast<State*, const Action*>(&LocationEngine::ApplyAction), DOC(LocationEngine, ApplyAction), py::arg("state"), py::arg("action"),
@@ -383,13 +820,53 @@ PYBIND11_MODULE(pyTORS, m) {
 			py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>())
 		.def("is_valid_action", py::overload_cast<const State*, const Action*>(&LocationEngine::IsValidAction, py::const_), DOC(LocationEngine, IsValidAction), py::arg("state"), py::arg("action"),
 			py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>())
+		.def("validate_many", &validate_many<LocationEngine>, DOC(LocationEngine, ValidateMany), py::arg("state"), py::arg("actions"), py::arg("return_reasons") = false)
+		.def_property_readonly("business_rule_names", &LocationEngine::GetBusinessRuleNames, DOC(LocationEngine, GetBusinessRuleNames))
+		.def_property_readonly("pruning_rule_names", &LocationEngine::GetPruningRuleNames, DOC(LocationEngine, GetPruningRuleNames))
 		.def("is_state_active", &LocationEngine::IsStateActive, DOC(LocationEngine, IsStateActive), py::arg("state"),
 			py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>())
+		.def_property("feasibility_monitor", &LocationEngine::IsFeasibilityMonitorActive, &LocationEngine::SetFeasibilityMonitor,
+			DOC(LocationEngine, SetFeasibilityMonitor))
+		.def("screen_scenario", &LocationEngine::ScreenScenario, DOC(LocationEngine, ScreenScenario), py::arg("scenario"))
+		.def_property("symmetry_reduction", &LocationEngine::IsSymmetryReductionActive, &LocationEngine::SetSymmetryReduction,
+			DOC(LocationEngine, SetSymmetryReduction))
+		.def("get_symmetry_classes", &LocationEngine::GetSymmetryClasses, DOC(LocationEngine, GetSymmetryClasses), py::arg("state"),
+			py::return_value_policy::reference)
 		.def("start_session", &LocationEngine::StartSession, DOC(LocationEngine, StartSession), py::arg("scenario"), py::return_value_policy::reference)
 		.def("end_session", &LocationEngine::EndSession, DOC(LocationEngine, EndSession), py::arg("state"))
-		.def("get_location", &LocationEngine::GetLocation, DOC(LocationEngine, GetLocation), py::return_value_policy::reference)
+		.def("reset_session", &LocationEngine::ResetSession, DOC(LocationEngine, ResetSession), py::arg("state"), py::arg("scenario"),
+			py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>())
+		.def("copy_session", &LocationEngine::CopySession, DOC(LocationEngine, CopySession), py::arg("source"), py::arg("target") = nullptr,
+			py::return_value_policy::reference, py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>())
+		.def("restore_session", &LocationEngine::RestoreSession, DOC(LocationEngine, RestoreSession), py::arg("result"), py::arg("target") = nullptr,
+			py::return_value_policy::reference, py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>())
+		.def("save_state", [](const LocationEngine& engine, const State* state) { return py::bytes(engine.SaveState(state)); },
+			DOC(LocationEngine, SaveState), py::arg("state"))
+		.def("load_state", &LocationEngine::LoadState, DOC(LocationEngine, LoadState), py::arg("data"), py::arg("target") = nullptr,
+			py::return_value_policy::reference)
+		.def("get_location", [](const LocationEngine& engine) {
+				auto& shared = engine.GetSharedLocation();
+				return keep_location_alive(py::cast(intern_location(shared), py::return_value_policy::reference), shared);
+			}, DOC(LocationEngine, GetLocation))
 		.def("get_scenario", &LocationEngine::GetScenario, DOC(LocationEngine, GetScenario), py::arg("file_path"), py::return_value_policy::reference)
-		.def("get_result", &LocationEngine::GetResult, DOC(LocationEngine, GetResult), py::arg("state"), py::return_value_policy::copy)
+		.def("load_scenario", &LocationEngine::LoadScenario, DOC(LocationEngine, LoadScenario), py::arg("file_path"), py::return_value_policy::take_ownership)
+		.def("rollout", [](LocationEngine& engine, State* state, RolloutPolicy policy, size_t n, unsigned int seed, int maxSteps, int nThreads, bool keepBestPlan) {
+				return PlayRollouts(engine, state, policy, n, seed, maxSteps, nThreads, keepBestPlan);
+			}, DOC(PlayRollouts), py::arg("state"), py::arg("policy") = RolloutPolicy::Random, py::arg("n") = 100, py::arg("seed") = 0,
+			py::arg("max_steps") = 1000, py::arg("n_threads") = 0, py::arg("keep_best_plan") = false, py::call_guard<py::gil_scoped_release>())
+		.def("beam_search", [](LocationEngine& engine, State* state, size_t width, const SearchHeuristic& heuristic, int maxDepth, double timeLimit, int nThreads) {
+				return BeamSearch(engine, state, width, heuristic, maxDepth, timeLimit, nThreads);
+			}, DOC(BeamSearch), py::arg("state"), py::arg("width") = 8, py::arg("heuristic") = defaultHeuristic, py::arg("max_depth") = 1000,
+			py::arg("time_limit") = -1, py::arg("n_threads") = 0, py::call_guard<py::gil_scoped_release>())
+		.def("astar_search", [](LocationEngine& engine, State* state, double weight, size_t maxExpansions, double timeLimit) {
+				return AStarSearch(engine, state, weight, maxExpansions, timeLimit);
+			}, DOC(AStarSearch), py::arg("state"), py::arg("weight") = 1.0, py::arg("max_expansions") = 100000, py::arg("time_limit") = -1,
+			py::call_guard<py::gil_scoped_release>())
+		.def("get_heuristic_score", [](LocationEngine& engine, State* state, const SearchHeuristic& heuristic) {
+				return GetHeuristicScore(engine, state, heuristic);
+			}, DOC(GetHeuristicScore), py::arg("state"), py::arg("heuristic") = defaultHeuristic)
+		.def("get_result", [](LocationEngine& engine, State* state) { engine.GetResult(state); return RunResultView(engine, state); },
+			DOC(LocationEngine, GetResult), py::arg("state"), py::keep_alive<0, 1>())
 		.def("get_path", &LocationEngine::GetPath, DOC(LocationEngine, GetPath), py::arg("state"), py::arg("move"), py::return_value_policy::take_ownership)
 		.def("import_result", &LocationEngine::ImportResult, DOC(LocationEngine, ImportResult), py::arg("file_path"), py::return_value_policy::take_ownership)
 		.def("calc_all_possible_paths", &LocationEngine::CalcAllPossiblePaths, DOC(LocationEngine, CalcAllPossiblePaths),
@@ -397,6 +874,139 @@ PYBIND11_MODULE(pyTORS, m) {
 		.def("calc_shortest_paths", &LocationEngine::CalcShortestPaths, DOC(LocationEngine, CalcShortestPaths),
 			py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>());
 
+	py::class_<Engine>(m, "MultiLocationEngine", DOC(Engine))
+		.def(py::init<>(), DOC(Engine, Engine))
+		.def(py::init<const std::string&>(), DOC(Engine, Engine, 2), py::arg("path"))
+		.def("get_location_engine", [](py::object self, const string& location) {
+				auto locationEngine = self.cast<Engine&>().GetOrLoadLocationEngine(location);
+				intern_location(locationEngine->GetSharedLocation());
+				auto result = py::cast(locationEngine, py::return_value_policy::reference);
+				py::detail::keep_alive_impl(result, self);
+				return keep_location_alive(result, locationEngine->GetSharedLocation());
+			}, DOC(Engine, GetOrLoadLocationEngine), py::arg("location"))
+		.def("get_loaded_locations", &Engine::GetLoadedLocations, DOC(Engine, GetLoadedLocations))
+		.def("set_memory_budget", &Engine::SetMemoryBudget, DOC(Engine, SetMemoryBudget), py::arg("budget"))
+		.def_property_readonly("memory_budget", &Engine::GetMemoryBudget, DOC(Engine, GetMemoryBudget))
+		.def_property("feasibility_monitor", &Engine::IsFeasibilityMonitorActive, &Engine::SetFeasibilityMonitor,
+			DOC(Engine, SetFeasibilityMonitor))
+		.def("screen_scenario", &Engine::ScreenScenario, DOC(Engine, ScreenScenario), py::arg("location"), py::arg("scenario"))
+		.def_property("symmetry_reduction", &Engine::IsSymmetryReductionActive, &Engine::SetSymmetryReduction,
+			DOC(Engine, SetSymmetryReduction))
+		.def("get_symmetry_classes", &Engine::GetSymmetryClasses, DOC(Engine, GetSymmetryClasses), py::arg("state"),
+			py::return_value_policy::reference)
+		.def_property_readonly("memory_usage", &Engine::GetMemoryUsage, DOC(Engine, GetMemoryUsage))
+		.def("step", &Engine::Step, DOC(Engine, Step), py::arg("state"),
+			py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>())
+		.def("get_valid_actions", &Engine::GetValidActions, DOC(Engine, GetValidActions), py::arg("state"), py::return_value_policy::reference)
+		.def("get_valid_action_table", &get_valid_action_table<Engine>, DOC(Engine, GetValidActionTable), py::arg("state"))
+		.def("apply_action_by_index", &Engine::ApplyActionByIndex, DOC(Engine, ApplyActionByIndex), py::arg("state"), py::arg("index"),
+			py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>())
+		.def("apply_action", py::overload_cast<State*, const SimpleAction&>(&Engine::ApplyAction, py::const_), DOC(Engine, ApplyAction), py::arg("state"), py::arg("action"),
+			py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>())
+		.def("apply_action", py::overload_cast<State*, const Action*>(&Engine::ApplyAction, py::const_), DOC(Engine, ApplyAction), py::arg("state"), py::arg("action"),
+			py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>())
+		.def("apply_action_and_step", py::overload_cast<State*, const SimpleAction&>(&Engine::ApplyActionAndStep), DOC(Engine, ApplyActionAndStep),
+			py::arg("state"), py::arg("action"), py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>())
+		.def("apply_action_and_step", py::overload_cast<State*, const Action*>(&Engine::ApplyActionAndStep), DOC(Engine, ApplyActionAndStep),
+			py::arg("state"), py::arg("action"), py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>())
+		.def("generate_action", &Engine::GenerateAction, DOC(Engine, GenerateAction), py::arg("state"), py::arg("action"), py::return_value_policy::take_ownership,
+			py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>())
+		.def("is_valid_action", py::overload_cast<const State*, const SimpleAction&>(&Engine::IsValidAction, py::const_), DOC(Engine, IsValidAction), py::arg("state"), py::arg("action"),
+			py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>())
+		.def("is_valid_action", py::overload_cast<const State*, const Action*>(&Engine::IsValidAction, py::const_), DOC(Engine, IsValidAction), py::arg("state"), py::arg("action"),
+			py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>())
+		.def("validate_many", &validate_many<Engine>, DOC(Engine, ValidateMany), py::arg("state"), py::arg("actions"), py::arg("return_reasons") = false)
+		.def("is_state_active", &Engine::IsStateActive, DOC(Engine, IsStateActive), py::arg("state"),
+			py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>())
+		.def("evaluate_plan", &Engine::EvaluatePlan, DOC(Engine, EvaluatePlan), py::arg("location"), py::arg("scenario"), py::arg("plan"),
+			py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>())
+		.def("start_session", &Engine::StartSession, DOC(Engine, StartSession), py::arg("location"), py::arg("scenario"), py::return_value_policy::reference)
+		.def("end_session", &Engine::EndSession, DOC(Engine, EndSession), py::arg("state"))
+		.def("reset_session", &Engine::ResetSession, DOC(Engine, ResetSession), py::arg("state"), py::arg("scenario"),
+			py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>())
+		.def("copy_session", &Engine::CopySession, DOC(Engine, CopySession), py::arg("source"), py::arg("target") = nullptr,
+			py::return_value_policy::reference, py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>())
+		.def("restore_session", &Engine::RestoreSession, DOC(Engine, RestoreSession), py::arg("result"), py::arg("target") = nullptr,
+			py::return_value_policy::reference, py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>())
+		.def("save_state", [](const Engine& engine, const State* state) { return py::bytes(engine.SaveState(state)); },
+			DOC(Engine, SaveState), py::arg("state"))
+		.def("load_state", &Engine::LoadState, DOC(Engine, LoadState), py::arg("data"), py::arg("target") = nullptr,
+			py::return_value_policy::reference)
+		.def("get_location", [](Engine& engine, const string& location) {
+				auto& shared = engine.GetOrLoadLocationEngine(location)->GetSharedLocation();
+				return keep_location_alive(py::cast(intern_location(shared), py::return_value_policy::reference), shared);
+			}, DOC(Engine, GetLocation), py::arg("location"))
+		.def("get_scenario", [](Engine& engine, const string& location, const string& fileName) {
+				auto scenario = py::cast(engine.GetScenario(location, fileName), py::return_value_policy::copy);
+				return keep_location_alive(scenario, engine.GetOrLoadLocationEngine(location)->GetSharedLocation());
+			}, DOC(Engine, GetScenario), py::arg("location"), py::arg("file_path"))
+		.def("rollout", [](Engine& engine, State* state, RolloutPolicy policy, size_t n, unsigned int seed, int maxSteps, int nThreads, bool keepBestPlan) {
+				auto locationEngine = engine.GetLocationEngine(state);
+				py::gil_scoped_release release;
+				return PlayRollouts(*locationEngine, state, policy, n, seed, maxSteps, nThreads, keepBestPlan);
+			}, DOC(PlayRollouts), py::arg("state"), py::arg("policy") = RolloutPolicy::Random, py::arg("n") = 100, py::arg("seed") = 0,
+			py::arg("max_steps") = 1000, py::arg("n_threads") = 0, py::arg("keep_best_plan") = false)
+		.def("beam_search", [](Engine& engine, State* state, size_t width, const SearchHeuristic& heuristic, int maxDepth, double timeLimit, int nThreads) {
+				auto locationEngine = engine.GetLocationEngine(state);
+				py::gil_scoped_release release;
+				return BeamSearch(*locationEngine, state, width, heuristic, maxDepth, timeLimit, nThreads);
+			}, DOC(BeamSearch), py::arg("state"), py::arg("width") = 8, py::arg("heuristic") = defaultHeuristic, py::arg("max_depth") = 1000,
+			py::arg("time_limit") = -1, py::arg("n_threads") = 0)
+		.def("astar_search", [](Engine& engine, State* state, double weight, size_t maxExpansions, double timeLimit) {
+				auto locationEngine = engine.GetLocationEngine(state);
+				py::gil_scoped_release release;
+				return AStarSearch(*locationEngine, state, weight, maxExpansions, timeLimit);
+			}, DOC(AStarSearch), py::arg("state"), py::arg("weight") = 1.0, py::arg("max_expansions") = 100000, py::arg("time_limit") = -1)
+		.def("get_heuristic_score", [](Engine& engine, State* state, const SearchHeuristic& heuristic) {
+				return GetHeuristicScore(*engine.GetLocationEngine(state), state, heuristic);
+			}, DOC(GetHeuristicScore), py::arg("state"), py::arg("heuristic") = defaultHeuristic)
+		.def("get_result", [](Engine& engine, State* state) { engine.GetResult(state); return RunResultView(engine, state); },
+			DOC(Engine, GetResult), py::arg("state"), py::keep_alive<0, 1>())
+		.def("get_path", &Engine::GetPath, DOC(Engine, GetPath), py::arg("state"), py::arg("move"), py::return_value_policy::take_ownership)
+		.def("import_result", [](Engine& engine, const string& fileName) {
+				auto result = engine.ImportResult(fileName);
+				auto& shared = engine.ResolveLocationEngine(result->GetLocation())->GetSharedLocation();
+				return keep_location_alive(py::cast(result, py::return_value_policy::take_ownership), shared);
+			}, DOC(Engine, ImportResult), py::arg("file_path"))
+		.def("calc_all_possible_paths", &Engine::CalcAllPossiblePaths, DOC(Engine, CalcAllPossiblePaths),
+			py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>())
+		.def("calc_shortest_paths", &Engine::CalcShortestPaths, DOC(Engine, CalcShortestPaths),
+			py::call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>());
+
+	py::class_<Featurizer>(m, "Featurizer", DOC(Featurizer))
+		.def(py::init<const Location&, int, int, int, int, const vector<string>&>(), DOC(Featurizer, Featurizer, 2), py::arg("location"),
+			py::arg("n_incoming") = 3, py::arg("n_outgoing") = 3, py::arg("n_shunting_units") = 3, py::arg("n_trains") = 3, 
+			py::arg("train_types") = vector<string>(), py::keep_alive<1, 2>())
+		.def("featurize", &featurize, DOC(Featurizer, Featurize), py::arg("state"), py::arg("out") = py::none())
+		.def("get_action_mask", &get_action_mask<LocationEngine>, DOC(Featurizer, GetActionMask), py::arg("engine"), py::arg("state"), py::arg("out") = py::none())
+		.def("get_action_mask", &get_action_mask<Engine>, DOC(Featurizer, GetActionMask), py::arg("engine"), py::arg("state"), py::arg("out") = py::none())
+		.def("get_action_index", &Featurizer::GetActionIndex, DOC(Featurizer, GetActionIndex), py::arg("state"), py::arg("action"))
+		.def("get_simple_action", &Featurizer::GetSimpleAction, DOC(Featurizer, GetSimpleAction), py::arg("state"), py::arg("index"), py::return_value_policy::take_ownership)
+		.def("get_track_slot", &Featurizer::GetTrackSlot, DOC(Featurizer, GetTrackSlot), py::arg("track"))
+		.def_property_readonly("observation_size", &Featurizer::GetObservationSize, DOC(Featurizer, GetObservationSize))
+		.def_property_readonly("n_actions", &Featurizer::GetNumberOfActions, DOC(Featurizer, GetNumberOfActions))
+		.def_property_readonly("n_shunting_unit_actions", &Featurizer::GetNumberOfShuntingUnitActions, DOC(Featurizer, GetNumberOfShuntingUnitActions))
+		.def_property_readonly("tracks", &Featurizer::GetTracks, DOC(Featurizer, GetTracks), py::return_value_policy::reference)
+		.def_property_readonly("train_types", &Featurizer::GetTrainTypes, DOC(Featurizer, GetTrainTypes))
+		.def_property_readonly("n_incoming", &Featurizer::GetNumberOfIncoming, DOC(Featurizer, GetNumberOfIncoming))
+		.def_property_readonly("n_outgoing", &Featurizer::GetNumberOfOutgoing, DOC(Featurizer, GetNumberOfOutgoing))
+		.def_property_readonly("n_shunting_units", &Featurizer::GetNumberOfShuntingUnits, DOC(Featurizer, GetNumberOfShuntingUnits))
+		.def_property_readonly("n_trains", &Featurizer::GetNumberOfTrains, DOC(Featurizer, GetNumberOfTrains));
+
+	////////////////////////////////////
+	//// SessionBatch               ////
+	////////////////////////////////////
+	py::class_<SessionBatch>(m, "SessionBatch", DOC(SessionBatch))
+		.def(py::init<LocationEngine&, const Featurizer&, size_t, float, int>(), DOC(SessionBatch, SessionBatch, 3), py::arg("engine"),
+			py::arg("featurizer"), py::arg("size"), py::arg("step_penalty") = 0.005, py::arg("n_threads") = 0, 
+			py::keep_alive<1, 2>(), py::keep_alive<1, 3>())
+		.def("reset", &reset_session, DOC(SessionBatch, Reset), py::arg("index"), py::arg("scenario"), py::arg("obs"), py::arg("masks"))
+		.def("step", &step_sessions, DOC(SessionBatch, Step), py::arg("actions"), py::arg("obs"), py::arg("rewards"), py::arg("dones"), py::arg("masks"))
+		.def("get_state", &SessionBatch::GetState, DOC(SessionBatch, GetState), py::arg("index"), py::return_value_policy::reference)
+		.def("__len__", &SessionBatch::GetSize, DOC(SessionBatch, GetSize))
+		.def_property_readonly("observation_size", &SessionBatch::GetObservationSize, DOC(SessionBatch, GetObservationSize))
+		.def_property_readonly("n_threads", &SessionBatch::GetNumberOfThreads, DOC(SessionBatch, GetNumberOfThreads));
+
 	////////////////////////////////////
 	//// Event                      ////
 	////////////////////////////////////
@@ -425,24 +1035,60 @@ PYBIND11_MODULE(pyTORS, m) {
 	py::class_<RunResult>(m, "RunResult", DOC(RunResult))
 		.def_property_readonly("scenario", &RunResult::GetScenario, DOC(RunResult, GetScenario), py::return_value_policy::reference)
 		.def_property_readonly("plan", &RunResult::GetPlan, DOC(RunResult, GetPlan), py::return_value_policy::reference)
+		.def_property_readonly("location", &RunResult::GetLocation, DOC(RunResult, GetLocation))
 		.def("get_actions", &RunResult::GetActions, DOC(RunResult, GetActions), py::return_value_policy::reference)
+		.def("__len__", [](const RunResult& r) { return r.GetActions().size(); })
+		.def("__getitem__", [](const RunResult& r, long i) -> const POSAction& { return RunResultView::GetAction(r, i); },
+			py::return_value_policy::reference_internal)
+		.def("snapshot", [](const RunResult& r) { return new RunResult(r); }, "Get a copy of this RunResult", py::return_value_policy::take_ownership)
 		.def("serialize_to_file", &RunResult::SerializeToFile, DOC(RunResult, SerializeToFile), py::arg("engine"), py::arg("file_name"));
 
+	py::class_<RunResultView>(m, "RunResultView", "A read-only view on the RunResult of an active session. "
+			"The view follows the session as Actions are applied, and raises a ValueError when the session has ended. "
+			"The scenario and plan that are returned by the view refer to the live RunResult and are only valid while the session is active. "
+			"The POSActions share their actions with the RunResult, so they are cheap to copy and stay valid. "
+			"Use snapshot() to get an independent copy of the whole RunResult.")
+		.def_property_readonly("scenario", [](const RunResultView& v) -> const Scenario& { return v.Get().GetScenario(); }, DOC(RunResult, GetScenario),
+			py::return_value_policy::reference_internal)
+		.def_property_readonly("plan", [](const RunResultView& v) -> const POSPlan& { return v.Get().GetPlan(); }, DOC(RunResult, GetPlan),
+			py::return_value_policy::reference_internal)
+		.def_property_readonly("location", [](const RunResultView& v) { return v.Get().GetLocation(); }, DOC(RunResult, GetLocation))
+		.def("get_actions", [](const RunResultView& v) { return v.Get().GetActions(); }, DOC(RunResult, GetActions))
+		.def("__len__", [](const RunResultView& v) { return v.Get().GetActions().size(); })
+		.def("__getitem__", [](const RunResultView& v, long i) { return RunResultView::GetAction(v.Get(), i); })
+		.def("snapshot", [](const RunResultView& v) { return new RunResult(v.Get()); }, "Get a copy of the current RunResult of the session",
+			py::return_value_policy::take_ownership)
+		.def("serialize_to_file", [](const RunResultView& v, LocationEngine& engine, const string& fileName) { v.Get().SerializeToFile(engine, fileName); },
+			DOC(RunResult, SerializeToFile), py::arg("engine"), py::arg("file_name"));
+
 	////////////////////////////////////
 	//// POSAction                  ////
 	////////////////////////////////////
 	py::class_<POSAction>(m, "POSAction", DOC(POSAction))
-		.def(py::init<int, int, int, const SimpleAction*>(), DOC(POSAction, POSAction, 2))
+		.def(py::init([](int suggestedStart, int suggestedEnd, int minDuration, const SimpleAction* action) {
+				return new POSAction(suggestedStart, suggestedEnd, minDuration, action->Clone()); 
+			}), DOC(POSAction, POSAction, 2))
 		.def_property_readonly("id", &POSAction::GetID, DOC(POSAction, GetID))
 		.def_property_readonly("suggested_start", &POSAction::GetSuggestedStart, DOC(POSAction, GetSuggestedStart))
 		.def_property_readonly("suggested_end", &POSAction::GetSuggestedEnd, DOC(POSAction, GetSuggestedEnd))
 		.def_property_readonly("minimum_duration", &POSAction::GetMinimumDuration, DOC(POSAction, GetMinimumDuration))
-		.def_property_readonly("action", &POSAction::GetAction, DOC(POSAction, GetAction), py::return_value_policy::reference);
+		.def_property_readonly("action", &POSAction::GetAction, DOC(POSAction, GetAction), py::return_value_policy::reference_internal);
 
 	////////////////////////////////////
 	//// Exceptions                 ////
 	////////////////////////////////////
-	py::register_exception<ScenarioFailedException>(m, "ScenarioFailedError");
+	static auto scenarioFailedError = py::register_exception<ScenarioFailedException>(m, "ScenarioFailedError");
+	static py::exception<DeadEndException> deadEndError(m, "DeadEndError", scenarioFailedError.ptr());
+	deadEndError.doc() = DOC(DeadEndException);
+	py::register_exception_translator([](std::exception_ptr p) {
+		try {
+			if(p) rethrow_exception(p);
+		} catch(const DeadEndException& e) {
+			auto error = py::handle(deadEndError.ptr())(e.what());
+			error.attr("reason") = e.GetReason();
+			PyErr_SetObject(deadEndError.ptr(), error.ptr());
+		}
+	});
 	py::register_exception<InvalidActionException>(m, "InvalidActionError");
 	py::register_exception<InvalidStateRequest>(m, "InvalidStateRequestError");
 }